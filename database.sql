@@ -19,6 +19,9 @@ CREATE TABLE IF NOT EXISTS project_versions (
     content TEXT NOT NULL,
     file_blob BLOB,
     created_at TEXT DEFAULT (datetime('now')),
+    -- 'full': content holds the JSON; 'delta': file_blob holds a compressed
+    -- delta from a newer version (see src/storage/json_delta.py), content is ''
+    encoding TEXT NOT NULL DEFAULT 'full',
 
     FOREIGN KEY (project_name, project_uploaded_at)
         REFERENCES project_data(Pname, uploaded_at)
@@ -27,6 +30,20 @@ CREATE TABLE IF NOT EXISTS project_versions (
     UNIQUE (project_name, project_uploaded_at, version_number)
 );
 
+-- one small row per project for listings, kept in step with project_data by HelperFunct --
+CREATE TABLE IF NOT EXISTS project_summary (
+    Pname TEXT PRIMARY KEY,
+    project_type TEXT,
+    languages TEXT NOT NULL DEFAULT '[]',
+    skills TEXT NOT NULL DEFAULT '[]',
+    version_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT DEFAULT (datetime('now')),
+
+    FOREIGN KEY (Pname)
+        REFERENCES project_data(Pname)
+        ON DELETE CASCADE
+);
+
 CREATE TRIGGER IF NOT EXISTS update_project_data_timestamp
 AFTER UPDATE ON project_data
 FOR EACH ROW
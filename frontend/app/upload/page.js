@@ -164,10 +164,11 @@ export default function UploadPage() {
    * project insight payload in local state.
    *
    * @param {string} projectName
+   * @param {string} [uploadId] Upload handle returned by the upload call.
    * @returns {Promise<void>}
    */
-  async function finalizeAnalysis(projectName) {
-    await analyzeUploadedProject(projectName);
+  async function finalizeAnalysis(projectName, uploadId) {
+    await analyzeUploadedProject(projectName, uploadId);
     const insights = await fetchProjectInsights();
     const matches = Array.isArray(insights)
       ? insights.filter((item) => item?.project_name === projectName)
@@ -194,7 +195,7 @@ export default function UploadPage() {
     try {
       const upload = await uploadProjectZip(zipFile);
       const projectName = upload?.project_name || zipFile.name.replace(/\.zip$/i, "");
-      const result =await finalizeAnalysis(projectName);
+      const result = await finalizeAnalysis(projectName, upload?.upload_id);
       setInsight(result);
       setSuccess(`Analysis complete for ${projectName}.`);
     } catch (err) {
@@ -237,7 +238,7 @@ export default function UploadPage() {
 
       const upload = await uploadProjectZip(zipAsFile, zipName);
       const projectName = upload?.project_name || root;
-      const result = await finalizeAnalysis(projectName);
+      const result = await finalizeAnalysis(projectName, upload?.upload_id);
       setInsight(result);
       setSuccess(`Folder compressed and analyzed as ${projectName}.`);
     } catch (err) {
@@ -284,7 +285,7 @@ async function onAnalyzeBatch() {
       try {
         const upload = await uploadProjectZip(file);
         const projectName = upload?.project_name || file.name.replace(/\.zip$/i, "");
-        const result = await finalizeAnalysis(projectName);
+        const result = await finalizeAnalysis(projectName, upload?.upload_id);
         updateItem(file.name, { status: BATCH_STATUS.DONE });
         if (result) setBatchInsights((prev) => [...prev, result]);
         doneCount++;
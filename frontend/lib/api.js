@@ -150,10 +150,14 @@ export function uploadProjectZip(file, nameOverride = "") {
  * If `projectName` is empty, backend uses its default selection behavior.
  *
  * @param {string} [projectName=""]
+ * @param {string} [uploadId=""] Upload handle returned by `uploadProjectZip`.
  * @returns {Promise<any>}
  */
-export function analyzeUploadedProject(projectName = "") {
-  const query = projectName ? `?project_name=${encodeURIComponent(projectName)}` : "";
+export function analyzeUploadedProject(projectName = "", uploadId = "") {
+  const params = [];
+  if (projectName) params.push(`project_name=${encodeURIComponent(projectName)}`);
+  if (uploadId) params.push(`upload_id=${encodeURIComponent(uploadId)}`);
+  const query = params.length ? `?${params.join("&")}` : "";
   return request(`/analyze${query}`);
 }
 
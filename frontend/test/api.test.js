@@ -133,6 +133,18 @@ test("analyzeUploadedProject with no name omits query string", async () => {
   assert.equal(calls[0], "http://localhost:8000/analyze");
 });
 
+test("analyzeUploadedProject forwards the upload handle", async () => {
+  const calls = [];
+  global.fetch = async (url) => {
+    calls.push(url);
+    return makeResponse({ json: { ok: true } });
+  };
+
+  await analyzeUploadedProject("demo", "abc123");
+
+  assert.equal(calls[0], "http://localhost:8000/analyze?project_name=demo&upload_id=abc123");
+});
+
 test("saveConsent sends expected JSON body", async () => {
   const calls = [];
   global.fetch = async (url, init) => {
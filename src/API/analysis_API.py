@@ -1,11 +1,14 @@
 from src.core.analysis_service import (
     analyze_project,
-    extract_if_zip,
+    extract_zip_for_analysis,
     safe_project_name,
 )
+from src.core.analysis_jobs import AnalysisJobManager, JobQueueFull
 from src.core.app_context import runtimeAppContext
+from src.API.project_io_API import upload_registry
 
 from pathlib import Path
+from typing import Callable
 import shutil
 
 from fastapi import APIRouter, HTTPException, UploadFile, status
@@ -14,53 +17,84 @@ analysisRouter = APIRouter(
     prefix="/analyze"
 )
 
-@analysisRouter.get("/")
-def perform_analysis_API(
-    use_ai: bool = False,
-    project_name: str | None = None,
-    remove_duplicates: bool = True,
-) -> dict:
-    """
-    API call for performing analysis on a project folder. Extracts from a zip file if provided Path is a zip file. Analysis is saved.
+# Shared pool for POST /analyze/jobs; bounded by ANALYSIS_JOB_WORKERS / ANALYSIS_JOB_QUEUE.
+analysis_jobs = AnalysisJobManager()
 
-    HTTP call is GET /analyze
-    Optional Get /analyze/?use_ai=bool&remove_duplicates=bool
+def _uploaded_source(upload_id: str | None = None) -> tuple[Path | UploadFile, str | None]:
+    """
+    Return the upload to analyze and its project name.
 
     Args:
-        use_ai (bool): determines whether analysis uses ai
-        remove_duplicates (bool): controls whether duplicate files are deleted.
+        upload_id (str | None): Handle returned by POST /projects/upload. When
+            omitted, the most recent upload of this process is used.
 
-    Returns:
-        dict: status message and dedup summary on success; str error on failure under status.
+    Raises:
+        HTTPException: 400 if nothing was uploaded, 404 if the upload id is
+            unknown or expired or the uploaded path is gone.
     """
-    
+    if upload_id is not None:
+        handle = upload_registry.get(upload_id)
+        if handle is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Unknown or expired upload: {upload_id}",
+            )
+        return Path(handle.path), handle.project_name
+
     folder_path = runtimeAppContext.currently_uploaded_file
     if folder_path is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="No project has been uploaded yet. Call POST /projects/upload first.",
         )
+    if isinstance(folder_path, Path) and not folder_path.exists():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Uploaded path not found: {folder_path}",
+        )
+    return folder_path, runtimeAppContext.currently_uploaded_project_name
 
+
+def _run_analysis(
+    folder_path: Path | UploadFile,
+    uploaded_project_name: str | None,
+    use_ai: bool,
+    project_name: str | None,
+    remove_duplicates: bool,
+    progress: Callable[[str], None] | None = None,
+) -> dict:
+    """
+    Extract (if needed) and analyze an uploaded project, then clean up.
+
+    Args:
+        folder_path (Path | UploadFile): Uploaded ZIP, file-like upload, or project folder.
+        uploaded_project_name (str | None): Name recorded at upload time.
+        use_ai (bool): determines whether analysis uses ai
+        project_name (str | None): Explicit project name; wins over the upload name.
+        remove_duplicates (bool): controls whether duplicate files are deleted.
+        progress (Callable[[str], None] | None): Stage callback forwarded to analyze_project.
+
+    Returns:
+        dict: status message, dedup summary, snapshots and project name.
+    """
     extracted_temp_dir: Path | None = None
+    # Archive uploads come with an inventory of every member; only the members
+    # analysis reads are extracted.
+    analyze_kwargs: dict = {}
+    if progress is not None:
+        analyze_kwargs["progress"] = progress
     try:
-        if isinstance(folder_path, Path):
-            if not folder_path.exists():
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Uploaded path not found: {folder_path}",
-                )
-            if (folder_path.suffix.lower() == ".zip"):
-                folder = extract_if_zip(folder_path)
-                extracted_temp_dir = folder
-            else:
-                folder = folder_path
-        else:   #Can only be an UploadFile at this point
-            folder = extract_if_zip(folder_path)
+        if isinstance(folder_path, Path) and folder_path.suffix.lower() != ".zip":
+            folder = folder_path
+        else:
+            if progress is not None:
+                progress("extract")
+            folder, analyze_kwargs["inventory"] = extract_zip_for_analysis(folder_path)
             extracted_temp_dir = folder
 
         source_project_name = (
             project_name
-            or runtimeAppContext.currently_uploaded_project_name
+            or uploaded_project_name
             or folder.name
         )
         effective_project_name = safe_project_name(source_project_name)
@@ -70,6 +104,7 @@ def perform_analysis_API(
             use_ai_analysis=use_ai,
             project_name=effective_project_name,
             remove_duplicates=remove_duplicates,
+            **analyze_kwargs,
         ) or {}
         return {
             "status": "Analysis Finished and Saved",
@@ -77,6 +112,40 @@ def perform_analysis_API(
             "snapshots": result.get("snapshots", []),
             "project_name": effective_project_name,
         }
+    finally:
+        if "inventory" in analyze_kwargs:
+            analyze_kwargs["inventory"].close()
+        if extracted_temp_dir is not None:
+            shutil.rmtree(extracted_temp_dir, ignore_errors=True)
+
+
+@analysisRouter.get("/")
+def perform_analysis_API(
+    use_ai: bool = False,
+    project_name: str | None = None,
+    remove_duplicates: bool = True,
+    upload_id: str | None = None,
+) -> dict:
+    """
+    API call for performing analysis on a project folder. Extracts from a zip file if provided Path is a zip file. Analysis is saved.
+
+    HTTP call is GET /analyze
+    Optional Get /analyze/?use_ai=bool&remove_duplicates=bool&upload_id=str
+
+    Prefer POST /analyze/jobs for large projects; this call holds the request
+    open until the analysis finishes.
+
+    Args:
+        use_ai (bool): determines whether analysis uses ai
+        remove_duplicates (bool): controls whether duplicate files are deleted.
+        upload_id (str | None): Upload handle from POST /projects/upload; defaults to the latest upload.
+
+    Returns:
+        dict: status message and dedup summary on success; str error on failure under status.
+    """
+    folder_path, uploaded_project_name = _uploaded_source(upload_id)
+    try:
+        return _run_analysis(folder_path, uploaded_project_name, use_ai, project_name, remove_duplicates)
     except HTTPException:
         raise
     except Exception as e:
@@ -84,6 +153,71 @@ def perform_analysis_API(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Analysis failed: {e}",
         )
-    finally:
-        if extracted_temp_dir is not None:
-            shutil.rmtree(extracted_temp_dir, ignore_errors=True)
+
+
+@analysisRouter.post("/jobs", status_code=status.HTTP_202_ACCEPTED)
+def submit_analysis_job_API(
+    use_ai: bool = False,
+    project_name: str | None = None,
+    remove_duplicates: bool = True,
+    upload_id: str | None = None,
+) -> dict:
+    """
+    Queue an analysis of the current upload and return immediately.
+
+    HTTP call is POST /analyze/jobs
+    Optional POST /analyze/jobs?use_ai=bool&project_name=str&remove_duplicates=bool&upload_id=str
+
+    The upload is captured when the job is submitted, so a later upload does not
+    change what this job analyzes.
+
+    Returns:
+        dict: The queued job (see GET /analyze/jobs/{job_id}).
+
+    Raises:
+        HTTPException: 400/404 for a missing upload, 429 when the job queue is full.
+    """
+    folder_path, uploaded_project_name = _uploaded_source(upload_id)
+
+    def run(progress: Callable[[str], None]) -> dict:
+        return _run_analysis(
+            folder_path, uploaded_project_name, use_ai, project_name, remove_duplicates, progress=progress
+        )
+
+    try:
+        job = analysis_jobs.submit(run, project_name=project_name or uploaded_project_name)
+    except JobQueueFull as e:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(e))
+    return job.to_dict()
+
+
+@analysisRouter.get("/jobs/{job_id}")
+def get_analysis_job_API(job_id: str) -> dict:
+    """
+    Report an analysis job's status and per-stage progress.
+
+    HTTP call is GET /analyze/jobs/{job_id}
+
+    Returns:
+        dict: Job status, current stage, stage map, and the result once succeeded.
+    """
+    job = analysis_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Unknown analysis job: {job_id}")
+    return job.to_dict()
+
+
+@analysisRouter.delete("/jobs/{job_id}")
+def cancel_analysis_job_API(job_id: str) -> dict:
+    """
+    Cancel an analysis job. Running jobs stop at their next stage boundary.
+
+    HTTP call is DELETE /analyze/jobs/{job_id}
+
+    Returns:
+        dict: The job's status after the cancellation request.
+    """
+    job = analysis_jobs.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Unknown analysis job: {job_id}")
+    return job.to_dict()
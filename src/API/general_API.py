@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from .analysis_API import analysisRouter
@@ -8,11 +10,26 @@ from .Resume_Generator_API import resumeRouter
 from .Portfolio_Generator_API import portfolioRouter
 from .representation_API import representationRouter
 from .project_insights_API import insights_router
+from src.core.app_context import runtimeAppContext
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Own the shared database connections for the life of the server.
+
+    The database is opened by the first request that needs it (see
+    LazyAppContext), so startup does not touch it; shutdown closes it.
+    """
+    yield
+    runtimeAppContext.close()
+
 
 app = FastAPI(
     title="DevDoc API",
     description="API for analysing projects and generating resumes and portfolios.",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
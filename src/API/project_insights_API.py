@@ -3,8 +3,10 @@ from fastapi import APIRouter
 from pathlib import Path
 
 from src.reporting.project_insights import (
-    list_project_insights,
+    insight_index,
     list_skill_history,
+    load_hierarchies,
+    skill_history_entry,
     rank_projects_by_contribution,
     summarize_top_project_histories,
     summaries_for_top_ranked_projects,
@@ -18,16 +20,18 @@ from src.analysis.insight_helpers import parse_date, filter_insights
 insights_router = APIRouter(prefix="/insights")
 
 @insights_router.get("/projects")
-def return_insight_projects_chronological(language: str | None = None, skill: str | None = None, since_str: str | None = None):
+def return_insight_projects_chronological(language: str | None = None, skill: str | None = None, since_str: str | None = None, include_hierarchy: bool = False):
     """
     Chronologically lists all projects that have been analyzed. Can filter by language, skill, and by projects completed after a date.
 
-    API call is "/insights/projects?language=str&skill=str&since_str=str
+    API call is "/insights/projects?language=str&skill=str&since_str=str&include_hierarchy=bool
 
     Args:
         language (str): languages to filter projects by
         skill (str): skill to filter projects by
         since_str (str): string date to filter projects from after that date
+        include_hierarchy (bool): also return each project's full file hierarchy (empty otherwise;
+            file_analysis summarizes it)
 
     Returns:
         List[dict]: A list of dictionaries representing projects in the format of a ProjectInsight. The list is projects in chronological order.
@@ -36,13 +40,14 @@ def return_insight_projects_chronological(language: str | None = None, skill: st
 
     since_dt = parse_date(since_str)
 
-    projects = list_project_insights(storage_path=storage_path)
     projects = filter_insights(
-        projects,
+        insight_index(storage_path=storage_path),
         language=language,
         skill=skill,
         since=since_dt,
     )
+    if include_hierarchy:
+        projects = load_hierarchies(projects, storage_path=storage_path)
     #cannot return namespaces or ProjectInsight objects through api calls so we need to convert to dicts
     filtered_projects = []
     for p in projects:
@@ -67,18 +72,10 @@ def return_insights_skills_chronological(skill: str | None = None, since_str: st
 
     since_dt = parse_date(since_str)
 
-    history = list_skill_history(storage_path=storage_path)
-    if since_dt or skill:
-        filtered = []
-        for entry in history:
-            when = parse_date(entry.get("analyzed_at"))
-            if since_dt and when and when < since_dt:
-                continue
-            if skill and all(skill.lower() != s.lower() for s in entry.get("skills", [])):
-                continue
-            filtered.append(entry)
-        history = filtered
-    return history
+    if not (since_dt or skill):
+        return list_skill_history(storage_path=storage_path)
+    matches = filter_insights(insight_index(storage_path=storage_path), skill=skill, since=since_dt)
+    return [skill_history_entry(insight) for insight in matches]
 
 @insights_router.get("/top-projects")
 def return_top_project_histories(top_n: int = 3, contributor: str | None = None, active_only: bool = False):
@@ -1,10 +1,9 @@
 import datetime
+import hashlib
 import json
-import io
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-import uuid
 from fastapi import APIRouter, UploadFile, HTTPException, Query, status
 from fastapi.responses import FileResponse
 import zipfile
@@ -14,6 +13,7 @@ from src.core.project_duration_estimation import format_duration
 from src.storage import saved_projects
 from src.storage.saved_projects import list_saved_projects
 from src.core.app_context import runtimeAppContext
+from src.core.upload_sessions import UploadHandle, UploadRegistry
 from src.storage.saved_projects import *
 from src.config.project_thumbnails import ThumbnailManager
 from src.reporting.project_insights import (
@@ -27,6 +27,10 @@ projectsRouter = APIRouter(
     prefix="/projects"
 )
 
+# Uploaded archives live in <tmp>/devdoc_uploads until idle for UPLOAD_TTL_SECONDS.
+upload_registry = UploadRegistry()
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MB
+
 
 @dataclass
 class _ResolvedProjectIdentifier:
@@ -83,27 +87,51 @@ def _resolve_project_identifier(identifier: str) -> _ResolvedProjectIdentifier:
         ),
     )
 
-def _persist_uploaded_zip(upload_file: UploadFile, payload: bytes) -> Path:
+async def _persist_uploaded_zip(upload_file: UploadFile) -> UploadHandle:
     """
-    Persist an uploaded ZIP payload to a temp file and return its path.
+    Stream an uploaded ZIP to disk under a new upload handle.
+
+    The upload is copied in UPLOAD_CHUNK_SIZE chunks and hashed as it is
+    written, then validated from the file on disk, so memory use does not grow
+    with the archive size.
 
     Args:
-        upload_file: Source upload metadata.
-        payload: Raw ZIP bytes.
+        upload_file: Incoming upload.
 
     Returns:
-        Path: Filesystem path to persisted ZIP.
+        UploadHandle: Handle of the persisted ZIP (id, path, size, hash).
+
+    Raises:
+        HTTPException: 400 if the upload is empty or not a ZIP file.
     """
-    upload_dir = Path(tempfile.gettempdir()) / "devdoc_uploads"
-    upload_dir.mkdir(parents=True, exist_ok=True)
+    upload_id, out_path = upload_registry.new_upload_path()
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with out_path.open("wb") as out:
+            while chunk := await upload_file.read(UPLOAD_CHUNK_SIZE):
+                out.write(chunk)
+                digest.update(chunk)
+                size += len(chunk)
+        valid = size > 0 and zipfile.is_zipfile(out_path)
+    except BaseException:
+        out_path.unlink(missing_ok=True)
+        raise
+    if not valid:
+        out_path.unlink(missing_ok=True)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="file is not a zip file",
+        )
 
     source_name = Path(upload_file.filename or "uploaded_project.zip").name
-    source_stem = Path(source_name).stem or "uploaded_project"
-    source_suffix = Path(source_name).suffix or ".zip"
-    out_name = f"{source_stem}_{uuid.uuid4().hex[:8]}{source_suffix}"
-    out_path = upload_dir / out_name
-    out_path.write_bytes(payload)
-    return out_path
+    return upload_registry.register(
+        upload_id,
+        filename=source_name,
+        project_name=Path(source_name).stem or "uploaded_project",
+        size=size,
+        sha256=digest.hexdigest(),
+    )
 
 
 def _allowed_project_save_dirs() -> tuple[Path, ...]:
@@ -131,26 +159,25 @@ async def upload_project(upload_file: UploadFile) -> dict:
     """
     Upload a ZIP project file (new snapshot) for later analysis.
 
-    Stores the uploaded ZIP as a temporary file and tracks that path in
-    ``runtimeAppContext.currently_uploaded_file`` for follow-up ``/analyze`` calls.
+    Stores the uploaded ZIP under a new upload handle and returns its
+    ``upload_id``; pass it to ``/analyze?upload_id=...`` so concurrent uploads
+    never overwrite each other. The upload is also tracked in
+    ``runtimeAppContext.currently_uploaded_file`` for callers that omit the id.
     """
-    payload = await upload_file.read()
-    await upload_file.close()
-    if not payload or not zipfile.is_zipfile(io.BytesIO(payload)):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="file is not a zip file",
-        )
-
-    persisted_zip = _persist_uploaded_zip(upload_file, payload)
-    source_stem = Path(upload_file.filename or "uploaded_project.zip").stem or "uploaded_project"
-    runtimeAppContext.currently_uploaded_file = persisted_zip
-    runtimeAppContext.currently_uploaded_project_name = source_stem
+    try:
+        handle = await _persist_uploaded_zip(upload_file)
+    finally:
+        await upload_file.close()
+    runtimeAppContext.currently_uploaded_file = Path(handle.path)
+    runtimeAppContext.currently_uploaded_project_name = handle.project_name
     return {
         "status": "ok",
+        "upload_id": handle.upload_id,
         "filename": upload_file.filename,
-        "stored_path": str(persisted_zip),
-        "project_name": source_stem,
+        "stored_path": handle.path,
+        "project_name": handle.project_name,
+        "size": handle.size,
+        "sha256": handle.sha256,
     }
 
 @projectsRouter.get("/")
@@ -172,6 +199,22 @@ def return_all_saved_projects() -> list:
 
     return saved_projects
 
+@projectsRouter.get("/summaries")
+def return_project_summaries() -> list:
+    """
+    List saved projects with their listing fields, without loading any analysis JSON.
+
+    API call is ``GET /projects/summaries``.
+
+    Returns:
+        list: ``{"project_name", "project_type", "languages", "skills",
+        "version_count", "updated_at"}`` per project, most recently updated first.
+    """
+    summaries = runtimeAppContext.store.list_project_summaries()
+    for summary in summaries:
+        summary["project_name"] = Path(summary["project_name"]).stem
+    return summaries
+
 @projectsRouter.get("/{id}")
 def get_project_by_name(id: str) -> dict:
     """
@@ -279,7 +279,7 @@ class get_contributors_percentages_per_person:
             return self.project_info
         return "Data unsuccessfully collected"
     
-def contribution_percentages_from_local(project_path: str | Path, *, include_unattributed: bool = True, project_name: str = None,) -> Dict[str, Any]:
+def contribution_percentages_from_local(project_path: str | Path, *, include_unattributed: bool = True, project_name: str = None, inventory=None,) -> Dict[str, Any]:
     """
     Calculates per-contributor percentage contributions for a local, non-Git project
     based on detected individual file ownership.
@@ -288,6 +288,7 @@ def contribution_percentages_from_local(project_path: str | Path, *, include_una
         project_path: Path to the local project directory.
         include_unattributed: Whether to include unattributed files in calculations.
         project_name: Optional display name for the project.
+        inventory: Optional ProjectInventory of project_path shared with other analysis stages.
 
     Returns:
         Dict[str, Any]: A summary dictionary containing project metadata and
@@ -298,7 +299,7 @@ def contribution_percentages_from_local(project_path: str | Path, *, include_una
     if project_name is None:
         project_name = root.name  # Get project name from directory
         
-    summary = detect_individual_contributions(project_path)
+    summary = detect_individual_contributions(project_path, inventory=inventory)
     contributors = summary.get("contributors", {})
 
     items = (
@@ -326,13 +327,15 @@ def contribution_percentages_from_local(project_path: str | Path, *, include_una
         "contributors": filtered
     }
     
-def contribution_summary(project_path: str | Path) -> Dict[str, Any]:
+def contribution_summary(project_path: str | Path, inventory=None) -> Dict[str, Any]:
     """
     Determines the appropriate contribution analysis method and returns a unified
     contribution summary for the given project path.
 
     Args:
         project_path: Path to the project directory to analyze.
+        inventory: Optional ProjectInventory of project_path; used by the local
+            (file-based) path so the tree is not walked again.
 
     Returns:
         Dict[str, Any]: A normalized summary dictionary containing project metadata
@@ -373,4 +376,4 @@ def contribution_summary(project_path: str | Path) -> Dict[str, Any]:
         }
 
     # Fallback to non-git / local contributions
-    return contribution_percentages_from_local(root, project_name=project_name) 
+    return contribution_percentages_from_local(root, project_name=project_name, inventory=inventory) 
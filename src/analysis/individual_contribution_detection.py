@@ -95,7 +95,7 @@ def contributor_names_from_files(root: Path) -> List[str]:
                 seen[key] = n.strip()
     return list(seen.values())
 
-def files_to_owner_map(root: Path, extractor: FileMetadataExtractor) -> Dict[str, Optional[str]]:
+def files_to_owner_map(root: Path, extractor: FileMetadataExtractor, inventory=None) -> Dict[str, Optional[str]]:
     
     """
     Builds a mapping of relative file paths to detected file owners using metadata.
@@ -103,6 +103,8 @@ def files_to_owner_map(root: Path, extractor: FileMetadataExtractor) -> Dict[str
     Args:
         root: Root directory of the project to scan.
         extractor: Metadata extractor used to determine file authorship.
+        inventory: Optional ProjectInventory of root. When given, the owners it
+            recorded are used and the tree is not walked again.
 
     Returns:
         Dict[str, Optional[str]]: A dictionary mapping POSIX-style relative file paths
@@ -111,6 +113,14 @@ def files_to_owner_map(root: Path, extractor: FileMetadataExtractor) -> Dict[str
     
     ignore = {"CONTRIBUTORS", "AUTHORS", "README", "README.MD", "README.TXT"}
     mapping: Dict[str, Optional[str]] = {}
+    if inventory is not None:
+        for entry in inventory.files():
+            if ".git" in (root / entry.rel_path).parts or entry.name.upper() in ignore:
+                continue
+            owner = entry.owner
+            mapping[entry.rel_path] = owner if owner and owner not in ("Unknown", "Author Unknown", "") else None
+        return mapping
+
     for p in root.rglob("*"):
         if not p.is_file() or ".git" in p.parts:
             continue
@@ -164,7 +174,8 @@ def detect_individual_contributions_local(
     project_root: Path,
     *,
     extractor: Optional[FileMetadataExtractor] = None,
-    include_unattributed: bool = True
+    include_unattributed: bool = True,
+    inventory=None,
 ) -> Dict[str, Dict]:
     
     """
@@ -180,6 +191,7 @@ def detect_individual_contributions_local(
         extractor: Optional metadata extractor used to determine file authorship.
         include_unattributed: Whether to include files that cannot be attributed
             to a specific contributor.
+        inventory: Optional ProjectInventory of project_root used instead of re-walking it.
 
     Returns:
         Dict[str, Dict]: A dictionary keyed by contributor name, where each value
@@ -189,7 +201,7 @@ def detect_individual_contributions_local(
     extractor = extractor or FileMetadataExtractor(project_root)
 
     contrib_names = contributor_names_from_files(project_root)
-    file_map = files_to_owner_map(project_root, extractor)
+    file_map = files_to_owner_map(project_root, extractor, inventory=inventory)
 
     owners = [v for v in set(file_map.values()) if v is not None]
     owner_to_canon, contrib_to_canon = build_canonical(owners, contrib_names)
@@ -291,7 +303,7 @@ def canonical_for_git(name: Optional[str], email: Optional[str], contribs: List[
     #6: No name or email
     return "<unknown>"
 
-def detect_individual_contributions_git(project_root: Path, *, repo: Optional[Repo] = None) -> Dict[str, Dict]:
+def detect_individual_contributions_git(project_root: Path, *, repo: Optional[Repo] = None, inventory=None) -> Dict[str, Dict]:
     
     """
     Detect individual contributions using Git history.
@@ -304,6 +316,7 @@ def detect_individual_contributions_git(project_root: Path, *, repo: Optional[Re
     Args:
         project_root: Root directory of the Git project to analyze.
         repo: Optional pre-initialized Git repository instance.
+        inventory: Optional ProjectInventory of project_root used to find untracked files.
 
     Returns:
         Dict[str, Dict]: A dictionary keyed by contributor name, where each value
@@ -388,7 +401,7 @@ def detect_individual_contributions_git(project_root: Path, *, repo: Optional[Re
         buckets[canonical]["files_owned"].append(rel)
 
     # Handle untracked files (exist on disk but not in git)
-    file_map = files_to_owner_map(project_root, FileMetadataExtractor(project_root))
+    file_map = files_to_owner_map(project_root, FileMetadataExtractor(project_root), inventory=inventory)
     for rel in file_map.keys():
         if rel not in tracked and rel not in buckets[UNATTRIBUTED]["files_owned"]:
             buckets[UNATTRIBUTED]["files_owned"].append(rel)
@@ -404,7 +417,7 @@ def detect_individual_contributions_git(project_root: Path, *, repo: Optional[Re
         for person, stats in buckets.items()
     }
 
-def detect_individual_contributions(project_path: str | Path, *, extractor: Optional[FileMetadataExtractor] = None) -> Dict:
+def detect_individual_contributions(project_path: str | Path, *, extractor: Optional[FileMetadataExtractor] = None, inventory=None) -> Dict:
     """
     Entry point: detect individual contributions for collaborative projects.
 
@@ -415,6 +428,7 @@ def detect_individual_contributions(project_path: str | Path, *, extractor: Opti
     Args:
         project_path: Path to the project directory to analyze.
         extractor: Optional metadata extractor used for local contribution detection.
+        inventory: Optional ProjectInventory of project_path shared with other analysis stages.
 
     Returns:
         Dict: A dictionary containing collaboration status, detection mode
@@ -425,7 +439,7 @@ def detect_individual_contributions(project_path: str | Path, *, extractor: Opti
     if not root.exists() or not root.is_dir():
         raise ValueError(f"Project path does not exist or is not a directory: {project_path}")
 
-    pt = detect_project_type(root)
+    pt = detect_project_type(root, inventory=inventory)
     if pt.get("project_type") != "collaborative":
         raise ValueError("Project is not collaborative")
 
@@ -433,7 +447,7 @@ def detect_individual_contributions(project_path: str | Path, *, extractor: Opti
     if mode == "git":
         try:
             with Repo(root) as repo:
-                contributors = detect_individual_contributions_git(root, repo=repo)
+                contributors = detect_individual_contributions_git(root, repo=repo, inventory=inventory)
                 return {"is_collaborative": True, "mode": "git", "contributors": contributors}
         except InvalidGitRepositoryError as e:
             # project_type_detection said "git" but repo isn't actually valid
@@ -447,5 +461,5 @@ def detect_individual_contributions(project_path: str | Path, *, extractor: Opti
             raise RuntimeError(f"Git contribution detection failed for {root}: {e}") from e
 
     # local mode (or fallback)
-    contributors = detect_individual_contributions_local(root, extractor=extractor)
+    contributors = detect_individual_contributions_local(root, extractor=extractor, inventory=inventory)
     return {"is_collaborative": True, "mode": "local", "contributors": contributors}
\ No newline at end of file
@@ -3,7 +3,8 @@ Shared helpers for working with project insights.
 
 Responsibilities:
 - Parse dates into timezone-aware datetimes
-- Filter insight objects by language, skill, or recency
+- Filter insight objects by language, skill, or recency, optionally through a
+  precomputed inverted index (InsightIndex)
 - Compute contribution-first ranking scores and expose rationale components
 
 These helpers are reusable anywhere we need consistent insight filtering and
@@ -12,8 +13,9 @@ scoring logic.
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from datetime import datetime, timezone
-from typing import Iterable
+from typing import Dict, Iterable, List, Set
 
 def parse_date(value: str | None) -> datetime | None:
     """Parse a date/datetime string into a timezone-aware datetime in UTC."""
@@ -27,6 +29,70 @@ def parse_date(value: str | None) -> datetime | None:
         dt = dt.replace(tzinfo=timezone.utc)
     return dt.astimezone(timezone.utc)
 
+class InsightIndex:
+    """
+    Inverted index over a fixed list of insight objects.
+
+    Maps each lower-cased language and skill to the positions of the insights
+    that list it, and keeps the parseable ``analyzed_at`` timestamps sorted so
+    ``since`` becomes a binary search. Filtering is then a set intersection
+    instead of a scan with string compares. The index is immutable; build a
+    new one when the insights change.
+
+    Attributes:
+        insights (tuple): The indexed insights, in their original order.
+    """
+
+    def __init__(self, insights: Iterable):
+        """
+        Args:
+            insights (Iterable): Insight-like objects exposing ``languages``,
+                ``skills`` and ``analyzed_at``.
+        """
+        self.insights = tuple(insights)
+        self._by_language: Dict[str, Set[int]] = {}
+        self._by_skill: Dict[str, Set[int]] = {}
+        dated: List[tuple[datetime, int]] = []
+        self._undated: Set[int] = set()
+        for pos, ins in enumerate(self.insights):
+            for lang in ins.languages or []:
+                self._by_language.setdefault(lang.lower(), set()).add(pos)
+            for skl in ins.skills or []:
+                self._by_skill.setdefault(skl.lower(), set()).add(pos)
+            analyzed = parse_date(ins.analyzed_at)
+            if analyzed is None:
+                self._undated.add(pos)
+            else:
+                dated.append((analyzed, pos))
+        dated.sort(key=lambda item: item[0])
+        self._dates = [when for when, _ in dated]
+        self._dated_positions = [pos for _, pos in dated]
+
+    def filter(
+        self,
+        *,
+        language: str | None = None,
+        skill: str | None = None,
+        since: datetime | None = None,
+    ) -> list:
+        """
+        Same semantics as ``filter_insights``; results keep the indexed order.
+        """
+        candidates: Set[int] | None = None
+        if language:
+            candidates = set(self._by_language.get(language.lower(), ()))
+        if skill:
+            matches = self._by_skill.get(skill.lower(), set())
+            candidates = matches.copy() if candidates is None else candidates & matches
+        if since:
+            # Insights without a parseable date are never excluded by ``since``.
+            recent = set(self._dated_positions[bisect_left(self._dates, since):]) | self._undated
+            candidates = recent if candidates is None else candidates & recent
+        if candidates is None:
+            return list(self.insights)
+        return [self.insights[pos] for pos in sorted(candidates)]
+
+
 def filter_insights(
     insights: Iterable,
     *,
@@ -34,7 +100,14 @@ def filter_insights(
     skill: str | None = None,
     since: datetime | None = None,
 ):
-    """Filter insight objects by language, skill, and a minimum analyzed_at timestamp."""
+    """
+    Filter insight objects by language, skill, and a minimum analyzed_at timestamp.
+
+    ``insights`` may be an ``InsightIndex``, in which case the index answers
+    the query without scanning.
+    """
+    if isinstance(insights, InsightIndex):
+        return insights.filter(language=language, skill=skill, since=since)
     language_l = language.lower() if language else None
     skill_l = skill.lower() if skill else None
     filtered = []
@@ -108,4 +181,4 @@ def compute_composite_score(
         "tie_break": tie_break,
     }
 
-__all__ = ["parse_date", "filter_insights", "compute_composite_score"]
+__all__ = ["parse_date", "InsightIndex", "filter_insights", "compute_composite_score"]
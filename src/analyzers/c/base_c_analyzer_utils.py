@@ -1,6 +1,16 @@
-
-from typing import Generator, Callable, Dict, Any, Iterable
+from typing import Generator, Callable, Dict, Any, Iterable, List, Sequence
 import re
+import threading
+
+from tree_sitter import Language, Parser, Query, QueryCursor
+
+# Per-process pool of tree-sitter objects, shared by every analyzer instance:
+# languages and compiled queries are immutable and built once per process;
+# parsers are not thread-safe, so each thread gets its own per language.
+_languages: Dict[str, Language] = {}
+_queries: Dict[tuple, Query] = {}
+_pool_lock = threading.Lock()
+_thread_parsers = threading.local()
 
 
 class cutilities:
@@ -8,58 +18,202 @@ class cutilities:
     Utility functions for C-family language analysis (C++, C#).
     Provides tree traversal, complexity calculation, and pattern recognition helpers.
     """
-    
+
+    @staticmethod
+    def language(name: str, loader: Callable[[], Any]) -> Language:
+        """
+        Return this process's tree-sitter Language for name, loading it on first use.
+
+        Args:
+            name: Key for the language (e.g. "cpp").
+            loader: Grammar entry point, such as tree_sitter_cpp.language.
+
+        Returns:
+            The shared Language object.
+        """
+        lang = _languages.get(name)
+        if lang is None:
+            with _pool_lock:
+                lang = _languages.get(name)
+                if lang is None:
+                    lang = _languages[name] = Language(loader())
+        return lang
+
+    @staticmethod
+    def parser(name: str, loader: Callable[[], Any]) -> Parser:
+        """
+        Return the calling thread's parser for a language, creating it on first use.
+
+        Args:
+            name: Key for the language (e.g. "cpp").
+            loader: Grammar entry point, such as tree_sitter_cpp.language.
+
+        Returns:
+            A Parser that only this thread uses.
+        """
+        parsers = getattr(_thread_parsers, "parsers", None)
+        if parsers is None:
+            parsers = _thread_parsers.parsers = {}
+        parser = parsers.get(name)
+        if parser is None:
+            parser = parsers[name] = Parser(cutilities.language(name, loader))
+        return parser
+
+    @staticmethod
+    def query(name: str, loader: Callable[[], Any], patterns: Dict[str, Sequence[str]]) -> Query:
+        """
+        Compile (once per process) a query capturing nodes of the given types.
+
+        Node types the grammar does not define are left out, so the same
+        capture table can be used across grammar versions.
+
+        Args:
+            name: Key for the language (e.g. "cpp").
+            loader: Grammar entry point, such as tree_sitter_cpp.language.
+            patterns: Capture name -> node types or raw query patterns; a raw
+                pattern (starting with "(") is used as-is.
+
+        Returns:
+            The compiled Query.
+        """
+        key = (name, tuple((capture, tuple(kinds)) for capture, kinds in patterns.items()))
+        query = _queries.get(key)
+        if query is None:
+            lang = cutilities.language(name, loader)
+            lines = []
+            for capture, kinds in patterns.items():
+                for kind in kinds:
+                    if kind.startswith("("):
+                        lines.append(f"{kind} @{capture}")
+                    elif lang.id_for_node_kind(kind, True):
+                        lines.append(f"({kind}) @{capture}")
+            query = Query(lang, "\n".join(lines))
+            with _pool_lock:
+                query = _queries.setdefault(key, query)
+        return query
+
+    @staticmethod
+    def captures(query: Query, root) -> Dict[str, List]:
+        """
+        Run a query once over a tree and group the captured nodes by capture name.
+
+        Args:
+            query: Query from cutilities.query.
+            root: Tree-sitter node to search (usually the root node).
+
+        Returns:
+            Capture name -> nodes, each list in depth-first (tree_walk) order.
+        """
+        return {
+            name: sorted(nodes, key=lambda n: (n.start_byte, -n.end_byte))
+            for name, nodes in QueryCursor(query).captures(root).items()
+        }
+
     @staticmethod
     def tree_walk(node) -> Generator:
         """
-        Recursively traverse a tree-sitter parse tree in depth-first order.
-        
+        Traverse a tree-sitter parse tree in depth-first order, without recursion.
+
         Args:
             node: Tree-sitter node to start traversal from
-            
+
         Yields:
             Each node in the tree, starting with the input node
         """
-        yield node
-        for child in node.children:
-            yield from cutilities.tree_walk(child)
+        cursor = node.walk()
+        depth = 0
+        while True:
+            yield cursor.node
+            if cursor.goto_first_child():
+                depth += 1
+                continue
+            while depth and not cursor.goto_next_sibling():
+                cursor.goto_parent()
+                depth -= 1
+            if not depth:
+                return
 
     @staticmethod
     def calculate_loop_depth(node) -> int:
         """
         Calculate maximum loop nesting depth within a function.
         Used for cyclomatic complexity analysis.
-        
+
         Args:
             node: Tree-sitter node representing a function/method
-            
+
         Returns:
             Maximum depth of nested loops (0 if no loops)
         """
         max_depth = 0
-    
+
         def traverse(x, current_depth):
             nonlocal max_depth
-        
+
             if x.type in ("for_statement", "while_statement", "do_statement"):
                 current_depth += 1
                 max_depth = max(max_depth, current_depth)
-        
+
             for child in x.children:
                 traverse(child, current_depth)
-    
+
         traverse(node, 0)
         return max_depth
-    
+
+    @staticmethod
+    def function_loop_depths(functions: Sequence, loops: Iterable) -> List[int]:
+        """
+        Maximum loop nesting inside each function, computed from byte ranges.
+
+        Gives the same result as calculate_loop_depth for every function, but
+        in one sweep over the captured nodes instead of a walk per function.
+
+        Args:
+            functions: Function nodes.
+            loops: Every loop node in the same tree.
+
+        Returns:
+            Loop depth for each function, in the order given.
+        """
+        events = sorted(
+            [(n.start_byte, -n.end_byte, True, i) for i, n in enumerate(functions)]
+            + [(n.start_byte, -n.end_byte, False, 0) for n in loops]
+        )
+        depths = [0] * len(functions)
+        open_loops: List[int] = []  # end bytes of loops enclosing the current node
+        open_functions: List[tuple] = []  # (end byte, index, loops open at entry)
+
+        def close_function() -> None:
+            _, index, entry_loops = open_functions.pop()
+            if open_functions:
+                _, parent, parent_loops = open_functions[-1]
+                depths[parent] = max(depths[parent], depths[index] + entry_loops - parent_loops)
+
+        for start, neg_end, is_function, index in events:
+            while open_loops and open_loops[-1] <= start:
+                open_loops.pop()
+            while open_functions and open_functions[-1][0] <= start:
+                close_function()
+            if is_function:
+                open_functions.append((-neg_end, index, len(open_loops)))
+            else:
+                open_loops.append(-neg_end)
+                if open_functions:
+                    _, innermost, entry_loops = open_functions[-1]
+                    depths[innermost] = max(depths[innermost], len(open_loops) - entry_loops)
+        while open_functions:
+            close_function()
+        return depths
+
     @staticmethod
     def is_special(name: str) -> bool:
         """
         Determine if a method name represents a special/magic method.
         Special methods include operators, destructors, and common overridable methods.
-        
+
         Args:
             name: Method name as string
-            
+
         Returns:
             True if the method is considered special, False otherwise
         """
@@ -68,5 +222,3 @@ class cutilities:
         name.startswith("~") or
         name in {"toString", "clone", "equals", "begin", "end"}
         )
-    
-    
\ No newline at end of file
@@ -12,11 +12,16 @@ Detects:
 - Polymorphism (vtables, function pointers)
 """
 
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, Set, Tuple
 # from pycparser import c_parser, c_ast found this late in the run, will refactor into later
 import re
 
+# Bump whenever per-file report output changes; cached reports from other
+# versions are then ignored.
+ANALYZER_VERSION = "3"
+
 # Common naming patterns for constructor/destructor like methods
 CONSTRUCTOR_PATTERNS = [
     r'.*_create$', r'.*_new$', r'.*_init$', r'.*_alloc$',
@@ -34,11 +39,263 @@ VTABLE_PATTERNS = [
     r'.*[_]?methods$', r'.*[_]?funcs$', r'.*[_]?interface$'
 ]
 
+# Tokenizer: comments are dropped, string and char literals collapse to a '"'
+# token, preprocessor lines are consumed whole (only #include targets and
+# library calls in #define bodies are kept), and every other token is a word
+# or one of the punctuators below.
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<comment>//[^\n]*|/\*[\s\S]*?(?:\*/|\Z))
+    |(?P<string>"(?:[^"\\\n]|\\[\s\S])*"?|'(?:[^'\\\n]|\\[\s\S])*'?)
+    |(?P<directive>^[ \t]*\#(?:[^\n\\]|\\[\s\S])*)
+    |(?P<token>\w+|[{}()\[\];*=,])
+    """,
+    re.VERBOSE | re.MULTILINE,
+)
+_INCLUDE_RE = re.compile(r'[ \t]*#\s*include\s*[<"]([^>"]+)[>"]')
+_DEFINE_RE = re.compile(r'[ \t]*#\s*define\b')
+_MACRO_CALL_RE = re.compile(r'\b(malloc|calloc|realloc|qsort|bsearch)\s*\(')
+
+_CONSTRUCTOR_RE = re.compile("|".join(f"(?:{p})" for p in CONSTRUCTOR_PATTERNS))
+_DESTRUCTOR_RE = re.compile("|".join(f"(?:{p})" for p in DESTRUCTOR_PATTERNS))
+_VTABLE_RE = re.compile("|".join(f"(?:{p})" for p in VTABLE_PATTERNS), re.IGNORECASE)
+
+# Words that can precede "(...) {" at file scope without naming a function
+_NOT_FUNCTION_NAMES = {'if', 'while', 'for', 'switch', 'return', 'sizeof', 'struct', '__attribute__', '__declspec'}
+_LOOP_KEYWORDS = {'for', 'while', 'do'}
+_PRIMITIVE_TYPES = {'int', 'char', 'float', 'double', 'long', 'short', 'void'}
+_ALLOCATORS = {'malloc', 'calloc', 'realloc'}
+_LIFECYCLE_VERBS = ('create', 'new', 'init', 'alloc')
+
+
+def _is_word(token: str) -> bool:
+    return token[0].isalnum() or token[0] == "_"
+
+
+def tokenize(source: str) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Split C source into tokens in one left-to-right pass.
+
+    Args:
+        source: C source code string.
+
+    Returns:
+        Tuple[List[str], List[str], List[str]]: The tokens, the #include targets
+        in order, and the allocator/qsort/bsearch calls made in #define bodies.
+    """
+    tokens: List[str] = []
+    includes: List[str] = []
+    macro_calls: List[str] = []
+    append = tokens.append
+    for match in _TOKEN_RE.finditer(source):
+        kind = match.lastgroup
+        if kind == "token":
+            append(match.group())
+        elif kind == "string":
+            append('"')
+        elif kind == "directive":
+            directive = match.group()
+            include = _INCLUDE_RE.match(directive)
+            if include:
+                includes.append(include.group(1))
+            elif _DEFINE_RE.match(directive):
+                macro_calls.extend(_MACRO_CALL_RE.findall(directive))
+    return tokens, includes, macro_calls
+
+
+@dataclass
+class _CScan:
+    """Everything analyze_source reports, gathered by scan_tokens in one pass."""
+
+    structs: List[Dict[str, Any]] = field(default_factory=list)
+    functions: List[Tuple[str, int]] = field(default_factory=list)  # (name, max loop depth)
+    arrays: int = 0
+    dynamic_memory: int = 0
+    uses_qsort: bool = False
+    uses_bsearch: bool = False
+    opaque_typedefs: List[str] = field(default_factory=list)  # typedef struct X X;
+    pointer_typedefs: int = 0  # typedef struct X *Y;
+
+
+class _StructFrame:
+    """An open struct body while scan_tokens reads it."""
+
+    def __init__(self, struct: Dict[str, Any], depth: int):
+        self.struct = struct  # the entry in _CScan.structs
+        self.depth = depth  # brace depth of the body
+        self.statement: List[str] = []  # tokens of the member being read
+        self.braced = False  # the member contains a nested body (struct/union/enum)
+
+    def end_member(self) -> None:
+        """Classify the member declaration just read: the first one may name a base struct."""
+        words = self.statement if not self.braced and all(_is_word(t) for t in self.statement) else []
+        if self.struct["first_member"] is None:
+            member = words[1:] if words[:1] == ["struct"] else words
+            self.struct["first_member"] = member[0] if len(member) == 2 else ""
+        if len(words) == 3 and words[0] == "struct":
+            self.struct["nested_structs"].append((words[1], words[2]))
+        self.statement = []
+        self.braced = False
+
+
+def scan_tokens(tokens: List[str]) -> _CScan:
+    """
+    Find structs, function definitions, function pointers and loop nesting in one scan.
+
+    Braces are matched as they are read; struct bodies still open at the end
+    (unbalanced braces, e.g. around #ifdef branches) are closed there. A brace
+    opened by `struct [Name]` is a
+    struct body; one opened right after `name(...)` outside any other block
+    (extern "C" blocks aside) is a function body. Inside function bodies each
+    for/while/do opens a loop that ends with its braced body, or at the end of
+    its statement when the body has no braces; the `while` closing a do-loop
+    opens nothing.
+
+    Args:
+        tokens: Tokens from tokenize().
+
+    Returns:
+        _CScan: The collected facts.
+    """
+    scan = _CScan()
+    n = len(tokens)
+    braces: List[str] = []  # kind of each open brace: "struct", "function", "extern" or "block"
+    code_depth = 0  # open braces other than extern "C" blocks
+    frames: List[_StructFrame] = []  # open struct bodies, innermost last
+    parens: List[int] = []  # indexes of open "(" tokens
+    call_name, call_end = None, -1  # word before the last closed top-level (...) and index of its ")"
+    function = None  # [name, body depth, deepest loop]
+    loops: List[Tuple[str, int, bool]] = []  # (keyword, brace depth that ends it, braced body)
+    loop_header = None  # (keyword, open parens when read) while reading a for/while header
+    loop_body = None  # loop keyword whose body starts at the next token
+    do_tail = False  # the next "while" closes a do-loop
+
+    for i in range(n):
+        tok = tokens[i]
+
+        if frames and len(braces) == frames[-1].depth and tok not in ";{}":
+            frames[-1].statement.append(tok)
+
+        if loop_body is not None:
+            braced = tok == "{"
+            loops.append((loop_body, len(braces) + braced, braced))
+            function[2] = max(function[2], len(loops))
+            loop_body = None
+        if do_tail:
+            do_tail = False
+            if tok == "while":
+                loop_header = ("", len(parens))
+                continue
+
+        if tok == "(":
+            frame = frames[-1] if frames else None
+            if (frame is not None and len(braces) == frame.depth and not parens
+                    and i + 3 < n and tokens[i + 1] == "*" and _is_word(tokens[i + 2]) and tokens[i + 3] == ")"):
+                frame.struct["methods"].append(tokens[i + 2])
+            parens.append(i)
+        elif tok == ")":
+            if parens:
+                opened = parens.pop()
+                if not parens:
+                    call_name = tokens[opened - 1] if opened and _is_word(tokens[opened - 1]) else None
+                    call_end = i
+            if loop_header is not None and len(parens) == loop_header[1]:
+                loop_body = loop_header[0] or None
+                loop_header = None
+        elif tok == ";":
+            if function is not None and not parens:
+                closed_do = False
+                while loops and not loops[-1][2] and loops[-1][1] == len(braces):
+                    closed_do = loops.pop()[0] == "do" or closed_do
+                do_tail = closed_do
+            if frames and len(braces) == frames[-1].depth:
+                frames[-1].end_member()
+        elif tok == "{":
+            if frames and len(braces) == frames[-1].depth:
+                frames[-1].braced = True
+            if i and (tokens[i - 1] == "struct" or (i > 1 and tokens[i - 2] == "struct" and _is_word(tokens[i - 1]))):
+                kind = "struct"
+            elif i > 1 and tokens[i - 2] == "extern" and tokens[i - 1] == '"':
+                kind = "extern"
+            elif (code_depth == 0 and call_end == i - 1 and call_name
+                    and call_name not in _NOT_FUNCTION_NAMES and not call_name[0].isdigit()):
+                kind = "function"
+            else:
+                kind = "block"
+            braces.append(kind)
+            if kind != "extern":
+                code_depth += 1
+            if kind == "struct":
+                tag = tokens[i - 1] if tokens[i - 1] != "struct" else None
+                struct = {"tag": tag, "name": tag, "methods": [], "nested_structs": [], "first_member": None}
+                scan.structs.append(struct)
+                frames.append(_StructFrame(struct, len(braces)))
+            elif kind == "function":
+                function = [call_name, len(braces), 0]
+                loops = []
+        elif tok == "}":
+            if not braces:
+                continue
+            depth = len(braces)
+            kind = braces.pop()
+            if kind != "extern":
+                code_depth -= 1
+            if function is not None:
+                closed_do = False
+                if loops and loops[-1][2] and loops[-1][1] == depth:
+                    closed_do = loops.pop()[0] == "do"
+                while loops and not loops[-1][2] and loops[-1][1] == depth - 1:
+                    closed_do = loops.pop()[0] == "do" or closed_do
+                do_tail = closed_do
+                if kind == "function":
+                    scan.functions.append((function[0], function[2]))
+                    function, loops, loop_header, loop_body, do_tail = None, [], None, None, False
+            if kind == "struct":
+                frame = frames.pop()
+                if frame.statement:
+                    frame.end_member()
+                alias = tokens[i + 1] if i + 1 < n and _is_word(tokens[i + 1]) else None
+                frame.struct["name"] = frame.struct["tag"] or alias or "anonymous"
+        elif function is not None and tok in _LOOP_KEYWORDS:
+            if tok == "do":
+                loop_body = "do"
+            else:
+                loop_header = (tok, len(parens))
+        elif i + 1 < n:
+            nxt = tokens[i + 1]
+            if nxt == "(":
+                if tok in _ALLOCATORS:
+                    scan.dynamic_memory += 1
+                elif tok == "qsort":
+                    scan.uses_qsort = True
+                elif tok == "bsearch":
+                    scan.uses_bsearch = True
+            elif nxt == "[" and _is_word(tok):
+                if i + 2 < n and (tokens[i + 2] == "]" or (
+                        tokens[i + 2][0].isdigit() and i + 3 < n and tokens[i + 3] == "]")):
+                    scan.arrays += 1
+            elif tok == "typedef" and nxt == "struct" and i + 4 < n and _is_word(tokens[i + 2]):
+                name = tokens[i + 2]
+                if tokens[i + 3] == name and tokens[i + 4] == ";":
+                    scan.opaque_typedefs.append(name)
+                elif tokens[i + 3] == "*" and _is_word(tokens[i + 4]) and i + 5 < n and tokens[i + 5] == ";":
+                    scan.pointer_typedefs += 1
+
+    for frame in reversed(frames):
+        if frame.statement:
+            frame.end_member()
+        frame.struct["name"] = frame.struct["tag"] or "anonymous"
+    return scan
+
+
 def analyze_source(source: str, path: Path) -> Dict[str, Any]:
     """
     Analyze a single C source file to detect object-oriented programming patterns
     and produce a canonical report compatible with the oop_aggregator.
 
+    The source is tokenized and scanned once (see tokenize and scan_tokens), so
+    the cost grows linearly with file size.
+
     Args:
         source: The full contents of the C source file as a string.
         path: Filesystem path to the source file being analyzed.
@@ -48,144 +305,83 @@ def analyze_source(source: str, path: Path) -> Dict[str, Any]:
         imports, data structure usage, complexity metrics, C-specific OOP features,
         and metadata describing the analyzed file.
     """
-    source_l = source.lower()
+    tokens, includes, macro_calls = tokenize(source)
+    scan = scan_tokens(tokens)
+    # Calls hidden in macro bodies, e.g. #define SORT(a, n) qsort(a, n, ...)
+    scan.dynamic_memory += sum(1 for call in macro_calls if call in _ALLOCATORS)
+    scan.uses_qsort = scan.uses_qsort or "qsort" in macro_calls
+    scan.uses_bsearch = scan.uses_bsearch or "bsearch" in macro_calls
+    identifiers = {t.lower() for t in set(tokens)}
 
-    includes = re.findall(r'#include\s*[<"]([^>"]+)[>"]', source)
-    struct_pattern = r'(?:typedef\s+)?struct\s+(\w+)?\s*\{([^}]+)\}\s*(\w+)?'
     struct_info = []
+    for struct in scan.structs:
+        struct_name = struct["name"] or struct["tag"] or "anonymous"
+        func_ptrs = struct["methods"]  # function pointers are methods
 
-    # Track constructors/destructors for lifecycle management
-    constructor_funcs = set()
-    destructor_funcs = set()
-
-    # Track all function definitions for complexity
-    total_functions = 0
-    functions_with_nested_loops = 0
-    max_loop_depth_overall = 0
-    #static_function_count = 0
-
-    for match in re.finditer(struct_pattern, source, re.DOTALL):
-        name1, body, name2 = match.group(1), match.group(2), match.group(3)
-        struct_name = name1 or name2 or "anonymous"
-
-        # function pointers
-        func_ptrs = re.findall(r'\(\s*\*\s*(\w+)\s*\)', body)
-
-        # nested structs
-        nested_structs = re.findall(r'struct\s+(\w+)\s+(\w+);', body)
-        
-        # Extract bases 
+        # Extract bases: a struct type as first member ("struct Shape base;" or "Shape base;")
         bases = []
-        # Look for struct type as first member (inheritance pattern)
-        #   Match: "struct Shape base;" or "Shape base;"
-        first_member_match = re.search(r'^\s*(?:struct\s+)?(\w+)\s+\w+\s*;', body.strip())
-        if first_member_match:
-            potential_base = first_member_match.group(1)
-            # Check if it's actually a struct name (not a primitive type)
-            if potential_base not in ['int', 'char', 'float', 'double', 'long', 'short', 'void']:
-                bases.append(potential_base)
-        
+        potential_base = struct["first_member"]
+        if potential_base and potential_base not in _PRIMITIVE_TYPES:
+            bases.append(potential_base)
+
         # Check if this is a vtable struct
-        is_vtable = any(re.match(pat, struct_name, re.IGNORECASE) 
-                       for pat in VTABLE_PATTERNS)
+        is_vtable = bool(_VTABLE_RE.match(struct_name))
         has_multiple_func_ptrs = len(func_ptrs) >= 2
-        
-        # Determine if has constructor
-        has_constructor = False
-        struct_l = struct_name.lower()
+
         # Look for functions like structname_create, structname_new, create_structname, etc.
-        constructor_searches = [
-            rf'\b{struct_l}_create\b', rf'\b{struct_l}_new\b',
-            rf'\b{struct_l}_init\b', rf'\b{struct_l}_alloc\b',
-            rf'\bcreate_{struct_l}\b', rf'\bnew_{struct_l}\b',
-            rf'\binit_{struct_l}\b', rf'\balloc_{struct_l}\b',
-        ]
-        for pat in constructor_searches:
-            if re.search(pat, source_l):
-                has_constructor = True
-                break
-        
+        struct_l = struct_name.lower()
+        has_constructor = any(
+            f"{struct_l}_{verb}" in identifiers or f"{verb}_{struct_l}" in identifiers
+            for verb in _LIFECYCLE_VERBS
+        )
+
         special_methods = []
         special_func_names = ['compare', 'equals', 'hash', 'clone', 'destroy', 'init']
         for name in func_ptrs:
             if any(special in name.lower() for special in special_func_names):
                 special_methods.append(name)
-        
 
         struct_info.append({
             "name": struct_name,
             "module": "N/A",  # C doesn't have modules
             "file_path": str(path),
             "bases": bases,
-            "methods": func_ptrs,  # function pointers are methods
+            "methods": func_ptrs,
             "has_constructor": has_constructor,
             "special_methods": special_methods,
             "private_attrs": [],  # C structs don't have private attrs
             "public_attrs": [],
             "is_vtable": is_vtable and has_multiple_func_ptrs,
-            "nested_structs": nested_structs,
+            "nested_structs": struct["nested_structs"],
         })
 
-    # Find function definitions for complexity analysis
-    func_pattern = r'^\s*(?P<static>\s+)?(?P<ret_type>[\w*\s]+?)\s*(?P<name>\w+)\s*\([^)]*\)\s*{'
-    for match in re.finditer(func_pattern, source, re.MULTILINE):
-        func_name = match.group(3)
-
-        # Skip common non-function patterns
-        if func_name in {'if', 'while', 'for', 'switch', 'return', 'sizeof', 'struct'}:
-            continue
-
-        # Check for constructor/destructor patterns
-        if any(re.match(p, func_name.lower()) for p in CONSTRUCTOR_PATTERNS):
+    # Track constructors/destructors for lifecycle management
+    constructor_funcs = set()
+    destructor_funcs = set()
+    functions_with_nested_loops = 0
+    max_loop_depth_overall = 0
+    for func_name, loop_depth in scan.functions:
+        if _CONSTRUCTOR_RE.match(func_name.lower()):
             constructor_funcs.add(func_name)
-
-        if any(re.match(p, func_name.lower()) for p in DESTRUCTOR_PATTERNS):
+        if _DESTRUCTOR_RE.match(func_name.lower()):
             destructor_funcs.add(func_name)
-
-        total_functions += 1
-
-        func_start = match.end()
-        brace_depth = 1
-        end = func_start
-
-        for i in range(func_start, len(source)):
-            if source[i] == '{':
-                brace_depth += 1
-            elif source[i] == '}':
-                brace_depth -= 1
-                if brace_depth == 0:
-                    end = i
-                    break
-
-        func_body = source[func_start:end]
-        loop_depth = calc_loop_depth(func_body)
-
         max_loop_depth_overall = max(max_loop_depth_overall, loop_depth)
         if loop_depth >= 2:
             functions_with_nested_loops += 1
 
     # Data structure detection from includes and code
     ds = {
-        "arrays": 0,                    # Static and dynamic arrays
-        "hash_tables": 0,               # Hash table usage
-        "linked_lists": 0,              # Linked list patterns
-        "trees": 0,                     # Tree structures
-        "queues": 0,                    # Queue implementations
-        "stacks": 0,                    # Stack usage
-        "uses_qsort": False,            # Standard library qsort
-        "uses_bsearch": False,          # Standard library bsearch
-        "dynamic_memory": 0,            # malloc/calloc/realloc count
-        "pointer_arrays": 0,            # Arrays of pointers
+        "arrays": scan.arrays,                  # Static and dynamic arrays
+        "hash_tables": 0,                       # Hash table usage
+        "linked_lists": 0,                      # Linked list patterns
+        "trees": 0,                             # Tree structures
+        "queues": 0,                            # Queue implementations
+        "stacks": 0,                            # Stack usage
+        "uses_qsort": scan.uses_qsort,          # Standard library qsort
+        "uses_bsearch": scan.uses_bsearch,      # Standard library bsearch
+        "dynamic_memory": scan.dynamic_memory,  # malloc/calloc/realloc count
+        "pointer_arrays": 0,                    # Arrays of pointers
     }
-        # Count array declarations
-    ds["arrays"] = len(re.findall(r'\w+\s*\[\s*\d*\s*\]', source))
-
-        # Count dynamic memory allocations
-    ds["dynamic_memory"] = (
-        source.count('malloc(') + 
-        source.count('calloc(') + 
-        source.count('realloc(')
-        )
 
     # Hash tables (look for actual usage, not just includes)
     if any('hash' in inc.lower() for inc in includes):
@@ -195,21 +391,15 @@ def analyze_source(source: str, path: Path) -> Dict[str, Any]:
     if any('queue' in inc.lower() or 'heap' in inc.lower() for inc in includes):
         ds["queues"] += 1
 
-    # Sorting (look for function call, not substring)
-    ds["uses_qsort"] = bool(re.search(r'\bqsort\s*\(', source))
-
-    # Binary search
-    ds["uses_bsearch"] = bool(re.search(r'\bbsearch\s*\(', source))
-
     complexity = {
-        "total_functions": total_functions,
+        "total_functions": len(scan.functions),
         "functions_with_nested_loops": functions_with_nested_loops,
         "max_loop_depth": max_loop_depth_overall,
     }
 
     # Additional C-specific data
     c_spec = {
-        "opaque_pointers": num_opaque_pointers(source),
+        "opaque_pointers": _count_opaque_pointers(scan),
         "vtable_structs": sum(1 for s in struct_info if s.get("is_vtable", False)),
         "constructor_functions": len(constructor_funcs),
         "destructor_functions": len(destructor_funcs),
@@ -232,33 +422,14 @@ def calc_loop_depth(code: str) -> int:
     Calculate maximum nesting depth of loops in code snippet.
     
     Args:
-        code: C code string to analyze.
+        code: C code string to analyze (statements of a function body).
         
     Returns:
         Maximum loop nesting depth.
     """
-    max_depth = 0
-    current_depth = 0
-    
-    # Find all loop keywords
-    loop_keywords = ['for', 'while', 'do']
-    
-    # Track brace depth to understand nesting
-    for line in code.split('\n'):
-        line = line.strip()
-
-        for keywords in loop_keywords:
-            if keywords == 'do' and line.startswith('do'):
-                current_depth += 1
-                max_depth = max(max_depth, current_depth)
-                break
-            elif keywords in ('for', 'while') and re.match(rf'\b{keywords}\s*\(', line):
-                current_depth += 1
-                max_depth = max(max_depth, current_depth)
-                break
-    
-        current_depth = max(0,current_depth - line.count('}'))
-    return max_depth
+    tokens = tokenize(code)[0]
+    scan = scan_tokens(["_", "(", ")", "{", *tokens, "}"])
+    return scan.functions[0][1] if scan.functions else 0
                 
 def num_opaque_pointers(source: str) -> int:
     """
@@ -271,22 +442,13 @@ def num_opaque_pointers(source: str) -> int:
     Returns:
         Count of opaque pointer typedefs.
     """
-    opaque_pattern = r'typedef\s+struct\s+(\w+)\s+\1\s*;'  # struct Foo Foo;
-    forward_decls = re.findall(opaque_pattern, source)
-    
-    # Check these don't have implementations in the same file
-    count = 0
-    for name in forward_decls:
-        # If there's no struct definition with a body, it's opaque
-        impl_pattern = rf'struct\s+{name}\s*\{{[^}}]+\}}'
-        if not re.search(impl_pattern, source, re.DOTALL):
-            count += 1
-    
-    # Also check explicit pointer typedefs
-    pointer_pattern = r'typedef\s+struct\s+\w+\s*\*\s*\w+;'
-    count += len(re.findall(pointer_pattern, source))
-    
-    return count
+    return _count_opaque_pointers(scan_tokens(tokenize(source)[0]))
+
+def _count_opaque_pointers(scan: _CScan) -> int:
+    """Count `typedef struct Foo Foo;` without a Foo body in the file, plus `typedef struct Foo *Bar;`."""
+    defined = {s["tag"] for s in scan.structs}
+    count = sum(1 for name in scan.opaque_typedefs if name not in defined)
+    return count + scan.pointer_typedefs
 
 def analyze_c_project(root: Path, extensions: List[str] = None) -> List[Dict[str, Any]]:
     """
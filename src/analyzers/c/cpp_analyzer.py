@@ -18,21 +18,42 @@ from typing import Dict, Any, List, Generator, Type
 import os
 import re
 import logging
+from bisect import bisect_left
 
 _CPP_IMPORT_ERROR: Exception | None = None
 
 try:
-    from tree_sitter import Language, Parser
     import tree_sitter_cpp as tscpp
     from .base_c_analyzer_utils import cutilities
 except Exception as e:
     _CPP_IMPORT_ERROR = e
     # Allow module to import, but analyzer usage will bubble a RuntimeError later.
-    Language = None  # type: ignore
-    Parser = None    # type: ignore
     tscpp = None     # type: ignore
     cutilities = None  # type: ignore
 
+# Bump whenever per-file report output changes; cached reports from other
+# versions are then ignored.
+ANALYZER_VERSION = "1"
+
+# Everything the extractors look at, gathered by one query pass per file.
+_CPP_CAPTURES = {
+    "include": ("preproc_include",),
+    "class": ("class_specifier", "struct_specifier"),
+    "field": ("field_declaration",),
+    "template_type": ("template_type",),
+    "dynamic_memory": ("new_expression", "delete_expression"),
+    "call": ("call_expression",),
+    "function": ("function_definition",),
+    "loop": ("for_statement", "while_statement", "do_statement"),
+    "template_class": (
+        "(template_declaration (class_specifier))",
+        "(template_declaration (struct_specifier))",
+    ),
+    "namespace": ("namespace_definition",),
+    "operator": ("operator_name",),
+    "destructor": ("destructor_name",),
+}
+
 class cppanalysis:
 
     """
@@ -61,11 +82,16 @@ class cppanalysis:
             ) from _CPP_IMPORT_ERROR
 
         try:
-            self.parser = Parser()
-            self.parser.language = Language(tscpp.language())
+            self.query = cutilities.query("cpp", tscpp.language, _CPP_CAPTURES)
+            self.parser  # create this thread's parser now so failures surface here
         except Exception as e:
             raise RuntimeError(f"C++ analyzer initialization failed: {e}") from e
 
+    @property
+    def parser(self):
+        """The calling thread's pooled C++ parser."""
+        return cutilities.parser("cpp", tscpp.language)
+
     def analyze_file(self, source:str, path:Path) -> Dict[str, Any]:
         """
         Analyze a single C++ source file and extract structural metrics.
@@ -94,11 +120,12 @@ class cppanalysis:
             return report
 
         try:
-            report["imports"] = self.extract_includes(root, source)
-            report["classes"] = self.extract_classes(root, source, path)
-            report["data_structures"] = self.extract_data_structures(root, source)
-            report["complexity"] = self.extract_complexity(root)
-            report["cpp_spec"] = self.cpp_spec(root, source)
+            captures = cutilities.captures(self.query, root)
+            report["imports"] = self.extract_includes(captures, source)
+            report["classes"] = self.extract_classes(captures, source, path)
+            report["data_structures"] = self.extract_data_structures(captures, source)
+            report["complexity"] = self.extract_complexity(captures)
+            report["cpp_spec"] = self.cpp_spec(captures, source)
         except Exception as e:
             # keep syntax_ok True because parse succeeded
             report["error"] = f"Extraction failed: {e}"
@@ -120,20 +147,18 @@ class cppanalysis:
             "syntax_ok": False,
         }
 
-    def extract_includes(self, root, source: str) -> List[str]:
+    def extract_includes(self, captures, source: str) -> List[str]:
          includes = []
-         for node in cutilities.tree_walk(root):
-              if node.type in ("preproc_include"):
-                   includes.append(source[node.start_byte:node.end_byte].strip())
+         for node in captures.get("include", []):
+              includes.append(source[node.start_byte:node.end_byte].strip())
          
          return includes
     
 
-    def extract_classes(self, root, source: str, path: Path):
+    def extract_classes(self, captures, source: str, path: Path):
          classes = []
-         for node in cutilities.tree_walk(root):
-              if node.type in ("class_specifier", "struct_specifier"):
-                   classes.append(self.parse_class(node, source, path))
+         for node in captures.get("class", []):
+              classes.append(self.parse_class(node, source, path))
          
          return classes
     
@@ -185,7 +210,6 @@ class cppanalysis:
                           current_access = access_type.rstrip(':')
 
                      if body.type == "field_declaration":
-                        print(f"Field declaration: {source[body.start_byte:body.end_byte]}")
                         fname = self.extract_fname(body, source)
                         if fname:
                             if current_access == "private":
@@ -196,7 +220,6 @@ class cppanalysis:
                         else:
                             # No field name found, might be a method declaration
                             methodinf = self.extract_methodinf(body, source, name)
-                            print(f"Method info from field_declaration: {methodinf}")
                             if methodinf:
                                 mname = methodinf["name"]
                                 methods.append(mname)
@@ -301,7 +324,7 @@ class cppanalysis:
             "is_destructor": is_destructor,
          }
     
-    def cpp_spec(self, root, source: str) -> Dict[str, int]:
+    def cpp_spec(self, captures, source: str) -> Dict[str, int]:
         """Extract C++-specific OOP patterns and features"""
         cpp_spec = {
             "template_classes": 0,
@@ -312,47 +335,38 @@ class cppanalysis:
             "operator_overloads": 0,
         }
 
-        # Track classes for abstract detection
-        class_names = set()
-        pure_virtual_classes = set()
+        # A template declaration holding a class counts once
+        cpp_spec["template_classes"] = len({node.id for node in captures.get("template_class", [])})
 
-        for node in cutilities.tree_walk(root):
-            if node.type == "template_declaration":
-                # Check if it contains a class
-                for child in node.children:
-                    if child.type in ("class_specifier", "struct_specifier"):
-                        cpp_spec["template_classes"] += 1
-                        break
+        cpp_spec["namespaces"] = len(captures.get("namespace", []))
 
-            elif node.type == "namespace_definition":
-                cpp_spec["namespaces"] += 1
+        # unique_ptr, shared_ptr, weak_ptr
+        for node in captures.get("template_type", []):
+            ttext = source[node.start_byte:node.end_byte]
+            if any(ptr in ttext for ptr in ["unique_ptr", "shared_ptr", "weak_ptr"]):
+                cpp_spec["smart_pointers"] += 1
 
-            # unique_ptr, shared_ptr, weak_ptr
-            elif node.type == "template_type":
-                ttext = source[node.start_byte:node.end_byte]
-                if any(ptr in ttext for ptr in ["unique_ptr", "shared_ptr", "weak_ptr"]):
-                    cpp_spec["smart_pointers"] += 1
+        # Operator overload: function definitions with an operator name anywhere inside
+        operator_starts = [node.start_byte for node in captures.get("operator", [])]
+        for node in captures.get("function", []):
+            i = bisect_left(operator_starts, node.start_byte)
+            if i < len(operator_starts) and operator_starts[i] < node.end_byte:
+                cpp_spec["operator_overloads"] += 1
 
-            # Operator overload
-            elif node.type == "function_definition":
-                for child in cutilities.tree_walk(node):
-                    if child.type == "operator_name":
-                        cpp_spec["operator_overloads"] += 1
-                        break
-
-            # Abstract classes
-            elif node.type in ("class_specifier", "struct_specifier"):
-                class_name = self.get_cname(node, source)
-                if class_name:
-                    class_names.add(class_name)
-                    # Check for pure virtual functions (= 0)
-                    if self.pure_virtual(node, source):
-                        pure_virtual_classes.add(class_name)
-
-            # pattern detection (destructor + resource management)
-            elif node.type == "destructor_name":
-                #if class has destructor, likely RAII
-                cpp_spec["raii_classes"] += 1
+        # Abstract classes
+        class_names = set()
+        pure_virtual_classes = set()
+        for node in captures.get("class", []):
+            class_name = self.get_cname(node, source)
+            if class_name:
+                class_names.add(class_name)
+                # Check for pure virtual functions (= 0)
+                if self.pure_virtual(node, source):
+                    pure_virtual_classes.add(class_name)
+
+        # pattern detection (destructor + resource management)
+        #if class has destructor, likely RAII
+        cpp_spec["raii_classes"] = len(captures.get("destructor", []))
 
         cpp_spec["abstract_classes"] = len(pure_virtual_classes)
 
@@ -371,14 +385,14 @@ class cppanalysis:
         # Look for "= 0" pattern which indicates pure virtual
         return "= 0" in ctext and "virtual" in ctext
     
-    def extract_data_structures(self, root, source: str) -> Dict[str, int]:
+    def extract_data_structures(self, captures, source: str) -> Dict[str, int]:
         """
         Detect data structure usage within C++ source code.
         Output strictly follows the data structure aggregation schema:
             arrays, hash_tables, linked_lists, trees,
             queues, stacks, dynamic_memory, pointer_arrays.
         Args:
-            root (Node): Tree-sitter root node.
+            captures (Dict[str, List[Node]]): Query captures for the file.
             source (str): Raw C++ source code.
         Returns:
             Dict[str, int]: Data structure usage counters.
@@ -393,72 +407,59 @@ class cppanalysis:
             "dynamic_memory": 0,
             "pointer_arrays": 0,
         }
-        for node in cutilities.tree_walk(root):
-            if node.type == "field_declaration":
-                field_text = source[node.start_byte:node.end_byte]
-        
-                if any(t in field_text for t in ["std::vector", "std::array"]):
-                    ds["arrays"] += 1
-        
-                elif any(t in field_text for t in ["std::map", "std::unordered_map"]):
-                    ds["hash_tables"] += 1
-        
-                elif any(t in field_text for t in ["std::list", "std::forward_list"]):
-                    ds["linked_lists"] += 1
-
-            # Count type identifiers for STL containers
-            elif node.type == "template_type":
-                type_text = source[node.start_byte:node.end_byte]
-                
-                if any(t in type_text for t in ["std::vector", "std::array"]):
-                    ds["arrays"] += 1
-                    if "*" in type_text or "ptr" in type_text.lower():
-                        ds["pointer_arrays"] += 1
-                
-                elif any(t in type_text for t in ["std::map", "std::unordered_map", "std::hash_map"]):
-                    ds["hash_tables"] += 1
-                
-                elif any(t in type_text for t in ["std::list", "std::forward_list"]):
-                    ds["linked_lists"] += 1
-                
-                elif any(t in type_text for t in ["std::set", "std::multiset", "std::tree"]):
-                    ds["trees"] += 1
-                
-                elif any(t in type_text for t in ["std::stack"]):
-                    ds["stacks"] += 1
-                
-                elif any(t in type_text for t in ["std::queue", "std::priority_queue", "std::deque"]):
-                    ds["queues"] += 1
+        for node in captures.get("field", []):
+            field_text = source[node.start_byte:node.end_byte]
+
+            if any(t in field_text for t in ["std::vector", "std::array"]):
+                ds["arrays"] += 1
+
+            elif any(t in field_text for t in ["std::map", "std::unordered_map"]):
+                ds["hash_tables"] += 1
+
+            elif any(t in field_text for t in ["std::list", "std::forward_list"]):
+                ds["linked_lists"] += 1
+
+        # Count type identifiers for STL containers
+        for node in captures.get("template_type", []):
+            type_text = source[node.start_byte:node.end_byte]
             
-            # Count dynamic memory operations
-            elif node.type == "new_expression":
-                ds["dynamic_memory"] += 1
-            elif node.type == "delete_expression":
+            if any(t in type_text for t in ["std::vector", "std::array"]):
+                ds["arrays"] += 1
+                if "*" in type_text or "ptr" in type_text.lower():
+                    ds["pointer_arrays"] += 1
+            
+            elif any(t in type_text for t in ["std::map", "std::unordered_map", "std::hash_map"]):
+                ds["hash_tables"] += 1
+            
+            elif any(t in type_text for t in ["std::list", "std::forward_list"]):
+                ds["linked_lists"] += 1
+            
+            elif any(t in type_text for t in ["std::set", "std::multiset", "std::tree"]):
+                ds["trees"] += 1
+            
+            elif any(t in type_text for t in ["std::stack"]):
+                ds["stacks"] += 1
+            
+            elif any(t in type_text for t in ["std::queue", "std::priority_queue", "std::deque"]):
+                ds["queues"] += 1
+        
+        # Count dynamic memory operations
+        ds["dynamic_memory"] += len(captures.get("dynamic_memory", []))
+        for node in captures.get("call", []):
+            call_text = source[node.start_byte:node.end_byte]
+            if "malloc(" in call_text or "free(" in call_text:
                 ds["dynamic_memory"] += 1
-            elif node.type == "call_expression":
-                call_text = source[node.start_byte:node.end_byte]
-                if "malloc(" in call_text or "free(" in call_text:
-                    ds["dynamic_memory"] += 1
 
         return ds
     
-    def extract_complexity(self, root) -> Dict[str, int]:
-        total_functions = 0
-        nested_loops = 0
-        max_depth = 0
-
-        for node in cutilities.tree_walk(root):
-            if node.type == "function_definition":
-                total_functions += 1
-                depth = cutilities.calculate_loop_depth(node)
-                max_depth = max(max_depth, depth)
-                if depth >= 2:
-                    nested_loops += 1
+    def extract_complexity(self, captures) -> Dict[str, int]:
+        functions = captures.get("function", [])
+        depths = cutilities.function_loop_depths(functions, captures.get("loop", []))
 
         return {
-            "total_functions": total_functions,
-            "functions_with_nested_loops": nested_loops,
-            "max_loop_depth": max_depth,
+            "total_functions": len(functions),
+            "functions_with_nested_loops": sum(1 for depth in depths if depth >= 2),
+            "max_loop_depth": max(depths, default=0),
         }
     
     def extract_base_classes(self, base_clause, source: str) -> List[str]:
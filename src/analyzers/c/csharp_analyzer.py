@@ -1,10 +1,23 @@
 from pathlib import Path
 import sys
 from typing import Dict, Any, List, Generator, Type
-from tree_sitter import Language, Parser
 import tree_sitter_c_sharp as tscs # type: ignore
 from .base_c_analyzer_utils import cutilities
 
+# Bump whenever per-file report output changes; cached reports from other
+# versions are then ignored.
+ANALYZER_VERSION = "1"
+
+# Everything the extractors look at, gathered by one query pass per file.
+_CSHARP_CAPTURES = {
+    "using": ("using_directive",),
+    "class": ("class_declaration", "struct_declaration"),
+    "function": ("method_declaration", "constructor_declaration"),
+    "loop": ("for_statement", "while_statement", "do_statement"),
+    "member": ("field_declaration", "property_declaration"),
+    "object_creation": ("object_creation_expression",),
+}
+
 class csharpanalysis:
     """
     Analyze C# source code for object-oriented structure and static metrics.
@@ -23,10 +36,15 @@ class csharpanalysis:
 
     def __init__(self):
         try:
-            self.parser = Parser()
-            self.parser.language = Language(tscs.language())
+            self.query = cutilities.query("csharp", tscs.language, _CSHARP_CAPTURES)
+            self.parser  # create this thread's parser now so failures surface here
         except Exception as e:
             raise RuntimeError(f"C# analyzer initialization failed: {e}") from e
+
+    @property
+    def parser(self):
+        """The calling thread's pooled C# parser."""
+        return cutilities.parser("csharp", tscs.language)
         
     def analyze_file(self, source: str, path: Path) -> Dict[str, Any]:
         """
@@ -51,10 +69,11 @@ class csharpanalysis:
             return report
     
         try:
-            report["imports"] = self.extract_usings(root, source)
-            report["classes"] = self.extract_classes(root, source, path)
-            report["data_structures"] = self.extract_data_structures(root, source)
-            report["complexity"] = self.extract_complexity(root)
+            captures = cutilities.captures(self.query, root)
+            report["imports"] = self.extract_usings(captures, source)
+            report["classes"] = self.extract_classes(captures, source, path)
+            report["data_structures"] = self.extract_data_structures(captures, source)
+            report["complexity"] = self.extract_complexity(captures)
         except Exception as e:
             report["error"] = f"Extraction failed: {e}"
     
@@ -81,29 +100,28 @@ class csharpanalysis:
         }
 
     
-    def extract_usings(self, root, source: str) -> List[str]:
+    def extract_usings(self, captures, source: str) -> List[str]:
         """
         Extract using directives (imports) from C# code.
         
         Args:
-            root: Parse tree root node
+            captures: Query captures for the file
             source: Source code string
             
         Returns:
             List of using directive strings
         """
         imports = []
-        for node in cutilities.tree_walk(root):
-            if node.type == "using_directive":
-                imports.append(source[node.start_byte:node.end_byte].strip())
+        for node in captures.get("using", []):
+            imports.append(source[node.start_byte:node.end_byte].strip())
         return imports
     
-    def extract_classes(self, root, source: str, path: Path) -> List[Dict[str, Any]]:
+    def extract_classes(self, captures, source: str, path: Path) -> List[Dict[str, Any]]:
         """
         Extract all class and struct declarations from the parse tree.
         
         Args:
-            root: Parse tree root node
+            captures: Query captures for the file
             source: Source code string
             path: File path for reference
             
@@ -111,9 +129,8 @@ class csharpanalysis:
             List of class information dictionaries
         """
         classes = []
-        for node in cutilities.tree_walk(root):
-            if node.type in ("class_declaration", "struct_declaration"):
-                classes.append(self.parse_class(node, source, path))
+        for node in captures.get("class", []):
+            classes.append(self.parse_class(node, source, path))
         return classes
     
     def get_identifier(self, node, source: str) -> str:
@@ -269,12 +286,12 @@ class csharpanalysis:
             "override_methods": [],
         }
     
-    def extract_complexity(self, root) -> Dict[str, int]:
+    def extract_complexity(self, captures) -> Dict[str, int]:
         """
         Calculate cyclomatic complexity metrics.
         
         Args:
-            root: Parse tree root node
+            captures: Query captures for the file
             
         Returns:
             Dictionary containing:
@@ -282,30 +299,21 @@ class csharpanalysis:
                 - functions_with_nested_loops: count of functions with loop depth >= 2
                 - max_loop_depth: maximum nesting depth of loops found
         """
-        total_functions = 0
-        nested_loops = 0
-        max_depth = 0
-
-        for node in cutilities.tree_walk(root):
-            if node.type in ("method_declaration", "constructor_declaration"):
-                total_functions += 1
-                depth = cutilities.calculate_loop_depth(node)
-                max_depth = max(max_depth, depth)
-                if depth >= 2:
-                    nested_loops += 1
+        functions = captures.get("function", [])
+        depths = cutilities.function_loop_depths(functions, captures.get("loop", []))
 
         return {
-            "total_functions": total_functions,
-            "functions_with_nested_loops": nested_loops,
-            "max_loop_depth": max_depth,
+            "total_functions": len(functions),
+            "functions_with_nested_loops": sum(1 for depth in depths if depth >= 2),
+            "max_loop_depth": max(depths, default=0),
         }
     
-    def extract_data_structures(self, root, source: str) -> Dict[str, int]:
+    def extract_data_structures(self, captures, source: str) -> Dict[str, int]:
         """
         Count usage of common C# data structures and collections.
         
         Args:
-            root: Parse tree root node
+            captures: Query captures for the file
             source: Source code string
             
         Returns:
@@ -327,26 +335,24 @@ class csharpanalysis:
             "dynamic_memory": 0,
         }
 
-        for node in cutilities.tree_walk(root):
-            # Fields and properties
-            if node.type in ("field_declaration", "property_declaration"):
-                text = source[node.start_byte:node.end_byte]
+        # Fields and properties
+        for node in captures.get("member", []):
+            text = source[node.start_byte:node.end_byte]
 
-                if "[]" in text or "Array" in text:
-                    ds["arrays"] += 1
-                if "List<" in text:
-                    ds["lists"] += 1
-                if "Dictionary<" in text:
-                    ds["dictionaries"] += 1
-                if "Queue<" in text:
-                    ds["queues"] += 1
-                if "Stack<" in text:
-                    ds["stacks"] += 1
-                if "HashSet<" in text:
-                    ds["hash_sets"] += 1
+            if "[]" in text or "Array" in text:
+                ds["arrays"] += 1
+            if "List<" in text:
+                ds["lists"] += 1
+            if "Dictionary<" in text:
+                ds["dictionaries"] += 1
+            if "Queue<" in text:
+                ds["queues"] += 1
+            if "Stack<" in text:
+                ds["stacks"] += 1
+            if "HashSet<" in text:
+                ds["hash_sets"] += 1
 
-            # Dynamic memory allocations (new keyword)
-            if node.type == "object_creation_expression":
-                ds["dynamic_memory"] += 1
+        # Dynamic memory allocations (new keyword)
+        ds["dynamic_memory"] += len(captures.get("object_creation", []))
 
-        return ds
\ No newline at end of file
+        return ds
@@ -6,17 +6,42 @@ data structure usage, and code complexity metrics using the javalang parser.
 Produces canonical reports compatible with oop_aggregator.
 """
 
+import hashlib
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, Optional, Set
 import javalang
 from src.analyzers.class_info import ClassInfo
 
+# Bump whenever per-file report output changes; cached reports from other
+# versions are then ignored.
+ANALYZER_VERSION = "3"
+
+from javalang.ast import Node
 from javalang.tree import (
     ClassDeclaration, MethodDeclaration, ConstructorDeclaration,
     VariableDeclarator, MemberReference, Assignment, ClassCreator,
     ForStatement, WhileStatement, DoStatement
 )
 
+# Token lists for recently seen sources, keyed by SHA-256 of the content.
+# Tokens do not depend on ANALYZER_VERSION, so they stay valid when the report
+# cache is invalidated, and identical files (vendored copies) tokenize once.
+TOKEN_CACHE_SIZE = 64  # entries; a large file is a few MB of token objects
+_token_cache: "OrderedDict[str, List[Any]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+# Data structure flags: a flag is set when its marker occurs in an import path
+# or in the type of a `new` expression (so ConcurrentHashMap, EnumSet,
+# CopyOnWriteArrayList, ... all count).
+DS_TYPE_MARKERS = {
+    "list_literals": "List",
+    "dict_literals": "Map",
+    "set_literals": "Set",
+    "uses_heapq": "PriorityQueue",
+}
+
 def iter_nodes(node):
     """
     Iterate all nodes in the AST starting from 'node' in depth-first manner.
@@ -120,7 +145,84 @@ def detect_class_creations(root) -> List[str]:
                 pass
     return names
 
-def analyze_source(source: str, path: Path) -> Dict[str, Any]:
+# Node types _scan_tree acts on, by exact type
+_SCAN_KINDS = {
+    ForStatement: "loop", WhileStatement: "loop", DoStatement: "loop",
+    Assignment: "assign", ClassCreator: "new",
+}
+
+def tokenize_source(source: str) -> List[Any]:
+    """
+    Tokenize Java source, reusing the tokens of identical content seen recently.
+
+    Args:
+        source: Java source code as a string.
+
+    Returns:
+        List of javalang tokens; treat it as read-only, it may be shared.
+
+    Raises:
+        javalang.tokenizer.LexerError: If the source cannot be tokenized.
+    """
+    key = hashlib.sha256(source.encode("utf-8", "surrogatepass")).hexdigest()
+    with _token_cache_lock:
+        tokens = _token_cache.get(key)
+        if tokens is not None:
+            _token_cache.move_to_end(key)
+            return tokens
+    tokens = list(javalang.tokenizer.tokenize(source))
+    with _token_cache_lock:
+        _token_cache[key] = tokens
+        while len(_token_cache) > TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
+    return tokens
+
+def _scan_tree(tree, members) -> tuple:
+    """
+    Walk the whole AST once, collecting per-member loop depth and `this` assignments.
+
+    Args:
+        tree: Root AST node.
+        members: Method/constructor nodes to report on.
+
+    Returns:
+        Tuple of (stats, created_types): stats maps id(member) to
+        [max loop depth, set of attributes assigned via `this`], counting
+        everything nested inside the member; created_types is the set of
+        simple type names used in `new` expressions anywhere in the tree.
+    """
+    stats = {id(m): [0, set()] for m in members}
+    created_types = set()
+    stack = [(tree, None, 0)]
+    while stack:
+        node, owner, depth = stack.pop()
+        kind = _SCAN_KINDS.get(type(node))
+        if kind is None:
+            member = stats.get(id(node))
+            if member is not None:
+                owner, depth = member, 0
+        elif kind == "loop":
+            depth += 1
+            if owner is not None and depth > owner[0]:
+                owner[0] = depth
+        elif kind == "assign":
+            lhs = node.expressionl
+            if owner is not None and isinstance(lhs, MemberReference) and lhs.qualifier == 'this' and lhs.member:
+                owner[1].add(lhs.member)
+        else:
+            t = node.type.name if hasattr(node.type, 'name') else str(node.type)
+            if t:
+                created_types.add(t)
+        for attr in node.__dict__.values():
+            if isinstance(attr, list):
+                for item in attr:
+                    if isinstance(item, Node):
+                        stack.append((item, owner, depth))
+            elif isinstance(attr, Node):
+                stack.append((attr, owner, depth))
+    return stats, created_types
+
+def analyze_source(source: str, path: Path, tokens: Optional[List[Any]] = None) -> Dict[str, Any]:
     """
     Parse a Java source string and produce per-file metrics.
     Extracts OOP information including classes, inheritance, methods,
@@ -129,6 +231,8 @@ def analyze_source(source: str, path: Path) -> Dict[str, Any]:
     Args:
         source: Java source code as a string.
         path: Path to the source file (for reporting).
+        tokens: javalang tokens for source, e.g. from tokenize_source; when
+            omitted the source is tokenized here (through the token cache).
         
     Returns:
         Dict in canonical format with keys:
@@ -141,7 +245,9 @@ def analyze_source(source: str, path: Path) -> Dict[str, Any]:
         - syntax_ok: Boolean indicating parse success
     """
     try:
-        tree = javalang.parse.parse(source)
+        if tokens is None:
+            tokens = tokenize_source(source)
+        tree = javalang.parser.Parser(tokens).parse()
     except Exception as e:
         return {
             "file": str(path),
@@ -165,15 +271,18 @@ def analyze_source(source: str, path: Path) -> Dict[str, Any]:
     functions_with_nested_loops = 0
     max_loop_depth_overall = 0
 
-    # Collect class creations to detect usage of e.g. ArrayList via new ArrayList<>()
-    created_types = detect_class_creations(tree)
-
-    # Iterate types (top-level classes, interfaces, enums)
-    for type_decl in getattr(tree, 'types', []):
-
-        if not isinstance(type_decl, ClassDeclaration):
-            continue
+    # Top-level classes (interfaces and enums are skipped)
+    class_decls = [t for t in getattr(tree, 'types', []) if isinstance(t, ClassDeclaration)]
+    members = [
+        m
+        for type_decl in class_decls
+        for m in (getattr(type_decl, 'methods', []) or []) + (getattr(type_decl, 'constructors', []) or [])
+    ]
+    # One walk gives loop depths, `this` assignments and class creations
+    # (e.g. new ArrayList<>()) for everything at once
+    member_stats, created_types = _scan_tree(tree, members)
 
+    for type_decl in class_decls:
         cname = type_decl.name
         # bases: extends and implements
         bases = []
@@ -210,46 +319,28 @@ def analyze_source(source: str, path: Path) -> Dict[str, Any]:
 
         # methods & constructors
         # javalang puts methods + constructors under type_decl.methods (MethodDeclaration)
-        for member in getattr(type_decl, 'methods', []) or []:
+        for member in (getattr(type_decl, 'methods', []) or []) + (getattr(type_decl, 'constructors', []) or []):
             if isinstance(member, MethodDeclaration):
                 methods.add(member.name)
                 # special methods mapping: treat toString/equals/hashCode/compareTo as "dunder-like"
                 if member.name in {"toString", "equals", "hashCode", "compareTo"}:
                     special_methods.append(member.name)
-
-                # complexity: treat each method as a function
-                total_functions += 1
-                depth = max_loop_depth(member)
-                max_loop_depth_overall = max(max_loop_depth_overall, depth)
-                if depth >= 2:
-                    functions_with_nested_loops += 1
-
-                # find `this` assignments within the method
-                tas = find_this_assignments(member)
-                for a in tas:
-                    # best-effort visibility: we don't know modifiers here; assume public unless field exists private
-                    if a in private_attrs:
-                        pass
-                    else:
-                        public_attrs.add(a)
-
-        for ctor in getattr(type_decl, 'constructors', []) or []:
-            if isinstance(ctor, ConstructorDeclaration):
+            elif isinstance(member, ConstructorDeclaration):
                 # name equals class name usually
-                methods.add(ctor.name)
+                methods.add(member.name)
                 has_constructor = True
-                total_functions += 1
-                depth = max_loop_depth(ctor)
-                max_loop_depth_overall = max(max_loop_depth_overall, depth)
-                if depth >= 2:
-                    functions_with_nested_loops += 1
-
-                tas = find_this_assignments(ctor)
-                for a in tas:
-                    if a in private_attrs:
-                        pass
-                    else:
-                        public_attrs.add(a)
+            else:
+                continue
+
+            # complexity: treat each method/constructor as a function
+            total_functions += 1
+            depth, this_attrs = member_stats[id(member)]
+            max_loop_depth_overall = max(max_loop_depth_overall, depth)
+            if depth >= 2:
+                functions_with_nested_loops += 1
+
+            # best-effort visibility for `this` assignments: public unless the field is private
+            public_attrs.update(this_attrs)
 
         # remove any private attrs from public set
         public_attrs.difference_update(private_attrs)
@@ -282,17 +373,14 @@ def analyze_source(source: str, path: Path) -> Dict[str, Any]:
         "uses_sorted": False,
     }
 
-    # If imports or class creations mention common types, flag them
-    if any('ArrayList' in imp or 'List' in imp or 'java.util.ArrayList' in imp for imp in imports) or any('ArrayList' == t for t in created_types):
-        ds["list_literals"] += 1
-    if any('HashMap' in imp or 'Map' in imp or 'java.util.HashMap' in imp for imp in imports) or any('HashMap' == t for t in created_types):
-        ds["dict_literals"] += 1
-    if any('HashSet' in imp or 'Set' in imp or 'java.util.HashSet' in imp for imp in imports) or any('HashSet' == t for t in created_types):
-        ds["set_literals"] += 1
-    if any('PriorityQueue' in imp or 'java.util.PriorityQueue' in imp for imp in imports) or any('PriorityQueue' == t for t in created_types):
-        ds["uses_heapq"] = True
-    # sorted analog: Collections.sort or Stream.sorted() detection via imports / class creations
-    if any('Collections' in imp or 'java.util.Collections' in imp for imp in imports):
+    # One string per file, so each marker is a single substring search
+    import_text = "\n".join(imports)
+    used_text = import_text + "\n" + "\n".join(created_types)
+    for key, marker in DS_TYPE_MARKERS.items():
+        if marker in used_text:
+            ds[key] = True if isinstance(ds[key], bool) else ds[key] + 1
+    # sorted analog: Collections.sort or Stream.sorted() detection via imports
+    if 'Collections' in import_text:
         ds["uses_sorted"] = True
 
     complexity = {
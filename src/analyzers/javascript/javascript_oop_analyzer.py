@@ -6,6 +6,7 @@ data structure usage, and time complexity metrics using an AST-based approach
 powered by Esprima.
 """
 
+import os
 from pathlib import Path
 from typing import Dict, Any, List, Set
 from collections import defaultdict
@@ -14,11 +15,82 @@ from src.analyzers.class_info import ClassInfo
 from src.aggregation.oop_aggregator import aggregate_canonical_reports
 from src.aggregation.oop_aggregator import build_narrative
 
+# AST child fields per ESTree node type, as produced by esprima. Types not
+# listed (Identifier, Literal, ThisExpression, ...) have no child nodes.
+CHILD_FIELDS: Dict[str, tuple] = {
+    "Program": ("body",),
+    "ArrayExpression": ("elements",),
+    "ArrayPattern": ("elements",),
+    "ArrowFunctionExpression": ("params", "body"),
+    "ArrowParameterPlaceHolder": ("params",),
+    "AssignmentExpression": ("left", "right"),
+    "AssignmentPattern": ("left", "right"),
+    "AwaitExpression": ("argument",),
+    "BinaryExpression": ("left", "right"),
+    "BlockStatement": ("body",),
+    "BreakStatement": ("label",),
+    "CallExpression": ("callee", "arguments"),
+    "CatchClause": ("param", "body"),
+    "ClassBody": ("body",),
+    "ClassDeclaration": ("id", "superClass", "body"),
+    "ClassExpression": ("id", "superClass", "body"),
+    "ConditionalExpression": ("test", "consequent", "alternate"),
+    "ContinueStatement": ("label",),
+    "DoWhileStatement": ("body", "test"),
+    "ExportAllDeclaration": ("source",),
+    "ExportDefaultDeclaration": ("declaration",),
+    "ExportNamedDeclaration": ("declaration", "specifiers", "source"),
+    "ExportSpecifier": ("exported", "local"),
+    "ExportDefaultSpecifier": ("local",),
+    "ExpressionStatement": ("expression",),
+    "FieldDefinition": ("key", "value"),
+    "ForInStatement": ("left", "right", "body"),
+    "ForOfStatement": ("left", "right", "body"),
+    "ForStatement": ("init", "test", "update", "body"),
+    "FunctionDeclaration": ("id", "params", "body"),
+    "FunctionExpression": ("id", "params", "body"),
+    "IfStatement": ("test", "consequent", "alternate"),
+    "ImportDeclaration": ("specifiers", "source"),
+    "ImportDefaultSpecifier": ("local",),
+    "ImportNamespaceSpecifier": ("local",),
+    "ImportSpecifier": ("local", "imported"),
+    "LabeledStatement": ("label", "body"),
+    "LogicalExpression": ("left", "right"),
+    "MemberExpression": ("object", "property"),
+    "MetaProperty": ("meta", "property"),
+    "MethodDefinition": ("key", "value"),
+    "NewExpression": ("callee", "arguments"),
+    "ObjectExpression": ("properties",),
+    "ObjectPattern": ("properties",),
+    "Property": ("key", "value"),
+    "RestElement": ("argument",),
+    "ReturnStatement": ("argument",),
+    "SequenceExpression": ("expressions",),
+    "SpreadElement": ("argument",),
+    "SwitchCase": ("test", "consequent"),
+    "SwitchStatement": ("discriminant", "cases"),
+    "TaggedTemplateExpression": ("tag", "quasi"),
+    "TemplateLiteral": ("quasis", "expressions"),
+    "ThrowStatement": ("argument",),
+    "TryStatement": ("block", "handler", "finalizer"),
+    "UnaryExpression": ("argument",),
+    "UpdateExpression": ("argument",),
+    "VariableDeclaration": ("declarations",),
+    "VariableDeclarator": ("id", "init"),
+    "WhileStatement": ("test", "body"),
+    "WithStatement": ("object", "body"),
+    "YieldExpression": ("argument",),
+}
+
+FUNCTION_TYPES = {"FunctionDeclaration", "FunctionExpression", "ArrowFunctionExpression"}
+LOOP_TYPES = {"ForStatement", "WhileStatement", "ForOfStatement", "ForInStatement"}
+
 def iter_js_nodes(node):
     """
     Depth-first traversal of an Esprima AST.
 
-    Safely yields AST nodes while skipping primitives.
+    Follows only the child fields listed in CHILD_FIELDS and skips empty
+    slots (such as array holes).
     
     Args:
         node: Root node of the Esprima AST to traverse.
@@ -34,19 +106,27 @@ def iter_js_nodes(node):
     while stack:
         n = stack.pop()
         yield n
+        _push_children(n, stack.append)
 
-        if isinstance(n, (list, tuple)):
-            stack.extend(reversed(n))
-            continue
+def _push_children(node, push):
+    """
+    Push the child nodes of node in reverse, so they pop in source order.
 
-        if not hasattr(n, "__dict__"):
+    Args:
+        node: Esprima AST node.
+        push: Callable receiving each child.
+    """
+    for field in reversed(CHILD_FIELDS.get(node.type, ())):
+        value = getattr(node, field)
+        if value is None:
             continue
+        if isinstance(value, list):
+            for i in range(len(value) - 1, -1, -1):
+                if value[i] is not None:
+                    push(value[i])
+        else:
+            push(value)
 
-        for v in n.__dict__.values():
-            if isinstance(v, (list, tuple)):
-                stack.extend(reversed(v))
-            elif hasattr(v, "__dict__"):
-                stack.append(v)
 class JavaScriptOOPAnalyzer:
     """
     AST-based JavaScript OOP analyzer using Esprima.
@@ -104,10 +184,12 @@ class JavaScriptOOPAnalyzer:
         Common directories such as node_modules, build outputs, and VCS metadata are ignored.
         """
         ignore = {"node_modules", ".git", "dist", "build"}
-        self.js_files = [
-            p for p in self.root.rglob("*.js")
-            if not any(part in ignore for part in p.parts)
-        ]
+        self.js_files = []
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            # Prune in place so ignored trees are never descended into
+            dirnames[:] = [d for d in dirnames if d not in ignore]
+            base = Path(dirpath)
+            self.js_files.extend(base / name for name in filenames if name.endswith(".js"))
 
     def analyze(self) -> Dict[str, Any]:
         """
@@ -156,30 +238,67 @@ class JavaScriptOOPAnalyzer:
             self.syntax_errors.append(path)
             return
 
-        # Class analysis (OOP) 
-        for node in tree.body:
-            if node.type == "ClassDeclaration":
-                self._handle_class(node, path)
+        classes = [node for node in tree.body if node.type == "ClassDeclaration"]
 
-        # Global AST walk for complexity + data structures
-        for node in iter_js_nodes(tree):
+        # One walk for complexity + data structures, also giving each
+        # top-level class method's loop depth
+        method_depths = self._scan(tree, [
+            element.value.body
+            for node in classes
+            for element in node.body.body
+            if element.type == "MethodDefinition"
+        ])
 
-            # Function counting (exclude MethodDefinition to avoid double-counting with class methods)
-            if getattr(node, "type", None) in {
-                "FunctionDeclaration",
-                "FunctionExpression",
-                "ArrowFunctionExpression",
-            }:
-                self.complexity_stats["total_functions"] += 1
+        # Class analysis (OOP)
+        for node in classes:
+            self._handle_class(node, path, method_depths)
 
-            # Data structures
-            if getattr(node, "type", None) == "ArrayExpression":
-                self.ds_counts["list_literals"] += 1
+    def _scan(self, tree, method_bodies) -> Dict[int, int]:
+        """
+        Walk the AST once, counting functions and literals and measuring loop depths.
 
-            elif getattr(node, "type", None) == "ObjectExpression":
-                self.ds_counts["dict_literals"] += 1
+        Function counting excludes MethodDefinition to avoid double-counting
+        with class methods (their FunctionExpression value is still counted).
+
+        Args:
+            tree: Esprima AST of one file.
+            method_bodies: Method body nodes to measure.
 
-    def _handle_class(self, node, path: Path):
+        Returns:
+            Dict[int, int]: id(method body) -> maximum loop nesting inside it.
+        """
+        depths = {id(b): 0 for b in method_bodies}
+        stack = [(tree, None, 0)]
+        push = stack.append
+        child_fields = CHILD_FIELDS
+        while stack:
+            node, owner, depth = stack.pop()
+            kind = node.type
+            if kind in LOOP_TYPES:
+                depth += 1
+                if owner is not None and depth > depths[owner]:
+                    depths[owner] = depth
+            elif kind in FUNCTION_TYPES:
+                self.complexity_stats["total_functions"] += 1
+            elif kind == "ArrayExpression":
+                self.ds_counts["list_literals"] += 1
+            elif kind == "ObjectExpression":
+                self.ds_counts["dict_literals"] += 1
+            elif kind == "BlockStatement" and id(node) in depths:
+                owner, depth = id(node), 0
+            for field in child_fields.get(kind, ()):
+                value = getattr(node, field)
+                if value is None:
+                    continue
+                if isinstance(value, list):
+                    for item in value:
+                        if item is not None:
+                            push((item, owner, depth))
+                else:
+                    push((value, owner, depth))
+        return depths
+
+    def _handle_class(self, node, path: Path, method_depths: Dict[int, int]):
         """
         Analyze a JavaScript class declaration node.
 
@@ -193,6 +312,7 @@ class JavaScriptOOPAnalyzer:
         Args:
             node: Esprima AST node representing a class declaration.
             path (Path): Path to the source file containing the class.
+            method_depths (Dict[int, int]): Loop depth per method body, from _scan.
         """
         
         try:
@@ -220,7 +340,7 @@ class JavaScriptOOPAnalyzer:
                 if method_name == "constructor":
                     has_constructor = True
 
-                depth = self._loop_depth(element.value.body)
+                depth = method_depths[id(element.value.body)]
                 self.complexity_stats["max_loop_depth"] = max(
                     self.complexity_stats["max_loop_depth"], depth
                 )
@@ -241,44 +361,6 @@ class JavaScriptOOPAnalyzer:
             )
         )
 
-    def _loop_depth(self, node) -> int:
-        """
-        Compute maximum loop nesting depth within a method body.
-
-        Args:
-            node: AST node representing a method body.
-
-        Returns:
-            int: Maximum nesting depth of loops.
-        """
-        
-        max_depth = 0
-
-        def visit(n, depth):
-            nonlocal max_depth
-            if n is None:
-                return
-            
-            # List of nodes
-            if isinstance(n, list):
-                for x in n:
-                    visit(x, depth)
-                return
-            
-            # Only process Esprima AST nodes
-            if not hasattr(n, "__dict__"):
-                return
-
-            if getattr(n, "type", None) in { "ForStatement", "WhileStatement", "ForOfStatement", "ForInStatement"}:
-                depth += 1
-                max_depth = max(max_depth, depth)
-
-            for attr in n.__dict__.values():
-                visit(attr, depth)
-
-        visit(node, 0)
-        return max_depth
-
     def _to_canonical_reports(self):
         """
         Convert collected ClassInfo objects into canonical per-file reports.
@@ -3,19 +3,173 @@ Multi-Language OOP Orchestrator
 
 Analyzes projects containing Python, Java, Javascript, C, C++ and C# source files,
 merging results into a single unified OOP metrics report.
+
+Per-file analysis can optionally run in a process pool (`workers` > 1). The
+parsers are CPU-bound pure Python, so threads would stay serialized on the GIL.
+Results are merged in discovery order, so the pooled output is identical to
+the serial one.
+
+With an AnalysisCache, files whose content was already analyzed by the same
+analyzer version reuse the stored per-file report and are not parsed again.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 import json
+import os
 
+from src.analyzers.c import c_oop_analyzer, cpp_analyzer, csharp_analyzer
 from src.analyzers.c.c_oop_analyzer import analyze_source as analyze_c_source
 from src.analyzers.c.cpp_analyzer import cppanalysis
 from src.analyzers.c.csharp_analyzer import csharpanalysis
+from src.analyzers.python import python_oop_analyzer
 from src.analyzers.python.python_oop_analyzer import PythonOOPAstAnalyzer
+from src.analyzers.java import java_analyzer
 from src.analyzers.java.java_analyzer import analyze_source as analyze_java_source, per_file_to_classinfo_list
 from src.analyzers.javascript.javascript_oop_analyzer import JavaScriptOOPAnalyzer
 from src.aggregation.oop_aggregator import aggregate_canonical_reports, combine_language_metrics
+from src.storage.analysis_cache import AnalysisCache, relocate_report
+from src.core.content_hashes import ContentHashes
+
+# Environment override for the default worker count (1 = serial).
+WORKERS_ENV_VAR = "OOP_ANALYSIS_WORKERS"
+
+# Analyzer instances owned by a pool worker process. Tree-sitter parsers cannot be
+# pickled, so every worker builds its own on first use and keeps it for later files.
+_worker_analyzers: Dict[str, Any] = {}
+
+# Cache key parts (analyzer name, analyzer version) for each per-file language.
+CACHE_ANALYZERS: Dict[str, Tuple[str, str]] = {
+    "Python": ("python", python_oop_analyzer.ANALYZER_VERSION),
+    "Java": ("java", java_analyzer.ANALYZER_VERSION),
+    "C": ("c", c_oop_analyzer.ANALYZER_VERSION),
+    "C++": ("cpp", cpp_analyzer.ANALYZER_VERSION),
+    "C#": ("csharp", csharp_analyzer.ANALYZER_VERSION),
+}
+
+
+def _worker_analyzer(language: str):
+    """Return this process's cached C++ or C# analyzer, creating it on first use."""
+    analyzer = _worker_analyzers.get(language)
+    if analyzer is None:
+        analyzer = cppanalysis() if language == "C++" else csharpanalysis()
+        _worker_analyzers[language] = analyzer
+    return analyzer
+
+
+def analyze_python_file(root: Path, path: Path) -> PythonOOPAstAnalyzer:
+    """
+    Analyze one Python file with a fresh analyzer bound to root.
+
+    Args:
+        root (Path): Project root, used to derive module names.
+        path (Path): Python file to analyze.
+
+    Returns:
+        PythonOOPAstAnalyzer: Analyzer holding only this file's results, to be
+            merged into the project-level analyzer.
+    """
+    partial = PythonOOPAstAnalyzer(root)
+    partial.analyze_file(path)
+    return partial
+
+
+def analyze_java_file(path: Path) -> Optional[Dict[str, Any]]:
+    """Return the canonical report for a Java file, or None if it cannot be read."""
+    try:
+        src = path.read_text(encoding="utf-8")
+    except Exception:
+        return None
+    return analyze_java_source(src, path)
+
+
+def analyze_c_file(path: Path) -> Dict[str, Any]:
+    """Return the canonical report for a C file, or an error report on failure."""
+    try:
+        src = path.read_text(encoding="utf-8", errors="ignore")
+        return analyze_c_source(src, path)
+    except Exception as e:
+        return {
+            "file": str(path),
+            "module": "",
+            "classes": [],
+            "imports": [],
+            "data_structures": {},
+            "complexity": {},
+            "syntax_ok": False,
+            "syntax_error": str(e),
+            "c_spec": {},
+        }
+
+
+def analyze_cpp_file(path: Path, analyzer: Optional[cppanalysis] = None) -> Dict[str, Any]:
+    """
+    Return the canonical report for a C++ file, or an error report on failure.
+
+    Args:
+        path (Path): C++ source or header file.
+        analyzer (Optional[cppanalysis]): Analyzer to reuse; defaults to the
+            current process's cached instance.
+    """
+    analyzer = analyzer or _worker_analyzer("C++")
+    try:
+        src = path.read_text(encoding="utf-8", errors="ignore")
+        return analyzer.analyze_file(src, path)
+    except Exception as e:
+        return {
+            "file": str(path),
+            "module": "",
+            "classes": [],
+            "imports": [],
+            "data_structures": {},
+            "complexity": {},
+            "cpp_spec": {},
+            "syntax_ok": False,
+            "error": str(e),
+        }
+
+
+def analyze_cs_file(path: Path, analyzer: Optional[csharpanalysis] = None) -> Dict[str, Any]:
+    """
+    Return the canonical report for a C# file, or an error report on failure.
+
+    Args:
+        path (Path): C# source file.
+        analyzer (Optional[csharpanalysis]): Analyzer to reuse; defaults to the
+            current process's cached instance.
+    """
+    analyzer = analyzer or _worker_analyzer("C#")
+    try:
+        src = path.read_text(encoding="utf-8", errors="ignore")
+        return analyzer.analyze_file(src, path)
+    except Exception as e:
+        return {
+            "file": str(path),
+            "module": "",
+            "classes": [],
+            "imports": [],
+            "data_structures": {},
+            "complexity": {},
+            "syntax_ok": False,
+            "error": str(e),
+        }
+
+
+def _to_cached(lang: str, result: Any) -> Any:
+    """Return the cacheable form of a per-file result."""
+    if lang == "Python":
+        return result.to_file_record()
+    return result
+
+
+def _default_workers() -> int:
+    """Read the worker count from the environment, falling back to serial."""
+    try:
+        return max(1, int(os.getenv(WORKERS_ENV_VAR, "1")))
+    except ValueError:
+        return 1
+
 
 class MultiLangOrchestrator:
     """Orchestrator for analyzing multi-language (Python + Java + C + Javascript + C# + C++) projects.
@@ -24,9 +178,27 @@ class MultiLangOrchestrator:
 
     IGNORE_DIRS = {".git", "__pycache__", ".venv", "venv", "env"}
 
-    def __init__(self, project_root: str | Path):
-        """Initialize with the project root directory."""
+    def __init__(
+        self,
+        project_root: str | Path,
+        inventory=None,
+        workers: Optional[int] = None,
+        cache: Optional[AnalysisCache] = None,
+    ):
+        """
+        Initialize with the project root directory.
+
+        Args:
+            project_root (str | Path): Project root to analyze.
+            inventory (ProjectInventory | None): Optional shared inventory used for file discovery.
+            workers (Optional[int]): Number of worker processes for per-file analysis.
+                1 runs serially; None reads OOP_ANALYSIS_WORKERS (default 1).
+            cache (Optional[AnalysisCache]): Per-file report cache; None analyzes every file.
+        """
         self.root = Path(project_root).resolve()
+        self.inventory = inventory
+        self.workers = max(1, workers) if workers is not None else _default_workers()
+        self.cache = cache
         self.py_analyzer = PythonOOPAstAnalyzer(self.root)
         self.js_analyzer = JavaScriptOOPAnalyzer(self.root)
 
@@ -42,11 +214,16 @@ class MultiLangOrchestrator:
                 Six lists containing discovered Python, Java, JavaScript,
                 C/C header files, C++ files, and C# files, respectively.
         """
-        
+
         py_files, java_files, js_files, c_files, cpp_files, cs_files = [], [], [], [], [], []
 
-        for p in self.root.rglob("*"):
-            if any(part in self.IGNORE_DIRS for part in p.parts) or not p.is_file():
+        if self.inventory is not None:
+            candidates = self.inventory.paths(base=self.root)
+        else:
+            candidates = (p for p in self.root.rglob("*") if p.is_file())
+
+        for p in candidates:
+            if any(part in self.IGNORE_DIRS for part in p.parts):
                 continue
             if p.suffix == ".py":
                 py_files.append(p)
@@ -63,9 +240,111 @@ class MultiLangOrchestrator:
 
         return py_files, java_files, js_files, c_files, cpp_files, cs_files
 
+    def _analyze_serial(self, py_files, java_files, c_files, cpp_files, cs_files):
+        """Run per-file analysis in this process, one file at a time."""
+        py_partials = [analyze_python_file(self.root, p) for p in py_files]
+
+        java_reports = [analyze_java_file(p) for p in java_files]
+        c_reports = [analyze_c_file(p) for p in c_files]
+
+        cpp_reports = [analyze_cpp_file(p) for p in cpp_files]
+        cs_reports = [analyze_cs_file(p) for p in cs_files]
+
+        return py_partials, java_reports, c_reports, cpp_reports, cs_reports
+
+    def _analyze_parallel(self, py_files, java_files, c_files, cpp_files, cs_files):
+        """
+        Fan per-file analysis out to a process pool.
+
+        Every file is submitted up front so all languages share the workers;
+        results are then collected in submission order.
+        """
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            py_futures = [pool.submit(analyze_python_file, self.root, p) for p in py_files]
+            java_futures = [pool.submit(analyze_java_file, p) for p in java_files]
+            c_futures = [pool.submit(analyze_c_file, p) for p in c_files]
+            cpp_futures = [pool.submit(analyze_cpp_file, p) for p in cpp_files]
+            cs_futures = [pool.submit(analyze_cs_file, p) for p in cs_files]
+
+            return (
+                [f.result() for f in py_futures],
+                [f.result() for f in java_futures],
+                [f.result() for f in c_futures],
+                [f.result() for f in cpp_futures],
+                [f.result() for f in cs_futures],
+            )
+
+    def _analyze_per_file(self, per_file: Dict[str, List[Path]]) -> Dict[str, List[Any]]:
+        """
+        Produce per-file results for every language, reusing cached reports where possible.
+
+        Args:
+            per_file (Dict[str, List[Path]]): Files per language, in the order
+                Python, Java, C, C++, C#.
+
+        Returns:
+            Dict[str, List[Any]]: Results per language, aligned with the input lists.
+        """
+        results: Dict[str, List[Any]] = {lang: [None] * len(files) for lang, files in per_file.items()}
+        digests: Dict[str, List[Optional[str]]] = {lang: [None] * len(files) for lang, files in per_file.items()}
+        pending: Dict[str, List[int]] = {lang: list(range(len(files))) for lang, files in per_file.items()}
+
+        if self.cache is not None:
+            for lang, files in per_file.items():
+                digests[lang] = self._content_digests(files)
+                name, version = CACHE_ANALYZERS[lang]
+                hits = self.cache.get_many(name, version, (d for d in digests[lang] if d))
+                pending[lang] = []
+                for i, (path, digest) in enumerate(zip(files, digests[lang])):
+                    if digest in hits:
+                        results[lang][i] = self._from_cached(lang, path, hits[digest])
+                    else:
+                        pending[lang].append(i)
+
+        todo = [[per_file[lang][i] for i in pending[lang]] for lang in per_file]
+        pooled_files = sum(len(files) for files in todo)
+        run = self._analyze_parallel if self.workers > 1 and pooled_files > 1 else self._analyze_serial
+        fresh = run(*todo)
+
+        for lang, lang_results in zip(per_file, fresh):
+            for i, result in zip(pending[lang], lang_results):
+                results[lang][i] = result
+
+        if self.cache is not None:
+            for lang, lang_results in zip(per_file, fresh):
+                name, version = CACHE_ANALYZERS[lang]
+                self.cache.put_many(name, version, [
+                    (digests[lang][i], _to_cached(lang, result))
+                    for i, result in zip(pending[lang], lang_results)
+                    if digests[lang][i] and result is not None
+                ])
+
+        return results
+
+    def _content_digests(self, files: List[Path]) -> List[Optional[str]]:
+        """
+        Return the SHA-256 of each file (None if unreadable), hashing on the
+        inventory's shared pool so later stages reuse the digests.
+        """
+        hashes = self.inventory.hashes if self.inventory is not None else ContentHashes()
+        hashes.prefetch(files)
+        digests: List[Optional[str]] = []
+        for path in files:
+            try:
+                digests.append(hashes.digest(path).sha256)
+            except OSError:
+                digests.append(None)
+        return digests
+
+    def _from_cached(self, lang: str, path: Path, record: Any) -> Any:
+        """Turn a cached record back into the per-file result for path."""
+        if lang == "Python":
+            return PythonOOPAstAnalyzer.from_file_record(self.root, path, record)
+        return relocate_report(record, path)
+
     def analyze(self) -> Dict[str, Any]:
         """Analyze all Python, Java, Javascript, C, C++, and C# files and return unified OOP metrics.
-        
+
         Args:
             None
 
@@ -85,25 +364,22 @@ class MultiLangOrchestrator:
             + len(cs_files)
         )
 
+        per_file = {"Python": py_files, "Java": java_files, "C": c_files, "C++": cpp_files, "C#": cs_files}
+        results = self._analyze_per_file(per_file)
+        py_partials, java_reports, c_reports, cpp_reports, cs_reports = (results[lang] for lang in per_file)
+
         # Analyze Python files
         self.py_analyzer.python_files = py_files
-        for p in py_files:
-            self.py_analyzer.analyze_file(p)
+        for partial in py_partials:
+            self.py_analyzer.merge(partial)
         if py_files:
             py_metrics = self.py_analyzer.compute_metrics()
             py_metrics["language"] = "Python"
             language_metrics["Python"] = py_metrics
 
-        # Analyze Java files
+        # Analyze Java files (unreadable files are skipped)
         if java_files:
-            java_reports = []
-            for jpath in java_files:
-                try:
-                    src = jpath.read_text(encoding="utf-8")
-                except Exception:
-                    continue
-                per_file = analyze_java_source(src, jpath)
-                java_reports.append(per_file)
+            java_reports = [r for r in java_reports if r is not None]
             java_metrics = aggregate_canonical_reports(java_reports, total_files=len(java_files))
             java_metrics["language"] = "Java"
             language_metrics["Java"] = java_metrics
@@ -116,71 +392,18 @@ class MultiLangOrchestrator:
 
         # Analyze C files
         if c_files:
-            c_reports = []
-            for cpath in c_files:
-                try:
-                    src = cpath.read_text(encoding="utf-8", errors="ignore")
-                    per_file = analyze_c_source(src, cpath)
-                    c_reports.append(per_file)
-                except Exception as e:
-                    c_reports.append({
-                        "file": str(cpath),
-                        "module": "",
-                        "classes": [],
-                        "imports": [],
-                        "data_structures": {},
-                        "complexity": {},
-                        "syntax_ok": False,
-                        "syntax_error": str(e),
-                        "c_spec": {},
-                    })
             c_metrics = aggregate_canonical_reports(c_reports, total_files=len(c_files))
             c_metrics["language"] = "C"
             language_metrics["C"] = c_metrics
 
         # Analyze C++ files
         if cpp_files:
-            cpp_reports = []
-            cpp_analyzer = cppanalysis()
-            for cpp_path in cpp_files:
-                try:
-                    src = cpp_path.read_text(encoding="utf-8", errors="ignore")
-                    cpp_reports.append(cpp_analyzer.analyze_file(src, cpp_path))
-                except Exception as e:
-                    cpp_reports.append({
-                        "file": str(cpp_path),
-                        "module": "",
-                        "classes": [],
-                        "imports": [],
-                        "data_structures": {},
-                        "complexity": {},
-                        "cpp_spec": {},
-                        "syntax_ok": False,
-                        "error": str(e),
-                    })
             cpp_metrics = aggregate_canonical_reports(cpp_reports, total_files=len(cpp_files))
             cpp_metrics["language"] = "C++"
             language_metrics["C++"] = cpp_metrics
 
         # Analyze C# files
         if cs_files:
-            cs_reports = []
-            cs_analyzer = csharpanalysis()
-            for cs_path in cs_files:
-                try:
-                    src = cs_path.read_text(encoding="utf-8", errors="ignore")
-                    cs_reports.append(cs_analyzer.analyze_file(src, cs_path))
-                except Exception as e:
-                    cs_reports.append({
-                        "file": str(cs_path),
-                        "module": "",
-                        "classes": [],
-                        "imports": [],
-                        "data_structures": {},
-                        "complexity": {},
-                        "syntax_ok": False,
-                        "error": str(e),
-                    })
             cs_metrics = aggregate_canonical_reports(cs_reports, total_files=len(cs_files))
             cs_metrics["language"] = "C#"
             language_metrics["C#"] = cs_metrics
@@ -196,9 +419,10 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Analyze Python + Java projects")
     parser.add_argument("project_root", help="Project root folder to analyze")
     parser.add_argument("--out", help="Write metrics JSON to this file")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for per-file analysis")
     args = parser.parse_args()
 
-    metrics = MultiLangOrchestrator(args.project_root).analyze()
+    metrics = MultiLangOrchestrator(args.project_root, workers=args.workers).analyze()
     print(json.dumps(metrics, indent=2))
 
     if args.out:
@@ -17,12 +17,38 @@ sys.path.append(str(Path(__file__).resolve().parents[1]))
 from src.aggregation.oop_aggregator import aggregate_canonical_reports
 from src.aggregation.oop_aggregator import build_narrative
 from src.analyzers.class_info import ClassInfo
-class ClassVisitor(ast.NodeVisitor):
+
+# Bump whenever per-file report output changes; cached reports from other
+# versions are then ignored.
+ANALYZER_VERSION = "1"
+
+
+_LITERAL_COUNTERS = {
+    ast.List: "list_literals",
+    ast.Dict: "dict_literals",
+    ast.Set: "set_literals",
+    ast.Tuple: "tuple_literals",
+    ast.ListComp: "list_comprehensions",
+    ast.DictComp: "dict_comprehensions",
+    ast.SetComp: "set_comprehensions",
+}
+_LOOP_TYPES = (ast.For, ast.While, ast.AsyncFor)
+
+
+class _ModuleVisitor:
     """
-    AST visitor that collects class definitions and OOP signals.
-    
-    Walks the AST to find class definitions, extract inheritance info,
-    method names, and attribute assignments.
+    Single-pass AST visitor that collects everything PythonOOPAstAnalyzer needs from a module.
+
+    One iterative walk over the tree gathers:
+        - Classes: name, bases, methods, dunder count and `self.x` attribute assignments
+        - Literal counts: lists, dicts, sets, tuples
+        - Comprehension counts: list/dict/set comprehensions
+        - Advanced structures: defaultdict, Counter, heapq, bisect, sorted
+        - Complexity: function counts and nested loop depth
+
+    Loop depth is tracked with a stack of open functions instead of re-walking
+    every function, and attribute assignments are credited to every class whose
+    method encloses them instead of walking each method again.
     """
 
     def __init__(self, file_path: Path, module_name: str):
@@ -34,22 +60,123 @@ class ClassVisitor(ast.NodeVisitor):
             module_name: Logical module identifier associated with the file (typically
                 derived from the package or import context, not the filesystem name).
         """
-        
         self.file_path = file_path
         self.module_name = module_name
         self.classes: List[ClassInfo] = []
 
-    def visit_ClassDef(self, node: ast.ClassDef) -> Any:
+        # Data structure counts
+        self.list_literals = 0
+        self.dict_literals = 0
+        self.set_literals = 0
+        self.tuple_literals = 0
+        self.list_comprehensions = 0
+        self.dict_comprehensions = 0
+        self.set_comprehensions = 0
+
+        # Advanced structures / algorithms
+        self.uses_defaultdict = False
+        self.uses_counter = False
+        self.uses_heapq = False
+        self.uses_bisect = False
+        self.uses_sorted = False
+
+        # Complexity signals
+        self.total_functions = 0
+        self.functions_with_nested_loops = 0
+        self.max_loop_depth_overall = 0
+
+    def visit(self, tree: ast.AST) -> None:
         """
-        Process a class definition node and extract OOP information.
+        Walk the tree once, depth-first in source order, recording every signal.
+
+        Args:
+            tree: Parsed module.
+
+        Returns:
+            None
+        """
+        literal_counts = dict.fromkeys(_LITERAL_COUNTERS.values(), 0)
+        method_classes: Dict[ast.FunctionDef, ClassInfo] = {}  # direct-body methods of seen classes
+        open_methods: List[tuple] = []  # (method node, owning ClassInfo), outermost first
+        open_functions: List[List[int]] = []  # [loop depth at entry, deepest loop depth inside]
+        loop_depth = 0
+
+        stack = [(tree, False)]
+        while stack:
+            node, leaving = stack.pop()
+            kind = type(node)
+
+            if leaving:
+                if kind is ast.FunctionDef:
+                    entry_depth, deepest = open_functions.pop()
+                    self._finish_function(deepest)
+                    if open_functions:
+                        parent = open_functions[-1]
+                        parent[1] = max(parent[1], deepest + entry_depth - parent[0])
+                    if open_methods and open_methods[-1][0] is node:
+                        open_methods.pop()
+                else:
+                    loop_depth -= 1
+                continue
+
+            counter = _LITERAL_COUNTERS.get(kind)
+            if counter is not None:
+                literal_counts[counter] += 1
+            elif kind in _LOOP_TYPES:
+                loop_depth += 1
+                if open_functions:
+                    current = open_functions[-1]
+                    current[1] = max(current[1], loop_depth - current[0])
+                stack.append((node, True))
+            elif kind is ast.FunctionDef:
+                open_functions.append([loop_depth, 0])
+                owner = method_classes.pop(node, None)
+                if owner is not None:
+                    open_methods.append((node, owner))
+                stack.append((node, True))
+            elif kind is ast.ClassDef:
+                info = self._class_info(node)
+                for stmt in node.body:
+                    if isinstance(stmt, ast.FunctionDef):
+                        method_classes[stmt] = info
+                self.classes.append(info)
+            elif kind is ast.Assign:
+                for _, owner in open_methods:
+                    for target in node.targets:
+                        _record_attr_target(owner, target)
+            elif kind is ast.AnnAssign:
+                for _, owner in open_methods:
+                    _record_attr_target(owner, node.target)
+            elif kind is ast.Call:
+                self._record_call(node)
+            elif kind is ast.ImportFrom:
+                self._record_import_from(node)
+            elif kind is ast.Import:
+                self._record_import(node)
+
+            children = []
+            for name in node._fields:
+                value = getattr(node, name, None)
+                if isinstance(value, ast.AST):
+                    children.append((value, False))
+                elif isinstance(value, list):
+                    children.extend((item, False) for item in value if isinstance(item, ast.AST))
+            children.reverse()
+            stack.extend(children)
+
+        for key, count in literal_counts.items():
+            setattr(self, key, count)
+
+    def _class_info(self, node: ast.ClassDef) -> ClassInfo:
+        """
+        Build the ClassInfo for a class definition from its bases and direct methods.
 
         Args:
             node: AST node representing a Python class definition.
 
         Returns:
-            Any: This visitor method returns None explicitly and records extracted class information as side effects on the visitor instance.
+            ClassInfo: The class, without attributes (those are added as its methods are walked).
         """
-    
         bases = []
         for b in node.bases:
             # Handle simple cases: BaseClass, module.BaseClass
@@ -68,131 +195,31 @@ class ClassVisitor(ast.NodeVisitor):
             file_path=self.file_path,
             bases=bases,
         )
-
         for stmt in node.body:
-            # Methods
             if isinstance(stmt, ast.FunctionDef):
                 info.methods.add(stmt.name)
                 if stmt.name == "__init__":
                     info.has_init = True
                 if stmt.name.startswith("__") and stmt.name.endswith("__"):
                     info.dunder_methods += 1
+        return info
 
-                # look for attribute assignments to self inside methods
-                self.collect_attr_assignments(info, stmt)
-
-        self.classes.append(info)
-        # Continue visiting nested classes
-        self.generic_visit(node)
-
-    def collect_attr_assignments(self, info: ClassInfo, func: ast.FunctionDef) -> None:
-        
+    def _finish_function(self, max_depth: int) -> None:
         """
-        Look for `self.x = value` inside a method to approximate encapsulation and attribute design.
-        
-        Args:
-            info: ClassInfo object being populated with detected attributes.
-            func: AST node representing a method definition to analyze.
+        Record a (non-async) function whose deepest for/while nesting was max_depth.
 
-        Returns:
-            None
-        """
-        for node in ast.walk(func):
-            # `self.foo = ...`
-            if isinstance(node, ast.Assign):
-                for target in node.targets:
-                    self.record_attr_target(info, target)
-            elif isinstance(node, ast.AnnAssign):
-                # `self.foo: int = 3`
-                self.record_attr_target(info, node.target)
-
-    def record_attr_target(self, info: ClassInfo, target: ast.AST) -> None:
-        """
-        Record an attribute assignment to self as private or public.
-        
         Args:
-            info: ClassInfo object being updated with detected attribute information.
-            target: AST node representing the assignment target to inspect.
+            max_depth: Maximum depth of nested for/while/async-for loops inside it.
 
         Returns:
             None
-        
         """
-        if isinstance(target, ast.Attribute) and isinstance(target.value, ast.Name):
-            if target.value.id == "self":  # self.<attr>
-                attr_name = target.attr
-                if attr_name.startswith("_") and not attr_name.startswith("__"):
-                    info.private_attrs.add(attr_name)
-                else:
-                    info.public_attrs.add(attr_name)
-                    
-class _DataStructureAndComplexityVisitor(ast.NodeVisitor):
-    """
-    AST visitor that collects data structure usage and complexity metrics.
-    
-    Tracks:
-        - Literal counts: lists, dicts, sets, tuples
-        - Comprehension counts: list/dict/set comprehensions
-        - Advanced structures: defaultdict, Counter, heapq, bisect
-        - Complexity: nested loop depth, function counts
-    """
-    
-    def __init__(self) -> None:
-        """Initialize counters and flags for data structure tracking."""
-        
-        # Data structure counts
-        self.list_literals = 0
-        self.dict_literals = 0
-        self.set_literals = 0
-        self.tuple_literals = 0
-        self.list_comprehensions = 0
-        self.dict_comprehensions = 0
-        self.set_comprehensions = 0
-
-        # Advanced structures / algorithms
-        self.uses_defaultdict = False
-        self.uses_counter = False
-        self.uses_heapq = False
-        self.uses_bisect = False
-        self.uses_sorted = False
-
-        # Complexity signals
-        self.total_functions = 0
-        self.functions_with_nested_loops = 0
-        self.max_loop_depth_overall = 0
-
-    # Data structure 
-    def visit_List(self, node: ast.List) -> Any:
-        self.list_literals += 1
-        self.generic_visit(node)
-
-    def visit_Dict(self, node: ast.Dict) -> Any:
-        self.dict_literals += 1
-        self.generic_visit(node)
-
-    def visit_Set(self, node: ast.Set) -> Any:
-        self.set_literals += 1
-        self.generic_visit(node)
-
-    def visit_Tuple(self, node: ast.Tuple) -> Any:
-        self.tuple_literals += 1
-        self.generic_visit(node)
-
-    def visit_ListComp(self, node: ast.ListComp) -> Any:
-        self.list_comprehensions += 1
-        self.generic_visit(node)
-
-    def visit_DictComp(self, node: ast.DictComp) -> Any:
-        self.dict_comprehensions += 1
-        self.generic_visit(node)
-
-    def visit_SetComp(self, node: ast.SetComp) -> Any:
-        self.set_comprehensions += 1
-        self.generic_visit(node)
+        self.total_functions += 1
+        self.max_loop_depth_overall = max(self.max_loop_depth_overall, max_depth)
+        if max_depth >= 2:
+            self.functions_with_nested_loops += 1
 
-    # Imports 
-    def visit_ImportFrom(self, node: ast.ImportFrom) -> Any:
-        
+    def _record_import_from(self, node: ast.ImportFrom) -> None:
         """
         Process a from-import statement to detect usage of specific standard library
         data structures and algorithms.
@@ -214,10 +241,8 @@ class _DataStructureAndComplexityVisitor(ast.NodeVisitor):
             self.uses_heapq = True
         if module == "bisect":
             self.uses_bisect = True
-        self.generic_visit(node)
 
-    def visit_Import(self, node: ast.Import) -> Any:
-        
+    def _record_import(self, node: ast.Import) -> None:
         """
         Process an import statement to detect usage of specific standard library
         modules related to data structures and algorithms.
@@ -229,60 +254,12 @@ class _DataStructureAndComplexityVisitor(ast.NodeVisitor):
             None
         """
         for alias in node.names:
-            name = alias.name
-            if name == "heapq":
+            if alias.name == "heapq":
                 self.uses_heapq = True
-            if name == "bisect":
+            if alias.name == "bisect":
                 self.uses_bisect = True
-            if name.startswith("collections"):
-                # generic collections usage, could be collections.defaultdict, collections.Counter, etc.
-                pass
-        self.generic_visit(node)
-
-    # complexity 
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> Any:
-        
-        """
-        Analyze a function definition to collect basic complexity metrics.
-
-        Args:
-            node: AST node representing a function definition.
 
-        Returns:
-            None
-        """
-        self.total_functions += 1
-        max_depth = self._max_loop_depth(node)
-        self.max_loop_depth_overall = max(self.max_loop_depth_overall, max_depth)
-        if max_depth >= 2:
-            self.functions_with_nested_loops += 1
-        self.generic_visit(node)
-
-    def _max_loop_depth(self, node: ast.AST, current_depth: int = 0) -> int:
-        
-        """
-        measure max nesting of for/while loops inside a function.
-
-        Args:
-            node: AST node to analyze for loop nesting.
-            current_depth: Current loop nesting depth during recursive traversal.
-
-        Returns:
-            int: Maximum depth of nested for/while/async-for loops found.
-        """
-        max_depth = current_depth
-        for child in ast.iter_child_nodes(node):
-            if isinstance(child, (ast.For, ast.While, ast.AsyncFor)):
-                depth = self._max_loop_depth(child, current_depth + 1)
-            else:
-                depth = self._max_loop_depth(child, current_depth)
-            if depth > max_depth:
-                max_depth = depth
-        return max_depth
-
-    # Advanced algorithms usage
-    def visit_Call(self, node: ast.Call) -> Any:
-        
+    def _record_call(self, node: ast.Call) -> None:
         """
         Detect usage of advanced algorithmic utilities within function calls.
 
@@ -301,8 +278,28 @@ class _DataStructureAndComplexityVisitor(ast.NodeVisitor):
         if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name):
             if func.value.id == "heapq":
                 self.uses_heapq = True
-        self.generic_visit(node)
-        
+
+
+def _record_attr_target(info: ClassInfo, target: ast.AST) -> None:
+    """
+    Record an attribute assignment to self as private or public.
+
+    Args:
+        info: ClassInfo object being updated with detected attribute information.
+        target: AST node representing the assignment target to inspect.
+
+    Returns:
+        None
+    """
+    if isinstance(target, ast.Attribute) and isinstance(target.value, ast.Name):
+        if target.value.id == "self":  # self.<attr>
+            attr_name = target.attr
+            if attr_name.startswith("_") and not attr_name.startswith("__"):
+                info.private_attrs.add(attr_name)
+            else:
+                info.public_attrs.add(attr_name)
+
+
 class PythonOOPAstAnalyzer:
     """
     Analyze Python OOP usage in a project directory using the built-in AST.
@@ -374,21 +371,20 @@ class PythonOOPAstAnalyzer:
             self.syntax_errors.append(path)
             return
 
+        visitor = _ModuleVisitor(path, self._module_name(path))
+        visitor.visit(tree)
+        self.class_infos.extend(visitor.classes)
+        self._accumulate_ds_and_complexity(visitor)
+        
+    def _module_name(self, path: Path) -> str:
+        """Return the dotted module name of path relative to root (the stem if outside root)."""
         try:
             rel = path.relative_to(self.root)
-            module_name = ".".join(rel.with_suffix("").parts)
+            return ".".join(rel.with_suffix("").parts)
         except ValueError:
-            module_name = path.stem
+            return path.stem
 
-        visitor = ClassVisitor(path, module_name)
-        visitor.visit(tree)
-        self.class_infos.extend(visitor.classes)
-        
-        ds_visitor = _DataStructureAndComplexityVisitor()
-        ds_visitor.visit(tree)
-        self._accumulate_ds_and_complexity(ds_visitor)
-        
-    def _accumulate_ds_and_complexity(self, v: _DataStructureAndComplexityVisitor) -> None:
+    def _accumulate_ds_and_complexity(self, v: _ModuleVisitor) -> None:
         """Accumulate data structure and complexity stats from a visitor."""
         # Data structure counts
         for key in self.ds_counts:
@@ -406,6 +402,101 @@ class PythonOOPAstAnalyzer:
             v.max_loop_depth_overall,
         )
         
+    def merge(self, other: "PythonOOPAstAnalyzer") -> None:
+        """
+        Fold another analyzer's per-file results into this one.
+
+        Used when files are analyzed by separate analyzer instances (e.g. in
+        worker processes). Merging in file order yields the same state as
+        calling analyze_file on this analyzer for each file.
+
+        Args:
+            other (PythonOOPAstAnalyzer): Analyzer holding results to merge.
+
+        Returns:
+            None
+        """
+        self.class_infos.extend(other.class_infos)
+        self.syntax_errors.extend(other.syntax_errors)
+
+        for key in self.ds_counts:
+            self.ds_counts[key] += other.ds_counts[key]
+        for key in self.alg_usage:
+            self.alg_usage[key] = self.alg_usage[key] or other.alg_usage[key]
+
+        self.complexity_stats["total_functions"] += other.complexity_stats["total_functions"]
+        self.complexity_stats["functions_with_nested_loops"] += other.complexity_stats["functions_with_nested_loops"]
+        self.complexity_stats["max_loop_depth"] = max(
+            self.complexity_stats["max_loop_depth"],
+            other.complexity_stats["max_loop_depth"],
+        )
+
+    def to_file_record(self) -> Dict[str, Any]:
+        """
+        Serialize a single-file analyzer's results into a path-independent record.
+
+        Paths and module names are left out so a cached record can be replayed for
+        the same file content at a different location (see from_file_record).
+
+        Args:
+            None
+
+        Returns:
+            Dict[str, Any]: JSON-serializable per-file results.
+        """
+        return {
+            "syntax_error": bool(self.syntax_errors),
+            "classes": [
+                {
+                    "name": ci.name,
+                    "bases": list(ci.bases),
+                    "methods": sorted(ci.methods),
+                    "has_init": ci.has_init,
+                    "dunder_methods": ci.dunder_methods,
+                    "private_attrs": sorted(ci.private_attrs),
+                    "public_attrs": sorted(ci.public_attrs),
+                }
+                for ci in self.class_infos
+            ],
+            "ds_counts": dict(self.ds_counts),
+            "alg_usage": dict(self.alg_usage),
+            "complexity_stats": dict(self.complexity_stats),
+        }
+
+    @classmethod
+    def from_file_record(cls, root: Path, path: Path, record: Dict[str, Any]) -> "PythonOOPAstAnalyzer":
+        """
+        Rebuild a single-file analyzer from a record produced by to_file_record.
+
+        Args:
+            root (Path): Project root, used to derive the module name.
+            path (Path): Current location of the analyzed file.
+            record (Dict[str, Any]): Stored per-file results.
+
+        Returns:
+            PythonOOPAstAnalyzer: Analyzer holding only this file's results.
+        """
+        partial = cls(root)
+        if record["syntax_error"]:
+            partial.syntax_errors.append(path)
+        module_name = partial._module_name(path)
+        for c in record["classes"]:
+            partial.class_infos.append(ClassInfo(
+                name=c["name"],
+                module=module_name,
+                file_path=path,
+                bases=list(c["bases"]),
+                methods=set(c["methods"]),
+                has_init=c["has_init"],
+                dunder_methods=c["dunder_methods"],
+                private_attrs=set(c["private_attrs"]),
+                public_attrs=set(c["public_attrs"]),
+            ))
+        partial.ds_counts.update(record["ds_counts"])
+        partial.alg_usage.update(record["alg_usage"])
+        partial.complexity_stats.update(record["complexity_stats"])
+        return partial
+
     def to_canonical_reports(self) -> List[Dict[str, Any]]:
         """
         Convert class_infos into canonical per-file reports for the aggregator.
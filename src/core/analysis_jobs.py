@@ -0,0 +1,244 @@
+"""Background job queue for project analysis.
+
+`analyze_project` can take minutes on large uploads, which is too long to hold
+an HTTP request open. `AnalysisJobManager` runs analyses on a bounded thread
+pool instead: callers submit a job, get an id back immediately, and poll the
+job for per-stage progress. Jobs can be cancelled while queued or between
+stages while running.
+
+Pool size and queue depth come from the environment:
+    ANALYSIS_JOB_WORKERS  maximum analyses running at once (default 2)
+    ANALYSIS_JOB_QUEUE    maximum jobs queued or running (default 16)
+"""
+
+from __future__ import annotations
+
+import datetime
+import logging
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+WORKERS_ENV_VAR = "ANALYSIS_JOB_WORKERS"
+QUEUE_ENV_VAR = "ANALYSIS_JOB_QUEUE"
+DEFAULT_WORKERS = 2
+DEFAULT_QUEUE_LIMIT = 16
+MAX_FINISHED_JOBS = 100
+
+# Stages reported by analyze_project through its progress callback, in order.
+STAGES = ("extract", "hierarchy", "docs", "contributions", "oop", "dedup", "export")
+# Once dedup has updated the index, the snapshot is exported even if the job
+# was cancelled meanwhile, so the two never disagree.
+UNCANCELLABLE_STAGES = {"export"}
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATES = {SUCCEEDED, FAILED, CANCELLED}
+
+
+class AnalysisCancelled(Exception):
+    """Raised inside a running job when it has been cancelled."""
+
+
+class JobQueueFull(Exception):
+    """Raised when a job is submitted while the queue is at its limit."""
+
+
+@dataclass
+class AnalysisJob:
+    """
+    State of one analysis job.
+
+    Attributes:
+        job_id (str): Unique job identifier.
+        project_name (Optional[str]): Project name the job was submitted for.
+        status (str): One of queued, running, succeeded, failed, cancelled.
+        stage (Optional[str]): Stage currently running (or last reached).
+        completed_stages (List[str]): Stages that finished, in order.
+        result (Optional[Dict[str, Any]]): Analysis result once succeeded.
+        error (Optional[str]): Error message once failed.
+        created_at / started_at / finished_at (Optional[datetime]): UTC timestamps.
+    """
+
+    job_id: str
+    project_name: Optional[str] = None
+    status: str = QUEUED
+    stage: Optional[str] = None
+    completed_stages: List[str] = field(default_factory=list)
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: datetime.datetime = field(default_factory=lambda: datetime.datetime.now(tz=datetime.timezone.utc))
+    started_at: Optional[datetime.datetime] = None
+    finished_at: Optional[datetime.datetime] = None
+    cancel_event: threading.Event = field(default_factory=threading.Event, repr=False)
+    future: Optional[Future] = field(default=None, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable snapshot of the job."""
+        return {
+            "job_id": self.job_id,
+            "project_name": self.project_name,
+            "status": self.status,
+            "stage": self.stage,
+            "stages": {
+                name: (
+                    "done" if name in self.completed_stages
+                    else "running" if name == self.stage and self.status == RUNNING
+                    else "pending"
+                )
+                for name in STAGES
+            },
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read a positive integer from the environment, falling back to default."""
+    try:
+        return max(1, int(os.getenv(name, str(default))))
+    except ValueError:
+        return default
+
+
+class AnalysisJobManager:
+    """
+    Runs analysis jobs on a bounded worker pool and tracks their progress.
+
+    The job callable receives a progress function and must call it with each
+    stage name as the stage starts; cancellation takes effect at those calls.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, queue_limit: Optional[int] = None):
+        """
+        Args:
+            max_workers (Optional[int]): Analyses allowed to run at once.
+                None reads ANALYSIS_JOB_WORKERS (default 2).
+            queue_limit (Optional[int]): Jobs allowed to be queued or running.
+                None reads ANALYSIS_JOB_QUEUE (default 16).
+        """
+        self.max_workers = max_workers or _env_int(WORKERS_ENV_VAR, DEFAULT_WORKERS)
+        self.queue_limit = queue_limit or _env_int(QUEUE_ENV_VAR, DEFAULT_QUEUE_LIMIT)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="analysis-job")
+        self._jobs: "OrderedDict[str, AnalysisJob]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        run: Callable[[Callable[[str], None]], Dict[str, Any]],
+        project_name: Optional[str] = None,
+    ) -> AnalysisJob:
+        """
+        Queue an analysis.
+
+        Args:
+            run (Callable): Called on a worker thread with a progress function;
+                its return value becomes the job result.
+            project_name (Optional[str]): Name shown in job status.
+
+        Returns:
+            AnalysisJob: The queued job.
+
+        Raises:
+            JobQueueFull: If queue_limit jobs are already queued or running.
+        """
+        with self._lock:
+            active = sum(1 for job in self._jobs.values() if job.status not in FINISHED_STATES)
+            if active >= self.queue_limit:
+                raise JobQueueFull(f"Analysis queue is full ({self.queue_limit} jobs)")
+
+            job = AnalysisJob(job_id=uuid.uuid4().hex, project_name=project_name)
+            self._jobs[job.job_id] = job
+            self._prune_finished()
+            job.future = self._executor.submit(self._run, job, run)
+        return job
+
+    def get(self, job_id: str) -> Optional[AnalysisJob]:
+        """Return the job with this id, or None if unknown (or pruned)."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[AnalysisJob]:
+        """
+        Cancel a job.
+
+        A queued job is cancelled immediately; a running job stops at its next
+        stage boundary. Finished jobs are left unchanged.
+
+        Args:
+            job_id (str): Job to cancel.
+
+        Returns:
+            Optional[AnalysisJob]: The job, or None if unknown.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status in FINISHED_STATES:
+                return job
+            job.cancel_event.set()
+            if job.status == QUEUED and job.future is not None and job.future.cancel():
+                self._finish(job, CANCELLED)
+        return job
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Cancel queued jobs and stop the worker pool."""
+        with self._lock:
+            for job in self._jobs.values():
+                if job.status not in FINISHED_STATES:
+                    job.cancel_event.set()
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _run(self, job: AnalysisJob, run: Callable[[Callable[[str], None]], Dict[str, Any]]) -> None:
+        """Worker-thread body: run the analysis and record its outcome."""
+        with self._lock:
+            if job.cancel_event.is_set():
+                self._finish(job, CANCELLED)
+                return
+            job.status = RUNNING
+            job.started_at = datetime.datetime.now(tz=datetime.timezone.utc)
+
+        def progress(stage: str) -> None:
+            with self._lock:
+                if job.stage is not None and job.stage not in job.completed_stages:
+                    job.completed_stages.append(job.stage)
+                if job.cancel_event.is_set() and stage not in UNCANCELLABLE_STAGES:
+                    raise AnalysisCancelled(job.job_id)
+                job.stage = stage
+
+        try:
+            result = run(progress)
+        except AnalysisCancelled:
+            with self._lock:
+                self._finish(job, CANCELLED)
+        except Exception as e:
+            logging.warning("Analysis job %s failed: %s", job.job_id, e)
+            with self._lock:
+                job.error = str(e)
+                self._finish(job, FAILED)
+        else:
+            with self._lock:
+                if job.stage is not None and job.stage not in job.completed_stages:
+                    job.completed_stages.append(job.stage)
+                job.result = result
+                self._finish(job, SUCCEEDED)
+
+    def _finish(self, job: AnalysisJob, status: str) -> None:
+        """Mark a job finished. Caller holds the lock."""
+        job.status = status
+        job.finished_at = datetime.datetime.now(tz=datetime.timezone.utc)
+
+    def _prune_finished(self) -> None:
+        """Forget the oldest finished jobs beyond MAX_FINISHED_JOBS. Caller holds the lock."""
+        finished = [job_id for job_id, job in self._jobs.items() if job.status in FINISHED_STATES]
+        for job_id in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job_id]
@@ -4,15 +4,17 @@ import json
 import logging
 import re
 import threading
-from pathlib import Path
-from typing import Any, Dict, List
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import Any, Callable, Dict, List, Tuple
 
 from fastapi import UploadFile
 
 # Analysis helpers used by interactive app flows for project ingestion and persistence.
 from src.core.app_context import runtimeAppContext
 from src.core.data_extraction import FileMetadataExtractor
-from src.core.extraction import extractInfo
+from src.core.project_inventory import ArchiveInventory, ProjectInventory
+from src.core.extraction import extractInfo, zip_member_parts
 from src.analysis.get_contributors_percentage_per_person import contribution_summary
 from src.core.project_duration_estimation import Project_Duration_Estimator
 from src.reporting.project_insights import record_project_insight
@@ -20,8 +22,9 @@ from src.analyzers.multilang_orchestrator import MultiLangOrchestrator
 from src.reporting.resume_item_generator import generate_resume_item
 from src.storage.file_data_saving import SaveFileAnalysisAsJSON
 from src.storage.dedup_index import deduplicate_project
+from src.storage.analysis_cache import AnalysisCache, CACHE_FILENAME
 from src.utils.utility_methods import convert_datetime_to_string
-from src.core.document_analysis import DocumentAnalyzer
+from src.core.document_analysis import DocumentAnalyzer, SUPPORTED_DOC_EXTS
 from src.core.project_stack_detection import detect_project_stack
 from src.reporting.portfolio_service import (
     load_portfolio_showcase,
@@ -71,14 +74,74 @@ def extract_if_zip(zip_path: Path | UploadFile) -> Path:
 
     return extracted_path
 
-def oop_analysis(root: Path, languages_found) -> Dict[str, Any] | None:
+
+# Files whose content some analysis stage reads: OOP sources, documents,
+# dependency manifests and contributor files. Other archive members are only
+# listed (name, size, timestamp) and never extracted.
+_CONTENT_SUFFIXES = {
+    ".py", ".java", ".js", ".c", ".h", ".cpp", ".cc", ".cxx", ".hpp", ".hh", ".hxx", ".cs",
+} | SUPPORTED_DOC_EXTS
+_CONTENT_NAMES = {
+    "requirements.txt", "pyproject.toml", "poetry.lock", "pdm.lock", "package.json",
+    "composer.json", "contributors", "authors", "readme.md",
+}
+
+
+def _members_to_extract(members: List[zipfile.ZipInfo]) -> set[str]:
+    """
+    Pick the archive members whose content analysis reads.
+
+    Archives containing a `.git` directory are extracted in full, since git
+    history is read through the working tree.
+    """
+    files = {m.filename: zip_member_parts(m.filename) for m in members if not m.is_dir()}
+    if any(".git" in parts for parts in files.values()):
+        return set(files)
+    return {
+        name for name, parts in files.items()
+        if parts and (
+            PurePosixPath(parts[-1]).suffix.lower() in _CONTENT_SUFFIXES
+            or parts[-1].lower() in _CONTENT_NAMES
+        )
+    }
+
+
+def extract_zip_for_analysis(zip_path: Path | UploadFile) -> Tuple[Path, ArchiveInventory]:
+    """
+    Open a ZIP archive for analysis, extracting only the members analysis reads.
+
+    Args:
+        zip_path (Path | UploadFile): Location of the ZIP file or a file-like object.
+
+    Returns:
+        Tuple[Path, ArchiveInventory]: Extraction folder and an inventory of every
+            archive member, to be passed to analyze_project.
+
+    Raises:
+        RuntimeError: Extraction returned an empty result.
+        ValueError: Extraction reported an error string.
+    """
+    out = extractInfo().runArchiveExtraction(zip_path, _members_to_extract)
+    if not out:
+        raise RuntimeError("Extraction returned empty result.")
+    if isinstance(out, str):
+        raise ValueError(f"Extraction failed: {out}")
+
+    extracted_dir, members, extracted = out
+    source = zip_path if isinstance(zip_path, Path) else zip_path.file
+    return Path(extracted_dir), ArchiveInventory(extracted_dir, source, members, extracted)
+
+
+def oop_analysis(root: Path, languages_found, inventory: ProjectInventory | None = None) -> Dict[str, Any] | None:
     """
     Run OOP analysis when Python/Java/C is present.
     Uses MultiLangOrchestrator to analyze projects containing Python, Java, C, C# and/or C++.
+    Per-file reports are cached by content hash, so unchanged files are not re-parsed.
 
     Args:
         root (Path): Project root to scan.
         languages_found: Languages found in project
+        inventory (ProjectInventory | None): Shared file inventory used for source discovery.
 
     Returns:
         Dict[str, Any] | None: OOP metrics when run, otherwise None.
@@ -95,7 +158,8 @@ def oop_analysis(root: Path, languages_found) -> Dict[str, Any] | None:
     if not detected_languages:
         return None
         
-    return MultiLangOrchestrator(root).analyze() # raise exceptions to api
+    cache = AnalysisCache(Path(runtimeAppContext.default_save_dir) / CACHE_FILENAME)
+    return MultiLangOrchestrator(root, inventory=inventory, cache=cache).analyze() # raise exceptions to api
 
 def export_json(project_name: str, analysis: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -188,6 +252,8 @@ def analyze_project(
     use_ai_analysis: bool = False,
     project_name: str | None = None,
     remove_duplicates: bool = True,
+    inventory: ProjectInventory | None = None,
+    progress: Callable[[str], None] | None = None,
 ) -> Dict[str, Any]:
     """
     Analyze a project folder and persist results.
@@ -196,13 +262,25 @@ def analyze_project(
         root (Path): Project root to scan.
         use_ai_analysis (bool): If true, uses ollama AI analysis. (Deprecated)
         remove_duplicates (bool): If true, duplicate files are deleted after being recorded.
+        inventory (ProjectInventory | None): Pre-built inventory of root, e.g. from
+            extract_zip_for_analysis. Built by walking root when omitted.
+        progress (Callable[[str], None] | None): Called with each stage name
+            ("hierarchy", "docs", "contributions", "oop", "dedup", "export") as
+            the stage starts. Exceptions it raises abort the analysis.
 
     Returns:
         None
     """
 
     display_name = safe_project_name(project_name or root.name)
-    hierarchy = FileMetadataExtractor(root).file_hierarchy()  #Metadata extracted with datetime objects
+    stage = progress or (lambda name: None)
+
+    stage("hierarchy")
+    # Walk the project once; every stage below reads from this inventory
+    # instead of re-listing and re-stat'ing the tree itself.
+    if inventory is None:
+        inventory = ProjectInventory(root)
+    hierarchy = FileMetadataExtractor(root, inventory=inventory).file_hierarchy()  #Metadata extracted with datetime objects
     try:
         duration = Project_Duration_Estimator(hierarchy).get_duration_human() #Project duration estimate
     except Exception:  #If error, gracefully replace estimation
@@ -210,12 +288,18 @@ def analyze_project(
 
     # Run doc_analysis and contrib_summary once here and pass into generate_resume_item
     # to avoid scanning the project twice.
-    doc_analysis = DocumentAnalyzer(root).analyze()
+    stage("docs")
+    doc_analysis = DocumentAnalyzer(
+        root,
+        files=sorted(inventory.paths(suffixes=SUPPORTED_DOC_EXTS)),
+        hashes=inventory.hashes,
+    ).analyze()
 
+    stage("contributions")
     contrib_summary: Dict[str, Any] | None = None
     contributors_data: Dict[str, Any] | None = None
     try:
-        contrib_summary = contribution_summary(root)
+        contrib_summary = contribution_summary(root, inventory=inventory)
         contributors_data = (contrib_summary or {}).get("contributors") or None
     except Exception as e:
         contrib_summary = None
@@ -226,6 +310,7 @@ def analyze_project(
         project_name=display_name,
         doc_analysis=doc_analysis,
         contrib_summary_data=contrib_summary,
+        inventory=inventory,
     )
 
     # Backfill duration into evidence now that we have it from Project_Duration_Estimator.
@@ -261,14 +346,15 @@ def analyze_project(
         analysis["contributors"] = contributors_data
 
     # Optional: stack detection (fallback to resume languages only)
+    stage("oop")
     try:
-        stack_languages = detect_project_stack(root).get("languages", [])
+        stack_languages = detect_project_stack(root, inventory=inventory).get("languages", [])
     except Exception as e:
         logging.warning(f"Project stack detection failed (optional): {e}")
         stack_languages = []
 
     languages_for_oop = sorted(set(stack_languages) | set(resume.languages))
-    oop_metrics = oop_analysis(root, languages_for_oop)  # may raise (critical)
+    oop_metrics = oop_analysis(root, languages_for_oop, inventory=inventory)  # may raise (critical)
 
         
     if oop_metrics is not None:
@@ -287,6 +373,7 @@ def analyze_project(
      
     #Project insights likely needs to be rebuilt
     snapshot_label = datetime.datetime.now(tz=datetime.timezone.utc).isoformat()
+    stage("dedup")
     with _write_lock:
         try:
             insight = record_project_insight(
@@ -300,8 +387,9 @@ def analyze_project(
 
         dedup_result = deduplicate_project(
             root,
-            Path(runtimeAppContext.default_save_dir) / "dedup_index.json",
+            Path(runtimeAppContext.default_save_dir) / "dedup_index.db",
             remove_duplicates=remove_duplicates,
+            inventory=inventory,
         )
         analysis["dedup"] = {
             "unique_files": dedup_result.unique_files,
@@ -311,6 +399,7 @@ def analyze_project(
             "removed": dedup_result.removed,
         }
 
+        stage("export")
         export_meta = export_json(display_name, convert_datetime_to_string(analysis)) or {}
     return {
         "dedup": analysis["dedup"],
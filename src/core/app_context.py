@@ -1,9 +1,11 @@
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 from fastapi import UploadFile
 from types import SimpleNamespace
 import os
 import sqlite3
+import threading
 from typing import Optional
 
 # Decide DB init behavior: default connect, but auto-skip when running pytest unless overridden.
@@ -15,11 +17,19 @@ if _env_skip is None:
 import sys
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
+from src.storage.connection_pool import SQLitePool
 from src.storage.db_helper_function import HelperFunct
 class _NullStore:
 
     def insert_json(self, *args, **kwargs): 
         return None
+
+    def insert_many(self, items, *args, **kwargs):
+        return [None for _ in items]
+
+    @contextmanager
+    def batch(self, *args, **kwargs):
+        yield self
     
     def fetch_by_name(self, *args, **kwargs): 
         return None
@@ -29,18 +39,22 @@ class _NullStore:
 
     def count_file_references(self, *args, **kwargs): 
         return 0
+
+    def list_project_summaries(self, *args, **kwargs):
+        return []
 @dataclass
 class AppContext:
     """
     Shared application handles for database access, default storage paths, and global settings variables.
 
     Attributes:
-        conn (sqlite3.Connection): Live SQLite connection.
+        conn (sqlite3.Connection): Live SQLite connection (the pool's writer).
         store (HelperFunct): Helper wrapper for DB operations.
         legacy_save_dir (Path): Legacy config/insight base directory.
         default_save_dir (Path): Default nested directory for new insights.
         external_consent (bool): consent for external llm use
         currently_uploaded_file (Path | UploadFile): file currently uploaded, can be a file-like object or a file path
+        pool (SQLitePool | None): Writer and reader connections behind conn and store.
     """
 
     conn: sqlite3.Connection
@@ -51,66 +65,86 @@ class AppContext:
     data_consent: bool
     currently_uploaded_file: Path | UploadFile
     currently_uploaded_project_name: Optional[str] = None
+    pool: Optional[SQLitePool] = None
 
     def close(self) -> None:
-        """Close the DB connection safely."""
+        """Close the DB connections safely."""
         try:
-            if self.conn:
+            if self.pool:
+                self.pool.close()
+            elif self.conn:
                 self.conn.close()
         except Exception:
             pass
 
 
-def create_app_context(external_consent_value=False, data_consent_value=False) -> AppContext:
+# Bump whenever database.sql changes; databases whose PRAGMA user_version is
+# lower get the schema re-applied (every statement in it is IF NOT EXISTS).
+SCHEMA_VERSION = 2
+
+
+def _save_dirs() -> tuple[Path, Path]:
+    """Return the legacy and default save directories under the repository root."""
+    legacy_save_dir = Path(__file__).absolute().resolve().parents[2] / "User_config_files"
+    return legacy_save_dir, legacy_save_dir / "project_insights"
+
+
+def _apply_schema(conn: sqlite3.Connection, schema_path: Path) -> None:
     """
-    Initialize database connection, helper store, and shared paths.
+    Run database.sql unless the database already records SCHEMA_VERSION.
 
-    paramaters:
-        external_consent_value: value of consent for external llm tools
+    Args:
+        conn (sqlite3.Connection): Writer connection.
+        schema_path (Path): The schema script.
+    """
+    row = conn.execute("PRAGMA user_version").fetchone()
+    if row is not None and row[0] >= SCHEMA_VERSION:
+        return
+    if schema_path.exists():
+        conn.executescript(schema_path.read_text())
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+def _open_database() -> tuple[Optional[SQLitePool], Optional[sqlite3.Connection], HelperFunct]:
+    """
+    Open the connection pool and helper store, applying the schema if needed.
 
     Returns:
-        AppContext: Shared handles for DB access and filesystem targets.
+        tuple: The pool, its writer connection and the store; with SKIP_DB_INIT=1,
+        (None, None, _NullStore()).
 
     Raises:
-        Exception: If connection cannot be established after retries.
+        Exception: If the database cannot be opened.
     """
-    root_folder = Path(__file__).absolute().resolve().parents[2]
-    legacy_save_dir = root_folder / "User_config_files"
-    default_save_dir = legacy_save_dir / "project_insights"
     if os.getenv("SKIP_DB_INIT") == "1":
-        return AppContext(
-            conn=None,
-            store=_NullStore(),
-            legacy_save_dir=legacy_save_dir,
-            default_save_dir=default_save_dir,
-            external_consent=external_consent_value,
-            data_consent=data_consent_value,
-            currently_uploaded_file=None,
-            currently_uploaded_project_name=None,
-        )
+        return None, None, _NullStore()
 
-    db_path = root_folder / "appdb.db"
-    schema_path = root_folder / "database.sql"
-
-    if not db_path.exists():
-        with open(schema_path, "r") as f:
-            sql = f.read()
-        temp_conn = sqlite3.connect(str(db_path))
-        temp_conn.executescript(sql)
-        temp_conn.close()
-        print("✅ Database initialized from database.sql")
-        
+    root_folder = Path(__file__).absolute().resolve().parents[2]
     try:
-        conn = sqlite3.connect(str(db_path), check_same_thread=False)
-        conn.execute("PRAGMA foreign_keys = ON")
-        conn.execute("PRAGMA journal_mode=WAL")
-        if schema_path.exists():
-            conn.executescript(schema_path.read_text())
-        print("✅ Connected to SQLite successfully!")
+        pool = SQLitePool(root_folder / "appdb.db")
+        conn = pool.writer
+        _apply_schema(conn, root_folder / "database.sql")
     except Exception as e:
         raise Exception(f"❌ Could not connect to SQLite: {e}")
 
-    store = HelperFunct(conn)
+    return pool, conn, HelperFunct(pool)
+
+
+def create_app_context(external_consent_value=False, data_consent_value=False) -> AppContext:
+    """
+    Initialize database connection, helper store, and shared paths.
+
+    paramaters:
+        external_consent_value: value of consent for external llm tools
+
+    Returns:
+        AppContext: Shared handles for DB access and filesystem targets.
+
+    Raises:
+        Exception: If connection cannot be established after retries.
+    """
+    legacy_save_dir, default_save_dir = _save_dirs()
+    pool, conn, store = _open_database()
 
     return AppContext(
         conn=conn,
@@ -121,7 +155,82 @@ def create_app_context(external_consent_value=False, data_consent_value=False) -
         data_consent=data_consent_value,
         currently_uploaded_file=None,
         currently_uploaded_project_name=None,
+        pool=pool,
     )
 
+
+class LazyAppContext:
+    """
+    An AppContext whose database is opened on first use instead of at import.
+
+    Paths and settings are available immediately; reading `conn`, `store` or
+    `pool` opens the database (once, thread-safely). Other attribute reads and
+    writes go straight to the wrapped AppContext.
+    """
+
+    _DATABASE_FIELDS = frozenset({"conn", "store", "pool"})
+
+    def __init__(self, external_consent_value=False, data_consent_value=False):
+        legacy_save_dir, default_save_dir = _save_dirs()
+        context = AppContext(
+            conn=None,
+            store=None,
+            legacy_save_dir=legacy_save_dir,
+            default_save_dir=default_save_dir,
+            external_consent=external_consent_value,
+            data_consent=data_consent_value,
+            currently_uploaded_file=None,
+            currently_uploaded_project_name=None,
+        )
+        object.__setattr__(self, "_context", context)
+        object.__setattr__(self, "_connected", False)
+        object.__setattr__(self, "_connect_lock", threading.Lock())
+
+    @property
+    def connected(self) -> bool:
+        """Whether the database handles have been opened (or assigned)."""
+        return self._connected
+
+    def connect(self) -> AppContext:
+        """
+        Open the database if it is not open yet.
+
+        Returns:
+            AppContext: The wrapped context, with its database handles set.
+        """
+        if not self._connected:
+            with self._connect_lock:
+                if not self._connected:
+                    pool, conn, store = _open_database()
+                    self._context.pool, self._context.conn, self._context.store = pool, conn, store
+                    object.__setattr__(self, "_connected", True)
+        return self._context
+
+    def close(self) -> None:
+        """Close the database connections; the next use reopens them."""
+        with self._connect_lock:
+            if self._connected:
+                self._context.close()
+                self._context.pool = self._context.conn = self._context.store = None
+                object.__setattr__(self, "_connected", False)
+
+    def __getattr__(self, name):
+        if name in self._DATABASE_FIELDS:
+            self.connect()
+        return getattr(self._context, name)
+
+    def __setattr__(self, name, value):
+        if name in self._DATABASE_FIELDS:
+            # Assigned handles replace the lazily opened ones.
+            object.__setattr__(self, "_connected", True)
+        setattr(self._context, name, value)
+
+    def __delattr__(self, name):
+        delattr(self._context, name)
+
+    def __repr__(self) -> str:
+        return f"LazyAppContext({self._context!r}, connected={self._connected})"
+
+
 #global variable so we don't need to pass the app context through the API for calls
-runtimeAppContext = create_app_context()
+runtimeAppContext = LazyAppContext()
@@ -0,0 +1,143 @@
+"""Shared, thread-pooled content hashing for one analysis run.
+
+Document analysis, the OOP report cache and dedup all need the SHA-256 of
+files in the same project, and used to hash them independently. A
+`ContentHashes` instance (one per `ProjectInventory`) hashes each file once,
+memoizes the digest for the other stages, and hashes batches of files on a
+thread pool; hashlib releases the GIL while digesting large buffers, so the
+threads overlap I/O and hashing.
+
+Each digest also records the SHA-256 of the first PARTIAL_HASH_BYTES bytes,
+which dedup stores as a cheap change check, computed in the same read.
+
+The pool size comes from the HASH_WORKERS environment variable
+(default: CPU count, at most 8).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterable, List, Optional, TypeVar
+
+CHUNK_SIZE = 1024 * 1024  # 1 MB
+PARTIAL_HASH_BYTES = 4096
+WORKERS_ENV_VAR = "HASH_WORKERS"
+MAX_DEFAULT_WORKERS = 8
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class FileDigest:
+    """
+    Content digests of one file.
+
+    Attributes:
+        sha256 (str): Hex SHA-256 of the whole content.
+        partial (str): Hex SHA-256 of the first PARTIAL_HASH_BYTES bytes.
+    """
+
+    sha256: str
+    partial: str
+
+
+def hash_stream(f: BinaryIO) -> FileDigest:
+    """Hash everything left in a binary stream in a single read."""
+    head = f.read(PARTIAL_HASH_BYTES)
+    full = hashlib.sha256(head)
+    for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+        full.update(chunk)
+    return FileDigest(sha256=full.hexdigest(), partial=hashlib.sha256(head).hexdigest())
+
+
+def hash_file(path: Path) -> FileDigest:
+    """Hash a file in a single read."""
+    with Path(path).open("rb") as f:
+        return hash_stream(f)
+
+
+def _default_workers() -> int:
+    """Read the pool size from HASH_WORKERS, defaulting to the CPU count (max 8)."""
+    try:
+        return max(1, int(os.environ[WORKERS_ENV_VAR]))
+    except (KeyError, ValueError):
+        return max(1, min(MAX_DEFAULT_WORKERS, os.cpu_count() or 1))
+
+
+class ContentHashes:
+    """
+    Memoized file digests shared by the stages of one analysis.
+
+    Files are assumed not to change while the instance is in use; it is meant
+    to live as long as the inventory it belongs to.
+
+    Attributes:
+        workers (int): Threads used by prefetch and map.
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        """
+        Args:
+            workers (Optional[int]): Pool size; None reads HASH_WORKERS.
+        """
+        self.workers = workers or _default_workers()
+        self._digests: Dict[Path, FileDigest] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: Path) -> Optional[FileDigest]:
+        """Return the memoized digest of a file, or None if it was not hashed yet."""
+        with self._lock:
+            return self._digests.get(Path(path))
+
+    def put(self, path: Path, digest: FileDigest) -> None:
+        """Record a digest computed elsewhere (e.g. from an archive stream)."""
+        with self._lock:
+            self._digests[Path(path)] = digest
+
+    def digest(self, path: Path) -> FileDigest:
+        """
+        Return a file's digest, hashing it on first use.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        path = Path(path)
+        known = self.get(path)
+        if known is not None:
+            return known
+        digest = hash_file(path)
+        self.put(path, digest)
+        return digest
+
+    def prefetch(self, paths: Iterable[Path]) -> None:
+        """
+        Hash files not hashed yet on the pool. Unreadable files are skipped;
+        a later digest() call raises their error.
+        """
+        todo = [Path(p) for p in dict.fromkeys(paths) if self.get(p) is None]
+
+        def hash_quietly(path: Path) -> None:
+            try:
+                self.digest(path)
+            except OSError:
+                pass
+
+        self.map(hash_quietly, todo)
+
+    def map(self, fn: Callable[[T], R], items: Iterable[T]) -> List[R]:
+        """
+        Apply fn to every item on the pool, returning results in input order.
+
+        Exceptions raised by fn propagate to the caller.
+        """
+        items = list(items)
+        if self.workers <= 1 or len(items) <= 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(items)), thread_name_prefix="hash") as pool:
+            return list(pool.map(fn, items))
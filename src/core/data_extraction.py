@@ -33,20 +33,24 @@ class FileMetadataExtractor:
         dir_path (Path): The root directory path to extract metadata from.
     """
 
-    def __init__(self, dir_path: str | Path):
+    def __init__(self, dir_path: str | Path, inventory=None):
         """
         Initialize the FileMetadataExtractor.
 
         Args:
             dir_path (str | Path): The directory path to scan for file hierarchy and metadata.
+            inventory (ProjectInventory | None): Optional pre-built inventory of dir_path.
+                When given, the hierarchy is built from it instead of re-walking the disk.
             
         Returns:
             None: This method initializes the extractor instance.
         """
         self.dir_path = Path(dir_path)
+        self.inventory = inventory
+        self._uid_names = {}
         
 ## creating a helper function in preparation of cross platform file checking
-    def get_author(self, path: Path):
+    def get_author(self, path: Path, uid: int | None = None):
 
         """
         Retrieve the author (owner) of a file.
@@ -59,6 +63,8 @@ class FileMetadataExtractor:
 
         Args:
             path (Path): The file path for which to determine the author.
+            uid (int | None): The file's st_uid when the caller has already stat'ed it,
+                so no second stat is needed.
 
         Returns:
             str: The detected author/owner of the file, or the current system user if a file owner cannot be determined.
@@ -76,18 +82,32 @@ class FileMetadataExtractor:
                 except Exception:
                   pass
 
-            if platform.system("Darwin", "Linux"):
-                try:
-                    import pwd
-                    return pwd.getpwuid(path.stat().st_uid).pw_name
-                except Exception:
-                    pass
+            if platform.system() in ("Darwin", "Linux"):
+                return self.get_author_from_uid(path.stat().st_uid if uid is None else uid)
         except Exception:
             pass
         
             # this returns the current logged in user for the system if not window
         return getpass.getuser()
 
+    def get_author_from_uid(self, uid: int):
+        """
+        Resolve a file owner UID to a local user name, caching each lookup.
+
+        Args:
+            uid (int): The owner UID taken from a stat result.
+
+        Returns:
+            str: The user name for the UID, or the current system user if it cannot be resolved.
+        """
+        if uid not in self._uid_names:
+            try:
+                import pwd
+                self._uid_names[uid] = pwd.getpwuid(uid).pw_name
+            except Exception:
+                self._uid_names[uid] = getpass.getuser()
+        return self._uid_names[uid]
+
 
 
     def file_hierarchy(self, dir_path: Path | None = None):
@@ -112,8 +132,52 @@ class FileMetadataExtractor:
         if not self.dir_path.is_dir():
             raise ValueError(f"Path is not a directory: {self.dir_path}")
 
+        if self.inventory is not None:
+            return self.tree_from_inventory(self.dir_path, "")
         return self.tree(self.dir_path) 
 
+    def tree_from_inventory(self, dir_path: Path, rel_dir: str):
+        """
+        Build the same nested hierarchy as tree(), but from the recorded inventory
+        so no additional listing or stat calls are made.
+
+        Args:
+            dir_path (Path): The directory the node represents.
+            rel_dir (str): POSIX path of dir_path relative to the inventory root.
+
+        Returns:
+            dict: A nested dictionary matching the output of tree().
+        """
+        node = {"name": dir_path.name, "type": "DIR", "children": []}
+
+        error = self.inventory.scan_error(rel_dir)
+        if error:
+            node["children"].append({"name": error, "type": "DIR", "children": []})
+            return node
+
+        content = self.inventory.children(rel_dir)
+        if content is None:
+            # Not descended during the inventory walk (e.g. a symlinked directory)
+            return self.tree(dir_path)
+        if not content:
+            node["children"].append({"name": "Empty", "type": "DIR", "children": []})
+            return node
+
+        for entry in content:
+            if entry.is_dir:
+                node["children"].append(self.tree_from_inventory(dir_path / entry.name, entry.rel_path))
+            else:
+                node["children"].append({
+                    "name": entry.name,
+                    "type": entry.suffix.lstrip('.') or "FILE",
+                    "size": entry.size,
+                    "modified": entry.modified,
+                    "author": entry.owner,
+                    "children": []
+                })
+
+        return node
+
 
     def tree(self, dir_path: Path):
         """
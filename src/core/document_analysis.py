@@ -2,11 +2,11 @@
 Supported formats: docx, pdf, txt, md. Outputs per-file summaries with hashes
 for deduplication plus simple heuristics for roles, dates, metrics, and skills."""
 from __future__ import annotations
-import hashlib
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Optional
+from src.core.content_hashes import ContentHashes, hash_file
 try:
     from docx import Document  # type: ignore
 except Exception:
@@ -23,11 +23,7 @@ def compute_sha256(path: Path) -> str:
     Args: path (Path): File path to hash.
     Returns: str: Hex digest of the file content.
     """
-    digest = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
+    return hash_file(path).sha256
 @dataclass
 
 class ParsedDoc:
@@ -49,17 +45,21 @@ class DocumentAnalyzer:
         root: Path,
         files: Optional[Iterable[Path]] = None,
         known_hashes: Optional[Dict[str, str]] = None,
+        hashes: Optional[ContentHashes] = None,
     ):
         """
         Initialize the analyzer with a project root and optional prior hashes.
         Args: root (Path): Project root to scan for documents.
               files (Optional[Iterable[Path]]): Optional iterable of files to analyze.
               known_hashes (Optional[Dict[str, str]]): Existing hash→path map to flag duplicates.
+              hashes (Optional[ContentHashes]): Shared digest store; documents are hashed
+                  on its pool and the digests are reused by later stages.
         Returns: None
         """
         self.root = Path(root)
         self.files = list(files) if files is not None else None
         self.known_hashes: Dict[str, str] = dict(known_hashes or {})
+        self.hashes = hashes
 
     def analyze(self) -> Dict[str, Any]:
         """
@@ -80,22 +80,23 @@ class DocumentAnalyzer:
                 "errors": [f"Root path not found: {self.root}"],
             }
         paths = self.files if self.files is not None else sorted(self.root.rglob("*"))
-        for path in paths:
-            if not path.is_file():
-                continue
-            if path.name.startswith("._") or "__MACOSX" in path.parts:
-                continue
-            if ".git" in path.parts:
-                continue
+        candidates = [
+            path for path in paths
+            if path.suffix.lower() in SUPPORTED_DOC_EXTS
+            and not (path.name.startswith("._") or "__MACOSX" in path.parts)
+            and ".git" not in path.parts
+            and path.is_file()
+        ]
+        if self.hashes is not None:
+            self.hashes.prefetch(candidates)
+        for path in candidates:
             suffix = path.suffix.lower()
-            if suffix not in SUPPORTED_DOC_EXTS:
-                continue
             try:
                 rel_path = str(path.relative_to(self.root))
             except ValueError:
                 rel_path = str(path)
             try:
-                file_hash = compute_sha256(path)
+                file_hash = self.hashes.digest(path).sha256 if self.hashes is not None else compute_sha256(path)
             except Exception as e:
                 errors.append(f"hash_failed:{rel_path}:{e}")
                 continue
@@ -1,12 +1,28 @@
 import shutil
 import zipfile
+import zlib
 import os, time
 import tempfile
 from pathlib import Path
 from pathlib import PurePosixPath
+from typing import Callable, List, Set, Tuple
 from fastapi import UploadFile
 
 
+def zip_member_parts(name: str) -> Tuple[str, ...]:
+    """
+    Return the path components a ZIP member extracts to.
+
+    Mirrors zipfile.ZipFile.extract: separators are the platform's, drive letters
+    and empty, "." and ".." components are dropped.
+    """
+    arcname = name.replace("/", os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    return tuple(p for p in arcname.split(os.path.sep) if p not in ("", os.path.curdir, os.path.pardir))
+
+
 class extractInfo:
     """
     This is a helper class that is for extracting the
@@ -22,6 +38,8 @@ class extractInfo:
     CORRUPT_FILE_ERROR_TEXT = "Error! Corrupt file detected - invalid header: "
     UNSAFE_ARCHIVE_PATH_ERROR_TEXT = "Error! Zip file contains unsafe path: "
 
+    CHUNK_SIZE = 1024 * 1024  # 1 MB
+
     # Magic bytes for file type validation
     MAGIC_BYTES = {
         '.png': b'\x89PNG\r\n\x1a\n',
@@ -52,62 +70,133 @@ class extractInfo:
         """
         Method that runs all zip extraction protocols
 
+        Validation and extraction share a single pass over the archive: every
+        member is decompressed once, its magic bytes are checked on the first
+        chunk and its CRC when the stream ends, while it is written to disk.
+
         Args:
             zipfile (Path | UploadFile): File path or file-like object that contains a zip file to be extracted.
         """
-        error = self.verifyZIP(zip_file)
-        if error != None:
-            return error
-        if (isinstance(zip_file, Path)):
-            file_name: str = zip_file.stem
-        else:   #Must be UploadFile if not Path
-            upload_name = zip_file.filename or "uploaded_project.zip"
-            file_name = Path(upload_name).stem
-        temp_path = self.extractFiles(zip_file, file_name)
-        error = self.validateExtractedFiles(temp_path)
-        if error != None:
-            shutil.rmtree(temp_path, ignore_errors=True)
-            return error
-        return temp_path
-
-    def extractFiles(self, zip_file: Path | UploadFile, file_name: str) -> str:
+        out = self.runArchiveExtraction(zip_file, lambda members: {m.filename for m in members})
+        if isinstance(out, str):
+            return out
+        return out[0]
+
+    def runArchiveExtraction(
+        self,
+        zip_file: Path | UploadFile,
+        select: Callable[[List[zipfile.ZipInfo]], Set[str]],
+    ) -> Tuple[str, List[zipfile.ZipInfo], Set[str]] | str:
         """
-        Extract ZIP contents into a unique directory under OS temp storage.
+        Validate a zip file and extract the members `select` picks, opening it once.
 
-        Returns:
-            str: Absolute path to extracted directory.
-        """
+        Unsafe paths are rejected from the member table before anything is
+        written. Selected members are streamed to disk with their magic bytes and
+        CRC checked on the way; for the others only the header is decompressed to
+        check magic bytes, so a CRC error in them surfaces when they are read later.
 
+        Args:
+            zip_file (Path | UploadFile): File path or file-like object that contains a zip file.
+            select (Callable[[List[zipfile.ZipInfo]], Set[str]]): Receives the member
+                table and returns the names of the members to extract.
 
+        Returns:
+            Tuple[str, List[zipfile.ZipInfo], Set[str]] | str: Extraction directory,
+                the full member table and the extracted member names, or error
+                text if the archive is invalid.
+        """
         if isinstance(zip_file, Path):
             file = str(zip_file)
-        else:   #Must be UplaodFile if not Path
+            if not os.path.exists(file):    #Checks filepath
+                return self.PATH_ERROR_TEXT + file
+            file_name = zip_file.stem
+        else:   #Must be UploadFile if not Path
             file = zip_file.file
-            try:
+            file_name = Path(zip_file.filename or "uploaded_project.zip").stem
+        if not zipfile.is_zipfile(file):    #checks if zip file is a zip file
+            return self.NOT_ZIP_ERROR_TEXT
+
+        try:
+            if not isinstance(file, str):
                 file.seek(0)
-            except Exception:
-                pass
-
-        temp_file_path = self._build_extraction_dir(file_name)
-        with zipfile.ZipFile(file, 'r') as zip_ref:
-            for member in zip_ref.infolist():
-                zip_ref.extract(member, temp_file_path)
-        self.RestoreTimestampsOfZipContents(zip_file, temp_file_path)
-        return temp_file_path
-
-    def RestoreTimestampsOfZipContents(self, zipname, extract_dir):
-        base_dir = Path(extract_dir).resolve()
-        for f in zipfile.ZipFile(zipname, 'r').infolist():
-            # path to this extracted f-item
-            fullpath = Path(os.path.join(extract_dir, f.filename)).resolve()
-            try:
-                fullpath.relative_to(base_dir)
-            except ValueError:
-                continue
-            # still need to adjust the dt o/w item will have the current dt
-            date_time = time.mktime(f.date_time + (0, 0, -1))
-            # update dt
-            os.utime(fullpath, (date_time, date_time))
+            with zipfile.ZipFile(file, 'r') as zip_ref:
+                members = zip_ref.infolist()
+                for member in members:
+                    if self._has_unsafe_zip_path(member.filename):
+                        return self.UNSAFE_ARCHIVE_PATH_ERROR_TEXT + member.filename
+
+                wanted = select(members)
+                temp_file_path = self._build_extraction_dir(file_name)
+                try:
+                    for member in members:
+                        if member.is_dir() or member.filename in wanted:
+                            error = self._extract_member(zip_ref, member, temp_file_path)
+                        else:
+                            error = self._check_member_header(zip_ref, member)
+                            # Keep the directory skeleton so the tree matches the archive.
+                            Path(temp_file_path, *zip_member_parts(member.filename)[:-1]).mkdir(
+                                parents=True, exist_ok=True
+                            )
+                        if error is not None:
+                            shutil.rmtree(temp_file_path, ignore_errors=True)
+                            return error
+                except BaseException:
+                    # Don't leave a partial extraction behind (disk full, permissions, ...)
+                    shutil.rmtree(temp_file_path, ignore_errors=True)
+                    raise
+        except zipfile.BadZipFile:  #Catches corrupted zip files
+            return self.BAD_ZIP_ERROR_TEXT
+        return temp_file_path, members, wanted
+
+    def _expected_magic(self, member: zipfile.ZipInfo) -> bytes | None:
+        """Return the magic bytes a member must start with, or None if it is not checked."""
+        parts = zip_member_parts(member.filename)
+        # Skip macOS resource fork files to avoid false corruption errors
+        if member.is_dir() or not parts or parts[-1].startswith("._") or "__MACOSX" in parts:
+            return None
+        return self.MAGIC_BYTES.get(os.path.splitext(parts[-1])[1].lower())
+
+    def _extract_member(self, zip_ref: zipfile.ZipFile, member: zipfile.ZipInfo, dest: str) -> str | None:
+        """
+        Stream one member to disk, checking its magic bytes and CRC, and restore its timestamp.
+
+        Returns:
+            str | None: Error text if the member is corrupt, otherwise None.
+        """
+        target = Path(dest, *zip_member_parts(member.filename))
+        if member.is_dir():
+            target.mkdir(parents=True, exist_ok=True)
+            return None
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        expected_magic = self._expected_magic(member)
+        try:
+            with zip_ref.open(member) as src, open(target, "wb") as dst:
+                head = src.read(self.CHUNK_SIZE)
+                if expected_magic is not None and not head.startswith(expected_magic):
+                    return self.CORRUPT_FILE_ERROR_TEXT + member.filename
+                dst.write(head)
+                shutil.copyfileobj(src, dst, self.CHUNK_SIZE)
+        except (zipfile.BadZipFile, zlib.error):    #CRC mismatch or corrupt compressed data
+            return self.BAD_FILE_ERROR_TEXT + member.filename
+
+        # still need to adjust the dt o/w item will have the current dt
+        date_time = time.mktime(member.date_time + (0, 0, -1))
+        os.utime(target, (date_time, date_time))
+        return None
+
+    def _check_member_header(self, zip_ref: zipfile.ZipFile, member: zipfile.ZipInfo) -> str | None:
+        """Check a member's magic bytes without extracting it, decompressing only the header."""
+        expected_magic = self._expected_magic(member)
+        if expected_magic is None:
+            return None
+        try:
+            with zip_ref.open(member) as f:
+                if f.read(len(expected_magic)) == expected_magic:
+                    return None
+        except Exception:
+            pass
+        return self.CORRUPT_FILE_ERROR_TEXT + member.filename
 
     @staticmethod
     def _has_unsafe_zip_path(name: str) -> bool:
@@ -149,30 +238,3 @@ class extractInfo:
                 return self.BAD_FILE_ERROR_TEXT + bad_file
         except zipfile.BadZipFile:  #Catches corrupted zip files
             return self.BAD_ZIP_ERROR_TEXT
-
-    def validateExtractedFiles(self, temp_path: str) -> str | None:
-        """
-        Validates extracted files by checking their magic bytes (file signatures).
-
-        :param temp_path: Path to the directory containing extracted files
-        :return: None if all files are valid, or error text if a corrupt file is detected
-        """
-        for root, dirs, files in os.walk(temp_path):
-            for file in files:
-                # Skip macOS resource fork files to avoid false corruption errors
-                if file.startswith("._") or "__MACOSX" in root:
-                    continue
-
-                filepath = os.path.join(root, file)
-                ext = os.path.splitext(file)[1].lower()
-
-                if ext in self.MAGIC_BYTES:
-                    expected_magic = self.MAGIC_BYTES[ext]
-                    try:
-                        with open(filepath, 'rb') as f:
-                            header = f.read(len(expected_magic))
-                            if header != expected_magic:
-                                return self.CORRUPT_FILE_ERROR_TEXT + filepath
-                    except Exception:
-                        return self.CORRUPT_FILE_ERROR_TEXT + filepath
-        return None
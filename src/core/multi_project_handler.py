@@ -30,7 +30,9 @@ class multi_project_handler:
         workers = min(len(paths), os.cpu_count() or 1)
         ordered_results = {str(p): None for p in paths}
 
-        with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Group the per-project database writes into shared transactions
+        # instead of committing (and syncing) once per project.
+        with runtimeAppContext.store.batch(), ThreadPoolExecutor(max_workers=workers) as executor:
             futures = {executor.submit(single_project_run, (p, use_ai)): str(p) for p in paths}
 
             with tqdm(total=len(paths), desc="Analyzing projects", unit="project") as progress:
@@ -0,0 +1,384 @@
+"""Single-pass file inventory shared by the analysis pipeline.
+
+`analyze_project` used to let every stage (metadata tree, document analysis,
+contribution detection, stack/skill detection, OOP discovery and dedup) walk
+the extracted project on its own. `ProjectInventory` walks the tree once with
+`os.scandir`, records path, suffix, size, timestamps and owner for every entry,
+and is then handed to each stage so no further directory walks or stat calls
+are needed.
+
+Entries are recorded in the same order `Path.rglob("*")` yields them, so
+consumers that depend on first-seen ordering (e.g. dedup canonical paths)
+behave exactly as before.
+
+`ArchiveInventory` builds the same listing straight from a ZIP's member table.
+Only the members some stage reads are extracted to disk; the rest stay in the
+archive and are read from it on demand (see `on_disk` / `open`).
+"""
+
+from __future__ import annotations
+
+import datetime
+import os
+import threading
+import time
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, List, Optional, Set
+
+from src.core.content_hashes import ContentHashes
+from src.core.data_extraction import FileMetadataExtractor
+from src.core.extraction import zip_member_parts
+
+
+@dataclass(frozen=True)
+class InventoryEntry:
+    """
+    Metadata captured for one filesystem entry during the inventory walk.
+
+    Attributes:
+        path: Path of the entry joined onto the inventory root.
+        rel_path: POSIX-style path relative to the inventory root.
+        name: Final path component.
+        suffix: File suffix as returned by `Path.suffix` (case preserved).
+        is_file: True when the entry is (or links to) a regular file.
+        is_dir: True when the entry is (or links to) a directory.
+        size: Size in bytes, 0 when the entry could not be stat'ed.
+        mtime: Modification time as a POSIX timestamp, or None on stat failure.
+        mtime_ns: Nanosecond modification time, or None on stat failure.
+        ctime_ns: Nanosecond change time, or None on stat failure.
+        owner: Owner name as reported by `FileMetadataExtractor.get_author`.
+    """
+
+    path: Path
+    rel_path: str
+    name: str
+    suffix: str
+    is_file: bool
+    is_dir: bool
+    size: int
+    mtime: Optional[float]
+    mtime_ns: Optional[int]
+    ctime_ns: Optional[int]
+    owner: str
+
+    @property
+    def modified(self) -> Optional[datetime.datetime]:
+        """Return the modification time as a local datetime (None if unknown)."""
+        if self.mtime is None:
+            return None
+        return datetime.datetime.fromtimestamp(self.mtime)
+
+
+class ProjectInventory:
+    """
+    In-memory listing of every file and directory under a project root.
+
+    Attributes:
+        root (Path): Root directory the inventory was built from.
+        hashes (ContentHashes): File digests shared by the stages reading this inventory.
+    """
+
+    def __init__(self, root: str | Path, extractor: Optional[FileMetadataExtractor] = None):
+        """
+        Walk `root` once and record metadata for each entry.
+
+        Args:
+            root (str | Path): Project root to scan.
+            extractor (Optional[FileMetadataExtractor]): Extractor used to resolve
+                file owners. Defaults to one bound to `root`.
+
+        Raises:
+            FileNotFoundError: If the root does not exist.
+            ValueError: If the root is not a directory.
+        """
+        self.root = Path(root)
+        if not self.root.exists():
+            raise FileNotFoundError(f"Directory not found: {self.root}")
+        if not self.root.is_dir():
+            raise ValueError(f"Path is not a directory: {self.root}")
+
+        self._extractor = extractor or FileMetadataExtractor(self.root)
+        self._entries: List[InventoryEntry] = []
+        self._children: Dict[str, List[InventoryEntry]] = {}
+        self._scan_errors: Dict[str, str] = {}
+        self.hashes = ContentHashes()
+        self._scan(self.root, "")
+
+    def _scan(self, directory: Path, rel_dir: str) -> None:
+        """
+        Record the entries of `directory`, then descend into its subdirectories.
+
+        Listing a directory's entries before recursing reproduces the order of
+        `Path.rglob("*")`. Symlinked directories are listed but not descended,
+        matching rglob.
+        """
+        try:
+            with os.scandir(directory) as it:
+                dir_entries = list(it)
+        except PermissionError:
+            self._scan_errors[rel_dir] = "No Access"
+            return
+        except OSError:
+            self._scan_errors[rel_dir] = "Error accessing folder"
+            return
+
+        children: List[InventoryEntry] = []
+        subdirs: List[tuple[Path, str]] = []
+        for dir_entry in dir_entries:
+            path = directory / dir_entry.name
+            rel_path = f"{rel_dir}/{dir_entry.name}" if rel_dir else dir_entry.name
+            entry = self._make_entry(dir_entry, path, rel_path)
+            children.append(entry)
+            self._entries.append(entry)
+            try:
+                descend = entry.is_dir and not dir_entry.is_symlink()
+            except OSError:
+                descend = False
+            if descend:
+                subdirs.append((path, rel_path))
+
+        self._children[rel_dir] = children
+        for path, rel_path in subdirs:
+            self._scan(path, rel_path)
+
+    def _make_entry(self, dir_entry: os.DirEntry, path: Path, rel_path: str) -> InventoryEntry:
+        """Build an InventoryEntry from a scandir entry using a single stat call."""
+        try:
+            is_dir = dir_entry.is_dir()
+        except OSError:
+            is_dir = False
+        try:
+            is_file = dir_entry.is_file()
+        except OSError:
+            is_file = False
+
+        try:
+            stat = dir_entry.stat()
+            size = stat.st_size
+            mtime: Optional[float] = stat.st_mtime
+            mtime_ns: Optional[int] = stat.st_mtime_ns
+            ctime_ns: Optional[int] = stat.st_ctime_ns
+            owner = self._extractor.get_author(path, uid=stat.st_uid)
+        except Exception:
+            size = 0
+            mtime = mtime_ns = ctime_ns = None
+            owner = "Unknown"
+
+        return InventoryEntry(
+            path=path,
+            rel_path=rel_path,
+            name=dir_entry.name,
+            suffix=path.suffix,
+            is_file=is_file,
+            is_dir=is_dir,
+            size=size,
+            mtime=mtime,
+            mtime_ns=mtime_ns,
+            ctime_ns=ctime_ns,
+            owner=owner,
+        )
+
+    def entries(self) -> List[InventoryEntry]:
+        """Return every recorded entry (files and directories) in rglob order."""
+        return list(self._entries)
+
+    def files(self) -> List[InventoryEntry]:
+        """Return the file entries in rglob order."""
+        return [e for e in self._entries if e.is_file]
+
+    def paths(self, base: str | Path | None = None, suffixes: Iterable[str] | None = None) -> List[Path]:
+        """
+        Return file paths, optionally filtered by (case-insensitive) suffix.
+
+        Args:
+            base (str | Path | None): Directory to join relative paths onto.
+                Defaults to the inventory root; pass a resolved root when the
+                caller compares paths against resolved locations.
+            suffixes (Iterable[str] | None): Lowercase suffixes (e.g. ".py") to keep.
+
+        Returns:
+            List[Path]: Matching file paths in rglob order.
+        """
+        base_path = Path(base) if base is not None else self.root
+        wanted = {s.lower() for s in suffixes} if suffixes is not None else None
+        return [
+            base_path / e.rel_path
+            for e in self._entries
+            if e.is_file and (wanted is None or e.suffix.lower() in wanted)
+        ]
+
+    def children(self, rel_dir: str = "") -> Optional[List[InventoryEntry]]:
+        """
+        Return the direct children of a directory, or None if it was not scanned.
+
+        Args:
+            rel_dir (str): POSIX relative path of the directory ("" for the root).
+        """
+        children = self._children.get(rel_dir)
+        return list(children) if children is not None else None
+
+    def scan_error(self, rel_dir: str = "") -> Optional[str]:
+        """Return the hierarchy label for a directory that could not be listed."""
+        return self._scan_errors.get(rel_dir)
+
+    def on_disk(self, entry: InventoryEntry) -> bool:
+        """Return True when the entry's content can be read from entry.path."""
+        return True
+
+    def open(self, entry: InventoryEntry) -> IO[bytes]:
+        """Open a file entry's content for binary reading."""
+        return entry.path.open("rb")
+
+    def close(self) -> None:
+        """Release resources held by the inventory (nothing for on-disk trees)."""
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def zip_member_mtime(info: zipfile.ZipInfo) -> float:
+    """Return a member's date_time as a local POSIX timestamp, as restored on extraction."""
+    return time.mktime(info.date_time + (0, 0, -1))
+
+
+class ArchiveInventory(ProjectInventory):
+    """
+    Inventory of a ZIP archive whose members are only partially extracted.
+
+    Entries come from the archive's member table: sizes are the uncompressed
+    sizes, modification times are the members' date_time, and the owner is the
+    owner of the extraction root (extracted files all belong to that user).
+    Members extracted under `root` are read from disk; the others are streamed
+    from the archive.
+
+    Attributes:
+        root (Path): Extraction directory the entries' paths are joined onto.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        source: Any,
+        members: Iterable[zipfile.ZipInfo],
+        extracted: Iterable[str],
+        extractor: Optional[FileMetadataExtractor] = None,
+    ):
+        """
+        Record every archive member without reading any member content.
+
+        Args:
+            root (str | Path): Directory the extracted members were written to.
+            source (Any): Archive path or binary file object, reopened on demand.
+            members (Iterable[zipfile.ZipInfo]): The archive's member table.
+            extracted (Iterable[str]): Member names that were written under root.
+            extractor (Optional[FileMetadataExtractor]): Extractor used to resolve
+                the owner. Defaults to one bound to `root`.
+
+        Raises:
+            FileNotFoundError: If the root does not exist.
+            ValueError: If the root is not a directory.
+        """
+        self.root = Path(root)
+        if not self.root.exists():
+            raise FileNotFoundError(f"Directory not found: {self.root}")
+        if not self.root.is_dir():
+            raise ValueError(f"Path is not a directory: {self.root}")
+
+        self._extractor = extractor or FileMetadataExtractor(self.root)
+        self._entries = []
+        self._children = {}
+        self._scan_errors = {}
+        self.hashes = ContentHashes()
+        self._source = source
+        self._archive: Optional[zipfile.ZipFile] = None
+        self._archive_lock = threading.Lock()
+        self._members: Dict[str, zipfile.ZipInfo] = {}
+        self._extracted: Set[str] = {_member_rel_path(name) for name in extracted}
+        self._build(members)
+
+    def _build(self, members: Iterable[zipfile.ZipInfo]) -> None:
+        """Lay out directory and file entries from the member table."""
+        owner = self._extractor.get_author(self.root)
+        children: Dict[str, Dict[str, InventoryEntry]] = {"": {}}
+
+        def add_dir(rel_dir: str) -> None:
+            if rel_dir in children:
+                return
+            parent, _, name = rel_dir.rpartition("/")
+            add_dir(parent)
+            children[parent][name] = self._entry(rel_dir, None, owner)
+            children[rel_dir] = {}
+
+        for info in members:
+            rel_path = _member_rel_path(info.filename)
+            if not rel_path:
+                continue
+            if info.is_dir():
+                add_dir(rel_path)
+                continue
+            parent, _, name = rel_path.rpartition("/")
+            add_dir(parent)
+            # A later member with the same name overwrites the earlier one on extraction.
+            children[parent].pop(name, None)
+            children[parent][name] = self._entry(rel_path, info, owner)
+            self._members[rel_path] = info
+
+        def walk(rel_dir: str) -> None:
+            listing = list(children[rel_dir].values())
+            self._children[rel_dir] = listing
+            self._entries.extend(listing)
+            for entry in listing:
+                if entry.is_dir:
+                    walk(entry.rel_path)
+
+        walk("")
+
+    def _entry(self, rel_path: str, info: Optional[zipfile.ZipInfo], owner: str) -> InventoryEntry:
+        """Build an entry for a file member (info given) or a directory (info None)."""
+        path = self.root / rel_path
+        mtime = zip_member_mtime(info) if info is not None else None
+        return InventoryEntry(
+            path=path,
+            rel_path=rel_path,
+            name=path.name,
+            suffix=path.suffix,
+            is_file=info is not None,
+            is_dir=info is None,
+            size=info.file_size if info is not None else 0,
+            mtime=mtime,
+            mtime_ns=int(mtime * 1_000_000_000) if mtime is not None else None,
+            ctime_ns=None,
+            owner=owner,
+        )
+
+    def on_disk(self, entry: InventoryEntry) -> bool:
+        """Return True when the member was extracted (directories always exist)."""
+        return entry.is_dir or entry.rel_path in self._extracted
+
+    def open(self, entry: InventoryEntry) -> IO[bytes]:
+        """Open a file entry from disk if extracted, otherwise from the archive."""
+        if self.on_disk(entry):
+            return super().open(entry)
+        with self._archive_lock:
+            if self._archive is None:
+                if hasattr(self._source, "seek"):
+                    self._source.seek(0)
+                self._archive = zipfile.ZipFile(self._source, "r")
+            return self._archive.open(self._members[entry.rel_path])
+
+    def close(self) -> None:
+        """Close the archive if it was reopened for reading."""
+        with self._archive_lock:
+            if self._archive is not None:
+                self._archive.close()
+                self._archive = None
+
+
+def _member_rel_path(name: str) -> str:
+    """Return the POSIX relative path a ZIP member extracts to."""
+    return "/".join(zip_member_parts(name))
+
+
+__all__ = ["ArchiveInventory", "InventoryEntry", "ProjectInventory", "zip_member_mtime"]
@@ -102,6 +102,7 @@ IGNORED_DIRS: Set[str] = {
 
 def detect_project_stack(
     project_root: Path | str,
+    inventory=None,
 ) -> Dict[str, List[str] | Dict[str, List[str]]]:
     """
     Analyze the given project directory and infer its primary languages,
@@ -109,6 +110,8 @@ def detect_project_stack(
 
     Args:
         project_root (Path | str): Path to the project root folder.
+        inventory (ProjectInventory | None): Optional pre-built inventory of the
+            project; when given, its file list is used instead of `rglob`.
 
     Returns:
         dict: A dictionary with three keys:
@@ -125,8 +128,9 @@ def detect_project_stack(
     frameworks: Set[str] = set()
     framework_sources: Dict[str, Set[str]] = defaultdict(set)
 
-    for path in root.rglob("*"):
-        if not path.is_file():
+    candidates = inventory.paths(base=root) if inventory is not None else root.rglob("*")
+    for path in candidates:
+        if inventory is None and not path.is_file():
             continue
         if any(part in IGNORED_DIRS for part in path.parts):
             continue
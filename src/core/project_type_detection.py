@@ -103,6 +103,22 @@ def collect_authors(root: Path) -> set[str]:
     return authors
 
 
+def authors_from_inventory(inventory) -> set[str]:
+    """
+    Collect unique authors from the owners recorded by a ProjectInventory walk.
+
+    Args:
+        inventory: ProjectInventory of the project root.
+
+    Returns:
+        set[str]: A set of unique author names, same filtering as collect_authors.
+    """
+    return {
+        e.owner for e in inventory.files()
+        if e.owner and e.owner not in ("Unknown", "Author Unknown", "")
+    }
+
+
 def find_contributor_files(root: Path) -> list[Path]:
     """Return a list of known contributor/author files found in the project."""
     known_files = ("CONTRIBUTORS", "AUTHORS", "README.md")
@@ -204,11 +220,15 @@ def detect_collaboration_by_text(files: list[Path]) -> dict:
     return {"project_type": "unknown", "mode": "local"}
 
 
-def detect_project_type(project_path: str | Path) -> dict:
+def detect_project_type(project_path: str | Path, inventory=None) -> dict:
     """
     If the folder is a git repo, use commit history.
     Otherwise, fall back to local checks.
 
+    Args:
+        project_path: Project directory to classify.
+        inventory: Optional ProjectInventory of project_path used for local checks.
+
     Returns:
         {"project_type": "individual" | "collaborative" | "unknown", "mode": "git" | "local"}
     """
@@ -225,7 +245,7 @@ def detect_project_type(project_path: str | Path) -> dict:
     if not root.exists() or not root.is_dir():
         return {"project_type": "unknown", "mode": "local"}
 
-    authors = collect_authors(root)
+    authors = authors_from_inventory(inventory) if inventory is not None else collect_authors(root)
     contributor_files = find_contributor_files(root)
 
     text_result = detect_collaboration_by_text(contributor_files)
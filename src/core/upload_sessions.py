@@ -0,0 +1,204 @@
+"""Per-upload handles for uploaded project archives.
+
+Every `POST /projects/upload` stores its ZIP under the upload directory as
+`<upload_id>.zip` next to a small `<upload_id>.json` sidecar (filename,
+project name, size, SHA-256, timestamps). Callers pass the upload id to
+`/analyze`, so concurrent users never share an upload slot, and any API process
+that sees the upload directory can resolve the handle.
+
+Uploads expire after a TTL measured from their last use. Expired uploads, and
+stray archives left over from older versions, are garbage-collected whenever a
+new upload is registered.
+
+The TTL comes from the UPLOAD_TTL_SECONDS environment variable (default 24h).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+TTL_ENV_VAR = "UPLOAD_TTL_SECONDS"
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+
+def default_upload_dir() -> Path:
+    """Return the directory uploaded archives are stored in."""
+    return Path(tempfile.gettempdir()) / "devdoc_uploads"
+
+
+def _default_ttl() -> float:
+    """Read the upload TTL from the environment, falling back to 24 hours."""
+    try:
+        return max(1.0, float(os.getenv(TTL_ENV_VAR, str(DEFAULT_TTL_SECONDS))))
+    except ValueError:
+        return float(DEFAULT_TTL_SECONDS)
+
+
+@dataclass
+class UploadHandle:
+    """
+    Metadata of one uploaded archive.
+
+    Attributes:
+        upload_id (str): Opaque identifier returned to the client.
+        path (str): Where the archive is stored.
+        filename (str): Original client-side filename.
+        project_name (str): Project name derived from the filename.
+        size (int): Archive size in bytes.
+        sha256 (str): SHA-256 hex digest of the archive.
+        created_at (float): POSIX timestamp of the upload.
+    """
+
+    upload_id: str
+    path: str
+    filename: str
+    project_name: str
+    size: int
+    sha256: str
+    created_at: float
+
+    def to_dict(self) -> dict:
+        """Return the handle as a JSON-serializable dict."""
+        return asdict(self)
+
+
+class UploadRegistry:
+    """
+    Filesystem-backed registry of upload handles.
+
+    Attributes:
+        upload_dir (Path): Directory holding archives and their sidecars.
+        ttl_seconds (float): Idle time after which an upload is collected.
+    """
+
+    def __init__(self, upload_dir: str | Path | None = None, ttl_seconds: Optional[float] = None):
+        """
+        Args:
+            upload_dir (str | Path | None): Storage directory; defaults to
+                `<tmp>/devdoc_uploads`.
+            ttl_seconds (Optional[float]): Idle TTL; None reads UPLOAD_TTL_SECONDS.
+        """
+        self.upload_dir = Path(upload_dir) if upload_dir is not None else default_upload_dir()
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else _default_ttl()
+
+    def new_upload_path(self) -> tuple[str, Path]:
+        """
+        Reserve an upload id and the path its archive should be written to.
+
+        Returns:
+            tuple[str, Path]: The upload id and the archive path.
+        """
+        self.upload_dir.mkdir(parents=True, exist_ok=True)
+        upload_id = uuid.uuid4().hex
+        return upload_id, self.upload_dir / f"{upload_id}.zip"
+
+    def register(
+        self,
+        upload_id: str,
+        filename: str,
+        project_name: str,
+        size: int,
+        sha256: str,
+    ) -> UploadHandle:
+        """
+        Record the sidecar for an archive written to `new_upload_path()`, then collect expired uploads.
+
+        Args:
+            upload_id (str): Id returned by new_upload_path.
+            filename (str): Original client-side filename.
+            project_name (str): Project name derived from the filename.
+            size (int): Archive size in bytes.
+            sha256 (str): SHA-256 hex digest of the archive.
+
+        Returns:
+            UploadHandle: The registered handle.
+        """
+        handle = UploadHandle(
+            upload_id=upload_id,
+            path=str(self.upload_dir / f"{upload_id}.zip"),
+            filename=filename,
+            project_name=project_name,
+            size=size,
+            sha256=sha256,
+            created_at=time.time(),
+        )
+        self._sidecar(upload_id).write_text(json.dumps(handle.to_dict()), encoding="utf-8")
+        self.collect_garbage()
+        return handle
+
+    def get(self, upload_id: str) -> Optional[UploadHandle]:
+        """
+        Resolve an upload id, refreshing its TTL.
+
+        Args:
+            upload_id (str): Id returned at upload time.
+
+        Returns:
+            Optional[UploadHandle]: The handle, or None if unknown, expired or its archive is gone.
+        """
+        if not upload_id or not upload_id.isalnum():
+            return None
+        sidecar = self._sidecar(upload_id)
+        try:
+            if time.time() - sidecar.stat().st_mtime > self.ttl_seconds:
+                return None
+            handle = UploadHandle(**json.loads(sidecar.read_text(encoding="utf-8")))
+        except (OSError, ValueError, TypeError):
+            return None
+        if not Path(handle.path).exists():
+            return None
+        try:
+            os.utime(sidecar)
+        except OSError:
+            pass
+        return handle
+
+    def collect_garbage(self, now: Optional[float] = None) -> int:
+        """
+        Delete uploads idle for longer than the TTL.
+
+        Sidecars are aged by their last use; archives without a sidecar (from
+        older versions or interrupted uploads) by their own modification time.
+
+        Args:
+            now (Optional[float]): Current POSIX time; defaults to time.time().
+
+        Returns:
+            int: Number of files removed.
+        """
+        now = time.time() if now is None else now
+        removed = 0
+        try:
+            entries = list(self.upload_dir.iterdir())
+        except OSError:
+            return 0
+
+        sidecar_ids = {p.stem for p in entries if p.suffix == ".json"}
+        for path in entries:
+            try:
+                if path.suffix == ".json":
+                    expired = now - path.stat().st_mtime > self.ttl_seconds
+                    targets = [self.upload_dir / f"{path.stem}.zip", path] if expired else []
+                elif path.stem not in sidecar_ids and path.is_file():
+                    targets = [path] if now - path.stat().st_mtime > self.ttl_seconds else []
+                else:
+                    targets = []
+                for target in targets:
+                    if target.exists():
+                        target.unlink()
+                        removed += 1
+            except OSError as e:
+                logging.warning("Could not remove expired upload %s: %s", path, e)
+        return removed
+
+    def _sidecar(self, upload_id: str) -> Path:
+        """Return the metadata file path for an upload id."""
+        return self.upload_dir / f"{upload_id}.json"
@@ -5,7 +5,9 @@ project_insights
 Utility helpers for persisting and querying analyzed project insights.
 
 Responsibilities:
-- Append analysis output (hierarchy, resume info, skills, contributors) to a JSON log
+- Append analysis output (hierarchy, resume info, skills, contributors) to a JSON Lines log
+  (see src.storage.insights_store); hierarchies are stored out of line and only
+  loaded for callers that ask for them
 - Store derived file analysis stats alongside each project
 - Provide chronological listings for projects and skill usage
 - Rank projects based on contribution signals and surface top-ranked summaries
@@ -13,12 +15,15 @@ Responsibilities:
 
 from __future__ import annotations
 
-import json
+import heapq
+import threading
 import uuid
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+from src.analysis.insight_helpers import InsightIndex
+from src.storage.insights_store import InsightStore
 from src.utils.utility_methods import convert_datetime_to_string
 
 JsonEntry = Dict[str, Any]
@@ -29,6 +34,24 @@ PathLike = Union[str, Path]
 _PROJECT_ROOT = Path(__file__).resolve().parents[2]
 DEFAULT_STORAGE = _PROJECT_ROOT / "User_config_files" / "project_insights.json"
 
+# Parsed, sorted listings per log path, keyed by InsightStore.version().
+_listing_cache: Dict[Path, tuple] = {}
+_listing_cache_lock = threading.Lock()
+
+
+class _Listing:
+    """One cached listing: the sorted insights and, once asked for, their index."""
+
+    def __init__(self, insights: Sequence["ProjectInsight"]):
+        self.insights = tuple(insights)
+        self._index: Optional[InsightIndex] = None
+
+    @property
+    def index(self) -> InsightIndex:
+        if self._index is None:
+            self._index = InsightIndex(self.insights)
+        return self._index
+
 
 def _now_iso(ts: Optional[datetime] = None) -> str:
     """Return an ISO 8601 timestamp in UTC."""
@@ -39,44 +62,6 @@ def _now_iso(ts: Optional[datetime] = None) -> str:
     return ts.astimezone(timezone.utc).isoformat()
 
 
-def _ensure_dir(path: Path) -> None:
-    """Ensure the parent directory for the provided file path exists."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-
-
-def _stash_corrupted_file(path: Path) -> None:
-    """Rename corrupted JSON logs so a clean file can be created safely."""
-    timestamp = datetime.now(tz=timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-    backup = path.with_name(f"{path.name}.corrupt-{timestamp}")
-    try:
-        path.replace(backup)
-    except Exception:
-        pass
-
-
-def _read_entries(path: Path) -> List[JsonEntry]:
-    """Read raw JSON entries from ``path`` and fall back to an empty list on error."""
-    if not path.exists():
-        return []
-    try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-        if isinstance(data, list):
-            return data
-        _stash_corrupted_file(path)
-        return []
-    except json.JSONDecodeError:
-        _stash_corrupted_file(path)
-        return []
-    except OSError:
-        return []
-
-
-def _write_entries(path: Path, entries: Sequence[JsonEntry]) -> None:
-    """Serialize entries with indentation to aid manual inspection."""
-    _ensure_dir(path)
-    path.write_text(json.dumps(list(entries), indent=2), encoding="utf-8")
-
-
 def _parse_percentage(value: Any) -> Optional[float]:
     """
     Parse a percentage-like value into a float.
@@ -412,6 +397,8 @@ class ProjectInsight:
     file_analysis: JsonEntry = field(default_factory=dict)
     thumbnail: Optional[Dict[str, Any]] = None
     snapshot_label: Optional[str] = None
+    hierarchy_ref: Optional[str] = None
+    contribution_scores: JsonEntry = field(default_factory=dict)
 
     def contribution_score(self, contributor: Optional[str] = None) -> float:
         """
@@ -421,12 +408,51 @@ class ProjectInsight:
           - Contributor-specific ranking: percentage first, then raw count fallback.
           - Overall ranking: top raw contribution count first, then percentage fallback.
 
+        Scores precomputed in ``contribution_scores`` are used when present.
+
         Args:
             contributor: Optional contributor name to focus scoring on.
 
         Returns:
             Contribution score as a float.
         """
+        return self.ranking_key(contributor)[0]
+
+    def ranking_key(self, contributor: Optional[str] = None) -> tuple[float, int]:
+        """
+        Return ``(contribution_score, contribution_count)`` for ranking.
+
+        Read from the precomputed score table when it has the entry, computed otherwise.
+
+        Args:
+            contributor: Optional contributor name to focus on.
+
+        Returns:
+            Tuple of score and raw contribution count.
+        """
+        table = self.contribution_scores or {}
+        cached = table.get("contributors", {}).get(contributor) if contributor else table.get("overall")
+        if isinstance(cached, (list, tuple)) and len(cached) == 2:
+            return float(cached[0]), int(cached[1])
+        return self._compute_contribution_score(contributor), self.contribution_count(contributor)
+
+    def score_table(self) -> JsonEntry:
+        """
+        Compute the ranking table stored as ``contribution_scores``.
+
+        Returns:
+            ``{"overall": [score, count], "contributors": {name: [score, count]}}``.
+        """
+        return {
+            "overall": [self._compute_contribution_score(None), self.contribution_count(None)],
+            "contributors": {
+                name: [self._compute_contribution_score(name), self.contribution_count(name)]
+                for name in self.contributors
+            },
+        }
+
+    def _compute_contribution_score(self, contributor: Optional[str] = None) -> float:
+        """Compute ``contribution_score`` from contributors and stats."""
         if contributor:
             if contributor not in self.contributors:
                 return 0.0
@@ -481,12 +507,21 @@ class ProjectInsight:
         return asdict(self)
 
 
-def _entry_to_dataclass(entry: JsonEntry) -> ProjectInsight:
+def _entry_to_dataclass(
+    entry: JsonEntry,
+    store: Optional[InsightStore] = None,
+    include_hierarchy: bool = True,
+) -> ProjectInsight:
     """
     Convert a raw dict entry to ``ProjectInsight`` while normalizing fields.
 
     This method smooths out older or slightly inconsistent data so our
     dataclass stays predictable and easy to work with.
+
+    Args:
+        entry: Raw entry from the insights log.
+        store: Store the entry came from; used to load an out-of-line hierarchy.
+        include_hierarchy: When False, leave ``hierarchy`` empty unless it is inline.
     """
     raw_contributors = entry.get("contributors", {}) or {}
     contributors = _normalize_contributors(raw_contributors)
@@ -506,12 +541,17 @@ def _entry_to_dataclass(entry: JsonEntry) -> ProjectInsight:
     stats.setdefault("skill_count", len(skills))
 
     analyzed_at = entry.get("analyzed_at", _now_iso())
-    hierarchy = entry.get("hierarchy", {})
     file_analysis = entry.get("file_analysis")
+    hierarchy = entry.get("hierarchy", {})
+    stored_out_of_line = store is not None and "hierarchy" not in entry
+    if stored_out_of_line and (include_hierarchy or not isinstance(file_analysis, dict)):
+        hierarchy = store.hierarchy(entry)
     if not isinstance(file_analysis, dict):
         file_analysis = _compute_file_analysis(hierarchy)
+    if stored_out_of_line and not include_hierarchy:
+        hierarchy = {}
 
-    return ProjectInsight(
+    insight = ProjectInsight(
         id=entry.get("id", str(uuid.uuid4())),
         project_name=str(entry.get("project_name", "unknown")),
         summary=entry.get("summary", ""),
@@ -528,7 +568,13 @@ def _entry_to_dataclass(entry: JsonEntry) -> ProjectInsight:
         file_analysis=file_analysis,
         thumbnail=entry.get("thumbnail"),
         snapshot_label=entry.get("snapshot_label"),
+        hierarchy_ref=entry.get("hierarchy_ref"),
     )
+    scores = entry.get("contribution_scores")
+    if not isinstance(scores, dict) or "overall" not in scores:
+        # Entries recorded before scores were stored.
+        scores = insight.score_table()
+    return replace(insight, contribution_scores=scores)
 
 
 def record_project_insight(
@@ -541,11 +587,11 @@ def record_project_insight(
     snapshot_label: Optional[str] = None,
 ) -> ProjectInsight:
     """
-    Save a new project insight to the JSON log.
+    Save a new project insight to the insights log.
 
     Basically takes the analysis data from the pipeline, normalizes it,
     computes file stats, calculates contributor stats, and then appends
-    the whole thing to the storage file.
+    the whole thing to the storage log (one line, no rewrite).
 
     Args:
         analysis: Analysis data from the pipeline with resume/hierarchy info.
@@ -591,28 +637,106 @@ def record_project_insight(
         file_analysis=_compute_file_analysis(hierarchy),
         snapshot_label=snapshot_label,
     )
+    insight = replace(insight, contribution_scores=insight.score_table())
 
-    path = Path(storage_path)
-    entries = _read_entries(path)
-    entries.append(insight.to_dict())
-    _write_entries(path, entries)
-
-    return insight
+    stored = InsightStore(storage_path).append(insight.to_dict())
+    return replace(insight, hierarchy_ref=stored.get("hierarchy_ref"))
 
 
-def list_project_insights(storage_path: PathLike = DEFAULT_STORAGE) -> List[ProjectInsight]:
+def list_project_insights(
+    storage_path: PathLike = DEFAULT_STORAGE,
+    include_hierarchy: bool = False,
+) -> List[ProjectInsight]:
     """
     Return all stored insights in chronological order (oldest → newest).
 
+    Hierarchies are stored separately from the log and are not loaded unless
+    asked for; ``file_analysis`` already summarizes them for listings.
+
+    The parsed, sorted list is cached per storage path and reused until the
+    log changes (see ``InsightStore.version``), so repeated polling does not
+    re-read the log.
+
     Args:
         storage_path: Where the project insights are stored.
+        include_hierarchy: Load each insight's full file hierarchy as well.
 
     Returns:
         List of ProjectInsight objects sorted by analyzed_at timestamp.
     """
-    path = Path(storage_path)
-    insights = (_entry_to_dataclass(e) for e in _read_entries(path))
-    return sorted(insights, key=lambda i: _parse_analyzed_at(i.analyzed_at))
+    insights = list(_cached_listing(storage_path).insights)
+    if include_hierarchy:
+        insights = load_hierarchies(insights, storage_path=storage_path)
+    return insights
+
+
+def insight_index(storage_path: PathLike = DEFAULT_STORAGE) -> InsightIndex:
+    """
+    Return the skill/language/date index over the stored insights.
+
+    The index is built once per version of the log, next to the cached listing,
+    so it follows every recorded or removed insight. Pass it to
+    ``filter_insights`` to filter without scanning.
+
+    Args:
+        storage_path: Where the project insights are stored.
+
+    Returns:
+        InsightIndex over the chronological listing (hierarchies not loaded).
+    """
+    return _cached_listing(storage_path).index
+
+
+def _cached_listing(storage_path: PathLike) -> _Listing:
+    """Return the cached listing for a log, re-reading it if the log changed."""
+    store = InsightStore(storage_path)
+    key = store.path.resolve()
+    version = store.version()
+    with _listing_cache_lock:
+        cached = _listing_cache.get(key)
+    if version is not None and cached is not None and cached[0] == version:
+        return cached[1]
+    listing = _Listing(sorted(
+        (_entry_to_dataclass(e, store, include_hierarchy=False) for e in store.entries()),
+        key=lambda i: _parse_analyzed_at(i.analyzed_at),
+    ))
+    with _listing_cache_lock:
+        if version is None:
+            _listing_cache.pop(key, None)
+        else:
+            _listing_cache[key] = (version, listing)
+    return listing
+
+
+def load_hierarchies(
+    insights: Iterable[ProjectInsight],
+    storage_path: PathLike = DEFAULT_STORAGE,
+) -> List[ProjectInsight]:
+    """
+    Fill in the hierarchy of insights listed without it.
+
+    Insights that share a hierarchy reference load it once; insights whose
+    hierarchy is already present (or that have none stored) are returned as is.
+
+    Args:
+        insights: Insights, e.g. from ``list_project_insights``.
+        storage_path: Where the project insights are stored.
+
+    Returns:
+        The insights, in the same order, with hierarchies loaded.
+    """
+    store = InsightStore(storage_path)
+    loaded: Dict[str, JsonEntry] = {}
+    out: List[ProjectInsight] = []
+    for insight in insights:
+        ref = insight.hierarchy_ref
+        if insight.hierarchy or not ref:
+            out.append(insight)
+            continue
+        if ref not in loaded:
+            loaded[ref] = store.hierarchy({"hierarchy_ref": ref})
+        out.append(replace(insight, hierarchy=loaded[ref]))
+    return out
 
 
 def rank_projects_by_contribution(
@@ -635,19 +759,14 @@ def rank_projects_by_contribution(
     Returns:
         List of ProjectInsight objects sorted by contribution score (highest first).
     """
-    ranked = sorted(
-        list_project_insights(storage_path),
-        key=lambda i: (
-            i.contribution_score(contributor),
-            i.contribution_count(contributor),
-        ),
-        reverse=True,
-    )
+    insights = list_project_insights(storage_path)
+    key = lambda i: i.ranking_key(contributor)
     if top_n is None:
-        return ranked
+        return sorted(insights, key=key, reverse=True)
     if top_n <= 0:
         return []
-    return ranked[:top_n]
+    # Same order as sorting (ties keep chronological order) without sorting everything.
+    return heapq.nlargest(top_n, insights, key=key)
 
 
 def list_skill_history(storage_path: PathLike = DEFAULT_STORAGE) -> List[Dict[str, Any]]:
@@ -664,15 +783,25 @@ def list_skill_history(storage_path: PathLike = DEFAULT_STORAGE) -> List[Dict[st
             - analyzed_at (str): ISO timestamp of when it was analyzed
             - skill_count (int): Number of skills in that project
     """
-    return [
-        {
-            "project_name": insight.project_name,
-            "skills": list(insight.skills),
-            "analyzed_at": insight.analyzed_at,
-            "skill_count": len(insight.skills),
-        }
-        for insight in list_project_insights(storage_path)
-    ]
+    return [skill_history_entry(insight) for insight in list_project_insights(storage_path)]
+
+
+def skill_history_entry(insight: ProjectInsight) -> Dict[str, Any]:
+    """
+    Build the skill timeline row for one insight (see ``list_skill_history``).
+
+    Args:
+        insight: A stored project insight.
+
+    Returns:
+        Dictionary with project_name, skills, analyzed_at and skill_count.
+    """
+    return {
+        "project_name": insight.project_name,
+        "skills": list(insight.skills),
+        "analyzed_at": insight.analyzed_at,
+        "skill_count": len(insight.skills),
+    }
 
 
 def group_project_histories(
@@ -779,30 +908,30 @@ def summarize_top_project_histories(
         if not grouped:
             return []
 
+    def rank_key(item: tuple) -> tuple:
+        project_name, history = item
+        latest = history[-1]
+        return (
+            -latest.contribution_score(contributor),
+            -len(latest.skills or []),
+            -_parse_analyzed_at(latest.analyzed_at).timestamp(),
+            -_safe_int((latest.stats or {}).get("top_contribution_count", 0)),
+            str(project_name).lower(),
+        )
+
+    # Histories from group_project_histories are already chronological; only the
+    # selected projects need their evolution summarized and latest snapshot serialized.
     project_cards: List[Dict[str, Any]] = []
-    for project_name, history in grouped.items():
-        ordered = sorted(history, key=lambda item: _parse_analyzed_at(item.analyzed_at))
-        latest = ordered[-1]
-        evolution = summarize_project_evolution(ordered)
+    for project_name, history in heapq.nsmallest(top_n, grouped.items(), key=rank_key):
+        latest = history[-1]
         project_cards.append({
             "project_name": project_name,
-            "snapshot_count": len(ordered),
+            "snapshot_count": len(history),
             "score": latest.contribution_score(contributor),
             "latest": latest.to_dict(),
-            "evolution": evolution,
+            "evolution": summarize_project_evolution(history),
         })
-
-    ranked = sorted(
-        project_cards,
-        key=lambda item: (
-            -float(item["score"]),
-            -len((item["latest"].get("skills") or [])),
-            -_parse_analyzed_at(item["latest"].get("analyzed_at")).timestamp(),
-            -_safe_int((item["latest"].get("stats") or {}).get("top_contribution_count", 0)),
-            str(item["project_name"]).lower(),
-        ),
-    )
-    return ranked[:top_n]
+    return project_cards
 
 
 def summaries_for_top_ranked_projects(
@@ -865,25 +994,17 @@ def update_thumbnail_in_insights(
     Returns:
         True if updated successfully, False otherwise
     """
-    path = Path(storage_path)
-    entries = _read_entries(path)
-    
-    updated = False
-    for entry in entries:
-        if entry.get("id") == project_id:
-            entry["thumbnail"] = {
-                "path": str(thumbnail_path),
-                "filename": thumbnail_path.name,
-                "exists": True,
-                "added_at": _now_iso(),
-            }
-            updated = True
-            break
-    
-    if updated:
-        _write_entries(path, entries)
-    
-    return updated
+    store = InsightStore(storage_path)
+    entry = store.get(project_id)
+    if entry is None:
+        return False
+    entry["thumbnail"] = {
+        "path": str(thumbnail_path),
+        "filename": thumbnail_path.name,
+        "exists": True,
+        "added_at": _now_iso(),
+    }
+    return store.replace(entry)
 
 
 def remove_project_from_insights(
@@ -900,13 +1021,8 @@ def remove_project_from_insights(
     Returns:
         Number of entries removed.
     """
-    path = Path(storage_path)
-    entries = _read_entries(path)
-    kept = [e for e in entries if e.get("project_name") != project_name]
-    removed = len(entries) - len(kept)
-    if removed:
-        _write_entries(path, kept)
-    return removed
+    store = InsightStore(storage_path)
+    return store.delete(store.ids_for_project(project_name))
 
 
 def remove_thumbnail_from_insights(
@@ -923,20 +1039,12 @@ def remove_thumbnail_from_insights(
     Returns:
         True if removed successfully, False otherwise
     """
-    path = Path(storage_path)
-    entries = _read_entries(path)
-    
-    updated = False
-    for entry in entries:
-        if entry.get("id") == project_id:
-            entry["thumbnail"] = None
-            updated = True
-            break
-    
-    if updated:
-        _write_entries(path, entries)
-    
-    return updated
+    store = InsightStore(storage_path)
+    entry = store.get(project_id)
+    if entry is None:
+        return False
+    entry["thumbnail"] = None
+    return store.replace(entry)
 
 def get_thumbnail_from_insight(
     insight: ProjectInsight
@@ -73,18 +73,24 @@ INFRA_TO_SKILL: Mapping[str, str] = {
 # --------------------------- MAIN API FUNCTION -------------------------------
 
 
-def identify_skills(project_root: Path | str) -> List[str]:
+def identify_skills(project_root: Path | str, inventory=None, stack_info=None) -> List[str]:
     """
     Derive high-level skills demonstrated within a project workspace.
 
     Combines language detection, framework discovery, and package analysis to produce
     a curated list of skill labels (sorted alphabetically).
+
+    Args:
+        project_root: Project directory to inspect.
+        inventory: Optional ProjectInventory of project_root used instead of `rglob`.
+        stack_info: Optional pre-computed detect_project_stack output to reuse.
     """
     root = Path(project_root)
     if not root.exists():
         return []
 
-    stack_info = detect_project_stack(root)
+    if stack_info is None:
+        stack_info = detect_project_stack(root, inventory=inventory)
     detected_languages = set(stack_info.get("languages", []))
     detected_frameworks = set(stack_info.get("frameworks", []))
 
@@ -101,27 +107,32 @@ def identify_skills(project_root: Path | str) -> List[str]:
     for framework in detected_frameworks & set(INFRA_TO_SKILL.keys()):
         skills.add(INFRA_TO_SKILL[framework])
 
-    skills.update(_scan_additional_skills(root))
+    skills.update(_scan_additional_skills(root, inventory=inventory))
 
     return sorted(skills)
 
 
-def _scan_additional_skills(root: Path) -> Set[str]:
+def _scan_additional_skills(root: Path, inventory=None) -> Set[str]:
     """
     Inspect dependency files for domain-specific skills (e.g., data analysis, testing).
     """
     detected: Set[str] = set()
 
-    for requirements in root.rglob("requirements.txt"):
+    def _named(filename: str):
+        if inventory is None:
+            return root.rglob(filename)
+        return [root / e.rel_path for e in inventory.files() if e.name == filename]
+
+    for requirements in _named("requirements.txt"):
         detected.update(_skills_from_requirements(requirements))
 
-    for pyproject in root.rglob("pyproject.toml"):
+    for pyproject in _named("pyproject.toml"):
         detected.update(_skills_from_text_file(pyproject))
 
-    for package_json in root.rglob("package.json"):
+    for package_json in _named("package.json"):
         detected.update(_skills_from_package_json(package_json))
 
-    for composer_json in root.rglob("composer.json"):
+    for composer_json in _named("composer.json"):
         detected.update(_skills_from_package_json(composer_json))
 
     return detected
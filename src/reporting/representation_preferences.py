@@ -12,7 +12,7 @@ from dataclasses import replace
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from src.reporting import project_insights
-from src.reporting.project_insights import ProjectInsight, list_project_insights
+from src.reporting.project_insights import ProjectInsight, list_project_insights, load_hierarchies
 
 _PROJECT_ROOT = Path(__file__).resolve().parents[2]
 PREFERENCES_PATH = _PROJECT_ROOT / "User_config_files" / "representation_preferences.json"
@@ -164,6 +164,9 @@ def apply_preferences(
                 others.append(ins)
         ordered = showcased + others
 
+    # The dashboard activity heatmap reads file paths from each hierarchy.
+    ordered = load_hierarchies(ordered, storage_path=storage_path or project_insights.DEFAULT_STORAGE)
+
     response = {
         "projects": [ins.to_dict() for ins in ordered],
         "project_order": order_list,
@@ -63,6 +63,7 @@ def generate_resume_item(
     project_name: str | None = None,
     doc_analysis: Dict[str, Any] | None = None,
     contrib_summary_data: Dict[str, Any] | None = None,
+    inventory=None,
 ) -> ResumeItem:
     """
     Analyse a project workspace and produce a résumé-ready description.
@@ -72,6 +73,8 @@ def generate_resume_item(
         project_name: Optional explicit project name. Defaults to folder name.
         doc_analysis: Optional pre-computed DocumentAnalyzer output. Reused to avoid double scan.
         contrib_summary_data: Optional pre-computed contribution_summary output. Reused to avoid double scan.
+        inventory: Optional ProjectInventory of the project. Shared by stack, skill and
+            evidence detection so the workspace is walked only once.
 
     Returns:
         ResumeItem with curated summary, highlight bullets, and supporting metadata.
@@ -89,7 +92,7 @@ def generate_resume_item(
     _contrib: Dict[str, Any] = contrib_summary_data or {}
     if not _contrib:
         try:
-            _contrib = contribution_summary(resolved_root) or {}
+            _contrib = contribution_summary(resolved_root, inventory=inventory) or {}
         except Exception:
             _contrib = {}
 
@@ -100,12 +103,12 @@ def generate_resume_item(
 
     # If Git analysis failed or returned unknown, use detect_project_type as fallback
     if project_type == "unknown":
-        project_type_info = detect_project_type(resolved_root)
+        project_type_info = detect_project_type(resolved_root, inventory=inventory)
         project_type = project_type_info.get("project_type", "unknown")
         detection_mode = str(project_type_info.get("mode", "local")).lower()
 
     # Detect programming languages and frameworks/tools from the project.
-    stack_info = detect_project_stack(resolved_root)
+    stack_info = detect_project_stack(resolved_root, inventory=inventory)
     languages = sorted(stack_info.get("languages", []))
     frameworks = sorted(stack_info.get("frameworks", []))
     framework_sources = {
@@ -113,11 +116,16 @@ def generate_resume_item(
     }
 
     # Infer higher-level skills and sort to ensure deterministic output.
-    skills = sorted(identify_skills(resolved_root))
+    skills = sorted(identify_skills(resolved_root, inventory=inventory, stack_info=stack_info))
 
     # Build evidence block from doc signals and contributor data.
     # duration is None here — analyze_project backfills it after estimation.
-    evidence = _extract_evidence(resolved_root, doc_analysis=doc_analysis, contrib_summary=_contrib)
+    evidence = _extract_evidence(
+        resolved_root,
+        doc_analysis=doc_analysis,
+        contrib_summary=_contrib,
+        inventory=inventory,
+    )
 
     # Compose résumé-ready text.
     summary = _compose_summary(
@@ -258,6 +266,7 @@ def _extract_evidence(
     *,
     doc_analysis: Dict[str, Any] | None = None,
     contrib_summary: Dict[str, Any] | None = None,
+    inventory=None,
 ) -> Dict[str, Any]:
     """
     Gather evidence signals from the project for portfolio display.
@@ -278,8 +287,9 @@ def _extract_evidence(
     # Test file count
     test_count = 0
     try:
-        for f in root.rglob("*"):
-            if not f.is_file():
+        candidates = inventory.paths(base=root) if inventory is not None else root.rglob("*")
+        for f in candidates:
+            if inventory is None and not f.is_file():
                 continue
             parts_lower = [p.lower() for p in f.parts]
             name_lower = f.name.lower()
@@ -0,0 +1,173 @@
+"""Content-addressed cache of per-file OOP analysis reports.
+
+Re-uploaded snapshots of a project usually differ in only a handful of files,
+so parsing every file again is wasted work. Reports are stored under
+(SHA-256 of the file content, analyzer name, analyzer version); a file whose
+content was analyzed before by the same analyzer version is served from the
+cache instead of being parsed.
+
+Stored reports are path-independent: the orchestrator rewrites file paths to
+the file's current location when a report is reused (see relocate_report).
+
+The cache lives alongside saved analyses (default: User_config_files/project_insights)
+as `analysis_cache.db`.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+CACHE_FILENAME = "analysis_cache.db"
+CONNECT_TIMEOUT = 10  # seconds
+MAX_ENTRIES = 200_000
+SQLITE_MAX_VARIABLES = 900
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS file_reports (
+    hash TEXT NOT NULL,
+    analyzer TEXT NOT NULL,
+    version TEXT NOT NULL,
+    report TEXT NOT NULL,
+    used_at REAL NOT NULL,
+    PRIMARY KEY (hash, analyzer, version)
+)
+"""
+
+
+def relocate_report(report: Dict[str, Any], path: Path) -> Dict[str, Any]:
+    """
+    Point a cached canonical report (and its classes) at the file's current path.
+
+    Args:
+        report (Dict[str, Any]): Canonical per-file report.
+        path (Path): Where the analyzed content lives now.
+
+    Returns:
+        Dict[str, Any]: The same report, updated in place.
+    """
+    report["file"] = str(path)
+    for cls in report.get("classes") or []:
+        if isinstance(cls, dict) and "file_path" in cls:
+            cls["file_path"] = str(path)
+    return report
+
+
+class AnalysisCache:
+    """
+    SQLite-backed store of per-file analysis reports.
+
+    Every operation opens its own short-lived connection, so one instance can be
+    shared between threads. Cache failures are logged and treated as misses;
+    they never fail an analysis.
+    """
+
+    def __init__(self, db_path: str | Path, max_entries: int = MAX_ENTRIES):
+        """
+        Args:
+            db_path (str | Path): SQLite file to use (created on first write).
+            max_entries (int): Least recently used reports beyond this count are evicted.
+        """
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection and make sure the schema exists."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=CONNECT_TIMEOUT)
+        conn.execute(_SCHEMA)
+        return conn
+
+    def get_many(self, analyzer: str, version: str, hashes: Iterable[str]) -> Dict[str, Any]:
+        """
+        Look up cached reports for several file hashes.
+
+        Args:
+            analyzer (str): Analyzer name, e.g. "java".
+            version (str): Analyzer version the reports must come from.
+            hashes (Iterable[str]): Content hashes to look up.
+
+        Returns:
+            Dict[str, Any]: Decoded report per hash found; missing hashes are absent.
+        """
+        wanted = list(dict.fromkeys(hashes))
+        if not wanted:
+            return {}
+
+        found: Dict[str, Any] = {}
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    for start in range(0, len(wanted), SQLITE_MAX_VARIABLES):
+                        batch = wanted[start:start + SQLITE_MAX_VARIABLES]
+                        marks = ",".join("?" * len(batch))
+                        rows = conn.execute(
+                            f"SELECT hash, report FROM file_reports "
+                            f"WHERE analyzer = ? AND version = ? AND hash IN ({marks})",
+                            [analyzer, version, *batch],
+                        ).fetchall()
+                        for digest, report in rows:
+                            found[digest] = json.loads(report)
+
+                        hit = [h for h in batch if h in found]
+                        if hit:
+                            conn.execute(
+                                f"UPDATE file_reports SET used_at = ? "
+                                f"WHERE analyzer = ? AND version = ? "
+                                f"AND hash IN ({','.join('?' * len(hit))})",
+                                [time.time(), analyzer, version, *hit],
+                            )
+            finally:
+                conn.close()
+        except (sqlite3.Error, ValueError) as e:
+            logging.warning("Analysis cache lookup failed at %s: %s", self.db_path, e)
+            return {}
+        return found
+
+    def put_many(self, analyzer: str, version: str, reports: List[Tuple[str, Any]]) -> None:
+        """
+        Store freshly computed reports.
+
+        Args:
+            analyzer (str): Analyzer name, e.g. "java".
+            version (str): Analyzer version that produced the reports.
+            reports (List[Tuple[str, Any]]): (content hash, JSON-serializable report) pairs.
+
+        Returns:
+            None
+        """
+        if not reports:
+            return
+
+        now = time.time()
+        try:
+            rows = [(digest, analyzer, version, json.dumps(report), now) for digest, report in reports]
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO file_reports (hash, analyzer, version, report, used_at) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                    self._evict(conn)
+            finally:
+                conn.close()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logging.warning("Analysis cache write failed at %s: %s", self.db_path, e)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop the least recently used reports once the cache exceeds max_entries."""
+        (count,) = conn.execute("SELECT COUNT(*) FROM file_reports").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            conn.execute(
+                "DELETE FROM file_reports WHERE rowid IN "
+                "(SELECT rowid FROM file_reports ORDER BY used_at LIMIT ?)",
+                (excess,),
+            )
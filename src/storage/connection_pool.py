@@ -0,0 +1,123 @@
+"""SQLite connections for one database: a single writer plus a pool of readers.
+
+SQLite allows one writer at a time but, in WAL mode, any number of readers
+that do not block it (or each other). `SQLitePool` keeps one writer
+connection, which callers must serialize themselves (`HelperFunct` does so
+with its lock), and hands out up to `readers` read-only connections so read
+endpoints running on different threads no longer share one handle.
+
+Each connection gets the same tuning: `synchronous=NORMAL` (safe with WAL),
+a memory-mapped I/O window, a larger page cache, a busy timeout and foreign
+keys on. The reader count comes from the DB_READER_CONNECTIONS environment
+variable (default 4).
+"""
+
+from __future__ import annotations
+
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+READERS_ENV_VAR = "DB_READER_CONNECTIONS"
+DEFAULT_READERS = 4
+BUSY_TIMEOUT_MS = 5000
+MMAP_SIZE = 256 * 1024 * 1024  # bytes
+CACHE_SIZE_KIB = 16 * 1024
+
+_PRAGMAS = (
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA synchronous = NORMAL",
+    f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}",
+    f"PRAGMA mmap_size = {MMAP_SIZE}",
+    f"PRAGMA cache_size = -{CACHE_SIZE_KIB}",
+)
+
+
+def _default_readers() -> int:
+    """Read the reader pool size from DB_READER_CONNECTIONS."""
+    try:
+        return max(1, int(os.environ[READERS_ENV_VAR]))
+    except (KeyError, ValueError):
+        return DEFAULT_READERS
+
+
+class SQLitePool:
+    """
+    One writer connection and a bounded pool of read-only connections.
+
+    Attributes:
+        db_path (Path): The database file.
+        writer (sqlite3.Connection): The only connection that writes.
+        readers (int): Maximum number of reader connections.
+    """
+
+    def __init__(self, db_path: str | Path, readers: Optional[int] = None):
+        """
+        Open the writer connection and switch the database to WAL.
+
+        Args:
+            db_path (str | Path): Database file (not ":memory:"; readers need a file).
+            readers (Optional[int]): Reader pool size; None reads DB_READER_CONNECTIONS.
+        """
+        self.db_path = Path(db_path)
+        self.readers = readers or _default_readers()
+        self.writer = self._connect()
+        self.writer.execute("PRAGMA journal_mode = WAL")
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._opened: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """Open a tuned connection usable from any thread (one thread at a time)."""
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=BUSY_TIMEOUT_MS / 1000)
+        for pragma in _PRAGMAS:
+            conn.execute(pragma)
+        if read_only:
+            conn.execute("PRAGMA query_only = ON")
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow a read-only connection for the duration of the block.
+
+        Opens a new connection while fewer than `readers` exist, otherwise waits
+        for one to be returned. Readers see the last committed state.
+
+        Yields:
+            sqlite3.Connection: A connection with query_only on.
+        """
+        conn = self._checkout()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put(conn)
+
+    def _checkout(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._opened) < self.readers:
+                conn = self._connect(read_only=True)
+                self._opened.append(conn)
+                return conn
+        return self._idle.get()
+
+    def close(self) -> None:
+        """Close the writer and every reader connection."""
+        with self._lock:
+            for conn in [self.writer, *self._opened]:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            self._opened = []
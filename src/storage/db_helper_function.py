@@ -1,7 +1,95 @@
 import json
 import sqlite3
 import threading
-from typing import Dict, List, Union
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Union
+
+from src.storage import json_delta
+from src.storage.connection_pool import SQLitePool
+
+# Writes inside HelperFunct.batch() are committed this often by default.
+BATCH_COMMIT_EVERY = 100
+
+# Statements used for every project write; keeping them as fixed strings lets
+# sqlite3's per-connection statement cache reuse the compiled statements.
+_SQL_PROJECT_EXISTS = "SELECT 1 FROM project_data WHERE Pname = ?"
+_SQL_MAX_VERSION = "SELECT COALESCE(MAX(version_number), 0) FROM project_versions WHERE project_name = ?"
+_SQL_UPSERT_PROJECT = (
+    "INSERT INTO project_data (Pname, content, file_blob, current_version) "
+    "VALUES (?, ?, ?, ?) "
+    "ON CONFLICT(Pname) DO UPDATE SET "
+    "content = excluded.content, file_blob = excluded.file_blob, current_version = excluded.current_version"
+)
+_SQL_UPLOADED_AT = "SELECT uploaded_at FROM project_data WHERE Pname = ?"
+_SQL_INSERT_VERSION = (
+    "INSERT INTO project_versions "
+    "(project_name, project_uploaded_at, version_number, content, file_blob) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+_SQL_PREVIOUS_FULL_VERSION = (
+    "SELECT id, content, file_blob FROM project_versions "
+    "WHERE project_name = ? AND project_uploaded_at = ? AND version_number < ? AND encoding = 'full' "
+    "ORDER BY version_number DESC LIMIT 1"
+)
+_SQL_STORE_AS_DELTA = "UPDATE project_versions SET content = '', file_blob = ?, encoding = 'delta' WHERE id = ?"
+_SQL_CREATE_SUMMARY = (
+    "CREATE TABLE IF NOT EXISTS project_summary ("
+    "Pname TEXT PRIMARY KEY, project_type TEXT, "
+    "languages TEXT NOT NULL DEFAULT '[]', skills TEXT NOT NULL DEFAULT '[]', "
+    "version_count INTEGER NOT NULL DEFAULT 0, updated_at TEXT DEFAULT (datetime('now')), "
+    "FOREIGN KEY (Pname) REFERENCES project_data(Pname) ON DELETE CASCADE)"
+)
+_SQL_UPSERT_SUMMARY = (
+    "INSERT INTO project_summary (Pname, project_type, languages, skills, version_count, updated_at) "
+    "SELECT ?, ?, ?, ?, COUNT(*), datetime('now') FROM project_versions "
+    "WHERE project_name = ? AND project_uploaded_at = ? "
+    "ON CONFLICT(Pname) DO UPDATE SET "
+    "project_type = excluded.project_type, languages = excluded.languages, skills = excluded.skills, "
+    "version_count = excluded.version_count, updated_at = excluded.updated_at"
+)
+_SQL_VERSION_ROW = (
+    "SELECT version_number, content, file_blob, created_at, encoding FROM project_versions "
+    "WHERE project_name = ? AND version_number = ?"
+)
+
+
+def _summary_fields(data: Any) -> tuple[str | None, str, str]:
+    """
+    Extract the listing fields kept in project_summary from an analysis payload.
+
+    Args:
+        data: Stored analysis JSON.
+
+    Returns:
+        tuple: project type, and the JSON-encoded languages and skills lists.
+    """
+    resume = data.get("resume_item") if isinstance(data, dict) else None
+    resume = resume if isinstance(resume, dict) else {}
+    project_type = resume.get("project_type")
+    languages = resume.get("languages") if isinstance(resume.get("languages"), list) else []
+    skills = resume.get("skills") if isinstance(resume.get("skills"), list) else []
+    return (
+        project_type if isinstance(project_type, str) else None,
+        json.dumps(languages),
+        json.dumps(skills),
+    )
+
+
+def _serialize(data: dict, raw_bytes: bytes = None) -> tuple[str, bytes]:
+    """
+    Serialize a payload once for the content column and, if not given, the blob.
+
+    Args:
+        data: The JSON content to store.
+        raw_bytes: Optional pre-serialized blob.
+
+    Returns:
+        tuple[str, bytes]: The content text and the blob.
+    """
+    content = json.dumps(data)
+    if raw_bytes is None:
+        raw_bytes = content.encode("utf-8")
+    return content, raw_bytes
 
 
 class HelperFunct:
@@ -10,21 +98,42 @@ class HelperFunct:
     Stores and retrieves JSON contents.
     """
 
-    def __init__(self, connection):
+    def __init__(self, connection, delta_versions: bool = True):
         """
         Initialize the HelperFunct with an active SQLite database connection.
 
         Args:
-            connection: An aSQLite connection object that is already connected.
+            connection: An aSQLite connection object that is already connected, or an
+                SQLitePool; with a pool, writes go through its writer connection and
+                reads through its read-only connections, so reads run concurrently.
+            delta_versions: When True, only the newest version of a project is kept
+                whole in project_versions; each older version is replaced by a
+                compressed delta from the next newer one when a new version is saved.
 
         Returns:
             None: This method initializes the database helper instance.
         """
         if connection is None:
             raise RuntimeError("ProjectDataStore was given an invalid SQLite connection.")
-        self.conn = connection
+        self._pool = connection if isinstance(connection, SQLitePool) else None
+        self.conn = self._pool.writer if self._pool else connection
+        self.delta_versions = delta_versions
         self._lock = threading.Lock()
+        self._batch_depth = 0
+        self._batch_commit_every = BATCH_COMMIT_EVERY
+        self._batch_pending = 0
         self.conn.row_factory = sqlite3.Row
+        self._ensure_version_encoding_column()
+        self._backfill_summaries()
+
+    def _ensure_version_encoding_column(self) -> None:
+        """Add project_versions.encoding to databases created before it existed."""
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(project_versions)")}
+        if columns and "encoding" not in columns:
+            self.conn.execute(
+                "ALTER TABLE project_versions ADD COLUMN encoding TEXT NOT NULL DEFAULT 'full'"
+            )
+            self.conn.commit()
 
 
     def insert_json(self, filename: str, data: dict, raw_bytes: bytes = None) -> tuple[str, bool]:
@@ -42,47 +151,255 @@ class HelperFunct:
                 - The project name (filename) of the inserted/updated record
                 - True if this was an update (project existed), False if new insert
         """
+        content, raw_bytes = _serialize(data, raw_bytes)
         with self._lock:
-            if raw_bytes is None:
-                raw_bytes = json.dumps(data).encode("utf-8")
-
             cursor = self.conn.cursor()
             try:
+                result = self._write_project(cursor, filename, content, raw_bytes, data)
+                self._commit()
+                return result
+            finally:
+                cursor.close()
 
-                cursor.execute("SELECT 1 FROM project_data WHERE Pname = ?", (filename,))
-                was_update = cursor.fetchone() is not None
+    def insert_many(self, items: Iterable[tuple]) -> List[tuple[str, bool]]:
+        """
+        Insert or update many projects in a single transaction.
 
-                cursor.execute(
-                    "SELECT COALESCE(MAX(version_number), 0) FROM project_versions WHERE project_name = ?",
-                    (filename,)
-                )
-                new_version = cursor.fetchone()[0] + 1
+        Each payload is serialized once and every row is written through the same
+        cursor and SQL strings, so SQLite reuses the prepared statements. One
+        commit (and one fsync) covers the whole batch instead of one per project.
+        If any write fails, none of the items are kept.
 
-                cursor.execute(
-                    "INSERT INTO project_data (Pname, content, file_blob, current_version) "
-                    "VALUES (?, ?, ?, ?) "
-                    "ON CONFLICT(Pname) DO UPDATE SET "
-                    "content = excluded.content, file_blob = excluded.file_blob, current_version = excluded.current_version",
-                    (filename, json.dumps(data), raw_bytes, new_version)  # 4 values ✅
-                )
+        Args:
+            items: ``(filename, data)`` or ``(filename, data, raw_bytes)`` tuples.
 
-                cursor.execute(
-                    "SELECT uploaded_at FROM project_data WHERE Pname = ?",
-                    (filename,)
-                )
-                uploaded_at = cursor.fetchone()[0]
+        Returns:
+            list: One ``(filename, was_update)`` tuple per item, in order.
+        """
+        prepared = []
+        for item in items:
+            filename, data, *rest = item
+            prepared.append((filename, *_serialize(data, rest[0] if rest else None), data))
 
-                cursor.execute(
-                    "INSERT INTO project_versions "
-                    "(project_name, project_uploaded_at, version_number, content, file_blob) "
-                    "VALUES (?, ?, ?, ?, ?)",
-                    (filename, uploaded_at, new_version, json.dumps(data), raw_bytes)
-                )
+        with self.batch(commit_every=0):
+            with self._lock:
+                cursor = self.conn.cursor()
+                try:
+                    self._begin(cursor)
+                    cursor.execute("SAVEPOINT insert_many")
+                    try:
+                        results = [self._write_project(cursor, *row) for row in prepared]
+                    except BaseException:
+                        cursor.execute("ROLLBACK TO SAVEPOINT insert_many")
+                        cursor.execute("RELEASE SAVEPOINT insert_many")
+                        raise
+                    cursor.execute("RELEASE SAVEPOINT insert_many")
+                    return results
+                finally:
+                    cursor.close()
 
-                self.conn.commit()
-                return filename, was_update
-            finally:
-                cursor.close()
+    @contextmanager
+    def batch(self, commit_every: int = BATCH_COMMIT_EVERY) -> Iterator["HelperFunct"]:
+        """
+        Group the writes made inside the block (from any thread) into shared transactions.
+
+        Writes still run one at a time under the store lock, but they are only
+        committed every ``commit_every`` writes and when the block exits, instead
+        of once per write. If the block raises, uncommitted writes are rolled back.
+        With a connection pool, reads only see batched writes once they are committed.
+
+        Args:
+            commit_every: Commit after this many writes; 0 commits only on exit.
+
+        Yields:
+            HelperFunct: This store.
+        """
+        with self._lock:
+            self._batch_depth += 1
+            self._batch_commit_every = commit_every if self._batch_depth == 1 else self._batch_commit_every
+        try:
+            yield self
+        except BaseException:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self.conn.rollback()
+                    self._batch_pending = 0
+            raise
+        else:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self.conn.commit()
+                    self._batch_pending = 0
+
+    def _insert_version(
+        self, cursor, project_name: str, uploaded_at: str, version: int, content: str, raw_bytes: bytes, data: Any
+    ) -> None:
+        """
+        Append a version row, refresh the project's summary row and, in delta
+        mode, turn the previous whole version into a delta from this one
+        (caller holds the lock).
+
+        In delta mode the row's blob is left empty when it is just the encoded
+        content, since retrieve_selected_version can rebuild it. A previous
+        version whose blob differs from its content (original bytes passed to
+        update) is kept whole, so those bytes can still be returned.
+        """
+        blob = raw_bytes
+        if self.delta_versions and raw_bytes == content.encode("utf-8"):
+            blob = None
+        cursor.execute(_SQL_INSERT_VERSION, (project_name, uploaded_at, version, content, blob))
+        self._refresh_summary(cursor, project_name, uploaded_at, data)
+        if not self.delta_versions:
+            return
+
+        cursor.execute(_SQL_PREVIOUS_FULL_VERSION, (project_name, uploaded_at, version))
+        previous = cursor.fetchone()
+        if previous is None:
+            return
+        row_id, previous_content, previous_blob = previous
+        if previous_blob is not None and previous_blob != previous_content.encode("utf-8"):
+            return
+        try:
+            old_data = json.loads(previous_content)
+        except ValueError:
+            return
+        # Diff the stored JSON, not `data`: serialization can change it (e.g.
+        # int dict keys become strings), and the delta is applied to what is stored.
+        new_data = json.loads(content)
+        ops = json_delta.diff(new_data, old_data)
+        if json_delta.apply(new_data, ops) != old_data:
+            return
+        delta = json_delta.encode(version, ops)
+        # Tiny documents can compress worse than they store; keep those whole.
+        if len(delta) < len(previous_content) + len(previous_blob or b""):
+            cursor.execute(_SQL_STORE_AS_DELTA, (delta, row_id))
+
+    def _refresh_summary(self, cursor, project_name: str, uploaded_at: str, data: Any) -> None:
+        """Rewrite a project's project_summary row from its latest content (caller holds the lock)."""
+        project_type, languages, skills = _summary_fields(data)
+        cursor.execute(
+            _SQL_UPSERT_SUMMARY,
+            (project_name, project_type, languages, skills, project_name, uploaded_at),
+        )
+
+    def _backfill_summaries(self) -> None:
+        """Create project_summary, and rows in it, for projects stored before it existed."""
+        tables = {row[0] for row in self.conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        if "project_data" not in tables:
+            return
+        if "project_summary" not in tables:
+            self.conn.execute(_SQL_CREATE_SUMMARY)
+        missing = self.conn.execute(
+            "SELECT Pname, uploaded_at, content FROM project_data "
+            "WHERE Pname NOT IN (SELECT Pname FROM project_summary)"
+        ).fetchall()
+        if not missing:
+            self.conn.commit()
+            return
+        cursor = self.conn.cursor()
+        try:
+            for name, uploaded_at, content in missing:
+                try:
+                    data = json.loads(content)
+                except ValueError:
+                    data = {}
+                self._refresh_summary(cursor, name, uploaded_at, data)
+            self.conn.commit()
+        finally:
+            cursor.close()
+
+    def _load_version_content(self, cursor, project_name: str, version_number: int) -> tuple[sqlite3.Row, Any] | None:
+        """
+        Load a version row and its content, applying deltas back from the
+        nearest newer whole version when the row is stored as a delta.
+
+        Returns:
+            tuple | None: The row and its parsed content, or None if the version does not exist.
+        """
+        cursor.execute(_SQL_VERSION_ROW, (project_name, version_number))
+        row = cursor.fetchone()
+        if row is None:
+            return None
+
+        chain = []
+        current = row
+        while current["encoding"] == "delta":
+            base, ops = json_delta.decode(current["file_blob"])
+            chain.append(ops)
+            cursor.execute(_SQL_VERSION_ROW, (project_name, base))
+            current = cursor.fetchone()
+            if current is None:
+                raise ValueError(f"Version {base} of {project_name} needed to rebuild version {version_number} is missing")
+
+        content = json.loads(current["content"])
+        for ops in reversed(chain):
+            content = json_delta.apply(content, ops)
+        return row, content
+
+    @contextmanager
+    def _reading(self) -> Iterator[sqlite3.Connection]:
+        """
+        Yield a connection for a read: a pooled reader (which sees committed data),
+        or else the single shared connection, held under the lock meanwhile.
+        """
+        if self._pool is not None:
+            with self._pool.reader() as conn:
+                yield conn
+        else:
+            with self._lock:
+                yield self.conn
+
+    def _begin(self, cursor) -> None:
+        """
+        Open a transaction unless one is open, so releasing a savepoint never
+        commits by itself; _commit decides when to commit.
+        """
+        if not self.conn.in_transaction:
+            cursor.execute("BEGIN")
+
+    def _commit(self) -> None:
+        """Commit now, or count the write toward the open batch (caller holds the lock)."""
+        if self._batch_depth == 0:
+            self.conn.commit()
+            return
+        self._batch_pending += 1
+        if self._batch_commit_every and self._batch_pending >= self._batch_commit_every:
+            self.conn.commit()
+            self._batch_pending = 0
+
+    def _write_project(self, cursor, filename: str, content: str, raw_bytes: bytes, data: Any) -> tuple[str, bool]:
+        """
+        Upsert one project row and append its next version (caller holds the lock).
+
+        The writes run inside a savepoint so a failure leaves no partial rows,
+        even inside a batch.
+
+        Returns:
+            tuple[str, bool]: The filename and whether the project already existed.
+        """
+        self._begin(cursor)
+        cursor.execute("SAVEPOINT write_project")
+        try:
+            cursor.execute(_SQL_PROJECT_EXISTS, (filename,))
+            was_update = cursor.fetchone() is not None
+
+            cursor.execute(_SQL_MAX_VERSION, (filename,))
+            new_version = cursor.fetchone()[0] + 1
+
+            cursor.execute(_SQL_UPSERT_PROJECT, (filename, content, raw_bytes, new_version))
+
+            cursor.execute(_SQL_UPLOADED_AT, (filename,))
+            uploaded_at = cursor.fetchone()[0]
+
+            self._insert_version(cursor, filename, uploaded_at, new_version, content, raw_bytes, data)
+        except BaseException:
+            cursor.execute("ROLLBACK TO SAVEPOINT write_project")
+            cursor.execute("RELEASE SAVEPOINT write_project")
+            raise
+        cursor.execute("RELEASE SAVEPOINT write_project")
+        return filename, was_update
 
 
             # returns the contents of the json file by name
@@ -97,13 +414,14 @@ class HelperFunct:
             dict | None: The parsed JSON content as a dictionary if found,
             or None if no matching record exists.
         """
-        cursor = self.conn.cursor()
-        try:
-            cursor.execute("SELECT content FROM project_data WHERE Pname = ?", (project_name,))
-            row = cursor.fetchone()
-            return json.loads(row[0]) if row else None
-        finally:
-            cursor.close()
+        with self._reading() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("SELECT content FROM project_data WHERE Pname = ?", (project_name,))
+                row = cursor.fetchone()
+                return json.loads(row[0]) if row else None
+            finally:
+                cursor.close()
 
             # returns the blob file by name
     def fetch_file_blob_by_name(self, project_name: str) -> bytes:
@@ -117,13 +435,14 @@ class HelperFunct:
             bytes | None: The raw file blob if found, or None if the record
             does not exist.
         """
-        cursor = self.conn.cursor()
-        try:
-            cursor.execute("SELECT file_blob FROM project_data WHERE Pname = ?", (project_name,))
-            row = cursor.fetchone()
-            return row[0] if row else None
-        finally:
-            cursor.close()
+        with self._reading() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("SELECT file_blob FROM project_data WHERE Pname = ?", (project_name,))
+                row = cursor.fetchone()
+                return row[0] if row else None
+            finally:
+                cursor.close()
 
             # returns all content
     def fetch_all(self):
@@ -137,13 +456,14 @@ class HelperFunct:
             list: A list of dictionaries representing all stored JSON
             contents in the project_data table.
         """
-        cursor = self.conn.cursor()
-        try:
-            cursor.execute("SELECT content FROM project_data")
-            rows = cursor.fetchall()
-            return [json.loads(r[0]) for r in rows]
-        finally:
-            cursor.close()
+        with self._reading() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("SELECT content FROM project_data")
+                rows = cursor.fetchall()
+                return [json.loads(r[0]) for r in rows]
+            finally:
+                cursor.close()
 
     def update(self, project_name: str, input: Union[dict, bytes]) -> bool:
             """
@@ -159,11 +479,11 @@ class HelperFunct:
             """
             # Parse input
             if isinstance(input, dict):
-                content = input
-                blob = json.dumps(input).encode("utf-8")
+                data = input
+                text, blob = _serialize(data)
             elif isinstance(input, bytes):
-                blob = input
-                content = json.loads(input.decode("utf-8"))
+                data = json.loads(input.decode("utf-8"))
+                text, blob = _serialize(data, input)
             else:
                 raise ValueError("input must be a dict or bytes")
             
@@ -186,17 +506,13 @@ class HelperFunct:
                     # Update project_data
                     cursor.execute(
                         "UPDATE project_data SET content=?, file_blob=?, current_version=? WHERE Pname=?",
-                        (json.dumps(content), blob, new_version, project_name)
+                        (text, blob, new_version, project_name)
                         )
 
                     # Save new version
-                    cursor.execute(
-                        "INSERT INTO project_versions (project_name, project_uploaded_at,version_number, content, file_blob) "
-                        "VALUES (?, ?, ?, ?, ?)",
-                        (project_name, uploaded_at, new_version, json.dumps(content), blob)
-                        )
+                    self._insert_version(cursor, project_name, uploaded_at, new_version, text, blob, data)
 
-                    self.conn.commit()
+                    self._commit()
                     return True
                 finally:
                     cursor.close()
@@ -212,16 +528,17 @@ class HelperFunct:
         Returns:
             int: The number of records that reference the specified filename.
         """
-        cursor = self.conn.cursor()
-        try:
-            cursor.execute(
-                "SELECT COUNT(*) FROM project_data WHERE Pname = ?",
-                (filename,),
-            )
-            row = cursor.fetchone()
-            return int(row[0]) if row else 0
-        finally:
-            cursor.close()
+        with self._reading() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(
+                    "SELECT COUNT(*) FROM project_data WHERE Pname = ?",
+                    (filename,),
+                )
+                row = cursor.fetchone()
+                return int(row[0]) if row else 0
+            finally:
+                cursor.close()
             
         # Delete
     def delete(self, project_name: str) -> bool:
@@ -238,8 +555,11 @@ class HelperFunct:
             cursor = self.conn.cursor()
             try:
                 cursor.execute("DELETE FROM project_data WHERE Pname = ?", (project_name,))
-                self.conn.commit()
-                return cursor.rowcount > 0
+                deleted = cursor.rowcount > 0
+                # Also covered by ON DELETE CASCADE, but only when foreign_keys is on.
+                cursor.execute("DELETE FROM project_summary WHERE Pname = ?", (project_name,))
+                self._commit()
+                return deleted
             finally:
                 cursor.close()
 
@@ -259,30 +579,31 @@ class HelperFunct:
             
             Ordered from newest to oldest.
         """
-        cursor = self.conn.cursor()
-        try:
-            cursor.execute("""
-                SELECT
-                    pv.version_number,
-                    pv.created_at,
-                    CASE
-                        WHEN pv.version_number = pd.current_version THEN TRUE
-                        ELSE FALSE
-                    END as is_current
-                FROM project_versions pv
-                JOIN project_data pd
-                    ON pv.project_name = pd.Pname
-                    AND pv.project_uploaded_at = pd.uploaded_at
-                WHERE pv.project_name = ?
-                ORDER BY pv.version_number DESC
-            """, (project_name,))
-
-            versions = [dict(row) for row in cursor.fetchall()]
-            for version in versions:
-                version['is_current'] = bool(version['is_current'])
-            return versions
-        finally:
-            cursor.close()
+        with self._reading() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("""
+                    SELECT
+                        pv.version_number,
+                        pv.created_at,
+                        CASE
+                            WHEN pv.version_number = pd.current_version THEN TRUE
+                            ELSE FALSE
+                        END as is_current
+                    FROM project_versions pv
+                    JOIN project_data pd
+                        ON pv.project_name = pd.Pname
+                        AND pv.project_uploaded_at = pd.uploaded_at
+                    WHERE pv.project_name = ?
+                    ORDER BY pv.version_number DESC
+                """, (project_name,))
+
+                versions = [dict(row) for row in cursor.fetchall()]
+                for version in versions:
+                    version['is_current'] = bool(version['is_current'])
+                return versions
+            finally:
+                cursor.close()
 
     def retrieve_selected_version(self, project_name: str, version_number: int) -> Dict | None:
         """
@@ -301,27 +622,28 @@ class HelperFunct:
                 - file_blob: Raw binary data (bytes)
                 - created_at: Timestamp when version was created
             Returns None if version doesn't exist.
+
+            Versions stored as deltas are rebuilt from the newer versions they
+            depend on; their file_blob is the re-encoded content.
         """
-        cursor = self.conn.cursor()
-        try:
-            cursor.execute("""
-                SELECT
-                    version_number,
-                    content,
-                    file_blob,
-                    created_at
-                FROM project_versions
-                WHERE project_name = ? AND version_number = ?
-            """, (project_name, version_number))
-            
-            row = cursor.fetchone()
-            if row:
-                version = dict(row)
-                version['content'] = json.loads(version['content'])
+        with self._reading() as conn:
+            cursor = conn.cursor()
+            try:
+                loaded = self._load_version_content(cursor, project_name, version_number)
+                if loaded is None:
+                    return None
+                row, content = loaded
+                version = {
+                    "version_number": row["version_number"],
+                    "content": content,
+                    "file_blob": row["file_blob"],
+                    "created_at": row["created_at"],
+                }
+                if row["encoding"] == "delta" or version["file_blob"] is None:
+                    version["file_blob"] = json.dumps(content).encode("utf-8")
                 return version
-            return None
-        finally:
-            cursor.close()
+            finally:
+                cursor.close()
 
     def get_all_projects_with_versions(self) -> List[Dict]:
         """
@@ -340,24 +662,61 @@ class HelperFunct:
                 - uploaded_at: When project was first created
                 - updated_at: When project was last updated
         """
-        cursor = self.conn.cursor()
-        try:
-            cursor.execute("""
-                SELECT 
-                    pd.Pname as project_name,
-                    pd.current_version,
-                    pd.uploaded_at,
-                    pd.updated_at,
-                    COUNT(pv.id) as total_versions
-                FROM project_data pd
-                LEFT JOIN project_versions pv ON pd.Pname = pv.project_name AND pv.project_uploaded_at = pd.uploaded_at
-                GROUP BY pd.Pname, pd.current_version, pd.uploaded_at, pd.updated_at
-                ORDER BY pd.updated_at DESC
-            """)
+        with self._reading() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("""
+                    SELECT 
+                        pd.Pname as project_name,
+                        pd.current_version,
+                        pd.uploaded_at,
+                        pd.updated_at,
+                        COALESCE(ps.version_count, 0) as total_versions
+                    FROM project_data pd
+                    LEFT JOIN project_summary ps ON ps.Pname = pd.Pname
+                    ORDER BY pd.updated_at DESC
+                """)
             
-            return [dict(row) for row in cursor.fetchall()]
-        finally:
-            cursor.close()
+                return [dict(row) for row in cursor.fetchall()]
+            finally:
+                cursor.close()
+
+    def list_project_summaries(self) -> List[Dict]:
+        """
+        List every project from the project_summary table, without reading or
+        parsing the stored analysis JSON.
+
+        Returns:
+            list: A list of dictionaries, most recently updated first, containing:
+                - project_name: The project name
+                - project_type: Project type from the latest analysis (or None)
+                - languages: Languages from the latest analysis
+                - skills: Skills from the latest analysis
+                - version_count: Number of saved versions
+                - updated_at: When the summary was last refreshed
+        """
+        with self._reading() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("""
+                    SELECT Pname, project_type, languages, skills, version_count, updated_at
+                    FROM project_summary
+                    ORDER BY updated_at DESC, Pname
+                """)
+                return [
+                    {
+                        "project_name": row[0],
+                        "project_type": row[1],
+                        "languages": json.loads(row[2]),
+                        "skills": json.loads(row[3]),
+                        "version_count": row[4],
+                        "updated_at": row[5],
+                    }
+                    for row in cursor.fetchall()
+                ]
+            finally:
+                cursor.close()
+
     def project_exists(self, project_name: str) -> bool:
         """
         Check if a project exists in the database.
@@ -368,12 +727,13 @@ class HelperFunct:
         Returns:
             bool: True if the project exists, False otherwise.
         """
-        cursor = self.conn.cursor()
-        try:
-            cursor.execute("SELECT 1 FROM project_data WHERE Pname = ?", (project_name,))
-            return cursor.fetchone() is not None
-        finally:
-            cursor.close()
+        with self._reading() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("SELECT 1 FROM project_data WHERE Pname = ?", (project_name,))
+                return cursor.fetchone() is not None
+            finally:
+                cursor.close()
         
     def list_all_projects(self) -> List[str]:
         """
@@ -382,12 +742,13 @@ class HelperFunct:
         Returns:
             list: A list of all project names.
         """
-        cursor = self.conn.cursor()
-        try:
-            cursor.execute("SELECT Pname FROM project_data ORDER BY updated_at DESC")
-            return [row[0] for row in cursor.fetchall()]
-        finally:
-            cursor.close()
+        with self._reading() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("SELECT Pname FROM project_data ORDER BY updated_at DESC")
+                return [row[0] for row in cursor.fetchall()]
+            finally:
+                cursor.close()
 
     def delete_old_versions(self, project_name: str, keep_last_n: int = 5) -> int:
         """
@@ -433,8 +794,13 @@ class HelperFunct:
                     AND project_uploaded_at = ?
                     AND version_number NOT IN ({placeholders})
                 """, (project_name, uploaded_at, *keep_versions))
+                deleted = cursor.rowcount
+                cursor.execute(
+                    "UPDATE project_summary SET version_count = ? WHERE Pname = ?",
+                    (len(keep_versions), project_name),
+                )
 
-                self.conn.commit()
-                return cursor.rowcount
+                self._commit()
+                return deleted
             finally:
                 cursor.close()
\ No newline at end of file
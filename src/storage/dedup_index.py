@@ -5,7 +5,8 @@ can avoid storing duplicates. A duplicate is the same hash with a different
 path; we keep the first-seen path as canonical.
 
 The index lives alongside saved analyses (default: User_config_files/project_insights)
-as `dedup_index.json`.
+as the SQLite database `dedup_index.db`. Older installs kept it in
+`dedup_index.json`; that file is migrated into the database on first use.
 """
 
 from __future__ import annotations
@@ -13,15 +14,32 @@ from __future__ import annotations
 import logging
 import hashlib
 import json
+import sqlite3
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Tuple
-from filelock import FileLock, Timeout
 
+from src.core.content_hashes import PARTIAL_HASH_BYTES, ContentHashes, hash_file, hash_stream
 
-CHUNK_SIZE = 1024 * 1024  # 1 MB
-LOCK_TIMEOUT = 10  # seconds
+LOCK_TIMEOUT = 30  # seconds to wait for another writer's transaction
 FILE_CACHE_KEY = "__file_cache__"
+SQLITE_MAX_VARIABLES = 900
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS hashes (
+    hash TEXT PRIMARY KEY,
+    path TEXT,
+    project TEXT
+);
+CREATE TABLE IF NOT EXISTS file_cache (
+    path TEXT PRIMARY KEY,
+    size INTEGER,
+    mtime_ns INTEGER,
+    ctime_ns INTEGER,
+    partial_hash TEXT,
+    hash TEXT NOT NULL
+);
+"""
 
 
 @dataclass
@@ -43,16 +61,12 @@ def _file_hash(path: Path) -> str:
     Returns:
         str: Hex digest string.
     """
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
-            h.update(chunk)
-    return h.hexdigest()
+    return hash_file(path).sha256
 
 
 def _load_index(index_path: Path) -> Tuple[Dict[str, dict], Dict[str, dict]]:
     """
-    Load the hash index from disk.
+    Load a legacy JSON hash index from disk.
 
     Args:
         index_path (Path): Location of the index file.
@@ -81,24 +95,116 @@ def _load_index(index_path: Path) -> Tuple[Dict[str, dict], Dict[str, dict]]:
     return {}, {}
 
 
-def _save_index(index_path: Path, index: Dict[str, dict], file_cache: Dict[str, dict]) -> None:
+class DedupIndexStore:
     """
-    Persist the hash index to disk.
+    SQLite-backed dedup index.
 
-    Args:
-        index_path (Path): Destination path.
-        index (dict): Hash map to store.
-        file_cache (dict): Path metadata cache used to skip unnecessary re-hashing.
+    Two tables replace the JSON document: `hashes` maps a content hash to the
+    canonical (first-seen) path and project, `file_cache` maps a resolved path
+    to the stat fingerprint and hashes last computed for it. Both are keyed by
+    primary key, so lookups and upserts touch only the rows involved.
+
+    The first time a store is opened next to a legacy `dedup_index.json`, that
+    file is imported and renamed to `dedup_index.json.migrated`.
     """
-    index_path.parent.mkdir(parents=True, exist_ok=True)
-    payload = dict(index)
-    payload[FILE_CACHE_KEY] = file_cache
-    index_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+
+    def __init__(self, db_path: str | Path, legacy_json: str | Path | None = None):
+        """
+        Args:
+            db_path (str | Path): SQLite file (created on first use).
+            legacy_json (str | Path | None): JSON index to import once, if present.
+        """
+        self.db_path = Path(db_path)
+        self.legacy_json = Path(legacy_json) if legacy_json is not None else None
+
+    def connect(self) -> sqlite3.Connection:
+        """
+        Open a connection in autocommit mode, creating the schema and migrating
+        the legacy JSON index if needed.
+
+        Raises:
+            sqlite3.Error: If the database is locked for longer than LOCK_TIMEOUT or unusable.
+        """
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=LOCK_TIMEOUT, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            if self.legacy_json is not None and self.legacy_json.exists():
+                self._migrate(conn)
+        except BaseException:
+            conn.close()
+            raise
+        return conn
+
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        """Import the legacy JSON index in one transaction, then set the file aside."""
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Another process may have migrated while we waited for the lock.
+            if not self.legacy_json.exists():
+                conn.execute("ROLLBACK")
+                return
+            index, file_cache = _load_index(self.legacy_json)
+            conn.executemany(
+                "INSERT OR IGNORE INTO hashes (hash, path, project) VALUES (?, ?, ?)",
+                [(digest, rec.get("path"), rec.get("project")) for digest, rec in index.items()],
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO file_cache (path, size, mtime_ns, ctime_ns, partial_hash, hash) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (key, rec.get("size"), rec.get("mtime_ns"), rec.get("ctime_ns"),
+                     rec.get("partial_hash"), rec.get("hash"))
+                    for key, rec in file_cache.items()
+                    if isinstance(rec, dict) and isinstance(rec.get("hash"), str)
+                ],
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        self.legacy_json.replace(self.legacy_json.with_name(self.legacy_json.name + ".migrated"))
+        logging.info(
+            "Migrated dedup index %s to %s (%d hashes, %d cached paths)",
+            self.legacy_json, self.db_path, len(index), len(file_cache),
+        )
+
+    @staticmethod
+    def load_file_cache(conn: sqlite3.Connection, keys: List[str]) -> Dict[str, dict]:
+        """
+        Fetch cached fingerprints for the given path keys.
+
+        Args:
+            conn (sqlite3.Connection): Open store connection.
+            keys (List[str]): Resolved path keys (see _path_cache_key).
+
+        Returns:
+            Dict[str, dict]: Cache entry per key found, in the legacy JSON entry shape.
+        """
+        found: Dict[str, dict] = {}
+        for start in range(0, len(keys), SQLITE_MAX_VARIABLES):
+            batch = keys[start:start + SQLITE_MAX_VARIABLES]
+            rows = conn.execute(
+                f"SELECT path, size, mtime_ns, ctime_ns, partial_hash, hash FROM file_cache "
+                f"WHERE path IN ({','.join('?' * len(batch))})",
+                batch,
+            )
+            for key, size, mtime_ns, ctime_ns, partial_hash, digest in rows:
+                found[key] = {
+                    "size": size,
+                    "mtime_ns": mtime_ns,
+                    "ctime_ns": ctime_ns,
+                    "partial_hash": partial_hash,
+                    "hash": digest,
+                }
+        return found
+
 
 def _partial_hash(path: Path) -> str:
     h = hashlib.sha256()
     with path.open("rb") as f:
-        h.update(f.read(4096))
+        h.update(f.read(PARTIAL_HASH_BYTES))
     return h.hexdigest()
 
 def _path_cache_key(path: Path) -> str:
@@ -112,15 +218,24 @@ def _stat_fingerprint(path: Path) -> Tuple[int, int, int]:
     return stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns
 
 
-def _digest_for_path(path: Path, file_cache: Dict[str, dict]) -> str:
+def _digest_for_path(
+    path: Path,
+    file_cache: Dict[str, dict],
+    fingerprint: Tuple[int, int, int] | None = None,
+    hashes: ContentHashes | None = None,
+) -> str:
     """
     Return content digest for a file, reusing cached hash when metadata is unchanged.
 
     The cache uses file size + nanosecond mtime/ctime as a cheap pre-check.
+    A fingerprint already captured by a ProjectInventory can be passed to skip the stat.
+    A digest an earlier stage already put in `hashes` is used as is; otherwise
+    the full and partial hashes are computed in one read.
     """
     cache_key = _path_cache_key(path)
-    size, mtime_ns, ctime_ns = _stat_fingerprint(path)
+    size, mtime_ns, ctime_ns = fingerprint or _stat_fingerprint(path)
     cached = file_cache.get(cache_key)
+    known = hashes.get(path) if hashes is not None else None
 
     if (
         isinstance(cached, dict)
@@ -128,91 +243,198 @@ def _digest_for_path(path: Path, file_cache: Dict[str, dict]) -> str:
         and cached.get("mtime_ns") == mtime_ns
         and cached.get("ctime_ns") == ctime_ns
         and isinstance(cached.get("hash"), str)
-        and cached.get("partial_hash") == _partial_hash(path)
+        and cached.get("partial_hash") == (known.partial if known else _partial_hash(path))
+        and (known is None or cached["hash"] == known.sha256)
     ):
         return cached["hash"]
 
-    digest = _file_hash(path)
+    digest = known or (hashes.digest(path) if hashes is not None else hash_file(path))
     file_cache[cache_key] = {
         "size": size,
         "mtime_ns": mtime_ns,
         "ctime_ns": ctime_ns,
-        "partial_hash": _partial_hash(path),
-        "hash": digest,
+        "partial_hash": digest.partial,
+        "hash": digest.sha256,
     }
-    return digest
+    return digest.sha256
+
 
+def _iter_files(root: Path, inventory=None):
+    """
+    Yield (path, stat fingerprint or None, entry or None) for every file under root.
 
-def deduplicate_project(root: Path, index_path: Path, remove_duplicates: bool = False) -> DedupResult:
+    The entry is only set for inventory files that are not on disk (members of
+    a partially extracted archive); their content is read through the inventory.
+    """
+    if inventory is None:
+        for path in root.rglob("*"):
+            if path.is_file():
+                yield path, None, None
+        return
+
+    for entry in inventory.files():
+        if not inventory.on_disk(entry):
+            yield root / entry.rel_path, None, entry
+            continue
+        fingerprint = None
+        if entry.mtime_ns is not None and entry.ctime_ns is not None:
+            fingerprint = (entry.size, entry.mtime_ns, entry.ctime_ns)
+        yield root / entry.rel_path, fingerprint, None
+
+
+def _index_paths(index_path: Path) -> Tuple[Path, Path]:
+    """Return the SQLite store path and the legacy JSON path for an index location."""
+    return index_path.with_suffix(".db"), index_path.with_suffix(".json")
+
+
+def deduplicate_project(
+    root: Path,
+    index_path: Path,
+    remove_duplicates: bool = False,
+    inventory=None,
+) -> DedupResult:
     """Scan all files under root, update index, and report duplicates.
 
+    Files are hashed first, on the inventory's shared hashing pool and reading
+    only the cache rows for this project's paths; the index is then updated in
+    one short write transaction.
+
     Args:
         root: Project root to scan.
-        index_path: Location of the persistent hash index.
+        index_path: Location of the persistent hash index. The SQLite store lives
+            at this path with a `.db` suffix; a legacy `.json` index at the same
+            stem is migrated into it on first use.
         remove_duplicates: When True, delete duplicate files after recording them.
+        inventory: Optional ProjectInventory of root; its file list, stat data
+            and already computed digests are reused instead of walking and
+            hashing the tree again. Files it reports as not on disk are hashed
+            from the inventory's archive.
     """
-    lock_path = str(index_path) + ".lock"
-    lock = FileLock(lock_path, timeout=LOCK_TIMEOUT)
+    db_path, legacy_json = _index_paths(Path(index_path))
+    try:
+        conn = DedupIndexStore(db_path, legacy_json).connect()
+    except sqlite3.Error as e:
+        return _skipped(db_path, root, e)
 
     try:
-        with lock:
-            index, file_cache = _load_index(index_path)
+        files = list(_iter_files(root, inventory))
+        file_cache = DedupIndexStore.load_file_cache(
+            conn, [_path_cache_key(path) for path, _, archived in files if archived is None]
+        )
+
+        hashes = inventory.hashes if inventory is not None else ContentHashes()
+
+        def digest_file(item) -> Tuple[str | None, dict | None]:
+            path, fingerprint, archived = item
+            try:
+                if archived is not None:
+                    known = hashes.get(path)
+                    if known is None:
+                        with inventory.open(archived) as f:
+                            known = hash_stream(f)
+                        hashes.put(path, known)
+                    return known.sha256, None
+                cache_key = _path_cache_key(path)
+                cached = file_cache.get(cache_key)
+                digest = _digest_for_path(path, file_cache, fingerprint, hashes)
+                updated = file_cache.get(cache_key)
+                return digest, (updated if updated is not cached else None)
+            except Exception:
+                # Skip unreadable files but continue processing others
+                return None, None
+
+        digests: List[Tuple[Path, str]] = []
+        dirty: Dict[str, dict] = {}
+        for (path, _, _), (digest, updated) in zip(files, hashes.map(digest_file, files)):
+            if digest is None:
+                continue
+            if updated is not None:
+                dirty[_path_cache_key(path)] = updated
+            digests.append((path, digest))
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
             duplicates: List[dict] = []
             unique_files = 0
             removed = 0
 
-            for path in root.rglob("*"):
-                if not path.is_file():
-                    continue
-                try:
-                    digest = _digest_for_path(path, file_cache)
-                except Exception:
-                    # Skip unreadable files but continue processing others
-                    continue
-
-                record = index.get(digest)
+            for path, digest in digests:
+                record = conn.execute(
+                    "SELECT path, project FROM hashes WHERE hash = ?", (digest,)
+                ).fetchone()
                 if record:
+                    original, project = record
                     # Skip if duplicate is from the same project (re-analysis)
-                    if record.get("project") == root.name:
+                    if project == root.name:
                         # Update the index entry with current path and count as unique
-                        index[digest] = {"path": str(path), "project": root.name}
+                        conn.execute("UPDATE hashes SET path = ? WHERE hash = ?", (str(path), digest))
                         unique_files += 1
                         continue
 
                     dup_entry = {
                         "path": str(path),
-                        "original": record.get("path"),
-                        "project": record.get("project"),
+                        "original": original,
+                        "project": project,
                         "removed": False,
                     }
                     if remove_duplicates:
                         try:
-                            path.unlink(missing_ok=True)
-                            file_cache.pop(_path_cache_key(path), None)
+                            path.unlink()
                             dup_entry["removed"] = True
                             removed += 1
+                        except FileNotFoundError:
+                            # Not on disk (e.g. a member left out of a sparse
+                            # extraction): nothing was removed
+                            pass
                         except Exception:
                             # If delete fails, keep entry but mark as not removed
                             dup_entry["removed"] = False
+                        if not path.exists():
+                            cache_key = _path_cache_key(path)
+                            dirty.pop(cache_key, None)
+                            conn.execute("DELETE FROM file_cache WHERE path = ?", (cache_key,))
                     duplicates.append(dup_entry)
                 else:
-                    index[digest] = {"path": str(path), "project": root.name}
+                    conn.execute(
+                        "INSERT INTO hashes (hash, path, project) VALUES (?, ?, ?)",
+                        (digest, str(path), root.name),
+                    )
                     unique_files += 1
 
-            _save_index(index_path, index, file_cache)
-
-            return DedupResult(
-                unique_files=unique_files,
-                duplicate_files=len(duplicates),
-                duplicates=duplicates,
-                index_size=len(index),
-                removed=removed,
+            conn.executemany(
+                "INSERT OR REPLACE INTO file_cache (path, size, mtime_ns, ctime_ns, partial_hash, hash) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (key, rec["size"], rec["mtime_ns"], rec["ctime_ns"], rec["partial_hash"], rec["hash"])
+                    for key, rec in dirty.items()
+                ],
             )
-    except Timeout:
-        logging.warning(
-            "Could not acquire dedup index lock at %s within %ss; skipping deduplication for %s",
-            lock_path,
-            LOCK_TIMEOUT,
-            root,
+            (index_size,) = conn.execute("SELECT COUNT(*) FROM hashes").fetchone()
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+        return DedupResult(
+            unique_files=unique_files,
+            duplicate_files=len(duplicates),
+            duplicates=duplicates,
+            index_size=index_size,
+            removed=removed,
         )
-        return DedupResult(unique_files=0, duplicate_files=0, duplicates=[], index_size=0, removed=0)
+    except sqlite3.Error as e:
+        return _skipped(db_path, root, e)
+    finally:
+        conn.close()
+
+
+def _skipped(db_path: Path, root: Path, error: Exception) -> DedupResult:
+    """Log why deduplication was skipped and return an empty result."""
+    logging.warning(
+        "Could not update dedup index at %s within %ss (%s); skipping deduplication for %s",
+        db_path,
+        LOCK_TIMEOUT,
+        error,
+        root,
+    )
+    return DedupResult(unique_files=0, duplicate_files=0, duplicates=[], index_size=0, removed=0)
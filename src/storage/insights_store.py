@@ -0,0 +1,540 @@
+"""Append-only log of project insights with a side index.
+
+`project_insights.json` used to be a single JSON array that was read, extended
+and rewritten in full for every recorded analysis. `InsightStore` keeps the
+same file as a JSON Lines log instead:
+
+- every recorded insight is appended as one line;
+- an update (e.g. a new thumbnail) appends the full new version of the entry,
+  which supersedes the earlier line with the same id;
+- a removal appends a tombstone line.
+
+A side index (`<log>.idx`, also JSON Lines) records, for every log line, the
+entry id, project name, `analyzed_at` and the line's byte offset and length.
+Writes append one line to each file, lookups by id or project read only the
+lines they need, and full listings skip superseded lines without parsing them.
+If the index does not cover the log exactly (crash between the two appends,
+log replaced externally) it is rebuilt from the log.
+
+Each entry's `hierarchy` (the full file tree of the snapshot, by far its
+largest part) is not stored in the log line. It is written once to
+`<log>.blobs/<sha256>.json`, keyed by the hash of its canonical JSON so
+snapshots with identical trees share one blob, and the line keeps only the
+`hierarchy_ref`. Readers that need the tree load it with `hierarchy()`.
+
+A legacy JSON array found at the log path is converted in place on first use;
+a file that is neither is set aside as `<name>.corrupt-<timestamp>`. Once
+superseded and deleted lines outnumber live entries the log is compacted and
+blobs no live entry refers to are removed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+JsonEntry = Dict[str, Any]
+
+LOG_HEADER = {"__insights_log__": 1}
+INDEX_SUFFIX = ".idx"
+BLOBS_SUFFIX = ".blobs"
+COMPACT_MIN_GARBAGE = 64
+
+_HEADER_LINE = (json.dumps(LOG_HEADER) + "\n").encode("utf-8")
+# One process-wide lock; appends to the log and index must stay in step.
+_lock = threading.RLock()
+# Bumped on every write so readers can tell cached results are stale.
+_generation = 0
+
+
+@dataclass(frozen=True)
+class IndexRecord:
+    """
+    Index entry for one log line.
+
+    Attributes:
+        id (str): Insight id the line belongs to.
+        project_name (str): Project name of the entry ("" for tombstones).
+        analyzed_at (str): ISO timestamp of the entry ("" for tombstones).
+        offset (int): Byte offset of the line in the log.
+        length (int): Byte length of the line, including the newline.
+        deleted (bool): True for tombstone lines.
+    """
+
+    id: str
+    project_name: str
+    analyzed_at: str
+    offset: int
+    length: int
+    deleted: bool = False
+
+    def to_json(self) -> str:
+        """Return the index line for this record (without newline)."""
+        return json.dumps({
+            "id": self.id,
+            "project_name": self.project_name,
+            "analyzed_at": self.analyzed_at,
+            "offset": self.offset,
+            "length": self.length,
+            "deleted": self.deleted,
+        })
+
+
+def _stash_corrupted_file(path: Path) -> None:
+    """Rename an unreadable log so a clean one can be created safely."""
+    timestamp = datetime.now(tz=timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    backup = path.with_name(f"{path.name}.corrupt-{timestamp}")
+    try:
+        path.replace(backup)
+    except Exception:
+        pass
+
+
+def _bump_generation() -> None:
+    """Mark every cached read of any log as stale (callers hold _lock)."""
+    global _generation
+    _generation += 1
+
+
+def _record_for(entry: JsonEntry, offset: int, length: int, deleted: bool = False) -> IndexRecord:
+    """Build the index record of a log line."""
+    return IndexRecord(
+        id=str(entry.get("id", "")),
+        project_name="" if deleted else str(entry.get("project_name", "unknown")),
+        analyzed_at="" if deleted else str(entry.get("analyzed_at", "")),
+        offset=offset,
+        length=length,
+        deleted=deleted,
+    )
+
+
+def _externalize(entry: JsonEntry, blobs: "BlobStore") -> JsonEntry:
+    """Return the entry with an inline hierarchy moved to the blob store."""
+    if "hierarchy" not in entry:
+        return entry
+    out = {k: v for k, v in entry.items() if k != "hierarchy"}
+    if entry["hierarchy"]:
+        out["hierarchy_ref"] = blobs.put(entry["hierarchy"])
+    return out
+
+
+def _live(records: Iterable[IndexRecord]) -> Dict[str, IndexRecord]:
+    """Return the latest record per id that is not deleted, in first-recorded order."""
+    live: Dict[str, IndexRecord] = {}
+    for record in records:
+        if record.deleted:
+            live.pop(record.id, None)
+        else:
+            live[record.id] = record
+    return live
+
+
+class BlobStore:
+    """
+    Content-addressed JSON values, one file per SHA-256 of the canonical JSON.
+
+    Attributes:
+        root (Path): Directory holding `<sha256>.json` files.
+    """
+
+    def __init__(self, root: str | Path):
+        """
+        Args:
+            root (str | Path): Blob directory; created on first write.
+        """
+        self.root = Path(root)
+
+    def put(self, value: Any) -> str:
+        """
+        Store a JSON-serializable value unless an identical one is already stored.
+
+        Args:
+            value (Any): Value to store.
+
+        Returns:
+            str: The value's reference (hex SHA-256).
+        """
+        data = json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        ref = hashlib.sha256(data).hexdigest()
+        target = self._path(ref)
+        if not target.exists():
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_name(f"{target.name}.{uuid.uuid4().hex}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, target)
+        return ref
+
+    def get(self, ref: str) -> Any:
+        """
+        Load a stored value.
+
+        Args:
+            ref (str): Reference returned by put().
+
+        Returns:
+            Any: The value, or None if it is missing or unreadable.
+        """
+        if not ref or not str(ref).isalnum():
+            return None
+        try:
+            return json.loads(self._path(ref).read_bytes())
+        except (OSError, ValueError):
+            logging.warning("Could not read blob %s from %s", ref, self.root)
+            return None
+
+    def retain(self, refs: Iterable[str]) -> int:
+        """
+        Delete every blob not in refs.
+
+        Args:
+            refs (Iterable[str]): References still in use.
+
+        Returns:
+            int: Number of blobs removed.
+        """
+        keep = {f"{ref}.json" for ref in refs}
+        removed = 0
+        try:
+            candidates = list(self.root.iterdir())
+        except OSError:
+            return 0
+        for blob in candidates:
+            if blob.name in keep or not blob.name.endswith(".json"):
+                continue
+            try:
+                blob.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def _path(self, ref: str) -> Path:
+        return self.root / f"{ref}.json"
+
+
+class InsightStore:
+    """
+    Project insight log at `path` with its side index and hierarchy blobs.
+
+    Attributes:
+        path (Path): The JSON Lines log.
+        index_path (Path): The side index next to it.
+        blobs (BlobStore): Hierarchy blobs next to it.
+    """
+
+    def __init__(self, path: str | Path):
+        """
+        Args:
+            path (str | Path): Log location, e.g. `User_config_files/project_insights.json`.
+        """
+        self.path = Path(path)
+        self.index_path = self.path.with_name(self.path.name + INDEX_SUFFIX)
+        self.blobs = BlobStore(self.path.with_name(self.path.name + BLOBS_SUFFIX))
+
+    # ------------------------------------------------------------------ reads
+
+    def records(self) -> List[IndexRecord]:
+        """
+        Return the index record of every live entry, in first-recorded order.
+
+        Returns:
+            List[IndexRecord]: Latest record per live id.
+        """
+        with _lock:
+            return list(self._live_index().values())
+
+    def entries(self, ids: Optional[Iterable[str]] = None) -> List[JsonEntry]:
+        """
+        Return live entries, in first-recorded order.
+
+        Args:
+            ids (Optional[Iterable[str]]): Only return these ids; None returns all.
+
+        Returns:
+            List[JsonEntry]: Parsed entries.
+        """
+        with _lock:
+            live = self._live_index()
+            if ids is not None:
+                wanted = set(ids)
+                live = {k: v for k, v in live.items() if k in wanted}
+            if not live:
+                return []
+            return self._read_lines(list(live.values()))
+
+    def get(self, insight_id: str) -> Optional[JsonEntry]:
+        """Return the live entry with this id, or None."""
+        found = self.entries([insight_id])
+        return found[0] if found else None
+
+    def version(self) -> Optional[tuple]:
+        """
+        Return a token that changes whenever the log changes.
+
+        The token combines a write counter bumped by every store in this
+        process with the log's mtime and size, which catch writes made by
+        other processes or by replacing the file.
+
+        Returns:
+            Optional[tuple]: The token, or None if there is no log.
+        """
+        with _lock:
+            try:
+                stat = self.path.stat()
+            except OSError:
+                return None
+            return (_generation, stat.st_mtime_ns, stat.st_size)
+
+    def ids_for_project(self, project_name: str) -> List[str]:
+        """Return the ids of live entries recorded for a project name."""
+        return [r.id for r in self.records() if r.project_name == project_name]
+
+    def hierarchy(self, entry: JsonEntry) -> JsonEntry:
+        """
+        Return an entry's file hierarchy, loading it from the blob store if needed.
+
+        Args:
+            entry (JsonEntry): Entry as returned by entries() or get().
+
+        Returns:
+            JsonEntry: The hierarchy, or {} if the entry has none (or its blob is gone).
+        """
+        if "hierarchy" in entry:
+            return entry["hierarchy"] or {}
+        ref = entry.get("hierarchy_ref")
+        if not ref:
+            return {}
+        loaded = self.blobs.get(ref)
+        return loaded if isinstance(loaded, dict) else {}
+
+    # ----------------------------------------------------------------- writes
+
+    def append(self, entry: JsonEntry) -> JsonEntry:
+        """
+        Record a new entry.
+
+        Args:
+            entry (JsonEntry): JSON-serializable insight dict with a new "id".
+
+        Returns:
+            JsonEntry: The entry as stored, with "hierarchy" replaced by "hierarchy_ref".
+        """
+        with _lock:
+            if not self._prepare():
+                self._rewrite([])
+            return self._append_lines([(entry, False)])[0]
+
+    def replace(self, entry: JsonEntry) -> bool:
+        """
+        Record a new version of a live entry, superseding the old one.
+
+        Args:
+            entry (JsonEntry): Updated entry; its "id" selects the entry to replace.
+
+        Returns:
+            bool: False if no live entry has that id (nothing is written).
+        """
+        with _lock:
+            if entry.get("id") not in self._live_index():
+                return False
+            self._append_lines([(entry, False)])
+            self._maybe_compact()
+            return True
+
+    def delete(self, ids: Iterable[str]) -> int:
+        """
+        Remove live entries.
+
+        Args:
+            ids (Iterable[str]): Ids to remove; unknown ids are ignored.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        with _lock:
+            live = self._live_index()
+            doomed = [i for i in dict.fromkeys(ids) if i in live]
+            if doomed:
+                self._append_lines([({"id": i}, True) for i in doomed])
+                self._maybe_compact()
+            return len(doomed)
+
+    # -------------------------------------------------------------- internals
+
+    def _prepare(self) -> bool:
+        """
+        Make sure the file at path, if any, is a log: convert a legacy JSON
+        array in place and stash anything else.
+
+        Returns:
+            bool: False if there is no log to read.
+        """
+        if not self.path.exists():
+            return False
+        with self.path.open("rb") as f:
+            head = f.read(len(_HEADER_LINE))
+        if head == _HEADER_LINE:
+            return True
+
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            data = None
+        except OSError:
+            return False
+        if isinstance(data, list):
+            entries = [e for e in data if isinstance(e, dict)]
+            for entry in entries:
+                # Ids key the index; legacy entries without one get one now.
+                entry.setdefault("id", str(uuid.uuid4()))
+            self._rewrite(entries)
+        else:
+            _stash_corrupted_file(self.path)
+            self._rewrite([])
+        return True
+
+    def _live_index(self) -> Dict[str, IndexRecord]:
+        """Return the latest record per live id, keeping first-recorded order."""
+        if not self._prepare():
+            return {}
+        return _live(self._load_index())
+
+    def _load_index(self) -> List[IndexRecord]:
+        """Load the index, rebuilding it if it does not cover the log exactly."""
+        try:
+            log_size = self.path.stat().st_size
+        except OSError:
+            return []
+
+        records: Optional[List[IndexRecord]] = []
+        try:
+            with self.index_path.open("r", encoding="utf-8") as f:
+                for line in f:
+                    records.append(IndexRecord(**json.loads(line)))
+        except (OSError, ValueError, TypeError):
+            records = None
+
+        if records is not None:
+            end = records[-1].offset + records[-1].length if records else len(_HEADER_LINE)
+            if end == log_size:
+                return records
+        return self._rebuild_index()
+
+    def _rebuild_index(self) -> List[IndexRecord]:
+        """Scan the log and rewrite the index from it, dropping unreadable lines."""
+        records: List[IndexRecord] = []
+        entries: List[tuple] = []
+        unreadable = 0
+        offset = 0
+        with self.path.open("rb") as f:
+            for raw in f:
+                if offset > 0:
+                    try:
+                        entry = json.loads(raw)
+                    except ValueError:
+                        entry = None
+                    if isinstance(entry, dict) and raw.endswith(b"\n"):
+                        deleted = bool(entry.get("__deleted__"))
+                        records.append(_record_for(entry, offset, len(raw), deleted))
+                        entries.append((entry, deleted))
+                    else:
+                        unreadable += 1
+                offset += len(raw)
+
+        if unreadable:
+            logging.warning("Dropping %d unreadable line(s) from %s", unreadable, self.path)
+            live: Dict[str, JsonEntry] = {}
+            for entry, deleted in entries:
+                if deleted:
+                    live.pop(entry.get("id"), None)
+                else:
+                    live[entry.get("id")] = entry
+            return self._rewrite(list(live.values()))
+        self._write_index(records)
+        return records
+
+    def _read_lines(self, records: List[IndexRecord]) -> List[JsonEntry]:
+        """Parse the log lines the given records point to."""
+        out: List[JsonEntry] = []
+        with self.path.open("rb") as f:
+            for record in records:
+                f.seek(record.offset)
+                raw = f.read(record.length)
+                try:
+                    entry = json.loads(raw.split(b"\n", 1)[0])
+                except ValueError:
+                    logging.warning("Skipping unreadable line at byte %d of %s", record.offset, self.path)
+                    continue
+                if isinstance(entry, dict):
+                    out.append(entry)
+        return out
+
+    def _append_lines(self, items: List[tuple]) -> List[JsonEntry]:
+        """
+        Append (entry, deleted) lines to the log and their records to the index.
+
+        Returns:
+            List[JsonEntry]: The payloads written, in order.
+        """
+        payloads = [
+            {"id": entry["id"], "__deleted__": True} if deleted else _externalize(entry, self.blobs)
+            for entry, deleted in items
+        ]
+        records: List[IndexRecord] = []
+        with self.path.open("ab") as f:
+            offset = f.tell()
+            for (entry, deleted), payload in zip(items, payloads):
+                line = (json.dumps(payload) + "\n").encode("utf-8")
+                f.write(line)
+                records.append(_record_for(entry, offset, len(line), deleted))
+                offset += len(line)
+        with self.index_path.open("a", encoding="utf-8") as f:
+            for record in records:
+                f.write(record.to_json() + "\n")
+        _bump_generation()
+        return payloads
+
+    def _rewrite(self, entries: List[JsonEntry]) -> List[IndexRecord]:
+        """Atomically replace the log (and index) with the given live entries."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        records: List[IndexRecord] = []
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with tmp.open("wb") as f:
+            f.write(_HEADER_LINE)
+            offset = len(_HEADER_LINE)
+            for entry in entries:
+                entry = _externalize(entry, self.blobs)
+                line = (json.dumps(entry) + "\n").encode("utf-8")
+                f.write(line)
+                records.append(_record_for(entry, offset, len(line)))
+                offset += len(line)
+        os.replace(tmp, self.path)
+        self._write_index(records)
+        _bump_generation()
+        return records
+
+    def _write_index(self, records: List[IndexRecord]) -> None:
+        """Atomically replace the index."""
+        tmp = self.index_path.with_name(self.index_path.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            for record in records:
+                f.write(record.to_json() + "\n")
+        os.replace(tmp, self.index_path)
+
+    def _maybe_compact(self) -> None:
+        """Rewrite the log without superseded and deleted lines once they dominate it."""
+        records = self._load_index()
+        live = _live(records)
+        garbage = len(records) - len(live)
+        if garbage >= COMPACT_MIN_GARBAGE and garbage > len(live):
+            entries = self._read_lines(list(live.values()))
+            self._rewrite(entries)
+            self.blobs.retain(e["hierarchy_ref"] for e in entries if e.get("hierarchy_ref"))
@@ -0,0 +1,139 @@
+"""Structural deltas between JSON documents.
+
+Used to store older project versions as small, compressed differences from
+the next newer version (reverse deltas): the newest version stays whole and
+any older one is rebuilt by applying deltas backwards from it.
+
+A delta is a list of operations, each addressing a value by its path (dict
+keys and list indexes from the document root):
+
+- ["set", path, value]: replace (or add) the value at path;
+- ["del", path]: remove the dict key at path;
+- ["trunc", path, n]: cut the list at path to its first n items;
+- ["ext", path, items]: append items to the list at path.
+
+Lists are compared item by item, so a list that only grew (such as the
+`snapshots` history in exported analyses) costs one "trunc" operation.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import zlib
+from typing import Any, List
+
+Path = List[Any]
+Op = List[Any]
+
+
+def diff(source: Any, target: Any) -> List[Op]:
+    """
+    Compute the operations that turn source into target.
+
+    Args:
+        source (Any): JSON-compatible document the delta is applied to.
+        target (Any): JSON-compatible document the delta produces.
+
+    Returns:
+        List[Op]: Operations for apply().
+    """
+    ops: List[Op] = []
+    _diff(source, target, [], ops)
+    return ops
+
+
+def _diff(source: Any, target: Any, path: Path, ops: List[Op]) -> None:
+    if isinstance(source, dict) and isinstance(target, dict):
+        for key in source:
+            if key not in target:
+                ops.append(["del", path + [key]])
+        for key, value in target.items():
+            if key in source:
+                _diff(source[key], value, path + [key], ops)
+            else:
+                ops.append(["set", path + [key], value])
+    elif isinstance(source, list) and isinstance(target, list):
+        for i in range(min(len(source), len(target))):
+            _diff(source[i], target[i], path + [i], ops)
+        if len(target) < len(source):
+            ops.append(["trunc", path, len(target)])
+        elif len(target) > len(source):
+            ops.append(["ext", path, target[len(source):]])
+    elif type(source) is not type(target) or source != target:
+        ops.append(["set", path, target])
+
+
+def apply(document: Any, ops: List[Op]) -> Any:
+    """
+    Apply a delta from diff() to a document.
+
+    Args:
+        document (Any): The source document; it is not modified.
+        ops (List[Op]): Operations from diff(document, target).
+
+    Returns:
+        Any: The target document.
+
+    Raises:
+        ValueError: If an operation does not fit the document.
+    """
+    doc = copy.deepcopy(document)
+    for op in ops:
+        kind, path = op[0], op[1]
+        if not path:
+            if kind != "set":
+                doc = _apply_list_op(doc, kind, op[2])
+            else:
+                doc = copy.deepcopy(op[2])
+            continue
+        try:
+            parent = doc
+            for key in path[:-1]:
+                parent = parent[key]
+            last = path[-1]
+            if kind == "set":
+                if isinstance(parent, list) and last == len(parent):
+                    parent.append(copy.deepcopy(op[2]))
+                else:
+                    parent[last] = copy.deepcopy(op[2])
+            elif kind == "del":
+                del parent[last]
+            else:
+                parent[last] = _apply_list_op(parent[last], kind, op[2])
+        except (KeyError, IndexError, TypeError) as e:
+            raise ValueError(f"Delta operation {kind} does not apply at {path}") from e
+    return doc
+
+
+def _apply_list_op(items: Any, kind: str, arg: Any) -> list:
+    if not isinstance(items, list):
+        raise ValueError(f"Delta operation {kind} needs a list")
+    if kind == "trunc":
+        return items[:arg]
+    if kind == "ext":
+        return items + copy.deepcopy(arg)
+    raise ValueError(f"Unknown delta operation {kind!r}")
+
+
+def encode(base_version: int, ops: List[Op]) -> bytes:
+    """Serialize and compress a delta that applies to base_version."""
+    payload = json.dumps({"base": base_version, "ops": ops}, separators=(",", ":"))
+    return zlib.compress(payload.encode("utf-8"), 9)
+
+
+def decode(blob: bytes) -> tuple[int, List[Op]]:
+    """
+    Decompress a delta from encode().
+
+    Returns:
+        tuple[int, List[Op]]: The base version and the operations.
+
+    Raises:
+        ValueError: If the blob is not an encoded delta.
+    """
+    try:
+        payload = json.loads(zlib.decompress(blob))
+        return int(payload["base"]), payload["ops"]
+    except (zlib.error, ValueError, KeyError, TypeError) as e:
+        raise ValueError("Not an encoded delta") from e
@@ -0,0 +1,120 @@
+"""
+Benchmark the tokenizer-based C analyzer against the earlier regex-based one.
+
+The regex implementation is loaded from git history (the commit before the
+tokenizer replaced it), so the comparison can be rerun on any checkout:
+
+    python test/benchmarks/bench_c_analyzer.py --lines 1000 5000 20000 100000
+
+The regex path grows quadratically; --regex-max-lines (default 20000) skips
+it for larger files.
+"""
+
+import argparse
+import importlib.util
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from src.analyzers.c.c_oop_analyzer import analyze_source  # noqa: E402
+
+ANALYZER_PATH = "src/analyzers/c/c_oop_analyzer.py"
+# Last revision of the analyzer that used per-construct regular expressions
+REGEX_REVISION = "31f12ce"
+
+
+def generate_c_source(lines: int) -> str:
+    """
+    Generate C source of about `lines` lines mixing structs, typedefs, comments and looping functions.
+
+    Args:
+        lines: Number of lines to produce.
+
+    Returns:
+        str: The generated source.
+    """
+    out = ['#include <stdio.h>', '#include <stdlib.h>', '#include "queue.h"']
+    i = 0
+    while len(out) < lines:
+        out += [
+            f"/* block {i}: struct shape_{i} {{ void (*fake)(void); }} */",
+            f"typedef struct Handle{i} *handle{i}_t;",
+            f"typedef struct Shape{i} {{",
+            f"    struct Base{i} base;",
+            "    int values[16];",
+            f"    void (*draw)(struct Shape{i} *self);",
+            f"    int (*area)(const struct Shape{i} *self);",
+            f"}} Shape{i};",
+            f"Shape{i} *shape{i}_create(void) {{",
+            f"    Shape{i} *s = malloc(sizeof(Shape{i}));  // allocate",
+            "    return s;",
+            "}",
+            f"static int shape{i}_sum(const int *xs, int n) {{",
+            "    int total = 0;",
+            "    for (int a = 0; a < n; a++) {",
+            "        for (int b = 0; b < n; b++) {",
+            "            while (total > 100) total -= 3;",
+            "            total += xs[a] * xs[b];",
+            "        }",
+            "    }",
+            '    printf("%d { for (;;) }\\n", total);',
+            "    return total;",
+            "}",
+            "",
+        ]
+        i += 1
+    return "\n".join(out[:lines]) + "\n"
+
+
+def load_regex_analyzer(revision: str):
+    """
+    Import the analyzer module as it was at `revision`.
+
+    Args:
+        revision: Git revision holding the regex-based analyzer.
+
+    Returns:
+        module: The loaded module.
+    """
+    source = subprocess.run(
+        ["git", "show", f"{revision}:{ANALYZER_PATH}"],
+        cwd=ROOT, check=True, capture_output=True, text=True,
+    ).stdout
+    path = Path(tempfile.mkdtemp()) / "c_oop_analyzer_regex.py"
+    path.write_text(source, encoding="utf-8")
+    spec = importlib.util.spec_from_file_location("c_oop_analyzer_regex", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _time(analyze, source: str) -> float:
+    start = time.perf_counter()
+    analyze(source, Path("generated.c"))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, nargs="+", default=[1000, 5000, 20000, 100000])
+    parser.add_argument("--regex-max-lines", type=int, default=20000)
+    parser.add_argument("--revision", default=REGEX_REVISION, help="git revision of the regex analyzer")
+    args = parser.parse_args()
+
+    regex = load_regex_analyzer(args.revision)
+    print(f"{'lines':>8}  {'regex path':>11}  {'tokenizer':>10}")
+    for lines in args.lines:
+        source = generate_c_source(lines)
+        new = _time(analyze_source, source)
+        old = _time(regex.analyze_source, source) if lines <= args.regex_max_lines else None
+        old_text = f"{old:10.2f}s" if old is not None else f"{'(skipped)':>11}"
+        print(f"{lines:>8}  {old_text}  {new:9.2f}s")
+
+
+if __name__ == "__main__":
+    main()
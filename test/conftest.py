@@ -1,4 +1,5 @@
 # conftest.py
+import functools
 import os
 import sys
 from types import SimpleNamespace
@@ -14,17 +15,19 @@ if ROOT not in sys.path:
 @pytest.fixture(autouse=True)
 def isolate_dedup_side_effects(monkeypatch, tmp_path):
     """
-    Stop tests from deleting real project files.
+    Stop tests from deleting real project files or writing real insights.
     - Stub deduplicate_project to a no-op result.
     - Point default_save_dir to a per-test temp directory.
+    - Record project insights to a per-test temp log.
     """
     os.environ.setdefault("SKIP_DB_INIT", "1")
     import src.core.analysis_service as analysis_service
+    from src.reporting import project_insights
 
     monkeypatch.setattr(
         analysis_service,
         "deduplicate_project",
-        lambda root, index_path, remove_duplicates=True: SimpleNamespace(
+        lambda root, index_path, remove_duplicates=True, inventory=None: SimpleNamespace(
             unique_files=0,
             duplicate_files=0,
             duplicates=[],
@@ -42,6 +45,14 @@ def isolate_dedup_side_effects(monkeypatch, tmp_path):
         raising=False,
     )
 
+    safe_insights = tmp_path / "project_insights.json"
+    monkeypatch.setattr(project_insights, "DEFAULT_STORAGE", safe_insights)
+    monkeypatch.setattr(
+        analysis_service,
+        "record_project_insight",
+        functools.partial(project_insights.record_project_insight, storage_path=safe_insights),
+    )
+
 
 def pytest_terminal_summary(terminalreporter, exitstatus, config):
     """
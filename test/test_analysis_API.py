@@ -148,3 +148,77 @@ def test_analyze_with_missing_uploaded_path_returns_404(tmp_path):
 #    response = test_client.get("/analyze")
 #    assert response.status_code == 200
 #    assert response.json() == "Error: Filepath not found"
+
+
+def test_analysis_job_runs_in_background_and_reports_stages(monkeypatch, tmp_path):
+    """
+    POST /analyze/jobs queues the analysis; GET /analyze/jobs/{id} reports stages and the result.
+    """
+    project_dir = tmp_path / "job_project"
+    project_dir.mkdir()
+    runtimeAppContext.currently_uploaded_file = project_dir
+    runtimeAppContext.currently_uploaded_project_name = "job_project"
+
+    def fake_analyze(folder, use_ai_analysis=False, project_name=None, remove_duplicates=True, progress=None):
+        for stage in ("hierarchy", "docs", "contributions", "oop", "dedup", "export"):
+            progress(stage)
+        return {"dedup": {"unique_files": 1}, "snapshots": []}
+
+    monkeypatch.setattr(analysis_api_mod, "analyze_project", fake_analyze)
+
+    response = test_client.post("/analyze/jobs")
+    assert response.status_code == 202
+    job_id = response.json()["job_id"]
+
+    analysis_api_mod.analysis_jobs.get(job_id).future.result(timeout=5)
+    body = test_client.get(f"/analyze/jobs/{job_id}").json()
+    assert body["status"] == "succeeded"
+    assert body["project_name"] == "job_project"
+    assert body["result"]["project_name"] == "job_project"
+    assert body["result"]["dedup"] == {"unique_files": 1}
+    assert body["stages"]["export"] == "done"
+    assert body["stages"]["extract"] == "pending"
+
+
+def test_analysis_job_unknown_id_returns_404():
+    """
+    Polling or cancelling an unknown job returns 404.
+    """
+    assert test_client.get("/analyze/jobs/does-not-exist").status_code == 404
+    assert test_client.delete("/analyze/jobs/does-not-exist").status_code == 404
+
+
+def test_analyze_uses_upload_handle_not_latest_upload(monkeypatch, tmp_path):
+    """
+    GET /analyze?upload_id=... analyzes that upload even after another one was uploaded.
+    """
+    monkeypatch.setattr(analysis_api_mod.upload_registry, "upload_dir", tmp_path)
+    analyzed = []
+
+    def fake_analyze(folder, use_ai_analysis=False, project_name=None, remove_duplicates=True, inventory=None):
+        analyzed.append(project_name)
+        return {"dedup": {}, "snapshots": []}
+
+    monkeypatch.setattr(analysis_api_mod, "analyze_project", fake_analyze)
+
+    upload_ids = []
+    for name in ("first.zip", "second.zip"):
+        archive = tmp_path / name
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("main.py", "print('hi')\n")
+        with archive.open("rb") as fh:
+            upload_ids.append(test_client.post("/projects/upload", files={"upload_file": fh}).json()["upload_id"])
+
+    response = test_client.get("/analyze", params={"upload_id": upload_ids[0]})
+    assert response.status_code == 200
+    assert analyzed == ["first"]
+
+
+def test_analyze_with_unknown_upload_id_returns_404():
+    """
+    Unknown or expired upload handles are rejected with 404.
+    """
+    response = test_client.get("/analyze", params={"upload_id": "0" * 32})
+    assert response.status_code == 404
+    assert "Unknown or expired upload" in response.json()["detail"]
+    assert test_client.post("/analyze/jobs", params={"upload_id": "0" * 32}).status_code == 404
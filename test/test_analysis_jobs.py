@@ -0,0 +1,133 @@
+import threading
+
+import pytest
+
+from src.core.analysis_jobs import (
+    CANCELLED,
+    FAILED,
+    SUCCEEDED,
+    AnalysisJobManager,
+    JobQueueFull,
+)
+
+
+def _wait(job, timeout=5):
+    """
+    Block until a job's future has finished.
+    Args:
+        job (AnalysisJob): Job to wait for.
+        timeout (float): Seconds to wait.
+    Returns:
+        None
+    """
+    try:
+        job.future.result(timeout=timeout)
+    except Exception:
+        pass
+
+
+def test_job_reports_stages_and_result():
+    """
+    A finished job lists every stage it passed through and stores the result.
+    Args:
+        None
+    Returns:
+        None
+    """
+    manager = AnalysisJobManager(max_workers=1)
+
+    def run(progress):
+        for stage in ("hierarchy", "docs", "oop"):
+            progress(stage)
+        return {"dedup": {"unique_files": 3}}
+
+    job = manager.submit(run, project_name="demo")
+    _wait(job)
+    status = manager.get(job.job_id).to_dict()
+
+    assert status["status"] == SUCCEEDED
+    assert status["result"] == {"dedup": {"unique_files": 3}}
+    assert status["stages"]["hierarchy"] == "done"
+    assert status["stages"]["oop"] == "done"
+    assert status["stages"]["export"] == "pending"
+    manager.shutdown()
+
+
+def test_failed_job_records_error():
+    """
+    Exceptions raised by the analysis mark the job failed with the message.
+    Args:
+        None
+    Returns:
+        None
+    """
+    manager = AnalysisJobManager(max_workers=1)
+
+    def run(progress):
+        progress("hierarchy")
+        raise RuntimeError("boom")
+
+    job = manager.submit(run)
+    _wait(job)
+
+    assert job.status == FAILED
+    assert job.error == "boom"
+    manager.shutdown()
+
+
+def test_running_job_stops_at_next_stage_after_cancel():
+    """
+    Cancelling a running job stops it at the next stage boundary.
+    Args:
+        None
+    Returns:
+        None
+    """
+    manager = AnalysisJobManager(max_workers=1)
+    started, release = threading.Event(), threading.Event()
+    reached = []
+
+    def run(progress):
+        progress("hierarchy")
+        started.set()
+        release.wait(5)
+        progress("docs")
+        reached.append("docs")
+        return {}
+
+    job = manager.submit(run)
+    started.wait(5)
+    manager.cancel(job.job_id)
+    release.set()
+    _wait(job)
+
+    assert job.status == CANCELLED
+    assert reached == []
+    manager.shutdown()
+
+
+def test_queue_limit_and_queued_cancellation():
+    """
+    Jobs beyond the queue limit are rejected; queued jobs cancel without running.
+    Args:
+        None
+    Returns:
+        None
+    """
+    manager = AnalysisJobManager(max_workers=1, queue_limit=2)
+    release = threading.Event()
+    ran = []
+
+    blocker = manager.submit(lambda progress: release.wait(5) and {})
+    queued = manager.submit(lambda progress: ran.append("queued") or {})
+    with pytest.raises(JobQueueFull):
+        manager.submit(lambda progress: {})
+
+    manager.cancel(queued.job_id)
+    assert queued.status == CANCELLED
+
+    release.set()
+    _wait(blocker)
+    assert ran == []
+    assert blocker.status == SUCCEEDED
+    manager.shutdown()
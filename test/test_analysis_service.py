@@ -157,7 +157,7 @@ def test_oop_analysis_runs(tmp_path, monkeypatch):
     metrics = {"score": {"oop_score": 0.9}}
     
     class FakeOrchestrator:
-        def __init__(self, root):
+        def __init__(self, root, inventory=None, cache=None):
             pass
         def analyze(self):
             return metrics
@@ -173,7 +173,7 @@ class TestAnalysisService(unittest.TestCase):
     def test_analyze_project_uses_stack_detection_for_oop_languages(self):
         """Ensure OOP analysis uses stack detection + resume languages union."""
         class FakeExtractor:
-            def __init__(self, root):
+            def __init__(self, root, inventory=None):
                 self.root = root
             def file_hierarchy(self):
                 return {"type": "DIR", "children": []}
@@ -187,14 +187,14 @@ class TestAnalysisService(unittest.TestCase):
                 return "Unknown"
 
         class FakeDocAnalyzer:
-            def __init__(self, root):
+            def __init__(self, root, files=None, hashes=None):
                 self.root = root
             def analyze(self):
                 return {"documents": []}
 
         captured = {}
 
-        def fake_oop_analysis(root, languages_found):
+        def fake_oop_analysis(root, languages_found, inventory=None):
             captured["languages_found"] = languages_found
             return {"score": {"oop_score": 0.5}}
 
@@ -207,21 +207,21 @@ class TestAnalysisService(unittest.TestCase):
                 patch.object(
                     mod,
                     "generate_resume_item",
-                    lambda root, project_name=None, doc_analysis=None, contrib_summary_data=None: _fake_resume(project_name=project_name, root=root),
+                    lambda root, project_name=None, doc_analysis=None, contrib_summary_data=None, inventory=None: _fake_resume(project_name=project_name, root=root),
                 ),
-                patch.object(mod, "contribution_summary", lambda root: None),
+                patch.object(mod, "contribution_summary", lambda root, inventory=None: None),
                 patch.object(mod, "load_portfolio_showcase", lambda display_name: None),
                 patch.object(mod, "build_portfolio_showcase", lambda data, yaml: None),
                 patch.object(mod, "export_json", lambda project_name, analysis: {"skipped": False, "snapshots": []}),
                 patch.object(mod, "record_project_insight", lambda analysis, contributors=None, snapshot_label=None: None),
-                patch.object(mod, "deduplicate_project", lambda root, index_path, remove_duplicates=True: SimpleNamespace(
+                patch.object(mod, "deduplicate_project", lambda root, index_path, remove_duplicates=True, inventory=None: SimpleNamespace(
                     unique_files=1,
                     duplicate_files=0,
                     duplicates=[],
                     index_size=1,
                     removed=0,
                 )),
-                patch.object(mod, "detect_project_stack", lambda root: {"languages": ["C++"]}),
+                patch.object(mod, "detect_project_stack", lambda root, inventory=None: {"languages": ["C++"]}),
                 patch.object(mod, "oop_analysis", fake_oop_analysis),
             ):
                 mod.analyze_project(root)
@@ -271,7 +271,7 @@ def test_oop_analysis_raises_on_failure(monkeypatch):
     """OOP is critical: if supported languages exist and analysis fails, it should raise."""
 
     class FailingOrchestrator:
-        def __init__(self, root):
+        def __init__(self, root, inventory=None, cache=None):
             pass
         def analyze(self):
             raise RuntimeError("OOP failed")
@@ -284,7 +284,7 @@ def test_oop_analysis_raises_on_failure(monkeypatch):
 def test_analyze_project_builds_analysis_and_exports(tmp_path, monkeypatch):
     """Check that analysis builds results and triggers export."""
     class FakeExtractor:
-        def __init__(self, root):
+        def __init__(self, root, inventory=None):
             self.root = root
         def file_hierarchy(self):
             return {"type": "DIR", "children": []}
@@ -296,7 +296,7 @@ def test_analyze_project_builds_analysis_and_exports(tmp_path, monkeypatch):
             return "Unknown"
 
     class FakeDocAnalyzer:
-        def __init__(self, root):
+        def __init__(self, root, files=None, hashes=None):
             self.root = root
         def analyze(self):
             return {"documents": []}
@@ -307,12 +307,12 @@ def test_analyze_project_builds_analysis_and_exports(tmp_path, monkeypatch):
     monkeypatch.setattr(
         mod,
         "generate_resume_item",
-        lambda root, project_name=None, doc_analysis=None, contrib_summary_data=None: _fake_resume(project_name=project_name, root=root),
+        lambda root, project_name=None, doc_analysis=None, contrib_summary_data=None, inventory=None: _fake_resume(project_name=project_name, root=root),
     )
     monkeypatch.setattr(
         mod,
         "contribution_summary",
-        lambda root: {"metric": "files", "contributors": {"Alice": {"file_count": 2, "percentage": "100%"}}},
+        lambda root, inventory=None: {"metric": "files", "contributors": {"Alice": {"file_count": 2, "percentage": "100%"}}},
     )
     monkeypatch.setattr(
         mod,
@@ -321,11 +321,11 @@ def test_analyze_project_builds_analysis_and_exports(tmp_path, monkeypatch):
     )
     monkeypatch.setattr(mod, "load_portfolio_showcase", lambda display_name: None)
     monkeypatch.setattr(mod, "build_portfolio_showcase", lambda data, yaml: None)
-    monkeypatch.setattr(mod, "detect_project_stack", lambda root: {"languages": []})
+    monkeypatch.setattr(mod, "detect_project_stack", lambda root, inventory=None: {"languages": []})
     monkeypatch.setattr(
         mod,
         "deduplicate_project",
-        lambda root, index_path, remove_duplicates=True: SimpleNamespace(
+        lambda root, index_path, remove_duplicates=True, inventory=None: SimpleNamespace(
             unique_files=1,
             duplicate_files=0,
             duplicates=[],
@@ -333,7 +333,7 @@ def test_analyze_project_builds_analysis_and_exports(tmp_path, monkeypatch):
             removed=0,
         ),
     )
-    monkeypatch.setattr(mod, "oop_analysis", lambda root, languages_found: {"score": {"oop_score": 0.75}})
+    monkeypatch.setattr(mod, "oop_analysis", lambda root, languages_found, inventory=None: {"score": {"oop_score": 0.75}})
 
     captured = {}
     monkeypatch.setattr(
@@ -353,7 +353,7 @@ def test_analyze_project_backfills_duration_into_evidence(monkeypatch, tmp_path)
     captured = {}
 
     class FakeExtractor:
-        def __init__(self, root): pass
+        def __init__(self, root, inventory=None): pass
         def file_hierarchy(self): return {"type": "DIR", "children": []}
 
     class FakeDurationEstimator:
@@ -361,7 +361,7 @@ def test_analyze_project_backfills_duration_into_evidence(monkeypatch, tmp_path)
         def get_duration_human(self): return "5 months"
 
     class FakeDocAnalyzer:
-        def __init__(self, root): pass
+        def __init__(self, root, files=None, hashes=None): pass
         def analyze(self): return {"documents": []}
 
     def fake_export(project_name, analysis):
@@ -376,15 +376,15 @@ def test_analyze_project_backfills_duration_into_evidence(monkeypatch, tmp_path)
     resume_obj = _fake_resume(project_name="X", root=tmp_path)
     monkeypatch.setattr(mod, "generate_resume_item", lambda *args, **kwargs: resume_obj)
 
-    monkeypatch.setattr(mod, "contribution_summary", lambda root: None)
+    monkeypatch.setattr(mod, "contribution_summary", lambda root, inventory=None: None)
     monkeypatch.setattr(mod, "load_portfolio_showcase", lambda display_name: None)
     monkeypatch.setattr(mod, "build_portfolio_showcase", lambda data, yaml: None)
     monkeypatch.setattr(mod, "record_project_insight", lambda *a, **k: None)
     monkeypatch.setattr(mod, "deduplicate_project", lambda *a, **k: SimpleNamespace(
         unique_files=1, duplicate_files=0, duplicates=[], index_size=1, removed=0
     ))
-    monkeypatch.setattr(mod, "detect_project_stack", lambda root: {"languages": []})
-    monkeypatch.setattr(mod, "oop_analysis", lambda root, langs: None)
+    monkeypatch.setattr(mod, "detect_project_stack", lambda root, inventory=None: {"languages": []})
+    monkeypatch.setattr(mod, "oop_analysis", lambda root, langs, inventory=None: None)
     monkeypatch.setattr(mod, "export_json", fake_export)
 
     mod.analyze_project(tmp_path)
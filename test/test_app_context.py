@@ -14,9 +14,12 @@ import src.core.app_context as mod
 class FakeConnection:
     def __init__(self):
         self.closed = False
+        self.user_version = 0
 
-    def execute(self, *args, **kwargs):
-        pass
+    def execute(self, sql, *args, **kwargs):
+        if sql.startswith("PRAGMA user_version ="):
+            self.user_version = int(sql.rsplit("=", 1)[1])
+        return types.SimpleNamespace(fetchone=lambda: (self.user_version,))
 
     def executescript(self, *args, **kwargs):
         pass
@@ -51,7 +54,9 @@ def test_create_app_context_success(monkeypatch):
     ctx = mod.create_app_context()
 
     assert ctx.conn is fake_conn
-    assert captured["conn"] is fake_conn
+    # The store gets the connection pool whose writer is the context's connection.
+    assert captured["conn"] is ctx.pool
+    assert ctx.pool.writer is fake_conn
     assert ctx.store.__class__ is FakeHelper
     assert ctx.default_save_dir.name == "project_insights"
     assert ctx.default_save_dir.parent.name == "User_config_files"
@@ -101,3 +106,54 @@ def test_app_context_close_swallows_errors(monkeypatch):
     )
     ctx.close()
     assert conn.closed is True
+
+
+def test_schema_is_applied_once_per_version(tmp_path):
+    """Check that database.sql only runs when user_version is behind.
+
+    Args:
+        tmp_path: Pytest temp directory.
+
+    Returns:
+        None: Assertions validate the schema version check.
+    """
+    schema = tmp_path / "schema.sql"
+    schema.write_text("CREATE TABLE IF NOT EXISTS t (x INTEGER);")
+    conn = mod.sqlite3.connect(str(tmp_path / "app.db"))
+    try:
+        mod._apply_schema(conn, schema)
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == mod.SCHEMA_VERSION
+
+        schema.write_text("CREATE TABLE u (x INTEGER);")
+        mod._apply_schema(conn, schema)
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+        assert tables == {"t"}
+    finally:
+        conn.close()
+
+
+def test_lazy_context_opens_database_on_first_use(monkeypatch):
+    """Check that the runtime context only opens the database when a handle is read.
+
+    Args:
+        monkeypatch: Pytest fixture for patching module attributes.
+
+    Returns:
+        None: Assertions validate lazy initialization.
+    """
+    opened = []
+    store = types.SimpleNamespace()
+    monkeypatch.setattr(mod, "_open_database", lambda: opened.append(1) or (None, None, store))
+
+    ctx = mod.LazyAppContext()
+    ctx.external_consent = True
+    assert ctx.default_save_dir.name == "project_insights"
+    assert ctx.external_consent is True
+    assert not ctx.connected and opened == []
+
+    assert ctx.store is store
+    assert ctx.store is store
+    assert ctx.connected and opened == [1]
+
+    ctx.close()
+    assert not ctx.connected
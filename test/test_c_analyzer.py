@@ -146,6 +146,150 @@ class TestCAnalyzer:
         assert complexity["total_functions"] >= 2
         assert complexity["max_loop_depth"] == 3
         assert complexity["functions_with_nested_loops"] >= 1
+
+    def test_comments_strings_and_keyword_prefixes_are_ignored(self):
+        """
+        Verify that code inside comments and string literals is not analyzed,
+        and that identifiers such as `double` are not mistaken for loops.
+
+        Returns:
+            None: Assertions are used to validate expected behavior.
+        """
+        source = (
+            "/* struct Fake { void (*f)(void); }; */\n"
+            "// for (;;) { while (1) { } }\n"
+            "void run(void) {\n"
+            "    double d = 1.0;\n"
+            '    const char *s = "for (;;) { while (1) { } }";\n'
+            "    while (d < 3) d += 1;\n"
+            "}\n"
+        )
+        report = analyze_source(source, Path("x.c"))
+
+        assert report["classes"] == []
+        assert report["complexity"]["total_functions"] == 1
+        assert report["complexity"]["max_loop_depth"] == 1
+
+    def test_braceless_and_do_while_loops_nest(self):
+        """
+        Verify that loops without braces nest correctly and that the `while`
+        closing a do-while is not counted as a second loop.
+
+        Returns:
+            None: Assertions are used to validate expected behavior.
+        """
+        source = (
+            "void run(int n) {\n"
+            "    for (int i = 0; i < n; i++)\n"
+            "        for (int j = 0; j < n; j++)\n"
+            "            while (n) n--;\n"
+            "    do { n--; } while (n > 0);\n"
+            "}\n"
+            "void once(int n) { do n--; while (n); }\n"
+        )
+        report = analyze_source(source, Path("x.c"))
+
+        assert report["complexity"]["total_functions"] == 2
+        assert report["complexity"]["max_loop_depth"] == 3
+        assert report["complexity"]["functions_with_nested_loops"] == 1
+
+    def test_extern_c_blocks_and_callback_parameters(self):
+        """
+        Verify that functions inside `extern "C"` blocks are found and that
+        function pointer parameters are not reported as struct methods.
+
+        Returns:
+            None: Assertions are used to validate expected behavior.
+        """
+        source = (
+            "struct Widget { void (*draw)(struct Widget *w); int id; };\n"
+            'extern "C" {\n'
+            "int api(int x) { return x; }\n"
+            "}\n"
+            "void each(void (*cb)(int), int n) { cb(n); }\n"
+        )
+        report = analyze_source(source, Path("x.c"))
+
+        classes = {c["name"]: c for c in report["classes"]}
+        assert classes["Widget"]["methods"] == ["draw"]
+        assert report["complexity"]["total_functions"] == 2
+
+    def test_struct_open_at_end_of_file(self):
+        """
+        Verify that an #ifdef typedef whose braces do not balance once
+        preprocessor lines are dropped is still analyzed.
+
+        Returns:
+            None: Assertions are used to validate expected behavior.
+        """
+        source = (
+            "#ifdef WIDE\n"
+            "typedef struct {\n"
+            " long v;\n"
+            "#else\n"
+            "typedef struct {\n"
+            " int v;\n"
+            "#endif\n"
+            "} num_t;\n"
+        )
+        report = analyze_source(source, Path("num.h"))
+
+        assert report["syntax_ok"] is True
+        assert [c["name"] for c in report["classes"]] == ["anonymous", "num_t"]
+
+    def test_library_calls_in_macro_bodies(self):
+        """
+        Verify that qsort, bsearch and allocator calls inside #define bodies
+        are detected.
+
+        Returns:
+            None: Assertions are used to validate expected behavior.
+        """
+        source = (
+            "#define SORT(a, n) qsort(a, n, sizeof *(a), cmp)\n"
+            "#define FIND(k, a, n) \\\n"
+            "    bsearch(k, a, n, sizeof *(a), cmp)\n"
+            "#define NEW(t) ((t *) malloc(sizeof(t)))\n"
+            "#include <stdlib.h>\n"
+        )
+        ds = analyze_source(source, Path("macros.c"))["data_structures"]
+
+        assert ds["uses_qsort"] is True
+        assert ds["uses_bsearch"] is True
+        assert ds["dynamic_memory"] == 1
+
+    def test_large_generated_file(self):
+        """
+        Verify that a generated file of about 100k lines is analyzed with
+        counts that scale exactly with the number of repeated blocks.
+
+        Returns:
+            None: Assertions are used to validate expected behavior.
+        """
+        block = (
+            "typedef struct Handle{i} *handle{i}_t;\n"
+            "typedef struct Shape{i} {{\n"
+            "    struct Base{i} base;\n"
+            "    void (*draw)(struct Shape{i} *self);\n"
+            "}} Shape{i};\n"
+            "Shape{i} *shape{i}_create(void) {{ return malloc(sizeof(Shape{i})); }}\n"
+            "static int shape{i}_sum(const int *xs, int n) {{\n"
+            "    int total = 0;\n"
+            "    for (int a = 0; a < n; a++)\n"
+            "        for (int b = 0; b < n; b++) total += xs[a] * xs[b];\n"
+            "    return total;\n"
+            "}}\n"
+        )
+        blocks = 100_000 // block.count("\n")
+        source = "".join(block.format(i=i) for i in range(blocks))
+        report = analyze_source(source, Path("big.c"))
+
+        assert len(report["classes"]) == blocks
+        assert report["classes"][-1]["bases"] == [f"Base{blocks - 1}"]
+        assert report["complexity"]["total_functions"] == 2 * blocks
+        assert report["complexity"]["functions_with_nested_loops"] == blocks
+        assert report["data_structures"]["dynamic_memory"] == blocks
+        assert report["c_spec"]["opaque_pointers"] == blocks
         
 def test_analyze_c_project_per_file_failure_returns_error_report(tmp_path, monkeypatch):
     # Arrange: make a fake project with one .c file
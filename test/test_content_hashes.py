@@ -0,0 +1,81 @@
+import hashlib
+
+import src.core.content_hashes as content_hashes
+from src.core.content_hashes import PARTIAL_HASH_BYTES, ContentHashes, hash_file
+from src.core.document_analysis import DocumentAnalyzer
+from src.core.project_inventory import ProjectInventory
+from src.storage.dedup_index import deduplicate_project
+
+
+def test_hash_file_computes_full_and_partial_digest_in_one_read(tmp_path):
+    """
+    The full and partial digests match hashlib over the whole file and its head.
+    Args:
+        tmp_path (Path): pytest temp directory.
+    Returns:
+        None
+    """
+    data = bytes(range(256)) * 64
+    f = tmp_path / "blob.bin"
+    f.write_bytes(data)
+
+    digest = hash_file(f)
+
+    assert digest.sha256 == hashlib.sha256(data).hexdigest()
+    assert digest.partial == hashlib.sha256(data[:PARTIAL_HASH_BYTES]).hexdigest()
+
+
+def test_prefetch_hashes_each_file_once_and_skips_unreadable(tmp_path, monkeypatch):
+    """
+    Prefetched digests are memoized; missing files are skipped until asked for directly.
+    Args:
+        tmp_path (Path): pytest temp directory.
+        monkeypatch (pytest.MonkeyPatch): Patches the hashing primitive.
+    Returns:
+        None
+    """
+    paths = []
+    for i in range(6):
+        p = tmp_path / f"f{i}.txt"
+        p.write_text(f"content {i}")
+        paths.append(p)
+    missing = tmp_path / "missing.txt"
+
+    calls = []
+    original = content_hashes.hash_file
+    monkeypatch.setattr(content_hashes, "hash_file", lambda path: calls.append(path) or original(path))
+
+    hashes = ContentHashes(workers=4)
+    hashes.prefetch(paths + [missing])
+    hashes.prefetch(paths)
+
+    assert sorted(calls) == sorted(paths + [missing])
+    assert [hashes.digest(p) for p in paths] == [original(p) for p in paths]
+    assert hashes.get(missing) is None
+
+
+def test_documents_and_dedup_share_digests(tmp_path, monkeypatch):
+    """
+    Documents hashed during document analysis are not hashed again by dedup.
+    Args:
+        tmp_path (Path): pytest temp directory.
+        monkeypatch (pytest.MonkeyPatch): Patches the hashing primitive.
+    Returns:
+        None
+    """
+    proj = tmp_path / "proj"
+    proj.mkdir()
+    (proj / "notes.md").write_text("# Notes\nSome text.")
+    (proj / "main.py").write_text("print('hi')\n")
+
+    calls = []
+    original = content_hashes.hash_file
+    monkeypatch.setattr(content_hashes, "hash_file", lambda path: calls.append(path.name) or original(path))
+
+    inventory = ProjectInventory(proj)
+    docs = DocumentAnalyzer(proj, files=inventory.paths(suffixes={".md"}), hashes=inventory.hashes).analyze()
+    result = deduplicate_project(proj, tmp_path / "dedup_index.db", inventory=inventory)
+
+    assert docs["documents"][0]["sha256"] == original(proj / "notes.md").sha256
+    assert result.unique_files == 2
+    assert sorted(calls) == ["main.py", "notes.md"]
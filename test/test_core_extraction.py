@@ -1,5 +1,6 @@
 import shutil
 import tempfile
+import time
 import zipfile
 from pathlib import Path
 
@@ -90,3 +91,79 @@ def test_verifyzip_rejects_unsafe_archive_path(tmp_path):
     text = extractInfo().verifyZIP(unsafe_zip)
     assert text is not None
     assert extractInfo.UNSAFE_ARCHIVE_PATH_ERROR_TEXT in text
+
+
+def test_run_archive_extraction_extracts_only_selected_members(tmp_path):
+    archive = tmp_path / "partial.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("src/main.py", "print('hi')\n")
+        zf.writestr("assets/logo.png", b"\x89PNG\r\n\x1a\n" + b"\x00" * 64)
+
+    output = extractInfo().runArchiveExtraction(archive, lambda members: {"src/main.py"})
+    try:
+        out_dir, members, extracted = output
+        out_dir = Path(out_dir)
+        assert [m.filename for m in members] == ["src/main.py", "assets/logo.png"]
+        assert extracted == {"src/main.py"}
+        assert (out_dir / "src" / "main.py").read_text() == "print('hi')\n"
+        assert (out_dir / "assets").is_dir()
+        assert not (out_dir / "assets" / "logo.png").exists()
+    finally:
+        shutil.rmtree(output[0], ignore_errors=True)
+
+
+def test_run_archive_extraction_checks_magic_bytes_of_unextracted_members():
+    path = Path(__file__).resolve().parent / "TestZIPs" / "CorruptInternalZIP.zip"
+    text = extractInfo().runArchiveExtraction(path, lambda members: set())
+    assert isinstance(text, str)
+    assert extractInfo.CORRUPT_FILE_ERROR_TEXT in text
+
+
+def test_run_extraction_reports_crc_mismatch_in_single_pass(tmp_path):
+    archive = tmp_path / "crc.zip"
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_STORED) as zf:
+        zf.writestr("good.txt", "fine")
+        zf.writestr("bad.txt", "original-content")
+    raw = archive.read_bytes()
+    archive.write_bytes(raw.replace(b"original-content", b"tampered-content"))
+
+    before = set(Path(tempfile.gettempdir(), "devdoc_extracts").glob("crc_*"))
+    text = extractInfo().runExtraction(archive)
+    assert text == extractInfo.BAD_FILE_ERROR_TEXT + "bad.txt"
+    assert set(Path(tempfile.gettempdir(), "devdoc_extracts").glob("crc_*")) == before
+
+
+def test_run_extraction_restores_member_timestamps(tmp_path):
+    archive = tmp_path / "stamped.zip"
+    info = zipfile.ZipInfo("dir/old.txt", date_time=(2020, 5, 17, 8, 30, 0))
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr(info, "old")
+
+    output = extractInfo().runExtraction(archive)
+    try:
+        extracted = Path(output) / "dir" / "old.txt"
+        assert extracted.read_text() == "old"
+        assert extracted.stat().st_mtime == time.mktime((2020, 5, 17, 8, 30, 0, 0, 0, -1))
+    finally:
+        _cleanup_path(output)
+
+
+def test_run_extraction_removes_partial_dir_on_write_error(tmp_path, monkeypatch):
+    archive = tmp_path / "diskfull.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("a.txt", "one")
+        zf.writestr("b.txt", "two")
+
+    extractor = extractInfo()
+    real_extract = extractor._extract_member
+
+    def failing_extract(zip_ref, member, dest):
+        if member.filename == "b.txt":
+            raise OSError(28, "No space left on device")
+        return real_extract(zip_ref, member, dest)
+
+    monkeypatch.setattr(extractor, "_extract_member", failing_extract)
+    before = set(Path(tempfile.gettempdir(), "devdoc_extracts").glob("diskfull_*"))
+    with pytest.raises(OSError):
+        extractor.runExtraction(archive)
+    assert set(Path(tempfile.gettempdir(), "devdoc_extracts").glob("diskfull_*")) == before
@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 from pathlib import Path
 from src.analyzers.c.cpp_analyzer import cppanalysis
@@ -122,6 +124,43 @@ class Test_cpp_analysis:
         assert result["cpp_spec"][spec_key] >= min_count
 
 
+    def test_nested_function_loop_depths_match_per_function_walk(self, analyzer):
+        source = (
+            "void f() { while (a) { struct L { void g() { for(;;) { do {} while (b); } } }; for(;;) {} } }\n"
+            "int main() { for (;;) { for (;;) { for (;;) {} } } }"
+        )
+        tree = analyzer.parser.parse(source.encode())
+        functions = [n for n in cutilities.tree_walk(tree.root_node) if n.type == "function_definition"]
+        loops = [n for n in cutilities.tree_walk(tree.root_node) if n.type in ("for_statement", "while_statement", "do_statement")]
+        expected = [cutilities.calculate_loop_depth(fn) for fn in functions]
+        assert expected == [3, 2, 3]
+        assert cutilities.function_loop_depths(functions, loops) == expected
+
+        result = analyze(analyzer, source)
+        assert result["complexity"] == {"total_functions": 3, "functions_with_nested_loops": 3, "max_loop_depth": 3}
+
+    def test_tree_walk_is_depth_first(self, analyzer):
+        def recursive(node):
+            yield node
+            for child in node.children:
+                yield from recursive(child)
+
+        tree = analyzer.parser.parse(b"class A : public B { int x; void f() { if (x) { g(); } } };")
+        assert [n.id for n in cutilities.tree_walk(tree.root_node)] == [n.id for n in recursive(tree.root_node)]
+        leaf = tree.root_node.descendant_for_byte_range(0, 1)
+        assert [n.id for n in cutilities.tree_walk(leaf)] == [leaf.id]
+
+    def test_parsers_and_queries_are_pooled(self):
+        first, second = cppanalysis(), cppanalysis()
+        assert first.query is second.query
+        assert first.parser is second.parser
+        other_thread = []
+        worker = threading.Thread(target=lambda: other_thread.append(first.parser))
+        worker.start()
+        worker.join()
+        assert other_thread[0] is not first.parser
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
 
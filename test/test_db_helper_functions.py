@@ -306,5 +306,146 @@ class TestHelperFunct(unittest.TestCase):
         self.assertIsNone(v1)
         self.assertIsNone(v2)
 
+    # -------------------- Batched writes --------------------
+    def test_insert_many_writes_all_rows_in_one_call(self):
+        """
+        Verify that insert_many stores every payload, versions repeated names,
+        and reports which items updated an existing project.
+
+        Args:
+            None: This test does not take any parameters.
+
+        Returns:
+            None: Assertions are used to validate expected behavior.
+        """
+        self.store.insert_json("existing.json", {"v": 0})
+        results = self.store.insert_many([
+            ("existing.json", {"v": 1}),
+            ("fresh.json", {"v": 1}),
+            ("fresh.json", {"v": 2}, b'{"v": 2}'),
+        ])
+
+        self.assertEqual(results, [("existing.json", True), ("fresh.json", False), ("fresh.json", True)])
+        self.assertEqual(self.store.fetch_by_name("fresh.json"), {"v": 2})
+        self.assertEqual(self.store.fetch_file_blob_by_name("existing.json"), json.dumps({"v": 1}).encode("utf-8"))
+        self.assertEqual(len(self.store.get_version_list("fresh.json")), 2)
+
+    def test_insert_many_keeps_nothing_when_a_write_fails(self):
+        """
+        Verify that a failing item rolls back the rows written earlier in the same call.
+
+        Args:
+            None: This test does not take any parameters.
+
+        Returns:
+            None: Assertions are used to validate expected behavior.
+        """
+        with self.assertRaises(sqlite3.Error):
+            self.store.insert_many([
+                ("good.json", {"v": 1}),
+                ("bad.json", {"v": 1}, object()),  # not bindable as a blob
+            ])
+
+        self.assertFalse(self.store.project_exists("good.json"))
+        self.assertFalse(self.store.project_exists("bad.json"))
+
+    def test_batch_commits_every_n_writes(self):
+        """
+        Verify that writes inside batch() become visible to other connections
+        only when the batch commits.
+
+        Args:
+            None: This test does not take any parameters.
+
+        Returns:
+            None: Assertions are used to validate expected behavior.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = Path(tmp) / "batch.db"
+            conn = sqlite3.connect(str(db_path))
+            with open(os.path.join(os.path.dirname(__file__), "..", "database.sql")) as f:
+                conn.executescript(f.read())
+            reader = sqlite3.connect(str(db_path))
+            store = HelperFunct(conn)
+            visible = lambda: reader.execute("SELECT COUNT(*) FROM project_data").fetchone()[0]
+            try:
+                with store.batch(commit_every=2):
+                    store.insert_json("a.json", {"v": 1})
+                    self.assertEqual(visible(), 0)
+                    store.insert_json("b.json", {"v": 1})
+                    self.assertEqual(visible(), 2)
+                    store.insert_json("c.json", {"v": 1})
+                    self.assertEqual(visible(), 2)
+                self.assertEqual(visible(), 3)
+            finally:
+                reader.close()
+                conn.close()
+
+    def test_project_summary_tracks_writes(self):
+        """
+        Verify that project_summary holds the latest type, languages, skills and
+        version count after inserts, updates, pruning and deletion.
+
+        Args:
+            None: This test does not take any parameters.
+
+        Returns:
+            None: Assertions are used to validate expected behavior.
+        """
+        def summary():
+            return next(
+                (s for s in self.store.list_project_summaries() if s["project_name"] == "summary.json"),
+                None,
+            )
+
+        resume = {"project_type": "individual", "languages": ["Python"], "skills": ["Flask"]}
+        self.store.insert_json("summary.json", {"resume_item": resume})
+        self.assertEqual(summary()["project_type"], "individual")
+        self.assertEqual(summary()["languages"], ["Python"])
+        self.assertEqual(summary()["version_count"], 1)
+
+        resume = {"project_type": "collaborative", "languages": ["Python", "C"], "skills": ["Flask"]}
+        self.store.update("summary.json", {"resume_item": resume})
+        self.store.insert_json("summary.json", {"resume_item": resume})
+        self.assertEqual(summary()["project_type"], "collaborative")
+        self.assertEqual(summary()["languages"], ["Python", "C"])
+        self.assertEqual(summary()["version_count"], 3)
+        totals = {p["project_name"]: p["total_versions"] for p in self.store.get_all_projects_with_versions()}
+        self.assertEqual(totals["summary.json"], 3)
+
+        self.store.delete_old_versions("summary.json", keep_last_n=1)
+        self.assertEqual(summary()["version_count"], 1)
+
+        self.store.delete("summary.json")
+        self.assertIsNone(summary())
+
+    def test_project_summary_is_backfilled_for_existing_projects(self):
+        """
+        Verify that projects saved before project_summary existed get a summary
+        row when the helper is created.
+
+        Args:
+            None: This test does not take any parameters.
+
+        Returns:
+            None: Assertions are used to validate expected behavior.
+        """
+        conn = sqlite3.connect(":memory:")
+        with open(os.path.join(os.path.dirname(__file__), "..", "database.sql")) as f:
+            conn.executescript(f.read())
+        store = HelperFunct(conn)
+        store.insert_json("old.json", {"resume_item": {"skills": ["SQL"]}})
+        conn.execute("DELETE FROM project_summary")
+        conn.commit()
+
+        summaries = HelperFunct(conn).list_project_summaries()
+
+        self.assertEqual(len(summaries), 1)
+        self.assertEqual(summaries[0]["project_name"], "old.json")
+        self.assertIsNone(summaries[0]["project_type"])
+        self.assertEqual(summaries[0]["skills"], ["SQL"])
+        self.assertEqual(summaries[0]["version_count"], 1)
+        conn.close()
+
 if __name__== "__main__":
     unittest.main()
@@ -127,3 +127,72 @@ class TestVersioningHelper(unittest.TestCase):
 
         restored_content = self.store.fetch_by_name(project_name )
         self.assertEqual(restored_content, {"data": 2})
+
+    # ---------- Delta storage ----------
+    def test_older_versions_are_stored_as_deltas(self):
+        """
+        Only the newest version is stored whole; every older version is rebuilt exactly.
+        """
+        history = [{"name": "p", "snapshots": [{"i": i, "notes": "x" * 200} for i in range(n)]} for n in range(1, 6)]
+        project_name, _ = self.store.insert_json("file.json", history[0])
+        for content in history[1:3]:
+            self.store.insert_json(project_name, content)
+        for content in history[3:]:
+            self.store.update(project_name, content)
+
+        rows = self.conn.execute(
+            "SELECT version_number, encoding FROM project_versions WHERE project_name = ? ORDER BY version_number",
+            (project_name,),
+        ).fetchall()
+        self.assertEqual([r["encoding"] for r in rows], ["delta"] * 4 + ["full"])
+
+        for number, expected in enumerate(history, start=1):
+            version = self.store.retrieve_selected_version(project_name, number)
+            self.assertEqual(version["content"], expected)
+            self.assertEqual(json.loads(version["file_blob"]), expected)
+
+        self.store.delete_old_versions(project_name, keep_last_n=2)
+        self.assertEqual(self.store.retrieve_selected_version(project_name, 4)["content"], history[3])
+
+    def test_int_keyed_versions_survive_delta_storage(self):
+        """
+        Deltas are taken from the stored JSON, so int dict keys (stored as strings) still round-trip.
+        """
+        self.store.insert_json("p", {"counts": {1: "a", 2: "b"}, "x": list(range(50))})
+        self.store.insert_json("p", {"counts": {1: "a", 2: "c"}, "x": list(range(60))})
+
+        version = self.store.retrieve_selected_version("p", 1)
+        self.assertEqual(version["content"], {"counts": {"1": "a", "2": "b"}, "x": list(range(50))})
+        self.assertEqual(self.store.retrieve_selected_version("p", 2)["content"]["counts"], {"1": "a", "2": "c"})
+
+    def test_original_bytes_of_older_version_are_kept(self):
+        """
+        A version saved from non-canonical bytes stays whole and returns those bytes.
+        """
+        raw = json.dumps({"snapshots": list(range(100))}, indent=4).encode("utf-8")
+        project_name, _ = self.store.insert_json("raw.json", {"snapshots": []})
+        self.store.update(project_name, raw)
+        self.store.update(project_name, {"snapshots": list(range(101))})
+
+        self.assertEqual(self.store.retrieve_selected_version(project_name, 2)["file_blob"], raw)
+
+    def test_existing_database_gains_encoding_column(self):
+        """
+        A database created before delta storage is upgraded when the helper is created.
+        """
+        conn = sqlite3.connect(":memory:")
+        conn.executescript(
+            "CREATE TABLE project_data (Pname TEXT NOT NULL, content TEXT NOT NULL, file_blob BLOB, "
+            "uploaded_at TEXT DEFAULT (datetime('now')) NOT NULL, current_version INTEGER DEFAULT 1, "
+            "updated_at TEXT DEFAULT (datetime('now')), PRIMARY KEY(Pname, uploaded_at), UNIQUE (Pname));"
+            "CREATE TABLE project_versions (id INTEGER PRIMARY KEY AUTOINCREMENT, project_name TEXT NOT NULL, "
+            "project_uploaded_at TEXT NOT NULL, version_number INTEGER NOT NULL, content TEXT NOT NULL, "
+            "file_blob BLOB, created_at TEXT DEFAULT (datetime('now')));"
+        )
+        try:
+            store = HelperFunct(conn)
+            store.insert_json("old.json", {"data": 1})
+            store.update("old.json", {"data": 2})
+            self.assertEqual(store.retrieve_selected_version("old.json", 1)["content"], {"data": 1})
+        finally:
+            conn.close()
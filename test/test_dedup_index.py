@@ -1,13 +1,31 @@
 import json
 import os
+import sqlite3
+import zipfile
 from pathlib import Path
 
 import pytest
 
+import src.core.content_hashes as content_hashes
 import src.storage.dedup_index as dedup_mod
 from src.storage.dedup_index import _file_hash, deduplicate_project
 
 
+def _cached_paths(index_path):
+    """
+    Return the path keys currently stored in the index's file cache.
+    Args:
+        index_path (Path): Index location passed to deduplicate_project.
+    Returns:
+        set: Cached path keys.
+    """
+    conn = sqlite3.connect(str(index_path.with_suffix(".db")))
+    try:
+        return {row[0] for row in conn.execute("SELECT path FROM file_cache")}
+    finally:
+        conn.close()
+
+
 def test_deduplicate_project_identifies_duplicates(tmp_path):
     """
     Detect duplicate content across different projects without deleting files.
@@ -98,6 +116,43 @@ def test_deduplicate_project_can_remove_duplicates(tmp_path):
     assert not f2.exists()
 
 
+def test_unextracted_archive_duplicate_is_not_counted_as_removed(tmp_path):
+    """
+    A duplicate that exists only inside the archive (sparse extraction) is reported, not removed.
+    Args:
+        tmp_path (Path): Pytest-provided temp directory.
+    Returns:
+        None
+    """
+    from src.core.project_inventory import ArchiveInventory
+
+    proj1 = tmp_path / "proj1"
+    proj1.mkdir()
+    (proj1 / "a.txt").write_text("same")
+    index_path = tmp_path / "dedup_index.json"
+    deduplicate_project(proj1, index_path)
+
+    archive = tmp_path / "proj2.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("b.txt", "same")
+        zf.writestr("c.txt", "same")
+    proj2 = tmp_path / "proj2"
+    proj2.mkdir()
+    (proj2 / "c.txt").write_text("same")
+    with zipfile.ZipFile(archive) as zf:
+        members = zf.infolist()
+    inventory = ArchiveInventory(proj2, archive, members, extracted={"c.txt"})
+    try:
+        result = deduplicate_project(proj2, index_path, remove_duplicates=True, inventory=inventory)
+    finally:
+        inventory.close()
+
+    removed = {Path(d["path"]).name: d["removed"] for d in result.duplicates}
+    assert removed == {"b.txt": False, "c.txt": True}
+    assert result.removed == 1
+    assert not (proj2 / "c.txt").exists()
+
+
 def test_deduplicate_project_removes_deleted_file_from_cache(tmp_path):
     """
     When a duplicate file is deleted, its per-path file cache entry should be removed.
@@ -118,17 +173,13 @@ def test_deduplicate_project_removes_deleted_file_from_cache(tmp_path):
     deduplicate_project(proj2, index_path)
 
     cache_key = dedup_mod._path_cache_key(f2)
-    index_before = json.loads(index_path.read_text(encoding="utf-8"))
-    file_cache_before = index_before.get(dedup_mod.FILE_CACHE_KEY, {})
-    assert cache_key in file_cache_before
+    assert cache_key in _cached_paths(index_path)
 
     result = deduplicate_project(proj2, index_path, remove_duplicates=True)
     assert result.removed == 1
     assert not f2.exists()
 
-    index_after = json.loads(index_path.read_text(encoding="utf-8"))
-    file_cache_after = index_after.get(dedup_mod.FILE_CACHE_KEY, {})
-    assert cache_key not in file_cache_after
+    assert cache_key not in _cached_paths(index_path)
 
 
 def test_corrupted_index_logs_warning(tmp_path, caplog):
@@ -171,22 +222,24 @@ def test_lock_contention_times_out_and_warns(tmp_path, monkeypatch, caplog):
     (proj / "file.txt").write_text("content")
 
     index_path = tmp_path / "dedup_index.json"
-    lock_path = str(index_path) + ".lock"
+    deduplicate_project(proj, index_path)
 
     # Speed up the test by shortening the lock timeout.
     monkeypatch.setattr(dedup_mod, "LOCK_TIMEOUT", 0.05)
 
-    lock = dedup_mod.FileLock(lock_path, timeout=dedup_mod.LOCK_TIMEOUT)
-    lock.acquire(timeout=0)  # hold the lock to force contention
+    # Hold the write lock from another connection to force contention.
+    holder = sqlite3.connect(str(index_path.with_suffix(".db")), isolation_level=None)
+    holder.execute("BEGIN IMMEDIATE")
     try:
         with caplog.at_level("WARNING"):
             result = deduplicate_project(proj, index_path)
     finally:
-        lock.release()
+        holder.execute("ROLLBACK")
+        holder.close()
 
     assert result.unique_files == 0
     assert result.duplicate_files == 0
-    assert any("Could not acquire dedup index lock" in msg for msg in caplog.messages)
+    assert any("Could not update dedup index" in msg for msg in caplog.messages)
 
 
 def test_unchanged_files_reuse_cached_hash(tmp_path, monkeypatch):
@@ -200,13 +253,13 @@ def test_unchanged_files_reuse_cached_hash(tmp_path, monkeypatch):
     index_path = tmp_path / "dedup_index.json"
 
     calls = {"count": 0}
-    original = dedup_mod._file_hash
+    original = content_hashes.hash_file
 
-    def counting_hash(path: Path) -> str:
+    def counting_hash(path: Path):
         calls["count"] += 1
         return original(path)
 
-    monkeypatch.setattr(dedup_mod, "_file_hash", counting_hash)
+    monkeypatch.setattr(content_hashes, "hash_file", counting_hash)
 
     deduplicate_project(proj, index_path)
     assert calls["count"] == 1
@@ -227,13 +280,13 @@ def test_changed_files_are_rehashed(tmp_path, monkeypatch):
     index_path = tmp_path / "dedup_index.json"
 
     calls = {"count": 0}
-    original = dedup_mod._file_hash
+    original = content_hashes.hash_file
 
-    def counting_hash(path: Path) -> str:
+    def counting_hash(path: Path):
         calls["count"] += 1
         return original(path)
 
-    monkeypatch.setattr(dedup_mod, "_file_hash", counting_hash)
+    monkeypatch.setattr(content_hashes, "hash_file", counting_hash)
 
     deduplicate_project(proj, index_path)
     assert calls["count"] == 1
@@ -269,13 +322,13 @@ def test_same_size_change_with_preserved_mtime_is_rehashed(tmp_path, monkeypatch
     os.utime(f2, ns=(old_stat.st_atime_ns, old_stat.st_mtime_ns))
 
     calls = {"count": 0}
-    original = dedup_mod._file_hash
+    original = content_hashes.hash_file
 
-    def counting_hash(path: Path) -> str:
+    def counting_hash(path: Path):
         calls["count"] += 1
         return original(path)
 
-    monkeypatch.setattr(dedup_mod, "_file_hash", counting_hash)
+    monkeypatch.setattr(content_hashes, "hash_file", counting_hash)
 
     result = deduplicate_project(proj2, index_path, remove_duplicates=True)
 
@@ -283,3 +336,42 @@ def test_same_size_change_with_preserved_mtime_is_rehashed(tmp_path, monkeypatch
     assert result.duplicate_files == 0
     assert result.removed == 0
     assert f2.exists()
+
+
+def test_legacy_json_index_is_migrated_once(tmp_path, monkeypatch):
+    """
+    A legacy JSON index is imported into SQLite on first use: known hashes stay
+    duplicates, cached digests are reused, and the JSON file is set aside.
+    """
+    proj = tmp_path / "proj2"
+    proj.mkdir()
+    f = proj / "b.txt"
+    f.write_text("same")
+    size, mtime_ns, ctime_ns = dedup_mod._stat_fingerprint(f)
+    digest = _file_hash(f)
+
+    index_path = tmp_path / "dedup_index.json"
+    index_path.write_text(json.dumps({
+        digest: {"path": "/old/proj1/a.txt", "project": "proj1"},
+        dedup_mod.FILE_CACHE_KEY: {
+            dedup_mod._path_cache_key(f): {
+                "size": size,
+                "mtime_ns": mtime_ns,
+                "ctime_ns": ctime_ns,
+                "partial_hash": dedup_mod._partial_hash(f),
+                "hash": digest,
+            },
+        },
+    }))
+
+    def fail_hash(path):
+        raise AssertionError("cached digest should have been reused")
+
+    monkeypatch.setattr(content_hashes, "hash_file", fail_hash)
+    result = deduplicate_project(proj, tmp_path / "dedup_index.db")
+
+    assert result.duplicate_files == 1
+    assert result.duplicates[0]["original"] == "/old/proj1/a.txt"
+    assert result.index_size == 1
+    assert not index_path.exists()
+    assert (tmp_path / "dedup_index.json.migrated").exists()
@@ -0,0 +1,54 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from src.analysis.insight_helpers import InsightIndex, filter_insights
+
+
+def _insight(name, analyzed_at, languages=(), skills=()):
+    """
+    Build a minimal insight-like object.
+    Args:
+        name (str): Project name.
+        analyzed_at (str): ISO timestamp (may be unparseable).
+        languages (tuple): Languages used.
+        skills (tuple): Skills used.
+    Returns:
+        SimpleNamespace: The insight.
+    """
+    return SimpleNamespace(project_name=name, analyzed_at=analyzed_at, languages=list(languages), skills=list(skills))
+
+
+INSIGHTS = [
+    _insight("a", "2024-01-01T00:00:00+00:00", ["Python"], ["Flask", "Testing"]),
+    _insight("b", "2024-03-01T00:00:00+00:00", ["JavaScript"], ["React"]),
+    _insight("c", "not a date", ["python"], ["flask"]),
+    _insight("d", "2024-06-01T00:00:00", ["Python", "C"], ["Testing"]),
+]
+
+
+def test_index_matches_linear_filter():
+    """
+    Every filter combination returns the same insights, in the same order, with or without the index.
+    Returns:
+        None
+    """
+    index = InsightIndex(INSIGHTS)
+    since = datetime(2024, 2, 1, tzinfo=timezone.utc)
+    for language in (None, "PYTHON", "c", "rust"):
+        for skill in (None, "Flask", "testing", "react"):
+            for when in (None, since):
+                expected = filter_insights(INSIGHTS, language=language, skill=skill, since=when)
+                got = filter_insights(index, language=language, skill=skill, since=when)
+                assert [i.project_name for i in got] == [i.project_name for i in expected]
+
+
+def test_index_since_keeps_undated_insights():
+    """
+    Insights without a parseable date are never excluded by a since filter.
+    Returns:
+        None
+    """
+    index = InsightIndex(INSIGHTS)
+    later = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    assert [i.project_name for i in index.filter(since=later)] == ["c"]
+    assert [i.project_name for i in index.filter()] == ["a", "b", "c", "d"]
@@ -0,0 +1,168 @@
+import json
+
+import src.storage.insights_store as store_mod
+from src.storage.insights_store import InsightStore
+
+
+def _entry(insight_id, project="Demo", analyzed_at="2024-01-01T00:00:00+00:00", **extra):
+    """
+    Build a minimal insight entry.
+    Args:
+        insight_id (str): Entry id.
+        project (str): Project name.
+        analyzed_at (str): ISO timestamp.
+    Returns:
+        dict: The entry.
+    """
+    return {"id": insight_id, "project_name": project, "analyzed_at": analyzed_at, **extra}
+
+
+def test_appends_do_not_rewrite_existing_lines(tmp_path):
+    """
+    Recording an entry appends to the log; earlier bytes stay untouched.
+    Args:
+        tmp_path (Path): pytest temp directory.
+    Returns:
+        None
+    """
+    path = tmp_path / "project_insights.json"
+    store = InsightStore(path)
+    store.append(_entry("a"))
+    before = path.read_bytes()
+
+    store.append(_entry("b", project="Other"))
+
+    assert path.read_bytes().startswith(before)
+    assert [e["id"] for e in store.entries()] == ["a", "b"]
+    assert [(r.id, r.project_name) for r in store.records()] == [("a", "Demo"), ("b", "Other")]
+    assert store.get("b")["project_name"] == "Other"
+
+
+def test_replace_and_delete_supersede_earlier_lines(tmp_path):
+    """
+    Replacements keep the entry's position; deletions hide every version of the entry.
+    Args:
+        tmp_path (Path): pytest temp directory.
+    Returns:
+        None
+    """
+    store = InsightStore(tmp_path / "project_insights.json")
+    for insight_id, project in (("a", "Demo"), ("b", "Demo"), ("c", "Other")):
+        store.append(_entry(insight_id, project=project))
+
+    assert store.replace(_entry("a", thumbnail={"path": "a.png"}))
+    assert not store.replace(_entry("missing"))
+    assert [e["id"] for e in store.entries()] == ["a", "b", "c"]
+    assert store.get("a")["thumbnail"] == {"path": "a.png"}
+
+    assert store.delete(store.ids_for_project("Demo")) == 2
+    assert [e["id"] for e in InsightStore(tmp_path / "project_insights.json").entries()] == ["c"]
+
+
+def test_legacy_json_array_is_converted_in_place(tmp_path):
+    """
+    A legacy JSON array is read, converted to the log format, and ids are filled in.
+    Args:
+        tmp_path (Path): pytest temp directory.
+    Returns:
+        None
+    """
+    path = tmp_path / "project_insights.json"
+    path.write_text(json.dumps([_entry("a"), {"project_name": "NoId"}]), encoding="utf-8")
+
+    entries = InsightStore(path).entries()
+
+    assert [e["project_name"] for e in entries] == ["Demo", "NoId"]
+    assert entries[1]["id"]
+    assert path.read_bytes().startswith(store_mod._HEADER_LINE)
+
+
+def test_stale_index_and_torn_line_are_repaired(tmp_path):
+    """
+    A missing index is rebuilt and a partially written trailing line is dropped.
+    Args:
+        tmp_path (Path): pytest temp directory.
+    Returns:
+        None
+    """
+    path = tmp_path / "project_insights.json"
+    store = InsightStore(path)
+    store.append(_entry("a"))
+    store.append(_entry("b"))
+    store.index_path.unlink()
+    with path.open("ab") as f:
+        f.write(b'{"id": "c", "proj')
+
+    assert [e["id"] for e in InsightStore(path).entries()] == ["a", "b"]
+    store.append(_entry("d"))
+    assert [e["id"] for e in InsightStore(path).entries()] == ["a", "b", "d"]
+
+
+def test_log_is_compacted_once_garbage_dominates(tmp_path, monkeypatch):
+    """
+    Superseded lines are dropped from the log once they outnumber live entries.
+    Args:
+        tmp_path (Path): pytest temp directory.
+        monkeypatch (pytest.MonkeyPatch): Lowers the compaction threshold.
+    Returns:
+        None
+    """
+    monkeypatch.setattr(store_mod, "COMPACT_MIN_GARBAGE", 2)
+    path = tmp_path / "project_insights.json"
+    store = InsightStore(path)
+    store.append(_entry("a"))
+    store.replace(_entry("a", summary="v1"))
+    assert len(path.read_bytes().splitlines()) == 3
+
+    store.replace(_entry("a", summary="v2"))
+    assert len(path.read_bytes().splitlines()) == 2  # header + the live entry
+    assert store.get("a")["summary"] == "v2"
+
+
+def test_hierarchies_are_stored_once_out_of_line(tmp_path):
+    """
+    Identical hierarchies share one blob; log lines only keep the reference.
+    Args:
+        tmp_path (Path): pytest temp directory.
+    Returns:
+        None
+    """
+    path = tmp_path / "project_insights.json"
+    store = InsightStore(path)
+    tree = {"name": "Demo", "type": "DIR", "children": [{"name": "a.py", "type": "FILE", "size": 3}]}
+    stored = store.append(_entry("a", hierarchy=tree))
+    store.append(_entry("b", hierarchy=dict(tree)))
+
+    assert "hierarchy" not in stored
+    assert b'"children"' not in path.read_bytes()
+    assert len(list(store.blobs.root.iterdir())) == 1
+    entries = store.entries()
+    assert entries[0]["hierarchy_ref"] == entries[1]["hierarchy_ref"] == stored["hierarchy_ref"]
+    assert store.hierarchy(entries[1]) == tree
+    assert store.hierarchy(_entry("c")) == {}
+
+
+def test_legacy_inline_hierarchies_move_out_and_unused_blobs_are_collected(tmp_path, monkeypatch):
+    """
+    Converting a legacy array externalizes hierarchies; compaction drops orphaned blobs.
+    Args:
+        tmp_path (Path): pytest temp directory.
+        monkeypatch (pytest.MonkeyPatch): Lowers the compaction threshold.
+    Returns:
+        None
+    """
+    monkeypatch.setattr(store_mod, "COMPACT_MIN_GARBAGE", 1)
+    path = tmp_path / "project_insights.json"
+    path.write_text(json.dumps([
+        _entry("a", hierarchy={"name": "A", "type": "DIR", "children": []}),
+        _entry("b", project="Other", hierarchy={"name": "B", "type": "DIR", "children": []}),
+    ]), encoding="utf-8")
+    store = InsightStore(path)
+
+    entries = store.entries()
+    assert all("hierarchy" not in e for e in entries)
+    assert store.hierarchy(entries[0])["name"] == "A"
+    assert len(list(store.blobs.root.iterdir())) == 2
+
+    store.delete(["b"])
+    assert [p.stem for p in store.blobs.root.iterdir()] == [entries[0]["hierarchy_ref"]]
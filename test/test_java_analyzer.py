@@ -4,7 +4,7 @@ import sys
 import textwrap
 
 sys.path.append(str(Path(__file__).parent.parent))
-from src.analyzers.java.java_analyzer import analyze_source
+from src.analyzers.java.java_analyzer import analyze_source, tokenize_source
 
 class TestJavaAnalyzer(unittest.TestCase):
 
@@ -98,6 +98,62 @@ class TestJavaAnalyzer(unittest.TestCase):
         self.assertEqual(cx["functions_with_nested_loops"], 1)
         self.assertEqual(cx["max_loop_depth"], 2)
 
+    def test_nested_bodies_count_towards_enclosing_member(self):
+        """Loops inside anonymous/local classes count towards the enclosing method."""
+        source = textwrap.dedent("""
+            public class Outer {
+                private int a;
+                public Outer() {
+                    class Local { void f() { for (;;) { } } }
+                }
+                public void run(int n) {
+                    for (int i = 0; i < n; i++) {
+                        Runnable r = new Runnable() {
+                            public void run() { while (true) { do { } while (false); } }
+                        };
+                    }
+                }
+            }
+        """)
+        result = analyze_source(source, Path("Outer.java"))
+
+        cx = result["complexity"]
+        self.assertEqual(cx["total_functions"], 2)
+        self.assertEqual(cx["functions_with_nested_loops"], 1)
+        self.assertEqual(cx["max_loop_depth"], 3)
+
+    def test_data_structures_from_imports_and_creations(self):
+        """Any collection type whose name contains List/Map/Set counts, imported or created."""
+        source = textwrap.dedent("""
+            import java.util.concurrent.CopyOnWriteArrayList;
+            import java.util.EnumSet;
+            import static java.util.Collections.sort;
+
+            public class Uses {
+                void f() {
+                    Object m = new ConcurrentHashMap<String, Integer>();
+                    Object q = new PriorityQueue<Integer>();
+                }
+            }
+        """)
+        ds = analyze_source(source, Path("Uses.java"))["data_structures"]
+
+        self.assertEqual(ds["list_literals"], 1)
+        self.assertEqual(ds["dict_literals"], 1)
+        self.assertEqual(ds["set_literals"], 1)
+        self.assertTrue(ds["uses_heapq"])
+        self.assertTrue(ds["uses_sorted"])
+
+    def test_pre_tokenized_input(self):
+        """Supplied tokens are parsed as-is and identical sources share cached tokens."""
+        source = "public class A { public A() {} }"
+        tokens = tokenize_source(source)
+
+        self.assertIs(tokenize_source(str(source)), tokens)
+        result = analyze_source("ignored", Path("A.java"), tokens=tokens)
+        self.assertTrue(result["syntax_ok"])
+        self.assertEqual(result["classes"][0]["name"], "A")
+
     def test_syntax_error_handling(self):
         """Invalid Java syntax should return syntax_ok=False."""
         source = "public class Broken { void foo( }"
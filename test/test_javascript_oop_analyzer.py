@@ -158,6 +158,51 @@ class TestJavaScriptOOPAnalyzer(unittest.TestCase):
         self.assertGreater(metrics["data_structures"]["list_literals"], 0)
         self.assertGreater(metrics["data_structures"]["dict_literals"], 0)
         
+    def test_loops_in_nested_functions_count_towards_method(self):
+        """Loops inside callbacks belong to the enclosing method; array holes are skipped."""
+        self._write_js(
+            "nested.js",
+            """
+            class Walker {
+                walk(items) {
+                    const holes = [1, , 3];
+                    items.forEach((row) => {
+                        for (const cell of row) {
+                            while (cell.next) { cell = cell.next; }
+                        }
+                    });
+                    do { } while (false);
+                }
+            }
+            function helper() { return {}; }
+            """
+        )
+
+        analyzer = JavaScriptOOPAnalyzer(self.tmpdir)
+        metrics = analyzer.analyze()
+
+        self.assertEqual(metrics["complexity"]["max_loop_depth"], 2)
+        self.assertEqual(metrics["complexity"]["functions_with_nested_loops"], 1)
+        # walk (method) + its function value + the arrow callback + helper
+        self.assertEqual(metrics["complexity"]["total_functions"], 4)
+        self.assertEqual(metrics["data_structures"]["list_literals"], 1)
+        self.assertEqual(metrics["data_structures"]["dict_literals"], 1)
+
+    def test_discovery_skips_ignored_directories(self):
+        """node_modules and build outputs are pruned during discovery."""
+        self._write_js("app.js", "const a = 1;")
+        (self.tmpdir / "src").mkdir()
+        self._write_js("src/util.js", "const b = 2;")
+        for ignored in ("node_modules/pkg/lib", "dist"):
+            (self.tmpdir / ignored).mkdir(parents=True)
+            self._write_js(f"{ignored}/bundle.js", "const c = 3;")
+
+        analyzer = JavaScriptOOPAnalyzer(self.tmpdir)
+        analyzer.discover_js_files()
+
+        found = sorted(p.relative_to(analyzer.root).as_posix() for p in analyzer.js_files)
+        self.assertEqual(found, ["app.js", "src/util.js"])
+
     def test_nonexistent_path_raises_error(self):
         """Check that non-existent path raises FileNotFoundError."""
         fake_path = Path("/fake/nonexistent/path")
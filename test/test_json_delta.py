@@ -0,0 +1,57 @@
+import pytest
+
+from src.storage import json_delta
+
+
+CASES = [
+    ({"a": 1, "b": [1, 2, 3], "c": {"d": "x"}}, {"a": 2, "b": [1, 2], "c": {"d": "x", "e": None}}),
+    ({"snapshots": [{"v": 1}]}, {"snapshots": [{"v": 1}, {"v": 2}, {"v": 3}]}),
+    ({"k": [1, {"x": 1}]}, {"k": "replaced"}),
+    ({"gone": True, "kept": 1}, {"kept": 1}),
+    ([1, 2, 3], [1, 5]),
+    ({"a": 1}, [1, 2]),
+    ({"n": 1}, {"n": 1.0}),
+    ({"same": [1, 2]}, {"same": [1, 2]}),
+]
+
+
+@pytest.mark.parametrize("source,target", CASES)
+def test_apply_diff_round_trips(source, target):
+    """
+    Applying diff(source, target) to source yields target and leaves source untouched.
+    Args:
+        source: Document the delta applies to.
+        target: Document the delta produces.
+    Returns:
+        None
+    """
+    before = repr(source)
+    ops = json_delta.diff(source, target)
+    result = json_delta.apply(source, ops)
+    assert result == target and type(result) is type(target)
+    assert repr(source) == before
+    base, decoded = json_delta.decode(json_delta.encode(7, ops))
+    assert base == 7 and json_delta.apply(source, decoded) == target
+
+
+def test_grown_list_is_a_single_operation():
+    """
+    An appended-to history list is encoded as one truncation, not a copy of the list.
+    Returns:
+        None
+    """
+    newer = {"snapshots": [{"i": i, "data": "x" * 100} for i in range(50)]}
+    older = {"snapshots": newer["snapshots"][:49]}
+    assert json_delta.diff(newer, older) == [["trunc", ["snapshots"], 49]]
+
+
+def test_mismatched_delta_raises_value_error():
+    """
+    Deltas that do not fit the document, or blobs that are not deltas, raise ValueError.
+    Returns:
+        None
+    """
+    with pytest.raises(ValueError):
+        json_delta.apply({"a": 1}, [["del", ["missing", "x"]]])
+    with pytest.raises(ValueError):
+        json_delta.decode(b"not a delta")
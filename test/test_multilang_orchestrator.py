@@ -0,0 +1,133 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+import src.analyzers.multilang_orchestrator as orch_mod
+from src.analyzers.multilang_orchestrator import MultiLangOrchestrator
+from src.storage.analysis_cache import AnalysisCache
+
+TEST_DIR = Path(__file__).resolve().parent
+
+
+@pytest.fixture
+def mixed_project(tmp_path):
+    """
+    Build a project containing Python, Java, C, C++ and C# sources.
+    Args:
+        tmp_path (Path): Pytest-provided temp directory.
+    Returns:
+        Path: Project root.
+    """
+    root = tmp_path / "mixed"
+    shutil.copytree(TEST_DIR / "tiny_scripts" / "tiny_scripts", root / "py")
+    shutil.copytree(TEST_DIR / "test_java_project", root / "java")
+    shutil.copytree(TEST_DIR / "test_c_project", root / "c")
+    (root / "cpp").mkdir()
+    (root / "cpp" / "shape.cpp").write_text(
+        "#include <vector>\n"
+        "class Shape { public: virtual double area() const = 0; virtual ~Shape() {} };\n"
+        "class Square : public Shape {\n"
+        "  double s;\n"
+        " public:\n"
+        "  Square(double v) : s(v) {}\n"
+        "  double area() const override { return s * s; }\n"
+        "};\n"
+    )
+    (root / "cs").mkdir()
+    (root / "cs" / "Animal.cs").write_text(
+        "public class Animal { private string name; public Animal(string n) { name = n; } }\n"
+        "public class Dog : Animal { public Dog(string n) : base(n) {} public void Bark() {} }\n"
+    )
+    (root / "py" / "broken.py").write_text("def oops(:\n")
+    return root
+
+
+def test_parallel_matches_serial(mixed_project):
+    """
+    Pooled per-file analysis returns exactly the serial report.
+    Args:
+        mixed_project (Path): Fixture project root.
+    Returns:
+        None
+    """
+    serial = MultiLangOrchestrator(mixed_project, workers=1).analyze()
+    parallel = MultiLangOrchestrator(mixed_project, workers=2).analyze()
+
+    assert parallel == serial
+    assert set(serial["languages"]) >= {"Python", "Java", "C", "C++", "C#"}
+
+
+def test_workers_default_from_environment(monkeypatch, tmp_path):
+    """
+    The worker count falls back to OOP_ANALYSIS_WORKERS, then to serial.
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+        tmp_path (Path): Pytest-provided temp directory.
+    Returns:
+        None
+    """
+    monkeypatch.setenv(orch_mod.WORKERS_ENV_VAR, "3")
+    assert MultiLangOrchestrator(tmp_path).workers == 3
+
+    monkeypatch.setenv(orch_mod.WORKERS_ENV_VAR, "not-a-number")
+    assert MultiLangOrchestrator(tmp_path).workers == 1
+
+    assert MultiLangOrchestrator(tmp_path, workers=0).workers == 1
+
+
+def test_cached_reports_are_reused_at_a_new_location(mixed_project, tmp_path, monkeypatch):
+    """
+    A re-uploaded copy of the project is served from the cache and matches a fresh analysis.
+    Args:
+        mixed_project (Path): Fixture project root.
+        tmp_path (Path): Pytest-provided temp directory.
+        monkeypatch: Pytest monkeypatch fixture.
+    Returns:
+        None
+    """
+    cache = AnalysisCache(tmp_path / "cache.db")
+    MultiLangOrchestrator(mixed_project, workers=1, cache=cache).analyze()
+
+    copy = tmp_path / "reupload"
+    shutil.copytree(mixed_project, copy)
+    expected = MultiLangOrchestrator(copy, workers=1).analyze()
+
+    def not_expected(*args, **kwargs):
+        raise AssertionError("cached file was parsed again")
+
+    for name in ("analyze_python_file", "analyze_java_file", "analyze_c_file", "analyze_cpp_file", "analyze_cs_file"):
+        monkeypatch.setattr(orch_mod, name, not_expected)
+
+    assert MultiLangOrchestrator(copy, workers=1, cache=cache).analyze() == expected
+
+
+def test_only_changed_files_are_reanalyzed(mixed_project, tmp_path, monkeypatch):
+    """
+    After one file changes, only that file is parsed and its new content is reported.
+    Args:
+        mixed_project (Path): Fixture project root.
+        tmp_path (Path): Pytest-provided temp directory.
+        monkeypatch: Pytest monkeypatch fixture.
+    Returns:
+        None
+    """
+    cache = AnalysisCache(tmp_path / "cache.db")
+    MultiLangOrchestrator(mixed_project, workers=1, cache=cache).analyze()
+
+    changed = mixed_project / "py" / "extra.py"
+    changed.write_text("class Extra:\n    def __init__(self):\n        self._x = 1\n")
+
+    parsed = []
+    real = orch_mod.analyze_python_file
+
+    def counting(root, path):
+        parsed.append(path)
+        return real(root, path)
+
+    monkeypatch.setattr(orch_mod, "analyze_python_file", counting)
+    result = MultiLangOrchestrator(mixed_project, workers=1, cache=cache).analyze()
+
+    assert [p.name for p in parsed] == ["extra.py"]
+    monkeypatch.setattr(orch_mod, "analyze_python_file", real)
+    assert result == MultiLangOrchestrator(mixed_project, workers=1).analyze()
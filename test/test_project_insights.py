@@ -13,13 +13,16 @@ import logging
 import tempfile
 import time
 import unittest
+from unittest import mock
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from src.storage.insights_store import InsightStore
 from src.reporting.project_insights import (
     group_project_histories,
     list_project_insights,
     list_skill_history,
+    load_hierarchies,
     summarize_top_project_histories,
     summarize_project_evolution,
     rank_projects_by_contribution,
@@ -121,7 +124,7 @@ class TestProjectInsights(unittest.TestCase):
         self.assertTrue(self.storage.exists())
 
         # Verify the JSON file was written with correct structure
-        disk_data = json.loads(self.storage.read_text(encoding="utf-8"))
+        disk_data = InsightStore(self.storage).entries()
         self.assertEqual(len(disk_data), 1)
 
         # Verify file analysis fields were computed
@@ -140,6 +143,69 @@ class TestProjectInsights(unittest.TestCase):
         self.assertEqual(listed[0].contributors["Bob"]["file_count"], 2)
         self.assertEqual(listed[0].stats["total_file_contributions"], 6)
 
+    def test_hierarchy_is_loaded_only_on_request(self) -> None:
+        """Listings skip the stored hierarchy; callers that need it load it explicitly."""
+        self._announce("Recording an insight and listing it with and without its hierarchy.")
+
+        payload = _analysis_payload("Alpha")
+        record_project_insight(payload, storage_path=self.storage, insight_id="alpha-1")
+
+        listed = list_project_insights(self.storage)
+        self.assertEqual(listed[0].hierarchy, {})
+        self.assertTrue(listed[0].hierarchy_ref)
+        self.assertGreaterEqual(listed[0].file_analysis["file_count"], 1)
+
+        loaded = load_hierarchies(listed, storage_path=self.storage)
+        self.assertEqual(loaded[0].hierarchy, payload["hierarchy"])
+        full = list_project_insights(self.storage, include_hierarchy=True)
+        self.assertEqual(full[0].hierarchy, payload["hierarchy"])
+
+    def test_listing_is_cached_until_the_log_changes(self) -> None:
+        """Repeated listings reuse the parsed log; writes and external replacements invalidate it."""
+        self._announce("Listing insights repeatedly around writes.")
+
+        record_project_insight(_analysis_payload("Alpha"), storage_path=self.storage, insight_id="alpha-1")
+        with mock.patch.object(InsightStore, "entries", autospec=True, side_effect=InsightStore.entries) as entries:
+            list_project_insights(self.storage)
+            list_project_insights(self.storage)
+            self.assertEqual(entries.call_count, 1)
+
+            record_project_insight(_analysis_payload("Beta"), storage_path=self.storage, insight_id="beta-1")
+            listed = list_project_insights(self.storage)
+            self.assertEqual(entries.call_count, 2)
+            self.assertEqual([i.id for i in listed], ["alpha-1", "beta-1"])
+
+            self.storage.write_text(json.dumps([{"id": "gamma-1", "project_name": "Gamma"}]), encoding="utf-8")
+            self.assertEqual([i.id for i in list_project_insights(self.storage)], ["gamma-1"])
+
+    def test_contribution_scores_are_stored_and_used_for_ranking(self) -> None:
+        """Scores are precomputed at record time and ranking reads them instead of recomputing."""
+        self._announce("Recording insights with contributors and ranking from stored scores.")
+
+        record_project_insight(
+            _analysis_payload("Alpha"),
+            storage_path=self.storage,
+            contributors={"Alice": {"file_count": 4, "percentage": "80%"}, "Bob": {"file_count": 1}},
+            insight_id="alpha-1",
+        )
+        stored = InsightStore(self.storage).get("alpha-1")
+        self.assertEqual(stored["contribution_scores"]["overall"], [4.0, 4])
+        self.assertEqual(stored["contribution_scores"]["contributors"]["Alice"], [80.0, 4])
+
+        stored["contribution_scores"]["overall"] = [100.0, 100]
+        InsightStore(self.storage).replace(stored)
+        record_project_insight(
+            _analysis_payload("Beta"),
+            storage_path=self.storage,
+            contributors={"Carol": {"file_count": 10}},
+            insight_id="beta-1",
+        )
+
+        ranked = rank_projects_by_contribution(storage_path=self.storage, top_n=1)
+        self.assertEqual([i.id for i in ranked], ["alpha-1"])
+        ranked = rank_projects_by_contribution(storage_path=self.storage, contributor="Alice", top_n=5)
+        self.assertEqual([i.id for i in ranked], ["alpha-1", "beta-1"])
+
     def test_list_project_insights_returns_chronological_records(self) -> None:
         """Ensure projects are ordered by analyzed_at timestamp."""
         self._announce("Building a chronological project list.")
@@ -732,7 +798,7 @@ class TestProjectInsights(unittest.TestCase):
         self.assertEqual(backups[0].read_text(encoding="utf-8"), "not-json")
 
         # Fresh log should contain only the new record
-        disk_data = json.loads(self.storage.read_text(encoding="utf-8"))
+        disk_data = InsightStore(self.storage).entries()
         self.assertEqual(len(disk_data), 1)
         self.assertEqual(disk_data[0]["id"], "omega-2")
 
@@ -768,7 +834,7 @@ class TestProjectInsights(unittest.TestCase):
             insight_id="thumb-test",
         )
 
-        disk_data = json.loads(self.storage.read_text(encoding="utf-8"))
+        disk_data = InsightStore(self.storage).entries()
         disk_data[0]["thumbnail"] = thumbnail_data
         self.storage.write_text(json.dumps(disk_data, indent=2), encoding="utf-8")
 
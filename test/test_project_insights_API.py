@@ -2,23 +2,34 @@ from fastapi.testclient import TestClient
 import json
 import shutil
 
+import pytest
+
 from src.API.project_insights_API import *
 from src.API.general_API import app
 from src.core.app_context import create_app_context
 
 from src.analysis.insight_helpers import parse_date
 
-def test_return_project_insights_chronological():
+TEST_INSIGHTS = Path(__file__).absolute().resolve().parent / "test_files" / "project_insights.json"
+
+
+@pytest.fixture
+def storage_path(tmp_path, monkeypatch):
+    """
+    Point the insights store at a per-test temp User_config_files and return its log path.
+    """
+    save_dir = tmp_path / "User_config_files"
+    save_dir.mkdir()
+    monkeypatch.setattr(runtimeAppContext, "legacy_save_dir", save_dir)
+    monkeypatch.setattr(runtimeAppContext, "default_save_dir", save_dir / "project_insights") #ensures temp paths from other tests don't leak in
+    return save_dir / "project_insights.json"
+
+def test_return_project_insights_chronological(storage_path):
     """
     Ensures that the correct amount of projects are returned and that they are in chronological order.
     """
-    root_folder = Path(__file__).absolute().resolve().parents[1]
-    runtimeAppContext.legacy_save_dir = root_folder / "User_config_files"
-    runtimeAppContext.default_save_dir = runtimeAppContext.legacy_save_dir / "project_insights" #ensures temp paths from other tests don't leak in
     testclient = TestClient(app)
-    storage_path = Path(runtimeAppContext.legacy_save_dir / "project_insights.json")
-    test_path = Path(runtimeAppContext.legacy_save_dir.parent / "test" / "test_files" / "project_insights.json")
-    shutil.copy(test_path, storage_path)
+    shutil.copy(TEST_INSIGHTS, storage_path)
     response = testclient.get("/insights/projects")
     dicts = response.json()
     assert response.status_code == 200
@@ -30,17 +41,26 @@ def test_return_project_insights_chronological():
             assert last_date <= this_date
         last_date = this_date
 
-def test_return_skill_insights_chronological():
+def test_return_project_insights_hierarchy_on_request(storage_path):
+    """
+    Ensures hierarchies are left out of the project listing unless requested.
+    """
+    testclient = TestClient(app)
+    shutil.copy(TEST_INSIGHTS, storage_path)
+    expected = {e["id"]: e["hierarchy"] for e in json.loads(TEST_INSIGHTS.read_text())}
+
+    listed = testclient.get("/insights/projects").json()
+    assert all(d["hierarchy"] == {} for d in listed)
+
+    full = testclient.get("/insights/projects", params={"include_hierarchy": True}).json()
+    assert {d["id"]: d["hierarchy"] for d in full} == expected
+
+def test_return_skill_insights_chronological(storage_path):
     """
     Ensures the correct amount of projects are returned and that they are in chronological order of skills.
     """
-    root_folder = Path(__file__).absolute().resolve().parents[1]
-    runtimeAppContext.legacy_save_dir = root_folder / "User_config_files"
-    runtimeAppContext.default_save_dir = runtimeAppContext.legacy_save_dir / "project_insights" #ensures temp paths from other tests don't leak in
     testclient = TestClient(app)
-    storage_path = Path(runtimeAppContext.legacy_save_dir / "project_insights.json")
-    test_path = Path(runtimeAppContext.legacy_save_dir.parent / "test" / "test_files" / "project_insights.json")
-    shutil.copy(test_path, storage_path)
+    shutil.copy(TEST_INSIGHTS, storage_path)
     response = testclient.get("/insights/skills")
     dicts = response.json()
     assert response.status_code == 200
@@ -53,16 +73,34 @@ def test_return_skill_insights_chronological():
         last_date = this_date
 
 
-def test_return_top_project_histories_unique_projects():
+def test_insight_filters_match_skill_language_and_date(storage_path):
+    """
+    Ensures project and skill listings filter case-insensitively by skill, language and date.
+    """
+    testclient = TestClient(app)
+    storage_path.write_text(json.dumps([
+        {"id": "a", "project_name": "Alpha", "analyzed_at": "2025-01-01T00:00:00+00:00",
+         "languages": ["Python"], "skills": ["Flask"]},
+        {"id": "b", "project_name": "Beta", "analyzed_at": "2025-06-01T00:00:00+00:00",
+         "languages": ["JavaScript"], "skills": ["React", "flask"]},
+    ]))
+
+    skills = testclient.get("/insights/skills", params={"skill": "FLASK"}).json()
+    assert [d["project_name"] for d in skills] == ["Alpha", "Beta"]
+    skills = testclient.get("/insights/skills", params={"skill": "flask", "since_str": "2025-03-01"}).json()
+    assert [d["project_name"] for d in skills] == ["Beta"]
+
+    projects = testclient.get("/insights/projects", params={"language": "python"}).json()
+    assert [d["id"] for d in projects] == ["a"]
+    projects = testclient.get("/insights/projects", params={"skill": "react", "language": "python"}).json()
+    assert projects == []
+
+def test_return_top_project_histories_unique_projects(storage_path):
     """
     Ensures top project history endpoint collapses snapshots by project name and
     returns evolution metadata.
     """
-    root_folder = Path(__file__).absolute().resolve().parents[1]
-    runtimeAppContext.legacy_save_dir = root_folder / "User_config_files"
-    runtimeAppContext.default_save_dir = runtimeAppContext.legacy_save_dir / "project_insights"
     testclient = TestClient(app)
-    storage_path = Path(runtimeAppContext.legacy_save_dir / "project_insights.json")
 
     sample = [
         {
@@ -112,13 +150,9 @@ def test_return_top_project_histories_unique_projects():
     assert body[0]["latest"]["summary"] == "Expanded alpha snapshot."
 
 
-def test_return_top_project_histories_respects_top_n():
+def test_return_top_project_histories_respects_top_n(storage_path):
     """Ensures the top-project history endpoint respects the top_n query parameter."""
-    root_folder = Path(__file__).absolute().resolve().parents[1]
-    runtimeAppContext.legacy_save_dir = root_folder / "User_config_files"
-    runtimeAppContext.default_save_dir = runtimeAppContext.legacy_save_dir / "project_insights"
     testclient = TestClient(app)
-    storage_path = Path(runtimeAppContext.legacy_save_dir / "project_insights.json")
 
     sample = [
         {
@@ -154,13 +188,9 @@ def test_return_top_project_histories_respects_top_n():
     assert body[0]["project_name"] == "One"
 
 
-def test_return_top_project_histories_prefers_skills_then_recency_on_ties():
+def test_return_top_project_histories_prefers_skills_then_recency_on_ties(storage_path):
     """Ensures top-project endpoint breaks equal contribution ties by skills, then recency."""
-    root_folder = Path(__file__).absolute().resolve().parents[1]
-    runtimeAppContext.legacy_save_dir = root_folder / "User_config_files"
-    runtimeAppContext.default_save_dir = runtimeAppContext.legacy_save_dir / "project_insights"
     testclient = TestClient(app)
-    storage_path = Path(runtimeAppContext.legacy_save_dir / "project_insights.json")
 
     sample = [
         {
@@ -206,14 +236,10 @@ def test_return_top_project_histories_prefers_skills_then_recency_on_ties():
     assert [entry["project_name"] for entry in body] == ["NewestPython", "NewerPython", "OlderNoSkills"]
 
 
-def test_return_top_project_histories_active_only_filters_to_saved_projects():
+def test_return_top_project_histories_active_only_filters_to_saved_projects(storage_path):
     """Ensures active_only returns only projects that still exist in saved project storage."""
-    root_folder = Path(__file__).absolute().resolve().parents[1]
-    runtimeAppContext.legacy_save_dir = root_folder / "User_config_files"
-    runtimeAppContext.default_save_dir = runtimeAppContext.legacy_save_dir / "project_insights"
     Path(runtimeAppContext.default_save_dir).mkdir(parents=True, exist_ok=True)
     testclient = TestClient(app)
-    storage_path = Path(runtimeAppContext.legacy_save_dir / "project_insights.json")
 
     sample = [
         {
@@ -0,0 +1,184 @@
+import shutil
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from src.core.analysis_service import extract_if_zip, extract_zip_for_analysis
+from src.core.data_extraction import FileMetadataExtractor
+from src.core.project_inventory import ProjectInventory
+from src.core.project_stack_detection import detect_project_stack
+from src.analyzers.multilang_orchestrator import MultiLangOrchestrator
+from src.storage.dedup_index import deduplicate_project
+
+
+def _make_project(root: Path) -> Path:
+    """
+    Build a small nested project used by the inventory tests.
+    Args:
+        root (Path): Directory to create the project in.
+    Returns:
+        Path: The project root.
+    """
+    (root / "src" / "pkg").mkdir(parents=True)
+    (root / "docs").mkdir()
+    (root / "empty").mkdir()
+    (root / "README.md").write_text("# Demo\n")
+    (root / "requirements.txt").write_text("flask\npytest\n")
+    (root / "src" / "main.py").write_text("class A:\n    pass\n")
+    (root / "src" / "pkg" / "util.py").write_text("def f():\n    return 1\n")
+    (root / "docs" / "notes.txt").write_text("notes")
+    return root
+
+
+def test_inventory_matches_rglob_order(tmp_path):
+    """
+    Entries are recorded in the same order Path.rglob("*") yields them.
+    Args:
+        tmp_path (Path): Pytest-provided temp directory.
+    Returns:
+        None
+    """
+    root = _make_project(tmp_path / "proj")
+    inventory = ProjectInventory(root)
+
+    assert [e.path for e in inventory.entries()] == list(root.rglob("*"))
+    assert inventory.paths() == [p for p in root.rglob("*") if p.is_file()]
+    assert inventory.paths(suffixes={".py"}) == [p for p in root.rglob("*.py")]
+
+
+def test_inventory_records_file_metadata(tmp_path):
+    """
+    Each file entry carries the size, suffix and timestamps from a single stat.
+    Args:
+        tmp_path (Path): Pytest-provided temp directory.
+    Returns:
+        None
+    """
+    root = _make_project(tmp_path / "proj")
+    inventory = ProjectInventory(root)
+
+    entry = next(e for e in inventory.files() if e.rel_path == "src/main.py")
+    stat = (root / "src" / "main.py").stat()
+    assert entry.suffix == ".py"
+    assert entry.size == stat.st_size
+    assert entry.mtime_ns == stat.st_mtime_ns
+    assert entry.owner
+
+
+def test_inventory_owner_comes_from_scandir_stat(tmp_path, monkeypatch):
+    """
+    Owners are resolved from the scandir stat's st_uid, without stat'ing each entry again.
+    Args:
+        tmp_path (Path): Pytest-provided temp directory.
+        monkeypatch: Pytest fixture for patching Path.stat.
+    Returns:
+        None
+    """
+    root = _make_project(tmp_path / "proj")
+    extractor = FileMetadataExtractor(root)
+    expected = extractor.get_author(root / "README.md")
+
+    stat_calls = []
+    real_stat = Path.stat
+
+    def counting_stat(self, *args, **kwargs):
+        if self != root:
+            stat_calls.append(self)
+        return real_stat(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "stat", counting_stat)
+    inventory = ProjectInventory(root, extractor=extractor)
+
+    assert stat_calls == []
+    assert {e.owner for e in inventory.entries()} == {expected}
+
+
+def test_hierarchy_from_inventory_matches_tree(tmp_path):
+    """
+    The hierarchy built from the inventory is identical to a fresh tree() walk.
+    Args:
+        tmp_path (Path): Pytest-provided temp directory.
+    Returns:
+        None
+    """
+    root = _make_project(tmp_path / "proj")
+    inventory = ProjectInventory(root)
+
+    expected = FileMetadataExtractor(root).file_hierarchy()
+    actual = FileMetadataExtractor(root, inventory=inventory).file_hierarchy()
+    assert actual == expected
+
+
+def test_stages_give_same_results_with_inventory(tmp_path):
+    """
+    Stack detection, OOP discovery and dedup agree with and without an inventory.
+    Args:
+        tmp_path (Path): Pytest-provided temp directory.
+    Returns:
+        None
+    """
+    root = _make_project(tmp_path / "proj")
+    inventory = ProjectInventory(root)
+
+    assert detect_project_stack(root, inventory=inventory) == detect_project_stack(root)
+    assert (
+        MultiLangOrchestrator(root, inventory=inventory).discover_files()
+        == MultiLangOrchestrator(root).discover_files()
+    )
+
+    with_inventory = deduplicate_project(root, tmp_path / "a.json", inventory=inventory)
+    without_inventory = deduplicate_project(root, tmp_path / "b.json")
+    assert with_inventory == without_inventory
+
+
+def test_inventory_rejects_missing_root(tmp_path):
+    """
+    Building an inventory for a missing directory raises FileNotFoundError.
+    Args:
+        tmp_path (Path): Pytest-provided temp directory.
+    Returns:
+        None
+    """
+    with pytest.raises(FileNotFoundError):
+        ProjectInventory(tmp_path / "missing")
+
+
+def test_archive_inventory_matches_full_extraction(tmp_path):
+    """
+    A partially extracted archive yields the same stage results as a full extraction.
+    Args:
+        tmp_path (Path): Pytest-provided temp directory.
+    Returns:
+        None
+    """
+    root = _make_project(tmp_path / "proj")
+    (root / "assets").mkdir()
+    (root / "assets" / "logo.png").write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x01" * 128)
+    archive = tmp_path / "proj.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        for path in root.rglob("*"):
+            zf.write(path, path.relative_to(root).as_posix())
+
+    full = Path(extract_if_zip(archive))
+    sparse, inventory = extract_zip_for_analysis(archive)
+    try:
+        assert not (sparse / "assets" / "logo.png").exists()
+        assert (sparse / "src" / "main.py").exists()
+
+        full_inventory = ProjectInventory(full)
+        assert sorted(e.rel_path for e in inventory.entries()) == sorted(
+            e.rel_path for e in full_inventory.entries()
+        )
+        logo = next(e for e in inventory.files() if e.name == "logo.png")
+        assert logo.size == 136
+        assert logo.modified == next(e for e in full_inventory.files() if e.name == "logo.png").modified
+
+        assert detect_project_stack(sparse, inventory=inventory) == detect_project_stack(full)
+        dedup_sparse = deduplicate_project(sparse, tmp_path / "a.json", inventory=inventory)
+        dedup_full = deduplicate_project(full, tmp_path / "b.json", inventory=full_inventory)
+        assert dedup_sparse.unique_files == dedup_full.unique_files == 6
+    finally:
+        inventory.close()
+        shutil.rmtree(full, ignore_errors=True)
+        shutil.rmtree(sparse, ignore_errors=True)
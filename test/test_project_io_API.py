@@ -84,6 +84,11 @@ def test_upload_file_API():
         assert body["status"] == "ok"
         assert body["filename"] == "api_test.zip"
         assert body["project_name"] == "api_test"
+        assert body["size"] == os.path.getsize(path)
+        assert len(body["sha256"]) == 64
+        handle = upload_registry.get(body["upload_id"])
+        assert handle is not None
+        assert handle.path == body["stored_path"]
     finally:
         fh.close()
         if os.path.exists(path):
@@ -102,6 +107,41 @@ def test_upload_file_API_no_zip():
     body = response.json()
     assert "zip file" in body["detail"]
 
+def test_upload_streams_in_chunks_and_hashes(monkeypatch, tmp_path):
+    """
+    Uploads larger than one chunk are streamed to disk intact and hashed on the way.
+    """
+    import hashlib
+    import src.API.project_io_API as project_io_mod
+
+    monkeypatch.setattr(project_io_mod.upload_registry, "upload_dir", tmp_path / "uploads")
+    monkeypatch.setattr(project_io_mod, "UPLOAD_CHUNK_SIZE", 64)
+    archive = tmp_path / "big.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("main.py", "x = 1\n" * 200)
+    data = archive.read_bytes()
+
+    with archive.open("rb") as fh:
+        response = test_client.post("/projects/upload", files={"upload_file": fh})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["size"] == len(data)
+    assert body["sha256"] == hashlib.sha256(data).hexdigest()
+    assert Path(body["stored_path"]).read_bytes() == data
+
+
+def test_rejected_upload_leaves_no_file(monkeypatch, tmp_path):
+    """
+    A non-zip upload is removed from the upload directory after validation fails.
+    """
+    import src.API.project_io_API as project_io_mod
+
+    upload_dir = tmp_path / "uploads"
+    monkeypatch.setattr(project_io_mod.upload_registry, "upload_dir", upload_dir)
+    response = test_client.post("/projects/upload", files={"upload_file": ("notes.zip", b"not a zip")})
+    assert response.status_code == 400
+    assert list(upload_dir.iterdir()) == []
+
 def test_get_project_by_name_prefers_database(monkeypatch):
     """
     Ensures GET /projects/{id} returns DB data when available.
@@ -121,6 +161,27 @@ def test_get_project_by_name_prefers_database(monkeypatch):
     assert body["source"] == "database"
     assert body["analysis"] == expected
 
+def test_project_summaries_lists_summary_rows(monkeypatch):
+    """
+    Ensures GET /projects/summaries returns the store's summary rows by project stem.
+    """
+    from src.core import app_context
+    rows = [{
+        "project_name": "alpha.json",
+        "project_type": "individual",
+        "languages": ["Python"],
+        "skills": ["Flask"],
+        "version_count": 2,
+        "updated_at": "2025-01-01 00:00:00",
+    }]
+    monkeypatch.setattr(app_context.runtimeAppContext.store, "list_project_summaries", lambda: rows)
+
+    response = test_client.get("/projects/summaries")
+    assert response.status_code == 200
+    body = response.json()
+    assert [p["project_name"] for p in body] == ["alpha"]
+    assert body[0]["version_count"] == 2
+
 def test_get_project_by_name_uses_filesystem_fallback(monkeypatch, make_project_save_dir):
     """
     Ensures GET /projects/{id} falls back to filesystem when DB misses.
@@ -4,7 +4,7 @@ from pathlib import Path
 import sys
 import textwrap
 sys.path.append(str(Path(__file__).parent.parent))
-from src.analyzers.python.python_oop_analyzer import analyze_python_project_oop
+from src.analyzers.python.python_oop_analyzer import PythonOOPAstAnalyzer, analyze_python_project_oop
 
 class TestPythonOOPAstAnalyzer(unittest.TestCase):
     """Check that the Python OOP analyzer returns expected metrics.
@@ -178,6 +178,67 @@ class TestPythonOOPAstAnalyzer(unittest.TestCase):
             self.assertTrue(
                 metrics["syntax_errors"][0].endswith("broken.py")
             )
+    def test_nested_scopes_in_single_pass(self):
+        
+        """Nested classes, functions and loops are attributed as by separate walks."""
+        
+        code = textwrap.dedent("""
+            import heapq
+            from collections import Counter
+
+            class Outer(Base, pkg.Mixin):
+                def build(self):
+                    self.items = [1, 2]
+                    class Inner:
+                        def __init__(self):
+                            self._cache: dict = {}
+                    for i in range(3):
+                        def helper():
+                            for j in range(i):
+                                while j:
+                                    j -= 1
+                        self.total = sorted({i})
+                    return Inner
+
+                async def fetch(self):
+                    self.fetched = (1, 2)
+                    for _ in range(2):
+                        for _ in range(2):
+                            pass
+
+            def top():
+                return [x for x in range(3)], heapq.nlargest(1, [])
+        """)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            path = self._write_file(root, "nested.py", code)
+
+            analyzer = PythonOOPAstAnalyzer(root)
+            analyzer.analyze_file(path)
+
+            outer, inner = analyzer.class_infos
+            self.assertEqual(outer.name, "Outer")
+            self.assertEqual(outer.bases, ["Base", "Mixin"])
+            # async methods are not counted, and nested assignments belong to
+            # every enclosing method's class.
+            self.assertEqual(outer.methods, {"build"})
+            self.assertEqual(outer.public_attrs, {"items", "total"})
+            self.assertEqual(outer.private_attrs, {"_cache"})
+            self.assertEqual(inner.private_attrs, {"_cache"})
+            self.assertTrue(inner.has_init)
+
+            self.assertEqual(analyzer.ds_counts["list_literals"], 2)
+            self.assertEqual(analyzer.ds_counts["set_literals"], 1)
+            self.assertEqual(analyzer.ds_counts["tuple_literals"], 2)
+            self.assertEqual(analyzer.ds_counts["dict_literals"], 1)
+            self.assertEqual(analyzer.ds_counts["list_comprehensions"], 1)
+            self.assertTrue(analyzer.alg_usage["uses_counter"])
+            self.assertTrue(analyzer.alg_usage["uses_heapq"])
+            self.assertTrue(analyzer.alg_usage["uses_sorted"])
+            # build, __init__, helper, top; build sees helper's loops under its own.
+            self.assertEqual(analyzer.complexity_stats["total_functions"], 4)
+            self.assertEqual(analyzer.complexity_stats["max_loop_depth"], 3)
+            self.assertEqual(analyzer.complexity_stats["functions_with_nested_loops"], 2)
 
 if __name__ == "__main__":
     unittest.main()
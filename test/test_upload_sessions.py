@@ -0,0 +1,74 @@
+import os
+import time
+
+from src.core.upload_sessions import UploadRegistry
+
+
+def _store(registry, payload=b"PK\x03\x04data", name="demo.zip"):
+    """
+    Write an archive under a new upload id and register it.
+    Args:
+        registry (UploadRegistry): Registry to store into.
+        payload (bytes): Archive bytes.
+        name (str): Client-side filename.
+    Returns:
+        UploadHandle: The registered handle.
+    """
+    upload_id, path = registry.new_upload_path()
+    path.write_bytes(payload)
+    return registry.register(upload_id, filename=name, project_name=name[:-4], size=len(payload), sha256="abc")
+
+
+def test_registered_upload_resolves_by_id(tmp_path):
+    """
+    A registered upload is found again by id, from any registry on the same directory.
+    Args:
+        tmp_path (Path): pytest temp directory.
+    Returns:
+        None
+    """
+    handle = _store(UploadRegistry(tmp_path, ttl_seconds=60))
+
+    resolved = UploadRegistry(tmp_path, ttl_seconds=60).get(handle.upload_id)
+    assert resolved == handle
+    assert resolved.project_name == "demo"
+    assert os.path.exists(resolved.path)
+
+
+def test_unknown_or_malformed_ids_resolve_to_none(tmp_path):
+    """
+    Unknown ids and ids that are not plain hex tokens never resolve.
+    Args:
+        tmp_path (Path): pytest temp directory.
+    Returns:
+        None
+    """
+    registry = UploadRegistry(tmp_path, ttl_seconds=60)
+    assert registry.get("deadbeef") is None
+    assert registry.get("../etc/passwd") is None
+    assert registry.get("") is None
+
+
+def test_expired_uploads_are_collected(tmp_path):
+    """
+    Uploads idle past the TTL stop resolving and their files are deleted, along with stray archives.
+    Args:
+        tmp_path (Path): pytest temp directory.
+    Returns:
+        None
+    """
+    registry = UploadRegistry(tmp_path, ttl_seconds=60)
+    old = _store(registry)
+    fresh = _store(registry)
+    stray = tmp_path / "legacy_1234abcd.zip"
+    stray.write_bytes(b"PK")
+
+    past = time.time() - 120
+    os.utime(tmp_path / f"{old.upload_id}.json", (past, past))
+    os.utime(stray, (past, past))
+    assert registry.get(old.upload_id) is None
+
+    assert registry.collect_garbage() == 3
+    assert not os.path.exists(old.path)
+    assert not stray.exists()
+    assert registry.get(fresh.upload_id) == fresh